@@ -3,13 +3,17 @@ import sys
 import asyncio
 import time
 import random
-from config import LOCK_FILE
-from utils import get_instance_id, register_instance, unregister_instance, check_running_instances, log_error
+import multiprocessing
+from config import LOCK_FILE, MONITOR_WORKERS, ensure_directories
+from event_bus import event_bus, print_event
+from utils import get_instance_id, register_instance, unregister_instance, check_running_instances, log_error, log_event
 from user_management import add_new_user, remove_user, show_saved_users
 from group_management import get_all_user_groups, get_group_link, select_group_for_action
 from media_handler import download_group_archive
 from event_handler import start_monitoring, cleanup_session_files
+from monitor_supervisor import start_supervised_monitoring
 from multiinstance import show_running_instances
+from profiling import profiled
 
 async def archive_menu(instance_id):
     """Menu per la gestione degli archivi."""
@@ -17,6 +21,9 @@ async def archive_menu(instance_id):
         print("\n==== Menu Archivio ====")
         print("1) Elenca tutti i gruppi")
         print("2) Scarica archivio completo di un gruppo")
+        print("3) Esporta l'archivio di un gruppo in un file compresso")
+        print("4) Crea l'anteprima di un gruppo (miniature e metadati)")
+        print("5) Scarica in originale i media scelti dall'anteprima")
         print("0) Torna al menu principale")
 
         try:
@@ -33,7 +40,27 @@ async def archive_menu(instance_id):
                 await get_all_user_groups(instance_id)
                 selected = select_group_for_action()
                 if selected:
-                    await download_group_archive(selected, instance_id)
+                    await profiled(download_group_archive(selected, instance_id))
+            elif scelta == "3":
+                # Usa l'elenco dei gruppi già salvato
+                selected = select_group_for_action()
+                if selected:
+                    from archive_export import export_group_archive
+                    await export_group_archive(selected)
+            elif scelta == "4":
+                await get_all_user_groups(instance_id)
+                selected = select_group_for_action()
+                if selected:
+                    from media_preview import preview_group_archive
+                    await profiled(preview_group_archive(selected, instance_id))
+            elif scelta == "5":
+                # Usa l'elenco dei gruppi già salvato
+                selected = select_group_for_action()
+                if selected:
+                    from media_preview import parse_selection, promote_media
+                    message_ids, media_types = parse_selection(
+                        input("ID dei messaggi (es. 10,20-30) o tipi di media (es. videos,images): "))
+                    await profiled(promote_media(selected, message_ids, media_types))
             elif scelta == "0":
                 return
             else:
@@ -161,7 +188,11 @@ def main_menu(instance_id):
                 set_instance_monitoring_state(instance_id, LOCK_FILE, True)
                 
                 try:
-                    asyncio.run(start_monitoring(instance_id))
+                    # Con più processi configurati gli account vengono divisi dal supervisore
+                    if MONITOR_WORKERS > 1:
+                        asyncio.run(start_supervised_monitoring(instance_id))
+                    else:
+                        asyncio.run(profiled(start_monitoring(instance_id), f"start_monitoring_{instance_id}"))
                 except KeyboardInterrupt:
                     print("\n🛑 Monitoraggio interrotto manualmente.")
                 except Exception as e:
@@ -187,6 +218,14 @@ def main_menu(instance_id):
             print("❌ Si è verificato un errore. Riprova.")
 
 if __name__ == "__main__":
+    # Necessario per i processi del monitoraggio nell'eseguibile
+    multiprocessing.freeze_support()
+    
+    # La console e il file di log ricevono i messaggi delle operazioni dal bus eventi
+    event_bus.subscribe(print_event)
+    event_bus.subscribe(log_event)
+    ensure_directories()
+
     # Genera un ID univoco per questa istanza
     instance_id = get_instance_id()
     
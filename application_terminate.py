@@ -12,11 +12,14 @@ import signal
 import threading
 import asyncio
 import traceback
+import concurrent.futures
 from PyQt5.QtWidgets import QApplication, QProgressDialog, QMessageBox
 from PyQt5.QtCore import Qt
 
 # Importa il session manager
 from gui_session_manager import session_manager
+from async_runner import loop_thread
+from config import SHUTDOWN_TIMEOUT
 
 def force_terminate(exit_code=1, timeout=2):
     """
@@ -39,7 +42,7 @@ def force_terminate(exit_code=1, timeout=2):
     force_thread.daemon = True
     force_thread.start()
 
-def terminate_application(app, instance_id, lock_file, monitoring_thread=None, operation_threads=None):
+def terminate_application(app, instance_id, lock_file, monitoring_operation=None, operations=None):
     """
     Termina l'applicazione in modo pulito, gestendo tutte le risorse.
     
@@ -47,8 +50,8 @@ def terminate_application(app, instance_id, lock_file, monitoring_thread=None, o
         app: L'istanza QApplication
         instance_id: ID dell'istanza corrente
         lock_file: Percorso del file di lock
-        monitoring_thread: Thread di monitoraggio attivo (opzionale)
-        operation_threads: Dizionario di thread operativi attivi (opzionale)
+        monitoring_operation: Operazione di monitoraggio attiva (opzionale)
+        operations: Dizionario di operazioni asincrone attive (opzionale)
     """
     from utils import unregister_instance
     
@@ -65,33 +68,39 @@ def terminate_application(app, instance_id, lock_file, monitoring_thread=None, o
         progress.show()
         QApplication.processEvents()
         
-        # 1. Termina i thread di monitoraggio
+        # 1. Annulla il monitoraggio
         progress.setLabelText("Interruzione del monitoraggio...")
         progress.setValue(1)
         QApplication.processEvents()
         
-        if monitoring_thread and monitoring_thread.isRunning():
+        if monitoring_operation and monitoring_operation.isRunning():
             try:
-                monitoring_thread.stop()
-                monitoring_thread.wait(3000)  # Attendi max 3 secondi
-                if monitoring_thread.isRunning():
-                    monitoring_thread.terminate()
+                monitoring_operation.stop()
             except Exception as e:
                 print(f"Errore durante l'interruzione del monitoraggio: {e}")
         
-        # 2. Termina gli altri thread operativi
+        # 2. Annulla le altre operazioni e ferma il loop asincrono condiviso
         progress.setLabelText("Interruzione delle operazioni in corso...")
         progress.setValue(2)
         QApplication.processEvents()
         
-        if operation_threads:
-            for thread_id, thread in list(operation_threads.items()):
-                if thread.isRunning():
+        if operations:
+            for operation_id, operation in list(operations.items()):
+                if operation.isRunning():
                     try:
-                        thread.terminate()
-                        thread.wait(1000)  # Attendi max 1 secondo
+                        operation.stop()
                     except Exception as e:
-                        print(f"Errore durante l'interruzione del thread {thread_id}: {e}")
+                        print(f"Errore durante l'interruzione dell'operazione {operation_id}: {e}")
+        
+        # Attendi che le operazioni si fermino ai punti sicuri, poi ferma il loop
+        pending = [operation.future for operation in (operations or {}).values()
+                   if operation.future is not None and not operation.future.done()]
+        if pending:
+            concurrent.futures.wait(pending, timeout=SHUTDOWN_TIMEOUT)
+        try:
+            loop_thread.stop(timeout=0.2)
+        except Exception as e:
+            print(f"Errore durante l'arresto del loop asincrono: {e}")
         
         # 3. Pulisci tutte le sessioni
         progress.setLabelText("Pulizia delle sessioni...")
@@ -126,9 +135,6 @@ def terminate_application(app, instance_id, lock_file, monitoring_thread=None, o
         progress.setValue(5)
         QApplication.processEvents()
         
-        # Breve pausa per mostrare il completamento
-        time.sleep(0.5)
-        
         # Chiudi il dialogo
         progress.close()
         
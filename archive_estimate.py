@@ -0,0 +1,190 @@
+"""
+Stima della dimensione degli archivi e controllo dello spazio su disco.
+
+Prima di scaricare un archivio, estimate_archive chiede a Telegram quanti
+messaggi contiene il gruppo per ogni tipo di media (una richiesta con
+limit=0 per filtro) e la dimensione di alcuni file campionati in punti
+diversi della cronologia. Ne ricava file e byte ancora da scaricare,
+togliendo quelli già presenti nella cartella dell'archivio: poche decine di
+richieste anche per gruppi con milioni di messaggi.
+
+DiskQuota verifica che la stima entri nello spazio libero del disco
+(lasciandone sempre libero ARCHIVE_MIN_FREE_BYTES) e, durante il download,
+controlla prima di ogni media lo spazio libero e la quota dell'archivio
+(ARCHIVE_QUOTA_BYTES): se non bastano il download si ferma in un punto sicuro
+e riprende dal checkpoint alla successiva esecuzione.
+"""
+
+import os
+import shutil
+import time
+
+from telethon.tl import types
+
+from config import (
+    ARCHIVE_ESTIMATE_SAMPLES, ARCHIVE_ESTIMATE_BATCHES, ARCHIVE_MIN_FREE_BYTES, ARCHIVE_QUOTA_BYTES,
+    ARCHIVE_SPACE_MARGIN
+)
+from event_bus import log
+from media_layout import MEDIA_TYPES, media_layouts
+
+# Filtri di ricerca di Telegram per i tipi di media scaricati (vedi get_media_type)
+MEDIA_FILTERS = {
+    "images": types.InputMessagesFilterPhotos,
+    "videos": types.InputMessagesFilterVideo,
+    "audio": types.InputMessagesFilterMusic,
+    "voice": types.InputMessagesFilterVoice,
+    "documents": types.InputMessagesFilterDocument,
+    "gifs": types.InputMessagesFilterGif,
+}
+
+def archive_usage(archive_path):
+    """
+    Conta i file già presenti nell'archivio (per i media, dal catalogo se è completo).
+
+    Returns:
+        dict: {tipo di media: (file, byte)} più "total" con la dimensione dell'intera cartella
+    """
+    usage = {}
+    total = 0
+    if not os.path.isdir(archive_path):
+        return {"total": (0, 0)}
+    # Con il catalogo completo i media si contano senza leggere le loro cartelle
+    catalogued = media_layouts.get(archive_path).usage()
+    for entry in os.scandir(archive_path):
+        if entry.is_file():
+            total += entry.stat().st_size
+            continue
+        if not entry.is_dir():
+            continue
+        if catalogued is not None and entry.name in MEDIA_TYPES:
+            files, size = usage[entry.name] = catalogued.get(entry.name, (0, 0))
+            total += size
+            continue
+        files = size = 0
+        for root, _, names in os.walk(entry.path):
+            for name in names:
+                try:
+                    size += os.path.getsize(os.path.join(root, name))
+                    files += 1
+                except OSError:
+                    pass
+        usage[entry.name] = (files, size)
+        total += size
+    usage["total"] = (sum(files for files, _ in usage.values()), total)
+    return usage
+
+def _file_size(message):
+    file = getattr(message, "file", None)
+    return getattr(file, "size", None) or 0
+
+async def _sample_sizes(client, entity, media_filter, newest_id):
+    """Dimensioni di alcuni file del tipo richiesto, presi da punti diversi della cronologia."""
+    per_batch = max(ARCHIVE_ESTIMATE_SAMPLES // ARCHIVE_ESTIMATE_BATCHES, 1)
+    sizes = []
+    seen = set()
+    for batch in range(ARCHIVE_ESTIMATE_BATCHES):
+        # offset_id restituisce i messaggi precedenti: il primo blocco parte dai più recenti
+        offset_id = int(newest_id * (ARCHIVE_ESTIMATE_BATCHES - batch) / ARCHIVE_ESTIMATE_BATCHES) + 1
+        messages = await client.get_messages(entity, limit=per_batch, offset_id=offset_id, filter=media_filter())
+        for message in messages:
+            if message.id not in seen:
+                seen.add(message.id)
+                sizes.append(_file_size(message))
+    return sizes
+
+async def estimate_archive(client, entity, usage=None):
+    """
+    Stima i media ancora da scaricare per un archivio.
+
+    Args:
+        client: Client Telegram connesso
+        entity: Entità del gruppo
+        usage: File già presenti nell'archivio (archive_usage), da escludere dalla stima
+
+    Returns:
+        dict: {"types": {tipo: {"count", "avg_size", "files", "bytes"}}, "files", "bytes", "seconds"}
+    """
+    start = time.monotonic()
+    usage = usage or {}
+    latest = await client.get_messages(entity, limit=1)
+    newest_id = latest[0].id if latest else 0
+    estimate = {"types": {}, "files": 0, "bytes": 0}
+    for media_type, media_filter in MEDIA_FILTERS.items():
+        count = (await client.get_messages(entity, limit=0, filter=media_filter())).total or 0
+        if not count:
+            continue
+        sizes = await _sample_sizes(client, entity, media_filter, newest_id)
+        average = sum(sizes) / len(sizes) if sizes else 0
+        files = max(count - usage.get(media_type, (0, 0))[0], 0)
+        estimate["types"][media_type] = {
+            "count": count,
+            "avg_size": int(average),
+            "files": files,
+            "bytes": int(files * average),
+        }
+        estimate["files"] += files
+        estimate["bytes"] += int(files * average)
+    estimate["seconds"] = round(time.monotonic() - start, 2)
+    return estimate
+
+def log_estimate(estimate):
+    """Riepiloga una stima nel log."""
+    log(f"📏 Stima: {estimate['files']} file da scaricare, {estimate['bytes'] / 1048576:.1f} MB "
+        f"(calcolata in {estimate['seconds']} s)")
+    for media_type, values in estimate["types"].items():
+        log(f"   - {media_type}: {values['files']} di {values['count']} file, "
+            f"circa {values['avg_size'] / 1024:.0f} KB l'uno", level="debug")
+
+class DiskQuota:
+    """Spazio disponibile per un archivio: disco libero e quota dell'archivio."""
+
+    def __init__(self, archive_path, used_bytes=0, quota_bytes=ARCHIVE_QUOTA_BYTES, min_free=ARCHIVE_MIN_FREE_BYTES):
+        """
+        Args:
+            archive_path: Cartella dell'archivio (per individuare il disco)
+            used_bytes: Byte già occupati dall'archivio
+            quota_bytes: Dimensione massima dell'archivio (0 = nessun limite)
+            min_free: Byte da lasciare sempre liberi sul disco
+        """
+        self.archive_path = archive_path
+        self.used_bytes = used_bytes
+        self.quota_bytes = quota_bytes
+        self.min_free = min_free
+
+    def free_bytes(self):
+        return shutil.disk_usage(self.archive_path).free
+
+    def preflight(self, estimate):
+        """
+        Verifica prima di iniziare che la stima entri nel disco.
+
+        Returns:
+            str: Il motivo per cui il download non può iniziare, oppure None
+        """
+        needed = int(estimate["bytes"] * ARCHIVE_SPACE_MARGIN)
+        available = self.free_bytes() - self.min_free
+        if needed > available:
+            return (f"servono circa {needed / 1048576:.1f} MB ma sul disco ne restano "
+                    f"{max(available, 0) / 1048576:.1f} MB utilizzabili")
+        if self.quota_bytes and self.used_bytes + needed > self.quota_bytes:
+            log(f"⚠️ L'archivio supererà la quota di {self.quota_bytes / 1048576:.0f} MB: "
+                f"il download si fermerà al suo raggiungimento", level="warning")
+        return None
+
+    def check(self, expected_bytes=0):
+        """
+        Verifica prima di un download che ci sia spazio per expected_bytes.
+
+        Returns:
+            str: Il motivo per cui fermarsi, oppure None
+        """
+        if self.quota_bytes and self.used_bytes + expected_bytes > self.quota_bytes:
+            return f"raggiunta la quota dell'archivio ({self.quota_bytes / 1048576:.0f} MB)"
+        if self.free_bytes() - expected_bytes < self.min_free:
+            return f"spazio libero sul disco sotto {self.min_free / 1048576:.0f} MB"
+        return None
+
+    def add(self, nbytes):
+        """Conteggia i byte scritti nell'archivio."""
+        self.used_bytes += nbytes
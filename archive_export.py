@@ -0,0 +1,393 @@
+"""
+Esportazione degli archivi in contenitori compressi.
+
+Un archivio (archive/<utente>/<gruppo>/) è fatto di moltissimi file piccoli,
+lenti da copiare e da salvare. L'esportazione li raccoglie in parti numerate
+in EXPORT_DIR/<utente>/<gruppo>/:
+
+- part-0001.zip (oppure part-0001.tar.zst se è installato il pacchetto
+  zstandard), scritta in streaming file per file, senza copie intermedie;
+- export_index.jsonl: per ogni file esportato la parte che lo contiene,
+  con dimensione e data di modifica.
+
+Ogni parte contiene anche _export/manifest-NNNN.json (riepilogo della parte)
+e _export/catalogue-NNNN.jsonl (catalogo dei media: ID del messaggio, tipo,
+dimensione). Le esportazioni successive aggiungono una nuova parte con i soli
+file nuovi o modificati (ad esempio messages.txt, che cresce); per ogni file
+vale la parte più recente.
+
+Nei zip i media, già compressi, vengono memorizzati senza ricomprimerli e i
+testi vengono compressi: la lettura di un singolo file è immediata. Nei
+tar.zst la lettura di un file richiede di decomprimere la parte fino a quel
+punto.
+
+Uso da riga di comando:
+
+    python archive_export.py export archive/<utente>/<gruppo> [--format zip|tar.zst]
+    python archive_export.py list exports/<utente>/<gruppo> [--pattern "images/*"]
+    python archive_export.py extract exports/<utente>/<gruppo> <file> [--output cartella]
+"""
+
+import asyncio
+import fnmatch
+import io
+import json
+import os
+import re
+import shutil
+import tarfile
+import time
+import zipfile
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from config import ARCHIVE_DIR, EXPORT_DIR, EXPORT_FORMAT, EXPORT_ZSTD_LEVEL
+from event_bus import log
+from media_layout import MEDIA_NAME
+from operation_control import ProgressTracker, is_cancelled
+from path_resolver import path_resolver
+from utils import log_error
+
+INDEX_FILE = "export_index.jsonl"
+META_DIR = "_export"
+FORMATS = ("zip", "tar.zst")
+
+# File dell'archivio da non esportare (download in corso, file temporanei)
+SKIPPED_SUFFIXES = (".part", ".temp")
+
+# Estensioni già compresse: nei zip vengono memorizzate senza ricomprimerle
+STORED_EXTENSIONS = {
+    ".jpg", ".jpeg", ".png", ".webp", ".gif", ".heic", ".mp4", ".mkv", ".webm", ".mov", ".avi",
+    ".mp3", ".m4a", ".ogg", ".oga", ".opus", ".zip", ".rar", ".7z", ".gz", ".zst", ".tgs",
+}
+
+def _check_format(fmt):
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato di esportazione non supportato: {fmt}")
+    if fmt == "tar.zst" and zstandard is None:
+        raise RuntimeError("Il formato tar.zst richiede il pacchetto zstandard (pip install zstandard)")
+
+def default_export_path(archive_path):
+    """Cartella di esportazione corrispondente a una cartella dell'archivio."""
+    relative = os.path.relpath(os.path.abspath(archive_path), os.path.abspath(ARCHIVE_DIR))
+    if relative.startswith(".."):
+        relative = os.path.basename(os.path.normpath(archive_path))
+    return os.path.join(EXPORT_DIR, relative)
+
+def load_index(export_path):
+    """
+    Legge l'indice di un'esportazione.
+
+    Returns:
+        dict: {nome del file: {"part", "size", "mtime_ns"}} (per ogni file la parte più recente)
+    """
+    items = {}
+    index_path = os.path.join(export_path, INDEX_FILE)
+    if not os.path.exists(index_path):
+        return items
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # Riga troncata da un'interruzione: la parte verrà riesportata
+                continue
+            items[entry.pop("name")] = entry
+    return items
+
+def part_files(export_path):
+    """Restituisce {numero: nome del file} delle parti presenti."""
+    parts = {}
+    if not os.path.isdir(export_path):
+        return parts
+    for file_name in os.listdir(export_path):
+        match = re.match(r"^part-(\d+)\.(zip|tar\.zst)$", file_name)
+        if match:
+            parts[int(match.group(1))] = file_name
+    return parts
+
+def scan_archive(archive_path):
+    """Elenca i file dell'archivio: {nome relativo: (percorso, dimensione, mtime_ns)}."""
+    files = {}
+    for root, dirs, names in os.walk(archive_path):
+        dirs.sort()
+        for name in sorted(names):
+            if name.endswith(SKIPPED_SUFFIXES):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            relative = os.path.relpath(path, archive_path).replace(os.sep, "/")
+            files[relative] = (path, stat.st_size, stat.st_mtime_ns)
+    return files
+
+def catalogue_entry(name, size):
+    """Voce del catalogo per un file esportato."""
+    # Il tipo è la prima cartella: le sottocartelle dipendono dalla disposizione (media_layout.py)
+    parts = name.split("/")
+    entry = {"name": name, "type": parts[0] if len(parts) > 1 else None, "size": size}
+    match = MEDIA_NAME.match(parts[-1])
+    if entry["type"] and match:
+        entry["date"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(int(match.group(1))))
+        entry["message_id"] = int(match.group(2))
+    return entry
+
+class _ZipPart:
+    def __init__(self, path):
+        self.file = zipfile.ZipFile(path, "w", allowZip64=True)
+
+    def add_file(self, path, name):
+        extension = os.path.splitext(name)[1].lower()
+        compression = zipfile.ZIP_STORED if extension in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+        self.file.write(path, name, compress_type=compression)
+        return self.file.getinfo(name).file_size
+
+    def add_bytes(self, name, data):
+        self.file.writestr(name, data, compress_type=zipfile.ZIP_DEFLATED)
+
+    def close(self):
+        self.file.close()
+
+class _TarZstPart:
+    def __init__(self, path):
+        self.raw = open(path, "wb")
+        self.stream = zstandard.ZstdCompressor(level=EXPORT_ZSTD_LEVEL, threads=-1).stream_writer(self.raw)
+        self.file = tarfile.open(fileobj=self.stream, mode="w|")
+
+    def add_file(self, path, name):
+        info = self.file.gettarinfo(path, arcname=name)
+        with open(path, "rb") as f:
+            self.file.addfile(info, f)
+        return info.size
+
+    def add_bytes(self, name, data):
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        self.file.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        self.file.close()
+        self.stream.close()
+        self.raw.close()
+
+def export_archive(archive_path, export_path=None, fmt=EXPORT_FORMAT, cancel_token=None):
+    """
+    Esporta in una nuova parte i file dell'archivio nuovi o modificati.
+
+    L'esportazione interrotta (cancel_token) chiude comunque la parte con i
+    file già scritti: la successiva riparte dai rimanenti.
+
+    Args:
+        archive_path: Cartella dell'archivio di un gruppo
+        export_path: Cartella di destinazione (predefinita: EXPORT_DIR/<utente>/<gruppo>)
+        fmt: "zip" o "tar.zst"
+        cancel_token: Token per interrompere l'esportazione tra due file
+
+    Returns:
+        dict: Riepilogo della parte creata, oppure None se non c'era niente da esportare
+    """
+    _check_format(fmt)
+    export_path = export_path or default_export_path(archive_path)
+    os.makedirs(export_path, exist_ok=True)
+
+    exported = load_index(export_path)
+    pending = [
+        (name, path, size, mtime_ns)
+        for name, (path, size, mtime_ns) in scan_archive(archive_path).items()
+        if name not in exported
+        or (exported[name].get("size"), exported[name].get("mtime_ns")) != (size, mtime_ns)
+    ]
+    if not pending:
+        log(f"📦 Nessun file nuovo da esportare in {export_path}")
+        return None
+
+    number = max(part_files(export_path), default=0) + 1
+    file_name = f"part-{number:04d}.{fmt}"
+    part_path = os.path.join(export_path, file_name)
+    temp_path = part_path + ".temp"
+    tracker = ProgressTracker("Esportazione archivio", total=len(pending))
+    written = []
+    catalogue = []
+
+    log(f"📦 Esportazione di {len(pending)} file in {part_path}")
+    part = _ZipPart(temp_path) if fmt == "zip" else _TarZstPart(temp_path)
+    try:
+        for name, path, size, mtime_ns in pending:
+            if is_cancelled(cancel_token):
+                log("🛑 Esportazione interrotta: i file rimanenti verranno esportati la prossima volta")
+                break
+            try:
+                size_written = part.add_file(path, name)
+            except FileNotFoundError:
+                # File rimosso dopo la scansione
+                continue
+            # Se il file è cresciuto durante la scrittura verrà riesportato la prossima volta
+            written.append({"name": name, "part": number, "size": size_written,
+                            "mtime_ns": mtime_ns if size_written == size else None})
+            if "/" in name:
+                catalogue.append(catalogue_entry(name, size_written))
+            tracker.update(messages=1, nbytes=size_written)
+
+        manifest = {
+            "part": number,
+            "format": fmt,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "source": os.path.abspath(archive_path),
+            "files": len(written),
+            "bytes": sum(entry["size"] for entry in written),
+            "media": len(catalogue),
+        }
+        part.add_bytes(f"{META_DIR}/catalogue-{number:04d}.jsonl",
+                       "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in catalogue).encode("utf-8"))
+        part.add_bytes(f"{META_DIR}/manifest-{number:04d}.json",
+                       json.dumps(manifest, indent=2, ensure_ascii=False).encode("utf-8"))
+        part.close()
+    except BaseException:
+        part.close()
+        os.remove(temp_path)
+        raise
+
+    if not written:
+        os.remove(temp_path)
+        return None
+
+    # La parte diventa visibile solo completa; l'indice viene aggiornato dopo
+    os.replace(temp_path, part_path)
+    with open(os.path.join(export_path, INDEX_FILE), "a", encoding="utf-8") as f:
+        for entry in written:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    tracker.emit()
+    log(f"✅ Esportati {manifest['files']} file ({manifest['bytes'] / 1048576:.1f} MB) in {part_path}")
+    return dict(manifest, path=part_path)
+
+async def export_group_archive(selected_group, fmt=EXPORT_FORMAT, cancel_token=None):
+    """Esporta l'archivio di un gruppo selezionato senza bloccare l'event loop."""
+    nickname = selected_group["user"]
+    group = selected_group["group"]
+    archive_path = path_resolver.group_dir(ARCHIVE_DIR, nickname, group["name"], chat_id=group["id"])
+    try:
+        return await asyncio.to_thread(export_archive, archive_path, None, fmt, cancel_token)
+    except Exception as e:
+        log_error(f"Errore durante l'esportazione dell'archivio: {e}")
+        return None
+
+class ExportReader:
+    """Lettura dei file di un'esportazione tramite l'indice."""
+
+    def __init__(self, export_path):
+        self.export_path = export_path
+        self.items = load_index(export_path)
+        self.parts = part_files(export_path)
+
+    def list(self, pattern=None):
+        """Restituisce [(nome, voce dell'indice)] ordinati per nome, filtrati con un pattern glob."""
+        return [(name, entry) for name, entry in sorted(self.items.items())
+                if pattern is None or fnmatch.fnmatch(name, pattern)]
+
+    def open(self, name):
+        """
+        Apre in lettura un file esportato (context manager con un oggetto file).
+
+        Raises:
+            KeyError: Se il file non è presente nell'esportazione
+        """
+        entry = self.items[name]
+        part_path = os.path.join(self.export_path, self.parts[entry["part"]])
+        if part_path.endswith(".zip"):
+            return _ZipMember(part_path, name)
+        return _TarZstMember(part_path, name)
+
+    def extract(self, name, output_dir="."):
+        """Estrae un file mantenendo il percorso relativo; restituisce il percorso creato."""
+        base = os.path.abspath(output_dir)
+        target = os.path.abspath(os.path.join(base, name))
+        # Il nome viene dall'indice: non deve uscire dalla cartella di destinazione
+        if target == base or os.path.commonpath([base, target]) != base:
+            raise ValueError(f"Percorso non valido: {name}")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with self.open(name) as source, open(target, "wb") as destination:
+            shutil.copyfileobj(source, destination, 1024 * 1024)
+        return target
+
+class _ZipMember:
+    def __init__(self, part_path, name):
+        self.archive = zipfile.ZipFile(part_path)
+        self.member = self.archive.open(name)
+
+    def __enter__(self):
+        return self.member
+
+    def __exit__(self, *exc_info):
+        self.member.close()
+        self.archive.close()
+
+class _TarZstMember:
+    def __init__(self, part_path, name):
+        if zstandard is None:
+            raise RuntimeError("La lettura dei file tar.zst richiede il pacchetto zstandard")
+        self.raw = open(part_path, "rb")
+        self.stream = zstandard.ZstdDecompressor().stream_reader(self.raw)
+        self.archive = tarfile.open(fileobj=self.stream, mode="r|")
+        # Lettura sequenziale: si ferma al file richiesto
+        for member in self.archive:
+            if member.name == name:
+                self.member = self.archive.extractfile(member)
+                return
+        self.__exit__()
+        raise KeyError(name)
+
+    def __enter__(self):
+        return self.member
+
+    def __exit__(self, *exc_info):
+        self.archive.close()
+        self.stream.close()
+        self.raw.close()
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Esportazione degli archivi in contenitori compressi")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser("export", help="Esporta i file nuovi di un archivio")
+    export_parser.add_argument("archive_path", help="Cartella dell'archivio (archive/<utente>/<gruppo>)")
+    export_parser.add_argument("--output", help="Cartella di esportazione")
+    export_parser.add_argument("--format", choices=FORMATS, default=EXPORT_FORMAT, help="Formato del contenitore")
+
+    list_parser = commands.add_parser("list", help="Elenca i file di un'esportazione")
+    list_parser.add_argument("export_path", help="Cartella dell'esportazione")
+    list_parser.add_argument("--pattern", help="Filtro glob (es. 'images/*')")
+
+    extract_parser = commands.add_parser("extract", help="Estrae uno o più file")
+    extract_parser.add_argument("export_path", help="Cartella dell'esportazione")
+    extract_parser.add_argument("names", nargs="+", help="File da estrarre (anche pattern glob)")
+    extract_parser.add_argument("--output", default=".", help="Cartella di destinazione")
+
+    args = parser.parse_args()
+    if args.command == "export":
+        result = export_archive(args.archive_path, args.output, args.format)
+        print(json.dumps(result, indent=2, ensure_ascii=False) if result else "Nessun file nuovo da esportare")
+    elif args.command == "list":
+        reader = ExportReader(args.export_path)
+        for name, entry in reader.list(args.pattern):
+            print(f"{entry['size']:>12}  parte {entry['part']:>4}  {name}")
+    else:
+        reader = ExportReader(args.export_path)
+        for pattern in args.names:
+            names = [name for name, _ in reader.list(pattern)] or [pattern]
+            for name in names:
+                try:
+                    print(f"✅ {reader.extract(name, args.output)}")
+                except KeyError:
+                    print(f"❌ {name} non presente nell'esportazione")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Thread con un event loop asyncio condiviso e di lunga durata.
+
+Invece di creare un nuovo event loop (con asyncio.run) per ogni operazione,
+la GUI invia le coroutine a questo loop e ottiene dei future. Le operazioni
+possono così condividere cache e client, e vengono annullate in modo
+cooperativo (CancelledError nel task) invece di terminare un thread.
+"""
+
+import asyncio
+import threading
+import weakref
+
+from event_bus import operation_context
+
+class AsyncLoopThread:
+    """Esegue un event loop asyncio in un thread dedicato."""
+
+    def __init__(self, name="asyncio-loop"):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._tasks = weakref.WeakKeyDictionary()  # {future: stato del task (vedi cancel)}
+
+    @property
+    def loop(self):
+        """Restituisce il loop, avviando il thread se necessario."""
+        self.start()
+        return self._loop
+
+    def is_running(self):
+        """Verifica se il thread del loop è attivo."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Avvia il thread del loop se non è già in esecuzione."""
+        with self._lock:
+            if self.is_running():
+                return
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        self._ready.wait()
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            # Annulla i task rimasti e lascia che gestiscano la cancellazione
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def submit(self, coro, operation_id=None):
+        """
+        Invia una coroutine al loop condiviso.
+
+        Args:
+            coro: La coroutine da eseguire
+            operation_id: ID dell'operazione con cui etichettare i messaggi emessi
+
+        Returns:
+            future: concurrent.futures.Future con il risultato; cancel(future)
+                    annulla il task nel loop in modo cooperativo
+        """
+        state = {"task": None, "cancelled": False}
+
+        async def _run_in_context():
+            state["task"] = asyncio.current_task()
+            if state["cancelled"]:
+                coro.close()
+                raise asyncio.CancelledError()
+            with operation_context(operation_id):
+                return await coro
+
+        future = asyncio.run_coroutine_threadsafe(_run_in_context(), self.loop)
+        self._tasks[future] = state
+        return future
+
+    def cancel(self, future):
+        """
+        Annulla il task di un future restituito da submit.
+
+        A differenza di future.cancel(), che segna subito il future come annullato,
+        il future si completa (annullato) solo quando il task ha finito di gestire
+        la cancellazione: chi attende la sua fine vede la chiusura reale.
+        """
+        state = self._tasks.get(future)
+        if state is None or future.done():
+            return
+
+        def _cancel():
+            state["cancelled"] = True
+            if state["task"] is not None:
+                state["task"].cancel()
+
+        self.loop.call_soon_threadsafe(_cancel)
+
+    def stop(self, timeout=1.0):
+        """Ferma il loop (annullando i task rimasti) e attende la fine del thread."""
+        with self._lock:
+            if not self.is_running():
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            thread = self._thread
+        thread.join(timeout)
+
+# Istanza singleton condivisa da tutta la GUI
+loop_thread = AsyncLoopThread()
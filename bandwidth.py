@@ -0,0 +1,292 @@
+"""
+Limiti di banda e di download contemporanei.
+
+I limiti si trovano in bandwidth_limits.json (facoltativo; senza file nessun
+limite) e vengono riletti quando il file cambia, anche a operazioni avviate:
+
+    {
+        "global_kbps": 0,              banda complessiva (KB/s, 0 = nessun limite)
+        "max_concurrency": 0,          download contemporanei complessivi (0 = nessun limite)
+        "classes": {                   limiti per tipo di operazione (operation_type dei client)
+            "archive": {"kbps": 2048, "concurrency": 2}
+        },
+        "accounts": {                  limiti per account
+            "nickname": {"kbps": 1024}
+        }
+    }
+
+Ogni limite è un secchio di token: la banda viene conteggiata dopo ogni
+blocco scaricato (progress_callback di Telethon) e il download attende se ha
+superato la propria quota. Le classi prioritarie (BANDWIDTH_PRIORITY_CLASSES,
+il monitoraggio) consumano subito la banda e attendono solo il proprio
+debito; le altre, come gli archivi, aspettano che nel secchio globale resti
+libera la riserva del monitoraggio finché questo ha scaricato qualcosa di
+recente. Gli archivi usano così la banda lasciata libera senza rallentare i
+download in tempo reale.
+
+I limiti sono applicati da ogni processo per conto proprio. Con il
+monitoraggio su più processi (MONITOR_WORKERS, monitor_supervisor.py) i limiti
+globali e quelli per tipo di operazione, banda e download contemporanei, sono
+divisi in parti uguali tra i processi del monitoraggio e il processo
+principale (che scarica gli archivi): il totale non supera il limite, ma ogni
+processo usa solo la propria parte anche quando gli altri sono inattivi, e
+ogni processo ha comunque almeno un download contemporaneo. I limiti per
+account non vengono divisi: ogni account è gestito da un solo processo.
+L'istante dell'ultimo download del monitoraggio è invece condiviso
+(share_priority_clock): la riserva scatta anche per gli archivi del processo
+principale quando il monitoraggio scarica in un altro processo.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+
+from config import (
+    BANDWIDTH_FILE, BANDWIDTH_PRIORITY_CLASSES, BANDWIDTH_RESERVE, BANDWIDTH_PRIORITY_WINDOW,
+    BANDWIDTH_BURST_SECONDS, BANDWIDTH_RELOAD_INTERVAL
+)
+from event_bus import log
+from metrics import metrics
+from utils import load_json, save_json
+
+DEFAULT_LIMITS = {
+    "global_kbps": 0,
+    "max_concurrency": 0,
+    "classes": {},
+    "accounts": {},
+}
+
+class TokenBucket:
+    """Secchio di token in byte al secondo (rate 0 = nessun limite)."""
+
+    def __init__(self, rate=0):
+        self.rate = 0
+        self.burst = 0
+        self.tokens = 0
+        self.updated = time.monotonic()
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        self.refill()
+        burst = rate * BANDWIDTH_BURST_SECONDS
+        # Un secchio appena limitato parte pieno, uno già limitato conserva il debito
+        self.tokens = min(self.tokens, burst) if self.rate else burst
+        self.rate = rate
+        self.burst = burst
+
+    def refill(self, now=None):
+        now = now or time.monotonic()
+        if self.rate:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount, floor=0.0):
+        """Secondi prima che si possano prelevare amount byte lasciandone almeno floor."""
+        if not self.rate:
+            return 0.0
+        # Un blocco più grande del secchio passa quando il secchio è pieno
+        needed = floor + min(amount, self.burst - floor)
+        return max(needed - self.tokens, 0.0) / self.rate
+
+    def debt_time(self):
+        """Secondi necessari per ripagare i token prelevati in anticipo."""
+        if not self.rate or self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def consume(self, amount):
+        if self.rate:
+            self.tokens -= amount
+
+class BandwidthGovernor:
+    """Applica i limiti di banda e di concorrenza ai download del processo."""
+
+    def __init__(self, limits_file=BANDWIDTH_FILE):
+        self.limits_file = limits_file
+        self.limits = dict(DEFAULT_LIMITS)
+        self.share = 1.0  # Quota dei limiti globali assegnata a questo processo
+        self._global = TokenBucket()
+        self._buckets = {}  # {("class"|"account", nome): TokenBucket}
+        self._active = {}   # {chiave di concorrenza: download in corso}
+        self._priority_waiting = 0
+        self._last_priority = 0.0
+        self._priority_clock = None  # multiprocessing.Value condiviso tra i processi (time.time())
+        self._clock_written = float("-inf")
+        self._lock = threading.Lock()
+        self._file_mtime = None
+        self._checked = 0.0
+
+    def configure(self, limits):
+        """Applica nuovi limiti (a runtime: valgono anche per i download in corso)."""
+        limits = dict(DEFAULT_LIMITS, **(limits or {}))
+        with self._lock:
+            self.limits = limits
+            self._global.set_rate(limits["global_kbps"] * 1024 * self.share)
+            for (kind, name), bucket in self._buckets.items():
+                bucket.set_rate(self._rate(kind, name))
+
+    def set_share(self, share):
+        """Assegna a questo processo una quota dei limiti globali (es. 1/numero di processi)."""
+        self.share = share
+        self.configure(self.limits)
+
+    def share_priority_clock(self, clock):
+        """
+        Condivide con gli altri processi l'istante dell'ultimo download prioritario.
+
+        Args:
+            clock: multiprocessing.Value("d") creato dal supervisore, oppure None
+        """
+        self._priority_clock = clock
+
+    def _priority_recent(self, now):
+        if now - self._last_priority < BANDWIDTH_PRIORITY_WINDOW:
+            return True
+        clock = self._priority_clock
+        return clock is not None and time.time() - clock.value < BANDWIDTH_PRIORITY_WINDOW
+
+    def save_limits(self, limits):
+        """Salva i limiti nel file (letto anche dagli altri processi) e li applica."""
+        save_json(self.limits_file, limits)
+        self.configure(limits)
+        log("🚦 Limiti di banda aggiornati")
+
+    def reload_if_changed(self):
+        """Rilegge il file dei limiti se è cambiato (al massimo ogni BANDWIDTH_RELOAD_INTERVAL)."""
+        now = time.monotonic()
+        if now - self._checked < BANDWIDTH_RELOAD_INTERVAL:
+            return
+        self._checked = now
+        try:
+            mtime = os.path.getmtime(self.limits_file)
+        except OSError:
+            mtime = None
+        if mtime == self._file_mtime:
+            return
+        self._file_mtime = mtime
+        self.configure(load_json(self.limits_file) if mtime else {})
+
+    def _settings(self, kind, name):
+        group = self.limits["classes"] if kind == "class" else self.limits["accounts"]
+        return group.get(name) or {}
+
+    def _rate(self, kind, name):
+        rate = self._settings(kind, name).get("kbps", 0) * 1024
+        # Le classi sono condivise tra i processi, gli account no
+        return rate * self.share if kind == "class" else rate
+
+    def _bucket(self, kind, name):
+        bucket = self._buckets.get((kind, name))
+        if bucket is None:
+            bucket = self._buckets[(kind, name)] = TokenBucket(self._rate(kind, name))
+        return bucket
+
+    async def acquire(self, amount, account=None, operation_class=None):
+        """
+        Conteggia amount byte scaricati e attende se superano i limiti.
+
+        Args:
+            amount: Byte ricevuti dall'ultimo controllo
+            account: Nickname dell'account che scarica
+            operation_class: Tipo di operazione (es. "monitoring", "archive")
+        """
+        if amount <= 0:
+            return
+        self.reload_if_changed()
+        priority = operation_class in BANDWIDTH_PRIORITY_CLASSES
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                buckets = [self._global, self._bucket("class", operation_class), self._bucket("account", account)]
+                for bucket in buckets:
+                    bucket.refill(now)
+                if priority:
+                    # Il monitoraggio preleva subito e attende solo il proprio debito
+                    if self._priority_clock is not None and now - self._clock_written >= 1:
+                        # Al massimo una scrittura al secondo nella memoria condivisa
+                        self._priority_clock.value = time.time()
+                        self._clock_written = now
+                    self._last_priority = now
+                    for bucket in buckets:
+                        bucket.consume(amount)
+                    wait = max(bucket.debt_time() for bucket in buckets)
+                else:
+                    # Gli altri attendono che resti libera la riserva per il monitoraggio
+                    reserve = 0.0
+                    if self._priority_recent(now):
+                        reserve = self._global.burst * BANDWIDTH_RESERVE
+                    wait = max(self._global.wait_time(amount, reserve),
+                               buckets[1].wait_time(amount), buckets[2].wait_time(amount))
+                    if not wait:
+                        for bucket in buckets:
+                            bucket.consume(amount)
+            if wait:
+                await asyncio.sleep(wait)
+                waited += wait
+            if priority or not wait:
+                break
+        if waited:
+            metrics.inc("bandwidth_wait_seconds", round(waited, 3), operation=operation_class or "other")
+
+    def _concurrency_keys(self, account, operation_class):
+        keys = []
+        if self.limits["max_concurrency"]:
+            keys.append(("global", None, self._shared(self.limits["max_concurrency"])))
+        for kind, name in (("class", operation_class), ("account", account)):
+            limit = self._settings(kind, name).get("concurrency", 0)
+            if limit:
+                keys.append((kind, name, self._shared(limit) if kind == "class" else limit))
+        return keys
+
+    def _shared(self, limit):
+        """Quota di questo processo di un limite di download contemporanei (almeno uno)."""
+        return max(1, int(limit * self.share))
+
+    def _try_take_slot(self, keys, priority):
+        with self._lock:
+            if not priority and self._priority_waiting:
+                return False
+            if any(self._active.get((kind, name), 0) >= limit for kind, name, limit in keys):
+                return False
+            for kind, name, _ in keys:
+                self._active[(kind, name)] = self._active.get((kind, name), 0) + 1
+            return True
+
+    @asynccontextmanager
+    async def slot(self, account=None, operation_class=None):
+        """Attende un posto libero tra i download contemporanei consentiti."""
+        self.reload_if_changed()
+        keys = self._concurrency_keys(account, operation_class)
+        priority = operation_class in BANDWIDTH_PRIORITY_CLASSES
+        if keys and not self._try_take_slot(keys, priority):
+            if priority:
+                with self._lock:
+                    self._priority_waiting += 1
+            try:
+                while not self._try_take_slot(keys, priority):
+                    await asyncio.sleep(0.1)
+            finally:
+                if priority:
+                    with self._lock:
+                        self._priority_waiting -= 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                for kind, name, _ in keys:
+                    self._active[(kind, name)] -= 1
+
+    def status(self):
+        """Riepilogo dei limiti e dei download in corso."""
+        with self._lock:
+            return {
+                "global_kbps": self._global.rate / 1024,
+                "active": {f"{kind}:{name}" if name else kind: count
+                           for (kind, name), count in self._active.items() if count},
+            }
+
+# Istanza singleton condivisa da tutto il processo
+bandwidth_governor = BandwidthGovernor()
@@ -0,0 +1,76 @@
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+# Budget per l'import di gui.py (millisecondi, valore cumulativo riportato da -X importtime)
+DEFAULT_BUDGET_MS = 250
+
+# Moduli pesanti che non devono essere caricati prima che la finestra sia visibile
+FORBIDDEN_MODULES = ["telethon", "emoji", "user_management", "group_management",
+                     "media_handler", "event_handler"]
+
+def measure(module):
+    """
+    Importa il modulo in un nuovo interprete con -X importtime.
+
+    Returns:
+        (cumulativo_ms, {modulo: cumulativo_ms}) per tutti i moduli importati
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.abspath(__file__)) + os.pathsep + env.get("PYTHONPATH", "")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env
+    )
+    if result.returncode != 0:
+        print(result.stderr)
+        raise RuntimeError(f"Import di {module} non riuscito")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # Formato: "import time: <self us> | <cumulative us> | <indentazione><modulo>"
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative_us) / 1000
+    return modules[module], modules
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del tempo di import della GUI")
+    parser.add_argument("--module", default="gui", help="Modulo da importare")
+    parser.add_argument("--runs", type=int, default=5, help="Numero di misurazioni")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Budget massimo (mediana)")
+    parser.add_argument("--top", type=int, default=10, help="Numero di moduli più lenti da mostrare")
+    args = parser.parse_args()
+
+    timings = []
+    modules = {}
+    for _ in range(args.runs):
+        total, modules = measure(args.module)
+        timings.append(total)
+
+    median = statistics.median(timings)
+    print(f"Import di {args.module}: mediana {median:.1f} ms "
+          f"(min {min(timings):.1f}, max {max(timings):.1f}, {args.runs} esecuzioni)\n")
+
+    print("Moduli più lenti (cumulativo, ultima esecuzione):")
+    slowest = sorted(((ms, name) for name, ms in modules.items() if name != args.module), reverse=True)
+    for ms, name in slowest[:args.top]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    failed = False
+    loaded = sorted(name for name in FORBIDDEN_MODULES if name in modules)
+    if loaded:
+        print(f"\n❌ Moduli pesanti caricati all'avvio: {', '.join(loaded)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"\n❌ Budget superato: {median:.1f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print(f"\n✅ Entro il budget di {args.budget_ms:.0f} ms")
+
+if __name__ == "__main__":
+    main()
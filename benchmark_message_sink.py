@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from datetime import datetime
+from types import SimpleNamespace
+
+from utils import sanitize_group_name
+from message_sink import MessageSinkRegistry, format_text_line
+from message_schema import iter_records
+
+def make_messages(count, groups):
+    """Genera messaggi sintetici distribuiti su più gruppi."""
+    date = datetime(2024, 1, 1, 12, 0, 0)
+    messages = []
+    for i in range(count):
+        message = SimpleNamespace(
+            id=i + 1,
+            date=date,
+            sender_id=1000 + i % 50,
+            text=f"Messaggio di prova numero {i} 🎉 con un po' di testo",
+            message=None,
+        )
+        messages.append((f"Gruppo {i % groups} 🚀", message))
+    return messages
+
+def write_unbuffered(base_dir, messages):
+    """Vecchio comportamento: makedirs, sanitizzazione e open/close per ogni messaggio."""
+    for group_name, message in messages:
+        # __wrapped__ esclude la cache, per riprodurre il costo della sanitizzazione per messaggio
+        group_dir = os.path.join(base_dir, "bench", sanitize_group_name.__wrapped__(group_name))
+        os.makedirs(group_dir, exist_ok=True)
+        with open(os.path.join(group_dir, "messages.txt"), 'a', encoding='utf-8') as f:
+            f.write(format_text_line(message, "User_1"))
+
+def write_buffered(base_dir, messages, formats):
+    """Nuovo comportamento: un sink per gruppo con scrittura a blocchi."""
+    registry = MessageSinkRegistry(formats)
+    for group_name, message in messages:
+        registry.get(base_dir, "bench", group_name).write(message, "User_1")
+    registry.close()
+
+def read_records(base_dir, file_name):
+    """Rilegge in streaming tutti i record scritti, come farebbe uno strumento esterno."""
+    count = 0
+    for entry in os.scandir(os.path.join(base_dir, "bench")):
+        if not entry.is_dir():
+            continue
+        for _ in iter_records(os.path.join(entry.path, file_name)):
+            count += 1
+    return count
+
+def run(label, func, *args):
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.3f} s")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark della scrittura dei messaggi di testo")
+    parser.add_argument("--messages", type=int, default=50000, help="Numero di messaggi sintetici")
+    parser.add_argument("--groups", type=int, default=10, help="Numero di gruppi")
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages, args.groups)
+    print(f"Benchmark su {args.messages} messaggi in {args.groups} gruppi\n")
+
+    work_dir = tempfile.mkdtemp(prefix="bench_sink_")
+    try:
+        old = run("open/append per messaggio", write_unbuffered, os.path.join(work_dir, "old"), messages)
+        new = run("sink bufferizzato (txt)", write_buffered, os.path.join(work_dir, "new"), messages, ("text",))
+        run("sink bufferizzato (txt + jsonl)", write_buffered, os.path.join(work_dir, "both"), messages, ("text", "jsonl"))
+        run("sink bufferizzato (txt + jsonl.gz)", write_buffered, os.path.join(work_dir, "gz"), messages, ("text", "jsonl.gz"))
+        run("lettura di messages.jsonl", read_records, os.path.join(work_dir, "both"), "messages.jsonl")
+        run("lettura di messages.jsonl.gz", read_records, os.path.join(work_dir, "gz"), "messages.jsonl.gz")
+
+        # Verifica che il contenuto prodotto sia identico
+        for group in os.listdir(os.path.join(work_dir, "old", "bench")):
+            with open(os.path.join(work_dir, "old", "bench", group, "messages.txt"), encoding='utf-8') as f:
+                old_content = f.read()
+            with open(os.path.join(work_dir, "new", "bench", group, "messages.txt"), encoding='utf-8') as f:
+                new_content = f.read()
+            if old_content != new_content:
+                print(f"❌ Contenuto diverso per il gruppo {group}")
+                sys.exit(1)
+
+        print(f"\nAccelerazione: {old / new:.1f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
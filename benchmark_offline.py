@@ -0,0 +1,247 @@
+"""
+Benchmark offline di archivio, monitoraggio e recupero gruppi.
+
+Usa il client finto di fake_telegram.py al posto di TelegramClient: nessun
+account reale è necessario. Ogni scenario riporta throughput, percentili di
+latenza e memoria; i risultati si possono salvare in JSON e confrontare con
+quelli di un commit precedente:
+
+    python benchmark_offline.py --save prima.json
+    python benchmark_offline.py --compare prima.json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+
+# I moduli dell'applicazione usano percorsi relativi alla directory di lavoro
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import client_tracking
+from event_bus import event_bus
+from fake_telegram import FakeTelegramClient, FakeWorld
+
+SCENARIOS = ("archive", "monitor", "groups")
+
+class RecordingClient(FakeTelegramClient):
+    """Client finto che tiene traccia delle istanze create dall'applicazione."""
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created = time.perf_counter()
+        self.closed = None
+        RecordingClient.instances.append(self)
+
+    async def disconnect(self):
+        self.closed = time.perf_counter()
+        await super().disconnect()
+
+def percentiles(values):
+    """Percentili in millisecondi di una lista di durate in secondi."""
+    if not values:
+        return {}
+    values = sorted(values)
+    if len(values) == 1:
+        values = values * 2
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p90_ms": round(cuts[89] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2),
+    }
+
+def peak_rss_mb():
+    """Memoria massima del processo (MB), se disponibile sulla piattaforma."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Su macOS il valore è in byte, su Linux in KB
+    return round(rss / (1048576 if sys.platform == "darwin" else 1024), 1)
+
+async def run_archive(world, args):
+    from media_handler import download_group_archive
+    group_id = world.group_ids()[0]
+    selected = {"user": "bench", "group": {"id": group_id, "name": world.channel(group_id).title}}
+
+    RecordingClient.instances = []
+    result = await download_group_archive(selected, operation_id="bench_archive")
+    client = RecordingClient.instances[0]
+    times = client.yield_times
+    elapsed = times[-1] - times[0] if len(times) > 1 else 0
+    return {
+        "ok": bool(result),
+        "messages": len(times),
+        "seconds": round(elapsed, 3),
+        "messages_per_s": round(len(times) / elapsed, 1) if elapsed else None,
+        "MB_per_s": round(client.downloaded_bytes / 1048576 / elapsed, 2) if elapsed else None,
+        "latency": percentiles([b - a for a, b in zip(times, times[1:])]),
+    }
+
+async def run_monitor(world, args):
+    from event_handler import handle_event
+    from message_sink import message_sinks
+    from config import DOWNLOADS_DIR
+
+    client = client_tracking.create_client("bench_monitor", "bench", "monitoring")
+    await client.start()
+    bot_entity = await client.get_me()
+    events = list(client.new_message_events(args.events))
+    durations = []
+
+    async def handle(event):
+        # Come Telethon: un task per ogni aggiornamento
+        start = time.perf_counter()
+        await handle_event(client, bot_entity, event, "bench")
+        durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    tasks = []
+    for event in events:
+        tasks.append(asyncio.ensure_future(handle(event)))
+        if args.rate:
+            await asyncio.sleep(1 / args.rate)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    message_sinks.close(DOWNLOADS_DIR, "bench")
+    await client.disconnect()
+    return {
+        "events": len(events),
+        "seconds": round(elapsed, 3),
+        "events_per_s": round(len(events) / elapsed, 1),
+        "MB_per_s": round(client.downloaded_bytes / 1048576 / elapsed, 2),
+        "latency": percentiles(durations),
+    }
+
+async def run_groups(world, args):
+    from group_management import get_all_user_groups
+    from config import PHONE_NUMBERS_FILE
+    with open(PHONE_NUMBERS_FILE, "w", encoding="utf-8") as f:
+        json.dump({f"bench{index}": f"+39000000{index:04d}" for index in range(args.accounts)}, f)
+
+    RecordingClient.instances = []
+    start = time.perf_counter()
+    result = await get_all_user_groups()
+    elapsed = time.perf_counter() - start
+    dialogs = args.accounts * world.groups
+    lifetimes = [client.closed - client.created for client in RecordingClient.instances if client.closed]
+    return {
+        "ok": bool(result),
+        "accounts": args.accounts,
+        "dialogs": dialogs,
+        "seconds": round(elapsed, 3),
+        "dialogs_per_s": round(dialogs / elapsed, 1),
+        "latency": percentiles(lifetimes),
+    }
+
+RUNNERS = {"archive": run_archive, "monitor": run_monitor, "groups": run_groups}
+
+def run_scenario(name, world, args):
+    """Esegue uno scenario in una directory di lavoro vuota."""
+    errors = []
+    token = event_bus.subscribe(lambda event: errors.append(event.message), kinds=["log"], min_level="error")
+    if args.tracemalloc:
+        tracemalloc.start()
+    try:
+        result = asyncio.run(RUNNERS[name](world, args))
+    finally:
+        event_bus.unsubscribe(token)
+    if args.tracemalloc:
+        result["tracemalloc_peak_MB"] = round(tracemalloc.get_traced_memory()[1] / 1048576, 1)
+        tracemalloc.stop()
+    result["errors"] = len(errors)
+    return result
+
+def current_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+def flatten(results, prefix=""):
+    values = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            values.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[prefix + key] = value
+    return values
+
+def compare(previous, current):
+    """Stampa le differenze percentuali rispetto a un'esecuzione salvata."""
+    print(f"\nConfronto con {previous.get('commit') or 'esecuzione salvata'}:")
+    old, new = flatten(previous["scenarios"]), flatten(current["scenarios"])
+    for key in sorted(new):
+        if key not in old or not old[key]:
+            continue
+        delta = (new[key] - old[key]) / old[key] * 100
+        print(f"  {key:40} {old[key]:>10} → {new[key]:>10}  ({delta:+.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline con un client Telegram finto")
+    parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all", help="Scenario da eseguire")
+    parser.add_argument("--messages", type=int, default=2000, help="Messaggi nella cronologia di ogni gruppo")
+    parser.add_argument("--events", type=int, default=500, help="Eventi NewMessage per lo scenario monitor")
+    parser.add_argument("--rate", type=float, default=0, help="Eventi al secondo (0 = tutti insieme)")
+    parser.add_argument("--accounts", type=int, default=4, help="Account per lo scenario groups")
+    parser.add_argument("--groups", type=int, default=200, help="Gruppi per account")
+    parser.add_argument("--media-ratio", type=float, default=0.3, help="Frazione di messaggi con media")
+    parser.add_argument("--media-kb", type=int, default=256, help="Dimensione media dei file (KB)")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Latenza di ogni richiesta (ms)")
+    parser.add_argument("--bandwidth-mbps", type=float, default=80, help="Banda dei download (Mbit/s, 0 = illimitata)")
+    parser.add_argument("--tracemalloc", action="store_true", help="Misura il picco di memoria allocata (più lento)")
+    parser.add_argument("--save", help="Salva i risultati in un file JSON")
+    parser.add_argument("--compare", help="Confronta con i risultati salvati in un file JSON")
+    parser.add_argument("--keep", action="store_true", help="Non eliminare la directory di lavoro")
+    args = parser.parse_args()
+
+    world = FakeWorld(groups=args.groups, messages_per_group=args.messages, media_ratio=args.media_ratio,
+                      media_size=args.media_kb * 1024, rpc_latency=args.latency_ms / 1000,
+                      download_latency=args.latency_ms / 1000, bandwidth=args.bandwidth_mbps * 1024 * 1024 / 8)
+    RecordingClient.world = world
+    client_tracking.set_client_class(RecordingClient)
+
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    results = {"commit": current_commit(), "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+               "parameters": vars(args), "scenarios": {}}
+
+    original_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="benchmark_offline_")
+    os.chdir(work_dir)
+    try:
+        for name in scenarios:
+            print(f"▶️ Scenario {name}...")
+            results["scenarios"][name] = result = run_scenario(name, world, args)
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+    finally:
+        os.chdir(original_dir)
+        if args.keep:
+            print(f"📁 Directory di lavoro: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    results["peak_rss_MB"] = peak_rss_mb()
+    print(f"\nMemoria massima del processo: {results['peak_rss_MB']} MB")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"💾 Risultati salvati in {args.save}")
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare(json.load(f), results)
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,7 @@ def build_executable(icon_path=None, name="TelegramMediaDownloader", version="1.
     include_files = [
         ".env",  # File di configurazione
         "README.md",  # Documentazione
+        "icon.png",  # Icona della finestra (caricata da gui.load_icon)
     ]
     
     # Cartelle da creare nel pacchetto
@@ -4,6 +4,12 @@ Utility per tenere traccia dei client attivi e diagnosticare problemi di disconn
 Questo modulo implementa un sistema di tracciamento globale per tutti i client Telegram
 che vengono creati nell'applicazione, permettendo di identificare e risolvere
 problemi di disconnessione involontaria.
+
+I client vanno creati con create_client: vengono registrati automaticamente e
+aggiornano in tempo reale i propri contatori (byte scaricati, messaggi
+elaborati, richieste RPC e relativi tempi, attese per FloodWait, riconnessioni).
+La scheda Istanze della GUI legge da qui lo stato dei client; gli stessi
+contatori finiscono nelle metriche per account (metrics.py).
 """
 
 import weakref
@@ -11,12 +17,49 @@ import threading
 import time
 from datetime import datetime
 
+from event_bus import log
+from metrics import metrics, StageTimer, BUCKETS
+
 # Dizionario che traccia tutti i client attivi
 # Utilizziamo weakref.WeakValueDictionary per non impedire la garbage collection
 active_clients = weakref.WeakValueDictionary()
 client_operations = {}  # Mappa client_id -> operation_info
 client_lock = threading.RLock()  # Lock per sincronizzare l'accesso ai dizionari
 
+# Contatori di ogni client
+COUNTERS = ("bytes_downloaded", "messages", "rpc_calls", "rpc_errors", "flood_wait_seconds", "reconnects")
+MAX_FINISHED = 100  # Client disconnessi conservati per la diagnostica
+
+# Classe usata da create_client (sostituibile, ad esempio con un client finto nei benchmark)
+_client_class = None
+
+def set_client_class(client_class):
+    """Imposta la classe dei client creati da create_client (None per quella predefinita)."""
+    global _client_class
+    _client_class = client_class
+
+def create_client(session_path, nickname, operation_type, operation_id=None, **kwargs):
+    """
+    Crea un client Telegram già registrato nel sistema di tracciamento.
+    
+    Args:
+        session_path: Percorso della sessione senza estensione .session
+        nickname: Nickname dell'utente associato
+        operation_type: Tipo di operazione (es. "monitoring", "archive")
+        operation_id: ID dell'operazione associata (se disponibile)
+        kwargs: Parametri aggiuntivi per il client
+    """
+    from config import API_ID, API_HASH
+    client_class = _client_class
+    if client_class is None:
+        from client_wrapper import TrackedTelegramClient
+        client_class = TrackedTelegramClient
+    kwargs.setdefault("connection_retries", 10)
+    kwargs.setdefault("retry_delay", 3)
+    client = client_class(session_path, API_ID, API_HASH, **kwargs)
+    register_client(client, operation_type, nickname, operation_id)
+    return client
+
 def register_client(client, operation_type, nickname, operation_id=None):
     """
     Registra un nuovo client nel sistema di tracciamento.
@@ -39,10 +82,12 @@ def register_client(client, operation_type, nickname, operation_id=None):
             "nickname": nickname,
             "operation_id": operation_id,
             "start_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "status": "active"
+            "status": "active",
+            "rpc_latency": StageTimer(),
+            **{name: 0 for name in COUNTERS}
         }
     
-    print(f"[TRACCIAMENTO] Client registrato: {client_id} - {operation_type} - {nickname}")
+    log(f"[TRACCIAMENTO] Client registrato: {client_id} - {operation_type} - {nickname}", level="debug")
     return client_id
 
 def unregister_client(client):
@@ -60,29 +105,108 @@ def unregister_client(client):
         
         if client_id in client_operations:
             operation_info = client_operations[client_id]
-            print(f"[TRACCIAMENTO] Client rimosso: {client_id} - {operation_info['operation_type']} - {operation_info['nickname']}")
+            if operation_info["status"] == "disconnected":
+                return
+            log(f"[TRACCIAMENTO] Client rimosso: {client_id} - {operation_info['operation_type']} - {operation_info['nickname']}", level="debug")
             operation_info["status"] = "disconnected"
             operation_info["end_time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
+            # Conserva solo gli ultimi client disconnessi
+            finished = [cid for cid, info in client_operations.items() if info["status"] == "disconnected"]
+            for cid in finished[:-MAX_FINISHED]:
+                del client_operations[cid]
+
+def get_client_labels(client):
+    """Restituisce (nickname, operation_type) di un client registrato, altrimenti (None, None)."""
+    with client_lock:
+        info = client_operations.get(id(client))
+        if info is None or id(client) not in active_clients:
+            return None, None
+        return info["nickname"], info["operation_type"]
+
+def track(client, **counters):
+    """
+    Aggiorna i contatori di un client (es. track(client, messages=1)).
+    
+    I client non registrati vengono ignorati; i contatori vengono riportati
+    anche nelle metriche, per account.
+    """
+    with client_lock:
+        info = client_operations.get(id(client))
+        if info is None or id(client) not in active_clients:
+            return
+        for name, value in counters.items():
+            info[name] = info.get(name, 0) + value
+        nickname = info["nickname"]
+    for name, value in counters.items():
+        metrics.inc(name, value, account=nickname)
+
+def observe_rpc(client, seconds):
+    """Registra la durata di una richiesta RPC di un client."""
+    with client_lock:
+        info = client_operations.get(id(client))
+        if info is not None and id(client) in active_clients:
+            info["rpc_latency"].observe(seconds)
+
+def _percentile(timer, fraction):
+    """Stima un percentile dall'istogramma (limite superiore della fascia)."""
+    if not timer.count:
+        return 0.0
+    target = timer.count * fraction
+    seen = 0
+    for bound, bucket in zip(BUCKETS, timer.buckets):
+        seen += bucket
+        if seen >= target:
+            return bound
+    return timer.max
+
+def _describe(client_id, info, client=None):
+    timer = info["rpc_latency"]
+    description = {key: value for key, value in info.items() if key != "rpc_latency"}
+    description["client_id"] = client_id
+    description["is_connected"] = client.is_connected() if client is not None else False
+    description["rpc_avg_ms"] = round(timer.total / timer.count * 1000, 1) if timer.count else 0.0
+    description["rpc_p95_ms"] = round(_percentile(timer, 0.95) * 1000, 1)
+    description["rpc_max_ms"] = round(timer.max * 1000, 1)
+    return description
 
 def get_active_clients():
     """
     Restituisce informazioni su tutti i client attualmente attivi.
     
     Returns:
-        clients_info: Lista di dizionari con informazioni sui client attivi
+        clients_info: Lista di dizionari con informazioni e contatori dei client attivi
     """
     clients_info = []
     
     with client_lock:
         for client_id, client in active_clients.items():
             if client_id in client_operations:
-                info = client_operations[client_id].copy()
-                info["client_id"] = client_id
-                info["is_connected"] = client.is_connected()
-                clients_info.append(info)
+                clients_info.append(_describe(client_id, client_operations[client_id], client))
     
     return clients_info
 
+def get_operations():
+    """
+    Raggruppa i contatori dei client (attivi e disconnessi) per operazione.
+    
+    Returns:
+        dict: {operation_id: {"operation_type", "clients", "active", contatori...}}
+    """
+    operations = {}
+    with client_lock:
+        for client_id, info in client_operations.items():
+            key = info["operation_id"] or info["operation_type"]
+            operation = operations.setdefault(key, {
+                "operation_type": info["operation_type"], "clients": 0, "active": 0,
+                **{name: 0 for name in COUNTERS}
+            })
+            operation["clients"] += 1
+            operation["active"] += client_id in active_clients
+            for name in COUNTERS:
+                operation[name] += info.get(name, 0)
+    return operations
+
 def print_client_status():
     """Stampa lo stato di tutti i client attivi."""
     clients = get_active_clients()
@@ -99,6 +223,10 @@ def print_client_status():
         print(f"  Operazione: {client['operation_id']}")
         print(f"  Avviato: {client['start_time']}")
         print(f"  Stato: {'Connesso' if client['is_connected'] else 'Disconnesso'}")
+        print(f"  Messaggi: {client['messages']} | Scaricati: {client['bytes_downloaded'] / 1048576:.1f} MB")
+        print(f"  RPC: {client['rpc_calls']} (errori: {client['rpc_errors']}) | "
+              f"Latenza media: {client['rpc_avg_ms']} ms, p95: {client['rpc_p95_ms']} ms")
+        print(f"  FloodWait: {client['flood_wait_seconds']} s | Riconnessioni: {client['reconnects']}")
         print("--------------------------")
 
 def debug_client_operations(client_id=None):
@@ -112,7 +240,7 @@ def debug_client_operations(client_id=None):
         if client_id:
             if client_id in client_operations:
                 print(f"\n==== Dettagli per client {client_id} ====")
-                for key, value in client_operations[client_id].items():
+                for key, value in _describe(client_id, client_operations[client_id]).items():
                     print(f"{key}: {value}")
             else:
                 print(f"Client {client_id} non trovato nel registro operazioni")
@@ -121,6 +249,6 @@ def debug_client_operations(client_id=None):
             for cid, info in client_operations.items():
                 is_active = cid in active_clients
                 print(f"Client {cid} - Attivo: {is_active}")
-                for key, value in info.items():
+                for key, value in _describe(cid, info).items():
                     print(f"  {key}: {value}")
-                print("---")
\ No newline at end of file
+                print("---")
@@ -3,12 +3,100 @@ Wrapper per i client Telethon che gestisce in modo sicuro le disconnessioni.
 """
 
 import asyncio
+import contextvars
 import signal
 import threading
 import time
 from telethon import TelegramClient
 from telethon.errors import ServerError, TimedOutError, FloodWaitError
 
+from event_bus import log
+from metrics import metrics
+import client_tracking
+
+# Vero nelle richieste in corso in TrackedTelegramClient._call (per task)
+_tracked_call = contextvars.ContextVar("tracked_call", default=False)
+
+class TrackedTelegramClient(TelegramClient):
+    """
+    TelegramClient che riporta la propria attività al registro dei client
+    (client_tracking.py) e alle metriche: richieste RPC e relativi tempi,
+    errori, attese per FloodWait e riconnessioni.
+    
+    Va creato con client_tracking.create_client, che lo registra automaticamente.
+    """
+    
+    @property
+    def flood_sleep_threshold(self):
+        # Dentro _call Telethon non deve attendere da solo i FloodWait (li confronta con
+        # questa proprietà, non con l'argomento): vengono attesi e conteggiati qui
+        if _tracked_call.get():
+            return 0
+        return self._flood_sleep_threshold
+    
+    @flood_sleep_threshold.setter
+    def flood_sleep_threshold(self, value):
+        TelegramClient.flood_sleep_threshold.fset(self, value)
+    
+    async def _call(self, sender, request, ordered=False, flood_sleep_threshold=None):
+        if flood_sleep_threshold is None:
+            flood_sleep_threshold = self._flood_sleep_threshold
+        method = type(request).__name__
+        while True:
+            start = time.perf_counter()
+            token = _tracked_call.set(True)
+            try:
+                # Le attese per FloodWait vengono gestite qui per poterle conteggiare
+                return await super()._call(sender, request, ordered, flood_sleep_threshold=0)
+            except FloodWaitError as e:
+                wait = e.seconds
+                client_tracking.track(self, flood_wait_seconds=wait)
+                if wait > flood_sleep_threshold:
+                    client_tracking.track(self, rpc_errors=1)
+                    raise
+            except Exception as e:
+                client_tracking.track(self, rpc_errors=1)
+                metrics.inc("rpc_errors_by_type", error=type(e).__name__)
+                raise
+            finally:
+                _tracked_call.reset(token)
+                elapsed = time.perf_counter() - start
+                client_tracking.track(self, rpc_calls=1)
+                client_tracking.observe_rpc(self, elapsed)
+                metrics.observe("rpc", elapsed)
+            
+            # Attesa fuori dalla misura della latenza, poi nuovo tentativo
+            log(f"⏳ FloodWait di {wait} secondi per {method}", level="warning")
+            await asyncio.sleep(wait)
+    
+    def add_reconnect_callback(self, callback):
+        """
+        Registra una funzione (sincrona, senza argomenti) chiamata dopo ogni
+        riconnessione automatica, prima che vengano elaborati gli aggiornamenti
+        ricevuti dopo la riconnessione.
+        """
+        if not hasattr(self, '_reconnect_callbacks'):
+            self._reconnect_callbacks = []
+        self._reconnect_callbacks.append(callback)
+    
+    async def _handle_auto_reconnect(self):
+        # Chiamato da Telethon dopo ogni riconnessione automatica: il task viene creato
+        # appena la connessione è ristabilita, quindi le callback (sincrone) girano
+        # prima che i nuovi aggiornamenti raggiungano gli handler
+        client_tracking.track(self, reconnects=1)
+        for callback in getattr(self, '_reconnect_callbacks', ()):
+            try:
+                callback()
+            except Exception as e:
+                log(f"⚠️ Errore nella callback di riconnessione: {e}", level="warning")
+        return await super()._handle_auto_reconnect()
+    
+    async def _disconnect_coro(self):
+        try:
+            return await super()._disconnect_coro()
+        finally:
+            client_tracking.unregister_client(self)
+
 class SafeTelegramClient:
     """
     Wrapper per TelegramClient che gestisce meglio le disconnessioni e la chiusura.
@@ -56,10 +144,10 @@ class SafeTelegramClient:
                 try:
                     await asyncio.wait_for(disconnection_task, timeout=3)
                 except asyncio.TimeoutError:
-                    print(f"[SafeTelegramClient] Timeout durante la disconnessione, forzando la chiusura")
+                    log(f"[SafeTelegramClient] Timeout durante la disconnessione, forzando la chiusura", level="warning")
                     # Non facciamo nulla, permettiamo che il client venga distrutto comunque
             except Exception as e:
-                print(f"[SafeTelegramClient] Errore durante la disconnessione: {e}")
+                log(f"[SafeTelegramClient] Errore durante la disconnessione: {e}", level="warning")
             finally:
                 self._is_connected = False
                 self.client = None
@@ -73,7 +161,7 @@ class SafeTelegramClient:
                 await self.client.disconnect()
             except (ConnectionError, ServerError, TimedOutError, OSError) as e:
                 # Questi errori sono attesi durante la disconnessione forzata
-                print(f"[SafeTelegramClient] Errore previsto durante la disconnessione: {e}")
+                log(f"[SafeTelegramClient] Errore previsto durante la disconnessione: {e}", level="warning")
                 pass
         finally:
             self._is_connected = False
@@ -0,0 +1,94 @@
+"""
+Indice su disco dei messaggi con il media già scaricato.
+
+Una bitmap per gruppo (completed_ids.bin nella cartella del gruppo): il bit
+<id messaggio> è acceso quando il media del messaggio è stato salvato. Il
+file è mappato in memoria con mmap, quindi il controllo costa una lettura di
+un byte anche per gruppi con milioni di messaggi e non richiede di caricare
+l'indice: un milione di messaggi occupa 125 KB.
+
+Il bit viene acceso solo dopo che il file definitivo è stato rinominato:
+l'indice non segnala mai come scaricato un media scritto a metà. Se il file
+manca viene ricostruito dal disco (vedi GroupLayout.completed_ids in
+media_layout.py).
+"""
+
+import mmap
+import os
+import threading
+
+COMPLETED_FILE = "completed_ids.bin"
+BLOCK_SIZE = 4096  # La bitmap cresce a blocchi di 4 KB (32768 messaggi)
+
+# Bit accesi di ogni valore di un byte, per contare con bytes.translate
+_POPCOUNT = bytes(bin(value).count("1") for value in range(256))
+
+class CompletedIds:
+    """Bitmap mappata in memoria degli ID dei messaggi completati."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._map = None
+        self._open()
+
+    def _open(self, size=BLOCK_SIZE):
+        self._file = open(self.path, "r+b" if os.path.exists(self.path) else "w+b")
+        current = os.fstat(self._file.fileno()).st_size
+        if current < size:
+            self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    def _grow(self, byte_index):
+        # Su Windows un file mappato non si può ingrandire: si chiude e si rimappa
+        size = max(len(self._map) * 2, (byte_index // BLOCK_SIZE + 1) * BLOCK_SIZE)
+        self._map.close()
+        self._file.close()
+        self._open(size)
+
+    def __contains__(self, message_id):
+        byte_index = message_id >> 3
+        with self._lock:
+            if byte_index >= len(self._map):
+                return False
+            return bool(self._map[byte_index] & (1 << (message_id & 7)))
+
+    def add(self, message_id):
+        """Segna come completato il media di un messaggio."""
+        self.add_many((message_id,))
+
+    def add_many(self, message_ids):
+        with self._lock:
+            for message_id in message_ids:
+                byte_index = message_id >> 3
+                if byte_index >= len(self._map):
+                    self._grow(byte_index)
+                self._map[byte_index] |= 1 << (message_id & 7)
+
+    def count(self):
+        """Numero di messaggi completati (scorre l'intera bitmap)."""
+        with self._lock:
+            return sum(self._map[:].translate(_POPCOUNT))
+
+    def flush(self):
+        with self._lock:
+            self._map.flush()
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.flush()
+                self._map.close()
+                self._file.close()
+                self._map = None
+
+def build(path, message_ids):
+    """Crea la bitmap in un file temporaneo e la sostituisce in un colpo solo."""
+    temp_path = path + ".temp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    completed = CompletedIds(temp_path)
+    completed.add_many(message_ids)
+    completed.close()
+    os.replace(temp_path, path)
@@ -17,12 +17,106 @@ ARCHIVE_DIR = "archive"  # Directory per gli archivi completi dei gruppi
 USER_GROUPS_FILE = "user_groups.json"
 PHONE_NUMBERS_FILE = "phone_numbers.json"
 LOCK_FILE = "running_instances.lock"  # File per gestire istanze multiple
+MONITOR_RULES_FILE = "monitor_rules.json"  # Chat e media da monitorare (facoltativo)
 
 # Impostazioni
 VERBOSE = True
 MAX_DOWNLOAD_RETRIES = 3
 DOWNLOAD_RETRY_DELAY = 2  # secondi
 
-# Creazione delle directory se non esistono
-for directory in [DOWNLOADS_DIR, TEMP_DIR, ARCHIVE_DIR]:
-    os.makedirs(directory, exist_ok=True)
\ No newline at end of file
+# Media privati inoltrati in chiaro
+PRIVATE_MEDIA_KEEP_LOCAL = False  # Conserva una copia in private/ oltre all'inoltro
+PRIVATE_MEDIA_MEMORY_LIMIT = 50 * 1024 * 1024  # Oltre questa dimensione si usa un file temporaneo
+PRIVATE_MEDIA_RETENTION_DAYS = 7  # Le copie locali più vecchie vengono rimosse
+PRIVATE_MEDIA_MAX_BYTES = 2 * 1024 * 1024 * 1024  # Dimensione massima della cartella private/
+PRIVATE_MEDIA_CLEANUP_INTERVAL = 3600  # secondi
+
+# Recupero dei messaggi persi dal monitoraggio
+MONITOR_STATE_SAVE_INTERVAL = 10  # secondi tra due salvataggi di monitor_state.json
+MONITOR_BACKFILL_LIMIT = 1000  # Messaggi massimi recuperati per chat a ogni controllo
+MONITOR_BACKFILL_WAIT = 1  # secondi tra due richieste di cronologia (blocchi da 100 messaggi)
+MONITOR_BACKFILL_CHAT_DELAY = 1.0  # secondi di pausa tra una chat e la successiva
+
+# Monitoraggio su più processi (monitor_supervisor.py)
+MONITOR_WORKERS = int(os.getenv('MONITOR_WORKERS', '0'))  # 0 o 1 = tutti gli account in questo processo
+MONITOR_WORKER_HEARTBEAT = 5  # secondi tra due segnali di vita dei processi
+MONITOR_WORKER_TIMEOUT = 60  # secondi senza segnali dopo i quali il processo viene riavviato
+MONITOR_WORKER_BACKOFF = 5  # secondi di attesa prima del primo riavvio (raddoppia a ogni errore)
+MONITOR_WORKER_BACKOFF_MAX = 300  # attesa massima tra due riavvii
+MONITOR_WORKER_STABLE = 300  # secondi di attività dopo i quali l'attesa torna al minimo
+MONITOR_WORKER_STOP_TIMEOUT = 15  # secondi concessi ai processi per fermarsi
+MONITOR_SUPERVISOR_REPORT_INTERVAL = 60  # secondi tra due riepiloghi dello stato dei processi
+
+# Deduplicazione dei media tra account
+DEDUP_CLAIM_TTL = 24 * 3600  # secondi di validità dei file di prenotazione
+DEDUP_LINK_TIMEOUT = 300  # secondi di attesa del download dell'altro account
+
+# Scrittura dei messaggi di testo
+MESSAGE_SINK_FORMATS = tuple(fmt.strip() for fmt in os.getenv('MESSAGE_SINK_FORMATS', 'text').split(','))  # "text" (messages.txt), "jsonl" (messages.jsonl) e/o "jsonl.gz"
+MESSAGE_SINK_GZIP_LEVEL = 6  # Livello di compressione di messages.jsonl.gz
+MESSAGE_SINK_FLUSH_INTERVAL = 2.0  # secondi
+MESSAGE_SINK_FLUSH_BYTES = 64 * 1024
+
+# Limiti di banda (bandwidth.py)
+BANDWIDTH_FILE = "bandwidth_limits.json"  # Limiti globali, per tipo di operazione e per account
+BANDWIDTH_PRIORITY_CLASSES = ("monitoring",)  # Operazioni servite prima degli archivi
+BANDWIDTH_RESERVE = 0.5  # Frazione della banda globale lasciata libera per le operazioni prioritarie
+BANDWIDTH_PRIORITY_WINDOW = 5  # secondi dopo l'ultimo download prioritario in cui la riserva resta attiva
+BANDWIDTH_BURST_SECONDS = 1.0  # secondi di banda che si possono usare in un colpo solo
+BANDWIDTH_RELOAD_INTERVAL = 5  # secondi tra due controlli del file dei limiti
+
+# Coda dei download per account (download_scheduler.py)
+DOWNLOAD_SCHEDULER_SLOTS = 4  # Download contemporanei per account
+DOWNLOAD_CLASS_PRIORITY = {"monitoring": 0, "archive": 2}  # Priorità per tipo di operazione (più basso = prima)
+DOWNLOAD_DEFAULT_PRIORITY = 1  # Priorità delle altre operazioni
+DOWNLOAD_SMALL_FILE_BYTES = 1024 * 1024  # Oltre questa dimensione un file perde priorità
+DOWNLOAD_LARGE_FILE_PENALTY = 1
+DOWNLOAD_AGING_INTERVAL = 30  # secondi di attesa per guadagnare un livello di priorità
+
+# Disposizione dei media nelle cartelle dei gruppi (media_layout.py)
+MEDIA_LAYOUT = os.getenv('MEDIA_LAYOUT', 'flat')  # Per i nuovi gruppi: "flat", "date" (anno/mese) o "hash"
+MEDIA_HASH_SHARD_CHARS = 2  # Cifre esadecimali delle sottocartelle "hash" (2 = 256 sottocartelle)
+
+# Stima e spazio su disco degli archivi (archive_estimate.py)
+ARCHIVE_ESTIMATE_SAMPLES = 30  # File campionati per tipo di media per stimarne la dimensione
+ARCHIVE_ESTIMATE_BATCHES = 3  # Punti della cronologia da cui prendere i campioni
+ARCHIVE_SPACE_MARGIN = 1.1  # Margine sulla stima richiesto prima di iniziare
+ARCHIVE_MIN_FREE_BYTES = 1024 * 1024 * 1024  # Spazio da lasciare sempre libero sul disco
+ARCHIVE_QUOTA_BYTES = int(os.getenv('ARCHIVE_QUOTA_MB', '0')) * 1024 * 1024  # Dimensione massima di un archivio (0 = nessun limite)
+
+# Esportazione degli archivi (archive_export.py)
+EXPORT_DIR = "exports"  # Parti compresse degli archivi: exports/<utente>/<gruppo>/part-NNNN.zip
+EXPORT_FORMAT = "zip"  # "zip" oppure "tar.zst" (richiede il pacchetto zstandard)
+EXPORT_ZSTD_LEVEL = 3  # Livello di compressione zstd
+ARCHIVE_EXPORT_AFTER_DOWNLOAD = os.getenv('ARCHIVE_EXPORT_AFTER_DOWNLOAD', '0') == '1'  # Esporta i file nuovi a fine download
+
+# Anteprima degli archivi (media_preview.py)
+PREVIEW_DIR_NAME = "previews"  # Sottocartella del gruppo con miniature e preview.jsonl
+PREVIEW_THUMB_MAX_SIDE = 320  # Lato massimo in pixel delle miniature scaricate (0 = solo quelle incluse nei messaggi)
+PREVIEW_CONCURRENCY = 8  # Miniature in download contemporaneamente (nei limiti della coda dell'account)
+
+# Metriche (metrics.py)
+METRICS_DIR = "metrics"  # <istanza>.json e <istanza>.prom
+METRICS_INTERVAL = 15  # secondi tra due scritture delle metriche
+METRICS_LAG_INTERVAL = 0.5  # secondi tra due campioni del ritardo dell'event loop
+
+# Profilazione delle operazioni (profiling.py)
+PROFILES_DIR = "profiles"  # <operazione>.prof, .tracemalloc e .json
+PROFILE_OPERATIONS = os.getenv('PROFILE_OPERATIONS', '0') == '1'  # cProfile su ogni operazione
+PROFILE_TRACEMALLOC = os.getenv('PROFILE_TRACEMALLOC', '0') == '1'  # anche istantanee della memoria (più lento)
+PROFILE_TRACEMALLOC_FRAMES = 10  # livelli di stack registrati per ogni allocazione
+
+# Log
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'info')  # debug, info, warning, error
+LOG_MAX_BYTES = 10 * 1024 * 1024  # rotazione oltre 10 MB
+LOG_ROTATE_INTERVAL = 24 * 3600  # rotazione giornaliera (secondi)
+LOG_BACKUP_COUNT = 5
+LOG_ROTATE_RETRY = 60  # secondi prima di riprovare una rotazione non riuscita (file in uso)
+LOG_FLUSH_INTERVAL = 0.5  # secondi
+
+SHUTDOWN_TIMEOUT = 0.8  # secondi concessi alle operazioni per fermarsi alla chiusura
+
+def ensure_directories():
+    """Crea le directory di lavoro se non esistono (chiamata all'avvio, non all'import)."""
+    for directory in [DOWNLOADS_DIR, TEMP_DIR, ARCHIVE_DIR]:
+        os.makedirs(directory, exist_ok=True)
\ No newline at end of file
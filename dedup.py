@@ -0,0 +1,258 @@
+"""
+Deduplicazione dei media tra account e tra istanze.
+
+Se più account configurati sono membri dello stesso canale o supergruppo, ogni
+client del monitoraggio riceve lo stesso messaggio con lo stesso ID. Nei gruppi
+base e nelle chat private gli ID dei messaggi sono invece diversi per ogni
+account, quindi i loro media non vengono deduplicati.
+
+Prima di scaricare un media l'account "prenota" la coppia (chat, messaggio):
+
+- nello stesso processo tramite un dizionario condiviso da tutti i client;
+- tra istanze diverse tramite un file di prenotazione creato in modo esclusivo
+  (O_EXCL) in downloads/.claims, valido finché l'istanza che lo ha creato
+  risulta attiva nel registro delle istanze.
+
+Solo il primo account scarica il media; gli altri registrano il riferimento in
+media_catalogue.jsonl nella propria cartella del gruppo e, quando possibile,
+creano un hard link al file già scaricato.
+"""
+
+import os
+import json
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+
+from utils import load_json, is_process_running, log_error
+from path_resolver import path_resolver
+from media_layout import media_layouts
+from config import DOWNLOADS_DIR, LOCK_FILE, DEDUP_CLAIM_TTL, DEDUP_LINK_TIMEOUT
+
+CLAIMS_DIR = os.path.join(DOWNLOADS_DIR, ".claims")
+MAX_LOCAL_CLAIMS = 10000
+
+def _set_result(future, value):
+    if not future.done():
+        future.set_result(value)
+
+class Claim:
+    """Prenotazione del download del media di un messaggio."""
+
+    def __init__(self, chat_id, message_id, owner, owned, instance_id=None, path=None):
+        self.chat_id = chat_id
+        self.message_id = message_id
+        self.owner = owner              # Nickname dell'account che scarica il media
+        self.owned = owned              # True se il download spetta a chi ha chiesto la prenotazione
+        self.instance_id = instance_id  # Istanza proprietaria (se diversa da questa)
+        self.path = path
+        self._done = False    # complete() già chiamata (anche con download fallito)
+        self._future = None   # Future di chi attende nello stesso processo
+        self._loop = None     # Loop del future: complete() può girare in un altro thread
+
+class MessageClaims:
+    """Registro delle prenotazioni condiviso da tutti i client del processo."""
+
+    def __init__(self, claims_dir=CLAIMS_DIR):
+        self.claims_dir = claims_dir
+        self.instance_id = f"pid_{os.getpid()}"
+        self._claims = OrderedDict()  # {(chat_id, message_id): Claim}
+        self._lock = threading.Lock()
+
+    def set_instance(self, instance_id):
+        """Imposta l'ID dell'istanza (quello del registro) con cui firmare le prenotazioni."""
+        self.instance_id = instance_id
+
+    def claim(self, chat_id, message_id, nickname):
+        """
+        Prenota il download del media di un messaggio per un account.
+
+        Solo per canali e supergruppi. Può leggere e scrivere file e controllare
+        i processi attivi: dall'event loop va chiamata con asyncio.to_thread.
+
+        Returns:
+            Claim: con owned=True se l'account deve scaricare il media
+        """
+        key = (chat_id, message_id)
+        with self._lock:
+            existing = self._claims.get(key)
+            if existing is not None:
+                # Già prenotato nel processo (da un altro account o da questo stesso)
+                return Claim(chat_id, message_id, existing.owner, False, path=existing.path)
+
+            claim = self._claim_file(chat_id, message_id, nickname)
+            if claim.owned:
+                self._claims[key] = claim
+                while len(self._claims) > MAX_LOCAL_CLAIMS:
+                    self._claims.popitem(last=False)
+            return claim
+
+    def complete(self, claim, path):
+        """
+        Registra il percorso del media scaricato (None se il download è fallito).
+
+        Scrive su disco: dall'event loop va chiamata con asyncio.to_thread.
+        """
+        with self._lock:
+            claim.path = path
+            claim._done = True
+            if claim._future is not None:
+                # I future di asyncio non sono thread-safe: il risultato passa dal loop di chi attende
+                claim._loop.call_soon_threadsafe(_set_result, claim._future, path)
+            if path is None:
+                # Download fallito: la prenotazione viene liberata per un nuovo tentativo
+                self._claims.pop((claim.chat_id, claim.message_id), None)
+        if path is None:
+            self._remove_file(claim)
+            return
+        file_path = self._file_path(claim.chat_id, claim.message_id)
+        try:
+            # Sostituzione atomica: le altre istanze non leggono mai un file scritto a metà
+            with open(file_path + ".temp", "w", encoding="utf-8") as f:
+                json.dump(self._file_data(claim.owner, os.path.abspath(path)), f)
+            os.replace(file_path + ".temp", file_path)
+        except OSError as e:
+            log_error(f"Impossibile aggiornare la prenotazione del messaggio {claim.message_id}: {e}")
+
+    async def wait_path(self, claim, timeout=DEDUP_LINK_TIMEOUT):
+        """Attende che il proprietario della prenotazione abbia scaricato il media."""
+        if claim.path:
+            return claim.path
+
+        with self._lock:
+            local = self._claims.get((claim.chat_id, claim.message_id))
+            if local is not None:
+                # Controllo e creazione del future insieme: complete() non può inserirsi nel mezzo
+                if local._done:
+                    return local.path
+                if local._future is None:
+                    local._loop = asyncio.get_running_loop()
+                    local._future = local._loop.create_future()
+                future = local._future
+        if local is not None:
+            # Stesso processo: attende il completamento senza interrogare il disco
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        # Altra istanza: controlla periodicamente il file di prenotazione
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            data = await asyncio.to_thread(self._read_file, claim.chat_id, claim.message_id)
+            if data is None:
+                return None
+            if data.get("path"):
+                return data["path"]
+            await asyncio.sleep(2)
+        return None
+
+    def prune(self, max_age=DEDUP_CLAIM_TTL):
+        """Rimuove i file di prenotazione più vecchi di max_age secondi."""
+        if not os.path.isdir(self.claims_dir):
+            return 0
+        removed = 0
+        now = time.time()
+        for name in os.listdir(self.claims_dir):
+            path = os.path.join(self.claims_dir, name)
+            try:
+                if now - os.path.getmtime(path) > max_age:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def _file_path(self, chat_id, message_id):
+        return os.path.join(self.claims_dir, f"{chat_id}_{message_id}.json")
+
+    def _file_data(self, nickname, path=None):
+        return {"instance": self.instance_id, "nickname": nickname, "pid": os.getpid(),
+                "time": time.time(), "path": path}
+
+    def _read_file(self, chat_id, message_id):
+        try:
+            with open(self._file_path(chat_id, message_id), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _remove_file(self, claim):
+        try:
+            os.remove(self._file_path(claim.chat_id, claim.message_id))
+        except OSError:
+            pass
+
+    def _claim_file(self, chat_id, message_id, nickname):
+        """Crea il file di prenotazione in modo esclusivo, sostituendo quelli di istanze non più attive."""
+        path_resolver.ensure_dir(self.claims_dir)
+        file_path = self._file_path(chat_id, message_id)
+        for _ in range(2):
+            try:
+                fd = os.open(file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                data = self._read_file(chat_id, message_id)
+                if data is None and self._recent(file_path):
+                    # File appena creato da un'altra istanza che non lo ha ancora scritto
+                    return Claim(chat_id, message_id, None, False)
+                if data is not None and (data.get("path") or self._instance_alive(data)):
+                    return Claim(chat_id, message_id, data.get("nickname"), False,
+                                 instance_id=data.get("instance"), path=data.get("path"))
+                # Prenotazione incompleta di un'istanza terminata: viene sostituita
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+                continue
+            except OSError as e:
+                # Senza file di prenotazione la deduplicazione resta solo nel processo
+                log_error(f"Impossibile creare la prenotazione del messaggio {message_id}: {e}")
+                return Claim(chat_id, message_id, nickname, True)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._file_data(nickname), f)
+            return Claim(chat_id, message_id, nickname, True)
+        return Claim(chat_id, message_id, nickname, True)
+
+    def _recent(self, file_path, seconds=10):
+        try:
+            return time.time() - os.path.getmtime(file_path) < seconds
+        except OSError:
+            return False
+
+    def _instance_alive(self, data):
+        """Verifica tramite il registro delle istanze se il proprietario è ancora attivo."""
+        instance_id = data.get("instance")
+        if instance_id == self.instance_id:
+            return True
+        info = load_json(LOCK_FILE).get(instance_id) if os.path.exists(LOCK_FILE) else None
+        pid = info.get("pid") if info else data.get("pid")
+        return is_process_running(pid)
+
+def record_duplicate(group_dir, message, owner, path, media_type):
+    """
+    Registra nella cartella del gruppo un media scaricato da un altro account.
+
+    Aggiunge una voce a media_catalogue.jsonl e, se il file è disponibile sullo
+    stesso disco, crea un hard link nella cartella del tipo di media.
+
+    Returns:
+        str: Percorso del collegamento creato, oppure None
+    """
+    layout = media_layouts.get(group_dir)
+    link_path = None
+    if path and os.path.exists(path):
+        timestamp = int(message.date.timestamp()) if getattr(message, 'date', None) else int(time.time())
+        candidate = os.path.join(layout.media_dir(media_type, message.id, timestamp), os.path.basename(path))
+        try:
+            if not os.path.exists(candidate):
+                os.link(path, candidate)
+            link_path = candidate
+        except OSError:
+            link_path = None
+
+    layout.record(message, media_type, link_path, owner=owner, path=path, link=link_path)
+    return link_path
+
+# Istanza singleton condivisa da tutti i client del monitoraggio
+message_claims = MessageClaims()
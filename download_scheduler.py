@@ -0,0 +1,207 @@
+"""
+Coda dei download con priorità, una per account.
+
+Monitoraggio e archivi usano le stesse connessioni dell'account: invece di
+competere alla cieca, ogni download passa dalla coda del proprio account, che
+ne fa partire al massimo DOWNLOAD_SCHEDULER_SLOTS alla volta scegliendo per
+primi quelli con priorità migliore (valore più basso):
+
+    priorità = DOWNLOAD_CLASS_PRIORITY[tipo di operazione]
+               + DOWNLOAD_LARGE_FILE_PENALTY se il file supera DOWNLOAD_SMALL_FILE_BYTES
+               - secondi di attesa / DOWNLOAD_AGING_INTERVAL
+
+I media del monitoraggio e i file piccoli passano quindi davanti ai file
+grandi degli archivi, che però guadagnano priorità mentre aspettano e non
+restano bloccati. Un download già in coda o in corso verso lo stesso file
+non viene ripetuto: chi lo richiede di nuovo ne attende il risultato.
+
+Il download viene eseguito dal task che lo ha richiesto, non da worker della
+coda: la coda decide solo quando può partire, quindi funziona con qualsiasi
+event loop (loop condiviso della GUI, asyncio.run della riga di comando).
+
+La coda è del processo: con il monitoraggio su più processi (MONITOR_WORKERS)
+i media del monitoraggio di un account passano dalla coda del suo processo e
+gli archivi da quella del processo principale, quindi non si ordinano tra
+loro. In quel caso la precedenza del monitoraggio resta affidata alla riserva
+di banda, condivisa tra i processi (bandwidth.py).
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+
+from config import (
+    DOWNLOAD_SCHEDULER_SLOTS, DOWNLOAD_CLASS_PRIORITY, DOWNLOAD_DEFAULT_PRIORITY,
+    DOWNLOAD_SMALL_FILE_BYTES, DOWNLOAD_LARGE_FILE_PENALTY, DOWNLOAD_AGING_INTERVAL
+)
+from metrics import metrics
+
+def _set_result(future, value):
+    if not future.done():
+        future.set_result(value)
+
+def _resolve(loop, future, value):
+    """Completa un future dal thread di qualsiasi loop."""
+    try:
+        loop.call_soon_threadsafe(_set_result, future, value)
+    except RuntimeError:
+        # Il loop del richiedente è già stato chiuso
+        pass
+
+class DownloadItem:
+    """Download in attesa o in corso."""
+    __slots__ = ("key", "operation_class", "size", "seq", "enqueued", "started", "loop", "ready", "waiters")
+
+    def __init__(self, key, operation_class, size, seq, loop):
+        self.key = key
+        self.operation_class = operation_class
+        self.size = size or 0
+        self.seq = seq
+        self.enqueued = time.monotonic()
+        self.started = None
+        self.loop = loop
+        self.ready = loop.create_future()
+        self.waiters = []  # Richieste duplicate: (loop, future) completati con il risultato
+
+    def priority(self, now):
+        priority = DOWNLOAD_CLASS_PRIORITY.get(self.operation_class, DOWNLOAD_DEFAULT_PRIORITY)
+        if self.size > DOWNLOAD_SMALL_FILE_BYTES:
+            priority += DOWNLOAD_LARGE_FILE_PENALTY
+        return priority - (now - self.enqueued) / DOWNLOAD_AGING_INTERVAL
+
+class DownloadScheduler:
+    """Coda dei download di un account."""
+
+    def __init__(self, account, slots=DOWNLOAD_SCHEDULER_SLOTS):
+        self.account = account
+        self.slots = slots
+        self.queue = []
+        self.active = set()
+        self.by_key = {}
+        self.completed = 0
+        self.deduplicated = 0
+        self.max_wait = 0.0
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def _dispatch(self):
+        """Sceglie i download che possono partire (da chiamare con il lock)."""
+        started = []
+        now = time.monotonic()
+        while self.queue and len(self.active) < self.slots:
+            item = min(self.queue, key=lambda queued: (queued.priority(now), queued.seq))
+            self.queue.remove(item)
+            self.active.add(item)
+            item.started = now
+            self.max_wait = max(self.max_wait, now - item.enqueued)
+            started.append(item)
+        return started
+
+    def _finish(self, item, result):
+        with self._lock:
+            if item in self.active:
+                self.active.discard(item)
+                self.completed += 1
+                metrics.observe("download_queue_wait", item.started - item.enqueued,
+                                operation=item.operation_class or "other")
+            elif item in self.queue:
+                self.queue.remove(item)
+            if item.key is not None and self.by_key.get(item.key) is item:
+                del self.by_key[item.key]
+            started = self._dispatch()
+        for loop, future in item.waiters:
+            _resolve(loop, future, result)
+        for next_item in started:
+            _resolve(next_item.loop, next_item.ready, None)
+
+    async def run(self, download, key=None, size=0, operation_class=None):
+        """
+        Esegue un download quando la coda gli assegna un posto.
+
+        Args:
+            download: Funzione senza argomenti che restituisce la coroutine del download
+            key: Identificativo del download (es. percorso di destinazione) per unire i duplicati
+            size: Dimensione prevista in byte
+            operation_class: Tipo di operazione (es. "monitoring", "archive")
+
+        Returns:
+            Il risultato del download (per i duplicati, quello della prima richiesta)
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            existing = self.by_key.get(key) if key is not None else None
+            if existing is not None:
+                duplicate = loop.create_future()
+                existing.waiters.append((loop, duplicate))
+                self.deduplicated += 1
+            else:
+                item = DownloadItem(key, operation_class, size, next(self._seq), loop)
+                if key is not None:
+                    self.by_key[key] = item
+                self.queue.append(item)
+                started = self._dispatch()
+        if existing is not None:
+            return await duplicate
+        for next_item in started:
+            _resolve(next_item.loop, next_item.ready, None)
+
+        result = None
+        try:
+            await item.ready
+            result = await download()
+            return result
+        finally:
+            self._finish(item, result)
+
+    def status(self):
+        """Stato della coda per la GUI e le metriche."""
+        now = time.monotonic()
+        with self._lock:
+            queued = list(self.queue)
+            active = len(self.active)
+        by_class = {}
+        for item in queued:
+            by_class[item.operation_class or "other"] = by_class.get(item.operation_class or "other", 0) + 1
+        return {
+            "account": self.account,
+            "active": active,
+            "queued": len(queued),
+            "queued_by_class": by_class,
+            "queued_bytes": sum(item.size for item in queued),
+            "oldest_wait": round(max((now - item.enqueued for item in queued), default=0.0), 1),
+            "max_wait": round(self.max_wait, 1),
+            "completed": self.completed,
+            "deduplicated": self.deduplicated,
+        }
+
+class DownloadSchedulers:
+    """Registro delle code dei download, una per account."""
+
+    def __init__(self):
+        self._schedulers = {}
+        self._lock = threading.Lock()
+
+    def get(self, account):
+        with self._lock:
+            scheduler = self._schedulers.get(account)
+            if scheduler is None:
+                scheduler = self._schedulers[account] = DownloadScheduler(account)
+            return scheduler
+
+    def status(self):
+        with self._lock:
+            schedulers = list(self._schedulers.values())
+        return [scheduler.status() for scheduler in schedulers]
+
+# Istanza singleton condivisa da tutto il processo
+download_schedulers = DownloadSchedulers()
+
+def _queue_depths():
+    statuses = download_schedulers.status()
+    return {
+        "download_queue_depth": sum(status["queued"] for status in statuses),
+        "downloads_active": sum(status["active"] for status in statuses),
+    }
+
+metrics.add_collector(_queue_depths)
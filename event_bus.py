@@ -0,0 +1,142 @@
+"""
+Bus di eventi strutturato per l'output delle operazioni.
+
+Le operazioni (monitoraggio, download archivi, recupero gruppi, ...) non scrivono
+più su sys.stdout: emettono record tipizzati (log e avanzamento) etichettati con
+l'ID dell'operazione corrente. GUI, CLI e file di log si iscrivono al bus e
+ricevono solo i record che interessano loro.
+"""
+
+import contextvars
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+# ID dell'operazione associata al contesto corrente (thread o task asyncio).
+# I task creati con asyncio ereditano il contesto, quindi basta impostarlo
+# all'avvio dell'operazione.
+_current_operation = contextvars.ContextVar("current_operation", default=None)
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+class LogEvent:
+    """Record di log emesso da un'operazione."""
+    kind = "log"
+    __slots__ = ("operation_id", "level", "message", "timestamp")
+
+    def __init__(self, message, level="info", operation_id=None):
+        self.operation_id = operation_id
+        self.level = level
+        self.message = message
+        self.timestamp = time.time()
+
+    def format(self):
+        """Restituisce il testo del record come veniva stampato in console."""
+        return self.message
+
+class ProgressEvent:
+    """Record di avanzamento emesso da un'operazione."""
+    kind = "progress"
+    __slots__ = ("operation_id", "stage", "current", "total", "details", "timestamp")
+
+    def __init__(self, stage, current=None, total=None, details=None, operation_id=None):
+        self.operation_id = operation_id
+        self.stage = stage
+        self.current = current
+        self.total = total
+        self.details = details or {}
+        self.timestamp = time.time()
+
+    def format(self):
+        """Restituisce una rappresentazione testuale dell'avanzamento."""
+        text = f"⏳ {self.stage}"
+        if self.current is not None:
+            text += f": {self.current}"
+            if self.total:
+                text += f"/{self.total}"
+        if self.details:
+            text += " (" + ", ".join(f"{k}: {v}" for k, v in self.details.items()) + ")"
+        return text
+
+class EventBus:
+    """Distribuisce i record emessi dalle operazioni agli iscritti."""
+
+    def __init__(self):
+        self._subscribers = {}  # {token: (callback, kinds, operation_id, min_level)}
+        self._tokens = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback, kinds=None, operation_id=None, min_level="debug"):
+        """
+        Iscrive una callback al bus.
+
+        Args:
+            callback: Funzione chiamata con ogni record (nel thread di chi emette)
+            kinds: Tipi di record accettati ("log", "progress"); None per tutti
+            operation_id: Se specificato, riceve solo i record di questa operazione
+            min_level: Livello minimo per i record di log
+
+        Returns:
+            token: Da passare a unsubscribe per annullare l'iscrizione
+        """
+        token = next(self._tokens)
+        kinds = frozenset(kinds) if kinds else None
+        with self._lock:
+            self._subscribers[token] = (callback, kinds, operation_id, LEVELS.get(min_level, 0))
+        return token
+
+    def unsubscribe(self, token):
+        """Annulla un'iscrizione."""
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def emit(self, event):
+        """Consegna un record a tutti gli iscritti interessati."""
+        if event.operation_id is None:
+            event.operation_id = _current_operation.get()
+
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+
+        level = LEVELS.get(getattr(event, "level", None), 0)
+        for callback, kinds, operation_id, min_level in subscribers:
+            if kinds is not None and event.kind not in kinds:
+                continue
+            if operation_id is not None and event.operation_id != operation_id:
+                continue
+            if event.kind == "log" and level < min_level:
+                continue
+            try:
+                callback(event)
+            except Exception:
+                # Un iscritto difettoso non deve interrompere l'operazione
+                pass
+
+# Istanza singleton condivisa da tutto il processo
+event_bus = EventBus()
+
+def log(message, level="info"):
+    """Emette un record di log per l'operazione corrente."""
+    event_bus.emit(LogEvent(message, level=level))
+
+def progress(stage, current=None, total=None, **details):
+    """Emette un record di avanzamento per l'operazione corrente."""
+    event_bus.emit(ProgressEvent(stage, current=current, total=total, details=details))
+
+def current_operation_id():
+    """Restituisce l'ID dell'operazione associata al contesto corrente."""
+    return _current_operation.get()
+
+@contextmanager
+def operation_context(operation_id):
+    """Associa i record emessi all'interno del blocco all'operazione indicata."""
+    token = _current_operation.set(operation_id)
+    try:
+        yield operation_id
+    finally:
+        _current_operation.reset(token)
+
+def print_event(event):
+    """Iscritto per la CLI: stampa i record in console."""
+    print(event.format())
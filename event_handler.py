@@ -2,26 +2,43 @@ import asyncio
 import os
 import random
 import time
-from telethon import TelegramClient, events, utils
+from telethon import events, utils
 
 # Importa il session manager
 from gui_session_manager import session_manager
 
-from config import API_ID, API_HASH, PHONE_NUMBERS_FILE
+from config import (
+    PHONE_NUMBERS_FILE, DOWNLOADS_DIR,
+    PRIVATE_MEDIA_KEEP_LOCAL, PRIVATE_MEDIA_CLEANUP_INTERVAL,
+    MONITOR_BACKFILL_LIMIT, MONITOR_BACKFILL_WAIT, MONITOR_BACKFILL_CHAT_DELAY
+)
+from event_bus import log
+from metrics import metrics, run_metrics
+import client_tracking
+from message_sink import message_sinks
+from monitor_state import MonitorState
+from dedup import message_claims
+from monitor_filters import MonitorFilter, load_monitor_filter
+from operation_control import ProgressTracker, is_cancelled
 from utils import load_json, log_error, format_user_info
 from media_handler import (
-    download_media, save_message_content, 
-    download_temporary_media, forward_media_clear, 
-    log_saved_media
+    download_media_once, save_message_content, is_forwardable_media,
+    download_temporary_media, forward_private_media, forward_private_album, 
+    log_saved_media, cleanup_private_media
 )
 
 # Dizionario per tenere traccia dei client attivi
 active_clients = {}
+metrics.add_collector(lambda: {"monitor_clients": len(active_clients)})
+
+# Filtro che ammette tutto, usato quando non sono configurate regole
+ALLOW_ALL = MonitorFilter()
 
 async def get_user_info(client, user_id):
     """Ottiene informazioni dettagliate su un utente."""
     try:
-        user = await client.get_entity(user_id)
+        with metrics.timer("resolve_entity"):
+            user = await client.get_entity(user_id)
         username = user.username if getattr(user, 'username', None) else None
         first_name = getattr(user, 'first_name', None)
         last_name = getattr(user, 'last_name', None)
@@ -39,10 +56,41 @@ async def get_user_info(client, user_id):
         log_error(f"Impossibile ottenere informazioni sull'utente {user_id}: {e}")
         return {"id": user_id, "display_name": f"User_{user_id}"}
 
-async def handle_event(client, bot_entity, event, nickname):
+async def resolve_group_name(client, chat_id):
+    """Restituisce il nome del gruppo (o canale) e la sua descrizione per i log."""
+    try:
+        with metrics.timer("resolve_entity"):
+            chat_entity = await client.get_entity(chat_id)
+        return chat_entity.title, f"{chat_entity.title} ({chat_id})"
+    except Exception as e:
+        log_error(f"Impossibile ottenere il nome del gruppo: {e}")
+        return str(chat_id), f"Gruppo {chat_id}"
+
+def private_recipient(chat_entity, bot_entity, sender_id):
+    """Determina il destinatario effettivo di un media ricevuto in una chat privata."""
+    if hasattr(chat_entity, 'participants'):
+        for participant in chat_entity.participants:
+            if participant.id != sender_id:
+                return participant.id
+        return None
+    return bot_entity.id
+
+async def handle_event(client, bot_entity, event, nickname, filters=ALLOW_ALL):
     """Gestisce gli eventi dei messaggi in arrivo."""
-    sender_id = event.sender_id
-    chat_id = event.chat_id
+    # I messaggi che fanno parte di un album vengono gestiti insieme da handle_album
+    if event.message.grouped_id:
+        return
+    await handle_message(client, bot_entity, event.message, nickname, filters)
+
+async def handle_message(client, bot_entity, message, nickname, filters=ALLOW_ALL):
+    """
+    Elabora un messaggio ricevuto: salvataggio per gruppi e canali, inoltro in
+    chiaro per i media privati. Usato sia in diretta sia dal recupero dei messaggi persi.
+    
+    I filtri decidono quali media scaricare e quali testi salvare.
+    """
+    sender_id = message.sender_id
+    chat_id = message.chat_id
     
     # Ignora i messaggi inviati dal bot stesso
     if sender_id == bot_entity.id:
@@ -54,31 +102,26 @@ async def handle_event(client, bot_entity, event, nickname):
         user_display = format_user_info(sender_info)
         
         # Messaggi da gruppi o canali
-        if event.is_group or event.is_channel:
+        if message.is_group or message.is_channel:
             # Ottieni il nome del gruppo
-            try:
-                chat_entity = await client.get_entity(chat_id)
-                group_name = chat_entity.title
-                group_display = f"{group_name} ({chat_id})"
-            except Exception as e:
-                log_error(f"Impossibile ottenere il nome del gruppo: {e}")
-                group_name = str(chat_id)
-                group_display = f"Gruppo {chat_id}"
+            group_name, group_display = await resolve_group_name(client, chat_id)
 
-            if event.message.media:
-                print(f"📥 Ricevuto media in {group_display} da {user_display}")
-                media_path = await download_media(event.message, group_name, nickname, sender_info=sender_info)
+            media_path = None
+            if filters.wants_media(message):
+                log(f"📥 Ricevuto media in {group_display} da {user_display}")
+                media_path = await download_media_once(message, group_name, nickname, sender_info=sender_info)
                 if media_path:
-                    print(f"✅ Media salvato: {media_path}")
+                    log(f"✅ Media salvato: {media_path}")
             
             # Salva il contenuto del messaggio se presente
-            if event.message.text or event.message.message:
-                print(f"💬 Messaggio in {group_display} da {user_display}")
-                await save_message_content(group_name, event.message, nickname, sender_info=sender_info)
+            if filters.wants_text(message):
+                log(f"💬 Messaggio in {group_display} da {user_display}")
+                await save_message_content(group_name, message, nickname, sender_info=sender_info,
+                                           media_path=media_path)
 
         # Messaggi privati con media
-        elif event.is_private and event.message.media:
-            print(f"📩 Ricevuto media temporaneo da {user_display}")
+        elif message.is_private and filters.wants_media(message) and is_forwardable_media(message):
+            log(f"📩 Ricevuto media temporaneo da {user_display}")
 
             # Ottieni l'entità della chat
             try:
@@ -88,49 +131,221 @@ async def handle_event(client, bot_entity, event, nickname):
                 return
 
             # Determina il destinatario effettivo
-            actual_recipient_id = None
-            if hasattr(chat_entity, 'participants'):
-                participants = chat_entity.participants
-                for participant in participants:
-                    if participant.id != sender_id:
-                        actual_recipient_id = participant.id
-                        break
-            else:
-                actual_recipient_id = bot_entity.id
-
-            # Scarica temporaneamente il media
-            temp_media_path = await download_temporary_media(event.message, client, sender_id, nickname, sender_info=sender_info)
-
-            # Inoltra il media in chiaro se è stato scaricato e c'è un destinatario
-            if temp_media_path and actual_recipient_id:
+            actual_recipient_id = private_recipient(chat_entity, bot_entity, sender_id)
+
+            # Copia locale facoltativa (soggetta alla politica di conservazione di private/)
+            local_path = None
+            if PRIVATE_MEDIA_KEEP_LOCAL:
+                local_path = await download_temporary_media(message, client, sender_id, nickname, sender_info=sender_info)
+
+            # Inoltra il media in chiaro, per riferimento o tramite memoria
+            if actual_recipient_id:
                 if actual_recipient_id != sender_id:
                     recipient_info = await get_user_info(client, actual_recipient_id)
                     recipient_display = format_user_info(recipient_info)
-                    print(f"📤 Inoltro media in chiaro da {user_display} a {recipient_display}")
-                    await forward_media_clear(client, actual_recipient_id, temp_media_path, sender_id, sender_info=sender_info)
-                    log_saved_media(sender_id, actual_recipient_id, temp_media_path, nickname, sender_info=sender_info, recipient_info=recipient_info)
+                    log(f"📤 Inoltro media in chiaro da {user_display} a {recipient_display}")
+                    with metrics.timer("forward"):
+                        mode = await forward_private_media(client, actual_recipient_id, message, sender_id,
+                                                           sender_info=sender_info)
+                    if mode:
+                        log_saved_media(sender_id, actual_recipient_id, local_path or f"<{mode}> messaggio {message.id}",
+                                        nickname, sender_info=sender_info, recipient_info=recipient_info)
                 else:
-                    print(f"⚠️ Il destinatario è il mittente stesso, non inoltro il media")
+                    log("⚠️ Il destinatario è il mittente stesso, non inoltro il media", level="warning")
     except Exception as e:
         log_error(f"Errore durante la gestione dell'evento: {e}")
 
-async def start_monitoring(instance_id=None):
-    """Avvia il monitoraggio per tutti gli utenti configurati."""
+async def handle_album(client, bot_entity, messages, nickname, filters=ALLOW_ALL):
+    """
+    Gestisce un album (più media inviati insieme) come un'unica unità.
+    
+    Mittente e chat vengono risolti una sola volta, i media dei gruppi vengono
+    scaricati in parallelo e quelli privati inoltrati con un solo invio multiplo.
+    """
+    first = messages[0]
+    sender_id = first.sender_id
+    chat_id = first.chat_id
+    media_messages = [message for message in messages if filters.wants_media(message)]
+    
+    # Ignora gli album inviati dal bot stesso
+    if sender_id == bot_entity.id:
+        return
+
+    try:
+        # Ottieni informazioni sul mittente (una volta per tutto l'album)
+        sender_info = await get_user_info(client, sender_id)
+        user_display = format_user_info(sender_info)
+        
+        # Album da gruppi o canali
+        if first.is_group or first.is_channel:
+            group_name, group_display = await resolve_group_name(client, chat_id)
+            
+            log(f"📥 Ricevuto album di {len(media_messages)} media in {group_display} da {user_display}")
+            results = await asyncio.gather(
+                *(download_media_once(message, group_name, nickname, sender_info=sender_info) for message in media_messages),
+                return_exceptions=True
+            )
+            media_paths = {}
+            for message, result in zip(media_messages, results):
+                if isinstance(result, Exception):
+                    log_error(f"Errore download media dell'album (ID: {message.id}): {result}")
+                elif result:
+                    log(f"✅ Media salvato: {result}")
+                    media_paths[message.id] = result
+            
+            # Salva la didascalia e gli eventuali testi dei singoli elementi
+            for message in messages:
+                if filters.wants_text(message):
+                    log(f"💬 Messaggio in {group_display} da {user_display}")
+                    await save_message_content(group_name, message, nickname, sender_info=sender_info,
+                                               media_path=media_paths.get(message.id))
+        
+        # Album privati
+        elif first.is_private and media_messages:
+            media_messages = [message for message in media_messages if is_forwardable_media(message)]
+            if not media_messages:
+                return
+            log(f"📩 Ricevuto album temporaneo di {len(media_messages)} media da {user_display}")
+            
+            try:
+                chat_entity = await client.get_entity(chat_id)
+            except Exception as e:
+                log_error(f"Impossibile ottenere l'entità della chat: {e}")
+                return
+            
+            actual_recipient_id = private_recipient(chat_entity, bot_entity, sender_id)
+            
+            # Copie locali facoltative, scaricate in parallelo
+            local_paths = [None] * len(media_messages)
+            if PRIVATE_MEDIA_KEEP_LOCAL:
+                local_paths = await asyncio.gather(
+                    *(download_temporary_media(message, client, sender_id, nickname, sender_info=sender_info)
+                      for message in media_messages)
+                )
+            
+            if actual_recipient_id:
+                if actual_recipient_id != sender_id:
+                    recipient_info = await get_user_info(client, actual_recipient_id)
+                    recipient_display = format_user_info(recipient_info)
+                    log(f"📤 Inoltro album in chiaro da {user_display} a {recipient_display}")
+                    with metrics.timer("forward"):
+                        mode = await forward_private_album(client, actual_recipient_id, media_messages, sender_id,
+                                                           sender_info=sender_info)
+                    if mode:
+                        for message, local_path in zip(media_messages, local_paths):
+                            log_saved_media(sender_id, actual_recipient_id, local_path or f"<{mode}> messaggio {message.id}",
+                                            nickname, sender_info=sender_info, recipient_info=recipient_info)
+                else:
+                    log("⚠️ Il destinatario è il mittente stesso, non inoltro l'album", level="warning")
+    except Exception as e:
+        log_error(f"Errore durante la gestione dell'album: {e}")
+
+async def backfill_missed_messages(client, bot_entity, nickname, state, cancel_token=None, tracker=None,
+                                   filters=ALLOW_ALL):
+    """
+    Recupera i messaggi arrivati mentre il monitoraggio non era connesso.
+    
+    Per ogni chat con un buco (state.backfill_points) scarica solo i messaggi
+    successivi al punto di recupero (iter_messages con min_id), con un limite
+    per chat e pause tra le richieste, e li elabora con la stessa pipeline dei
+    messaggi in diretta. I messaggi già gestiti in diretta e quelli esclusi dai
+    filtri vengono saltati. Il punto di recupero avanza solo fino ai messaggi
+    elaborati: una chat oltre il limite riprende da lì al recupero successivo.
+    
+    Returns:
+        int: Numero di messaggi recuperati
+    """
+    recovered = 0
+    generation = state.generation
+    for chat_id, synced_id in state.backfill_points().items():
+        if is_cancelled(cancel_token):
+            break
+        # Gli ID positivi sono utenti, cioè chat private
+        if not filters.accepts_chat(chat_id, is_private=chat_id > 0):
+            continue
+        
+        album = []
+        count = 0
+        # Ultimo messaggio elaborato completamente (gli album in sospeso non contano)
+        done_id = None
+        complete = False
+        try:
+            async for message in client.iter_messages(chat_id, min_id=synced_id, reverse=True,
+                                                      limit=MONITOR_BACKFILL_LIMIT, wait_time=MONITOR_BACKFILL_WAIT):
+                count += 1
+                # Salta messaggi inviati, messaggi di servizio e quelli già gestiti in diretta
+                if (message.out or getattr(message, 'action', None) or not filters.accepts(message)
+                        or not state.claim(chat_id, message.id)):
+                    if not album:
+                        done_id = message.id
+                    continue
+                
+                # I messaggi consecutivi dello stesso album vengono elaborati insieme
+                if album and album[0].grouped_id != message.grouped_id:
+                    await handle_album(client, bot_entity, album, nickname, filters)
+                    done_id = album[-1].id
+                    album = []
+                if message.grouped_id:
+                    album.append(message)
+                else:
+                    await handle_message(client, bot_entity, message, nickname, filters)
+                    done_id = message.id
+                
+                recovered += 1
+                if tracker is not None:
+                    tracker.update(messages=1, recovered=1)
+            if album:
+                await handle_album(client, bot_entity, album, nickname, filters)
+                done_id = album[-1].id
+            complete = count < MONITOR_BACKFILL_LIMIT
+            if not complete:
+                log(f"⚠️ Chat {chat_id}: raggiunto il limite di {MONITOR_BACKFILL_LIMIT} messaggi, "
+                    f"il resto verrà recuperato alla prossima riconnessione o al riavvio", level="warning")
+        except Exception as e:
+            log_error(f"Errore nel recupero dei messaggi persi della chat {chat_id}: {e}")
+        finally:
+            state.mark_synced(chat_id, done_id, generation, complete)
+        
+        await asyncio.sleep(MONITOR_BACKFILL_CHAT_DELAY)
+    
+    state.save()
+    if recovered:
+        log(f"↩️ Recuperati {recovered} messaggi arrivati durante la disconnessione ({nickname})")
+    return recovered
+
+async def start_monitoring(instance_id=None, cancel_token=None, nicknames=None):
+    """
+    Avvia il monitoraggio per tutti gli utenti configurati.
+    
+    Se viene fornito un cancel_token, la sua cancellazione disconnette i client
+    in modo ordinato: il monitoraggio termina e le sessioni vengono rilasciate.
+    Con nicknames vengono monitorati solo gli account indicati (usato dai
+    processi del supervisore, vedi monitor_supervisor.py).
+    """
     global active_clients
     
     # Crea un operation_id per questo monitoraggio
     operation_id = f"monitor_{instance_id or int(time.time())}"
     
     phone_numbers = load_json(PHONE_NUMBERS_FILE)
+    if nicknames is not None:
+        phone_numbers = {nickname: phone for nickname, phone in phone_numbers.items() if nickname in nicknames}
     tasks = []
+    
+    # Le prenotazioni dei media condivisi tra account sono firmate con l'ID dell'istanza
+    if instance_id:
+        message_claims.set_instance(instance_id)
+    session_ids = []
+    tracker = ProgressTracker("Monitoraggio", interval=30)
 
     if not phone_numbers:
-        print("❌ Nessun utente configurato. Aggiungi almeno un utente.")
+        log("❌ Nessun utente configurato. Aggiungi almeno un utente.", level="error")
         return False
 
     for nickname, phone_number in phone_numbers.items():
         # Crea una sessione dedicata per questo monitoraggio
-        _, session_path = session_manager.create_session(nickname, operation_id)
+        session_id, session_path = session_manager.create_session(nickname, operation_id)
+        session_ids.append(session_id)
         
         # Utilizza un client univoco per ogni istanza+nickname
         client_key = f"{operation_id}_{nickname}"
@@ -145,18 +360,12 @@ async def start_monitoring(instance_id=None):
             except:
                 pass
         
-        # Crea un nuovo client con la sessione dedicata
-        client = TelegramClient(
-            session_path,
-            API_ID, 
-            API_HASH,
-            connection_retries=10,
-            retry_delay=3
-        )
+        # Crea un nuovo client con la sessione dedicata (registrato nel tracciamento dei client)
+        client = client_tracking.create_client(session_path, nickname, "monitoring", operation_id)
         
         # Stampa l'ID del client per debug
         client_id = id(client)
-        print(f"Debug: Client ID per monitoraggio {nickname}: {client_id}")
+        log(f"Debug: Client ID per monitoraggio {nickname}: {client_id}", level="debug")
         
         active_clients[client_key] = client
 
@@ -164,6 +373,8 @@ async def start_monitoring(instance_id=None):
             try:
                 # Attendi un po' per evitare conflitti tra istanze
                 await asyncio.sleep(random.uniform(0.3, 1.0))
+                if is_cancelled(cancel_token):
+                    return
                 
                 async with client:
                     client_id = id(client)
@@ -175,7 +386,7 @@ async def start_monitoring(instance_id=None):
                             break
                         except Exception as e:
                             if "database is locked" in str(e).lower() and attempt < max_attempts - 1:
-                                print(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})")
+                                log(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})", level="warning")
                                 await asyncio.sleep(random.uniform(1, 3) * (attempt + 1))
                             else:
                                 raise
@@ -184,26 +395,106 @@ async def start_monitoring(instance_id=None):
                     bot_info = await get_user_info(client, bot_entity.id)
                     bot_display = format_user_info(bot_info)
                     
+                    # Punto di recupero per chat: i messaggi in diretta arrivati dopo
+                    # un'interruzione non lo spostano finché il recupero non è completo
+                    state = MonitorState.for_user(nickname)
+                    
+                    # Le chat da monitorare sono filtrate da Telethon (chats=) e dal pre-filtro
+                    # func: le altre non raggiungono nemmeno gli handler
+                    filters = load_monitor_filter(nickname)
+                    chat_filter = filters.event_kwargs()
+                    
                     # Registra l'handler per i nuovi messaggi, passando il nickname
-                    @client.on(events.NewMessage(incoming=True, outgoing=False))
+                    @client.on(events.NewMessage(incoming=True, outgoing=False, func=filters.accepts_event, **chat_filter))
                     async def handler(event):
-                        await handle_event(client, bot_entity, event, nickname)
+                        # Pre-filtro su mittente e media prima di qualsiasi richiesta a Telegram
+                        if not filters.accepts(event.message):
+                            return
+                        if not event.message.grouped_id and not state.claim(event.chat_id, event.id):
+                            return
+                        client_tracking.track(client, messages=1)
+                        with metrics.timer("handle_message"):
+                            await handle_event(client, bot_entity, event, nickname, filters)
+                        tracker.update(messages=1)
+                    
+                    # Gli album arrivano come un unico evento con tutti i messaggi
+                    @client.on(events.Album(func=lambda event: not event.messages[0].out and filters.accepts_event(event),
+                                            **chat_filter))
+                    async def album_handler(event):
+                        messages = [message for message in event.messages
+                                    if filters.accepts(message) and state.claim(message.chat_id, message.id)]
+                        if messages:
+                            client_tracking.track(client, messages=len(messages))
+                            with metrics.timer("handle_album"):
+                                await handle_album(client, bot_entity, messages, nickname, filters)
+                            tracker.update(messages=len(messages))
+                    
+                    # Recupero all'avvio e a ogni riconnessione, in parallelo all'ascolto
+                    backfill_lock = asyncio.Lock()
+                    backfills = set()
+                    
+                    async def recover_missed():
+                        # Un recupero alla volta: quello successivo riparte dal punto aggiornato
+                        async with backfill_lock:
+                            await backfill_missed_messages(client, bot_entity, nickname, state, cancel_token,
+                                                           tracker, filters)
+                    
+                    def start_backfill():
+                        task = asyncio.ensure_future(recover_missed())
+                        backfills.add(task)
+                        task.add_done_callback(backfills.discard)
+                    
+                    def on_reconnect():
+                        # Chiamata da Telethon subito dopo la riconnessione, prima dei nuovi aggiornamenti
+                        state.mark_gap()
+                        log(f"🔌 Client {nickname} riconnesso: recupero dei messaggi persi")
+                        start_backfill()
+                    
+                    client.add_reconnect_callback(on_reconnect)
+                    start_backfill()
 
-                    print(f"🔄 Monitoraggio attivo per {bot_display} (Nickname: {nickname}) [Istanza: {instance_id or 'principale'}] [Client ID: {client_id}]")
+                    log(f"🔄 Monitoraggio attivo per {bot_display} (Nickname: {nickname}) [Istanza: {instance_id or 'principale'}] [Client ID: {client_id}]")
+                    
+                    # Alla cancellazione disconnetti il client: run_until_disconnected termina
+                    if cancel_token is not None:
+                        async def disconnect_on_cancel():
+                            await cancel_token.wait()
+                            await client.disconnect()
+                        stopper = asyncio.ensure_future(disconnect_on_cancel())
                     
                     # Rimani in ascolto finché il client non si disconnette
-                    await client.run_until_disconnected()
+                    try:
+                        await client.run_until_disconnected()
+                    finally:
+                        for task in list(backfills):
+                            task.cancel()
+                        state.save()
+                        if cancel_token is not None:
+                            stopper.cancel()
             except Exception as e:
                 log_error(f"Errore nel client {nickname} (ID: {id(client)}): {e}")
             finally:
                 # Rimuovi il client dalla lista dei client attivi
                 if client_key in active_clients:
                     c_id = id(active_clients[client_key])
-                    print(f"Rimozione client {nickname} dal monitoraggio (ID: {c_id})")
+                    log(f"Rimozione client {nickname} dal monitoraggio (ID: {c_id})", level="debug")
                     del active_clients[client_key]
                 
         tasks.append(run_client(nickname, phone_number, client, client_key))
 
+    async def periodic_cleanup():
+        """Applica periodicamente la conservazione dei media privati e rimuove le prenotazioni scadute."""
+        while True:
+            try:
+                await asyncio.to_thread(cleanup_private_media)
+                await asyncio.to_thread(message_claims.prune)
+            except Exception as e:
+                log_error(f"Errore durante la pulizia periodica: {e}")
+            await asyncio.sleep(PRIVATE_MEDIA_CLEANUP_INTERVAL)
+
+    retention_task = asyncio.ensure_future(periodic_cleanup())
+    # Ritardo del loop, tempi per fase e code scritti periodicamente in metrics/
+    metrics_task = asyncio.ensure_future(run_metrics(instance_id or operation_id))
     try:
         await asyncio.gather(*tasks)
         return True
@@ -214,15 +505,23 @@ async def start_monitoring(instance_id=None):
                 if client.is_connected():
                     client_id = id(client)
                     await client.disconnect()
-                    print(f"🔌 Client monitoraggio disconnesso durante KeyboardInterrupt (ID: {client_id})")
+                    log(f"🔌 Client monitoraggio disconnesso durante KeyboardInterrupt (ID: {client_id})")
             except:
                 pass
         active_clients.clear()
         raise
     finally:
+        retention_task.cancel()
+        metrics_task.cancel()
+        
         # Rilascia tutte le sessioni per questa operazione
-        print(f"Rilascio sessioni per operazione di monitoraggio: {operation_id}")
-        session_manager.release_session(operation_id)
+        log(f"Rilascio sessioni per operazione di monitoraggio: {operation_id}", level="debug")
+        for session_id in session_ids:
+            session_manager.release_session(session_id)
+        
+        # Scrivi i messaggi ancora nel buffer e chiudi i file dei gruppi monitorati
+        for nickname in phone_numbers:
+            message_sinks.close(DOWNLOADS_DIR, nickname)
 
 def cleanup_session_files(instance_id):
     """Pulisce i file di sessione temporanei per questa istanza."""
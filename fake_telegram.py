@@ -0,0 +1,358 @@
+"""
+Client Telegram finto per i benchmark offline (benchmark_offline.py).
+
+FakeTelegramClient espone la parte dell'interfaccia di TelegramClient usata
+da archivio, monitoraggio e recupero gruppi (start, get_entity, get_messages,
+iter_messages, iter_dialogs, send_file, ...). Messaggi, utenti e gruppi sono
+generati in modo deterministico; latenza delle richieste e banda dei download
+sono configurabili, così i percorsi del codice si possono misurare senza un
+account reale.
+
+Si attiva con client_tracking.set_client_class(FakeTelegramClient): i client
+creati dall'applicazione diventano finti ma restano registrati nel
+tracciamento e nelle metriche come quelli veri.
+"""
+
+import asyncio
+import inspect
+import io
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from telethon.tl import types
+
+import client_tracking
+
+CHUNK_SIZE = 128 * 1024  # Dimensione dei blocchi dei download simulati
+
+class FakeWorld:
+    """Parametri dei dati sintetici e della rete simulata."""
+
+    def __init__(self, groups=5, users=50, messages_per_group=1000, media_ratio=0.3, media_size=256 * 1024,
+                 rpc_latency=0.02, download_latency=0.05, bandwidth=10 * 1024 * 1024, seed=1):
+        """
+        Args:
+            groups: Gruppi per account
+            users: Utenti distinti che scrivono nei gruppi
+            messages_per_group: Messaggi nella cronologia di ogni gruppo
+            media_ratio: Frazione dei messaggi con un media
+            media_size: Dimensione media dei file (byte)
+            rpc_latency: Latenza di ogni richiesta (secondi)
+            download_latency: Latenza iniziale di ogni download (secondi)
+            bandwidth: Banda dei download (byte/s, 0 = illimitata)
+            seed: Seme per generare sempre gli stessi dati
+        """
+        self.groups = groups
+        self.users = users
+        self.messages_per_group = messages_per_group
+        self.media_ratio = media_ratio
+        self.media_size = media_size
+        self.rpc_latency = rpc_latency
+        self.download_latency = download_latency
+        self.bandwidth = bandwidth
+        self.seed = seed
+        self.start_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def group_ids(self):
+        return [-1000000000000 - index for index in range(1, self.groups + 1)]
+
+    def user_ids(self):
+        return list(range(1000, 1000 + self.users))
+
+    def channel(self, chat_id):
+        index = -chat_id - 1000000000000
+        return types.Channel(id=index, title=f"Gruppo di prova {index}", photo=types.ChatPhotoEmpty(),
+                             date=self.start_date, megagroup=True, username=f"gruppo_{index}",
+                             participants_count=self.users)
+
+    def user(self, user_id):
+        return types.User(id=user_id, first_name=f"Utente{user_id}", last_name="Prova", username=f"utente_{user_id}")
+
+class FakeFile:
+    """Equivalente ridotto di message.file."""
+
+    def __init__(self, size, ext, mime_type, width=1280, height=720, duration=None):
+        self.size = size
+        self.ext = ext
+        self.name = None
+        self.mime_type = mime_type
+        self.width = width
+        self.height = height
+        self.duration = duration
+
+class FakeMessage:
+    """Messaggio sintetico con gli attributi usati dall'applicazione."""
+
+    def __init__(self, client, chat_id, message_id, sender_id, date, text="", media_kind=None, size=0,
+                 is_private=False, grouped_id=None):
+        self._client = client
+        self.id = message_id
+        self.chat_id = chat_id
+        self.sender_id = sender_id
+        self.date = date
+        self.text = self.message = text
+        self.is_private = is_private
+        self.is_group = not is_private
+        self.is_channel = not is_private
+        self.grouped_id = grouped_id
+        self.out = False
+        self.action = None
+        self.photo = self.video = self.audio = self.voice = self.document = self.sticker = self.gif = None
+        self.media = None
+        self.file = None
+        # Miniature come quelle di Telegram: una minuscola inclusa nel messaggio e una da 320 pixel
+        thumbs = [types.PhotoStrippedSize(type="i", bytes=b"\x01\x28\x16" + b"\0" * 40),
+                  types.PhotoSize(type="m", w=320, h=180, size=max(size // 40, 512))]
+        if media_kind == "photo":
+            self.photo = types.Photo(id=message_id, access_hash=0, file_reference=b"", date=date,
+                                     sizes=thumbs + [types.PhotoSize(type="x", w=1280, h=720, size=size)], dc_id=2)
+            self.media = types.MessageMediaPhoto(photo=self.photo)
+            self.file = FakeFile(size, ".jpg", "image/jpeg")
+        elif media_kind == "video":
+            self.video = self.document = types.Document(
+                id=message_id, access_hash=0, file_reference=b"", date=date, mime_type="video/mp4", size=size,
+                dc_id=2, attributes=[types.DocumentAttributeVideo(duration=10, w=1280, h=720)], thumbs=thumbs)
+            self.media = types.MessageMediaDocument(document=self.document)
+            self.file = FakeFile(size, ".mp4", "video/mp4", duration=10)
+
+    async def download_media(self, file=None, progress_callback=None, thumb=None):
+        """Simula il download: latenza iniziale, poi blocchi alla banda configurata."""
+        return await self._client._download(self, file, progress_callback, thumb)
+
+class FakeDialog:
+    def __init__(self, entity, chat_id):
+        self.entity = entity
+        self.id = chat_id
+        self.name = entity.title
+        self.is_group = True
+        self.is_channel = True
+
+class FakeResult(list):
+    """Lista di messaggi con il totale, come quella restituita da get_messages."""
+    total = 0
+
+class FakeTelegramClient:
+    """Sostituto offline di TelegramClient."""
+
+    # Dati e rete condivisi da tutti i client finti (impostati dal benchmark)
+    world = FakeWorld()
+
+    def __init__(self, session_path, api_id=None, api_hash=None, **kwargs):
+        self.session_path = session_path
+        self.flood_sleep_threshold = kwargs.get("flood_sleep_threshold", 60)
+        self._connected = False
+        self._handlers = []
+        self._reconnect_callbacks = []
+        self._disconnected = None
+        self.sent_files = 0
+        self.downloaded_bytes = 0
+        # Tempi di consegna dei messaggi di iter_messages (per le latenze per messaggio)
+        self.yield_times = []
+        self._media_cache = {}  # {chat: [(ID, tipo di media)]} per i filtri di get_messages
+
+    async def _rpc(self):
+        """Simula una richiesta: latenza di rete e conteggio nel tracciamento."""
+        start = time.perf_counter()
+        if self.world.rpc_latency:
+            await asyncio.sleep(self.world.rpc_latency)
+        client_tracking.track(self, rpc_calls=1)
+        client_tracking.observe_rpc(self, time.perf_counter() - start)
+
+    async def start(self, phone=None):
+        await self._rpc()
+        self._connected = True
+        return self
+
+    async def connect(self):
+        self._connected = True
+
+    async def disconnect(self):
+        self._connected = False
+        if self._disconnected is not None and not self._disconnected.done():
+            self._disconnected.set_result(True)
+        client_tracking.unregister_client(self)
+
+    def is_connected(self):
+        return self._connected
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.disconnect()
+
+    def add_reconnect_callback(self, callback):
+        self._reconnect_callbacks.append(callback)
+
+    def simulate_reconnect(self):
+        """Simula una riconnessione automatica (come TrackedTelegramClient._handle_auto_reconnect)."""
+        client_tracking.track(self, reconnects=1)
+        for callback in self._reconnect_callbacks:
+            callback()
+
+    async def run_until_disconnected(self):
+        self._disconnected = asyncio.get_running_loop().create_future()
+        await self._disconnected
+
+    def on(self, event_builder):
+        def decorator(callback):
+            self._handlers.append((event_builder, callback))
+            return callback
+        return decorator
+
+    async def get_me(self):
+        await self._rpc()
+        return types.User(id=1, is_self=True, first_name="Benchmark", username="benchmark")
+
+    async def get_entity(self, entity_id):
+        await self._rpc()
+        if isinstance(entity_id, int) and entity_id < 0:
+            return self.world.channel(entity_id)
+        return self.world.user(entity_id)
+
+    async def get_messages(self, entity, limit=None, offset_id=0, filter=None, ids=None, **kwargs):
+        """Ultimi messaggi della chat (prima di offset_id), filtrati per tipo di media come Telethon."""
+        await self._rpc()
+        chat_id = entity if isinstance(entity, int) else -1000000000000 - entity.id
+        if ids is not None:
+            # Come Telethon: None per gli ID che non esistono
+            return [self.make_message(chat_id, message_id) if 0 < message_id <= self.world.messages_per_group
+                    else None for message_id in ids]
+        result = FakeResult()
+        if filter is None:
+            result.total = self.world.messages_per_group
+            ids = range(min(offset_id - 1 if offset_id else self.world.messages_per_group,
+                            self.world.messages_per_group), 0, -1)
+            for message_id in ids[:limit or 0]:
+                result.append(self.make_message(chat_id, message_id))
+            return result
+        kind = self._filter_kind(filter)
+        matching = [message_id for message_id, media_kind in self._media_kinds(chat_id) if media_kind == kind]
+        result.total = len(matching)
+        for message_id in reversed(matching):
+            if limit is not None and len(result) >= limit:
+                break
+            if not offset_id or message_id < offset_id:
+                result.append(self.make_message(chat_id, message_id))
+        return result
+
+    @staticmethod
+    def _filter_kind(message_filter):
+        # Filtri supportati: foto e video, gli unici media generati
+        return {types.InputMessagesFilterPhotos: "photo",
+                types.InputMessagesFilterVideo: "video"}.get(type(message_filter))
+
+    def _media_kinds(self, chat_id):
+        kinds = self._media_cache.get(chat_id)
+        if kinds is None:
+            kinds = self._media_cache[chat_id] = [
+                (message_id, kind) for message_id in range(1, self.world.messages_per_group + 1)
+                if (kind := self._draw(chat_id, message_id)[2])
+            ]
+        return kinds
+
+    def _draw(self, chat_id, message_id):
+        """Mittente e tipo di media del messaggio, sempre uguali per la stessa chat e lo stesso ID."""
+        rng = random.Random(hash((self.world.seed, chat_id, message_id)))
+        sender_id = rng.choice(self.world.user_ids())
+        media_kind = None
+        if rng.random() < self.world.media_ratio:
+            media_kind = "photo" if rng.random() < 0.7 else "video"
+        return rng, sender_id, media_kind
+
+    def make_message(self, chat_id, message_id, is_private=False, grouped_id=None):
+        """Genera in modo deterministico il messaggio message_id della chat."""
+        rng, sender_id, media_kind = self._draw(chat_id, message_id)
+        date = self.world.start_date + timedelta(minutes=message_id)
+        size = 0
+        if media_kind:
+            size = max(1024, int(rng.gauss(self.world.media_size, self.world.media_size / 4)))
+        text = f"Messaggio di prova {message_id} " * rng.randint(1, 8) if not media_kind or rng.random() < 0.3 else ""
+        return FakeMessage(self, chat_id, message_id, sender_id, date, text.strip(), media_kind, size,
+                           is_private=is_private, grouped_id=grouped_id)
+
+    async def iter_messages(self, entity, limit=None, min_id=0, offset_id=0, reverse=False, wait_time=None,
+                            filter=None, **kwargs):
+        """Cronologia sintetica: 1..messages_per_group, a blocchi da 100 come Telethon."""
+        # ID "marcato" dei canali, come utils.get_peer_id di Telethon
+        chat_id = entity if isinstance(entity, int) else -1000000000000 - entity.id
+        newest = self.world.messages_per_group
+        if reverse:
+            ids = range(min_id + 1, newest + 1)
+        else:
+            ids = range((offset_id or newest + 1) - 1, max(min_id, 0), -1)
+        if filter is not None:
+            kind = self._filter_kind(filter)
+            wanted = {message_id for message_id, media_kind in self._media_kinds(chat_id) if media_kind == kind}
+            ids = [message_id for message_id in ids if message_id in wanted]
+        count = 0
+        for message_id in ids:
+            if limit is not None and count >= limit:
+                return
+            if count % 100 == 0:
+                await self._rpc()
+            count += 1
+            self.yield_times.append(time.perf_counter())
+            yield self.make_message(chat_id, message_id)
+
+    async def iter_dialogs(self, **kwargs):
+        for index, chat_id in enumerate(self.world.group_ids()):
+            if index % 100 == 0:
+                await self._rpc()
+            yield FakeDialog(self.world.channel(chat_id), chat_id)
+
+    async def send_file(self, entity, file, caption=None, **kwargs):
+        await self._rpc()
+        self.sent_files += len(file) if isinstance(file, list) else 1
+
+    async def _download(self, message, file, progress_callback=None, thumb=None):
+        size = message.file.size if message.file else 0
+        if isinstance(thumb, (types.PhotoStrippedSize, types.PhotoCachedSize)):
+            # Come Telethon: le miniature incluse nel messaggio si scrivono senza richieste
+            with open(file, "wb") as target:
+                target.write(thumb.bytes)
+            return file
+        if thumb is not None:
+            size = thumb.size
+        if self.world.download_latency:
+            await asyncio.sleep(self.world.download_latency)
+        chunk = b"\0" * CHUNK_SIZE
+        target = file if isinstance(file, io.IOBase) else open(file, "wb")
+        received = 0
+        try:
+            while received < size:
+                part = min(CHUNK_SIZE, size - received)
+                if self.world.bandwidth:
+                    await asyncio.sleep(part / self.world.bandwidth)
+                target.write(chunk[:part])
+                received += part
+                client_tracking.track(self, rpc_calls=1)
+                if progress_callback is not None:
+                    # Come Telethon: il callback può essere una coroutine
+                    result = progress_callback(received, size)
+                    if inspect.isawaitable(result):
+                        await result
+        finally:
+            if target is not file:
+                target.close()
+        self.downloaded_bytes += size
+        return file
+
+    def new_message_events(self, count, chat_ids=None, start_id=None):
+        """Genera eventi NewMessage sintetici (con gli attributi letti dagli handler)."""
+        chat_ids = chat_ids or self.world.group_ids()
+        start_id = start_id or self.world.messages_per_group + 1
+        for index in range(count):
+            message = self.make_message(chat_ids[index % len(chat_ids)], start_id + index)
+            yield FakeEvent(message)
+
+class FakeEvent:
+    """Evento NewMessage sintetico."""
+
+    def __init__(self, message):
+        self.message = message
+        self.chat_id = message.chat_id
+        self.id = message.id
+        self.is_private = message.is_private
@@ -2,9 +2,12 @@ import asyncio
 import os
 import random
 import shutil
-from telethon import TelegramClient, errors
+from telethon import errors
+from event_bus import log
+import client_tracking
+from operation_control import OperationCancelled, ProgressTracker
 from utils import load_json, save_json, sanitize_group_name, log_error
-from config import API_ID, API_HASH, USER_GROUPS_FILE, PHONE_NUMBERS_FILE
+from config import USER_GROUPS_FILE, PHONE_NUMBERS_FILE
 
 async def create_client_for_instance(nickname, instance_id=None):
     """Crea un client con sessione dedicata per questa istanza."""
@@ -28,31 +31,30 @@ async def create_client_for_instance(nickname, instance_id=None):
             instance_session = original_session
             
         # Crea il client con la sessione dell'istanza
-        client = TelegramClient(
+        client = client_tracking.create_client(
             instance_session.replace('.session', ''),  # Rimuovi l'estensione
-            API_ID, 
-            API_HASH,
-            connection_retries=10,
-            retry_delay=3
+            nickname, "groups", instance_id
         )
     else:
         # Se non c'è ID istanza, usa la sessione originale
-        client = TelegramClient(
-            original_session.replace('.session', ''),
-            API_ID, 
-            API_HASH,
-            connection_retries=10,
-            retry_delay=3
-        )
+        client = client_tracking.create_client(original_session.replace('.session', ''), nickname, "groups")
     
     return client
 
-async def list_chats(client, nickname):
-    """Elenca tutti i gruppi e canali disponibili per un utente."""
+async def list_chats(client, nickname, cancel_token=None, tracker=None):
+    """
+    Elenca tutti i gruppi e canali disponibili per un utente.
+    
+    Solleva OperationCancelled se il cancel_token viene annullato durante la scansione.
+    """
     groups = []
     try:
-        print(f"\nRecupero gruppi per {nickname}...")
+        log(f"Recupero gruppi per {nickname}...")
         async for dialog in client.iter_dialogs():
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            if tracker is not None:
+                tracker.update(messages=1)
             if dialog.is_group or dialog.is_channel:
                 username = f"@{dialog.entity.username}" if getattr(dialog.entity, 'username', None) else f"ID: {dialog.id}"
                 ascii_name = sanitize_group_name(dialog.name)
@@ -63,21 +65,29 @@ async def list_chats(client, nickname):
                     "link": username,
                     "members_count": getattr(dialog.entity, 'participants_count', 0)
                 })
-                print(f"- {dialog.name} ({username}) - Membri: {getattr(dialog.entity, 'participants_count', 'N/A')}")
+                log(f"- {dialog.name} ({username}) - Membri: {getattr(dialog.entity, 'participants_count', 'N/A')}")
         return groups
+    except OperationCancelled:
+        raise
     except Exception as e:
         log_error(f"Errore durante il recupero dei gruppi per {nickname}: {e}")
         return []
 
-async def get_all_user_groups(instance_id=None):
-    """Recupera tutti i gruppi per tutti gli utenti."""
+async def get_all_user_groups(instance_id=None, cancel_token=None):
+    """
+    Recupera tutti i gruppi per tutti gli utenti.
+    
+    Se l'operazione viene annullata, vengono salvati solo gli utenti la cui
+    scansione è stata completata; per gli altri resta l'elenco salvato in precedenza.
+    """
     phone_numbers = load_json(PHONE_NUMBERS_FILE)
     user_groups = {}
     tasks = []
     temp_sessions = []
+    tracker = ProgressTracker("Dialoghi analizzati")
 
     if not phone_numbers:
-        print("❌ Nessun utente salvato. Aggiungi almeno un utente.")
+        log("❌ Nessun utente salvato. Aggiungi almeno un utente.", level="error")
         return False
 
     for nickname, phone_number in phone_numbers.items():
@@ -99,14 +109,18 @@ async def get_all_user_groups(instance_id=None):
                         break
                     except Exception as e:
                         if "database is locked" in str(e).lower() and attempt < max_attempts - 1:
-                            print(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})")
+                            log(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})", level="warning")
                             await asyncio.sleep(random.uniform(1, 3) * (attempt + 1))
                         else:
                             raise
                 
-                groups = await list_chats(user_client, nickname)
+                groups = await list_chats(user_client, nickname, cancel_token, tracker)
                 await user_client.disconnect()
                 return nickname, groups
+            except OperationCancelled:
+                if user_client.is_connected():
+                    await user_client.disconnect()
+                return nickname, None
             except Exception as e:
                 log_error(f"Errore per l'utente {nickname}: {e}")
                 if user_client.is_connected():
@@ -117,17 +131,29 @@ async def get_all_user_groups(instance_id=None):
 
     try:
         results = await asyncio.gather(*tasks)
+        tracker.emit()
+        
+        cancelled = any(groups is None for _, groups in results)
+        if cancelled:
+            # Mantieni i gruppi già salvati per gli utenti non completati
+            user_groups = load_json(USER_GROUPS_FILE)
+            log("🛑 Recupero gruppi interrotto: salvati solo gli utenti completati", level="warning")
         
         for nickname, groups in results:
             if groups:
                 user_groups[nickname] = groups
         
+        if cancelled:
+            if user_groups:
+                save_json(USER_GROUPS_FILE, user_groups)
+            return False
+        
         if not user_groups:
-            print("❌ Nessun gruppo trovato per nessun utente.")
+            log("❌ Nessun gruppo trovato per nessun utente.", level="error")
             return False
             
         save_json(USER_GROUPS_FILE, user_groups)
-        print(f"✅ Gruppi salvati in {USER_GROUPS_FILE}")
+        log(f"✅ Gruppi salvati in {USER_GROUPS_FILE}")
         return True
     finally:
         # Pulizia delle sessioni temporanee
@@ -144,7 +170,7 @@ async def get_group_link(chat_id, instance_id=None):
     temp_sessions = []
     
     if not phone_numbers:
-        print("❌ Nessun utente salvato. Aggiungi almeno un utente.")
+        log("❌ Nessun utente salvato. Aggiungi almeno un utente.", level="error")
         return None
     
     for nickname, phone_number in phone_numbers.items():
@@ -168,7 +194,7 @@ async def get_group_link(chat_id, instance_id=None):
                     break
                 except Exception as e:
                     if "database is locked" in str(e).lower() and attempt < max_attempts - 1:
-                        print(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})")
+                        log(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})", level="warning")
                         await asyncio.sleep(random.uniform(1, 3) * (attempt + 1))
                     else:
                         raise
@@ -178,18 +204,18 @@ async def get_group_link(chat_id, instance_id=None):
                     group = await client.get_entity(int(chat_id))
                     if hasattr(group, 'username') and group.username:
                         link = f"https://t.me/{group.username}"
-                        print(f"🔗 Link del gruppo trovato con {nickname}: {link}")
+                        log(f"🔗 Link del gruppo trovato con {nickname}: {link}")
                         await client.disconnect()
                         return link
                     else:
-                        print(f"⚠️ Il gruppo ({chat_id}) trovato da {nickname} non ha un link pubblico.")
+                        log(f"⚠️ Il gruppo ({chat_id}) trovato da {nickname} non ha un link pubblico.", level="warning")
                 except Exception as e:
-                    print(f"⚠️ Utente {nickname} non può accedere al gruppo: {e}")
+                    log(f"⚠️ Utente {nickname} non può accedere al gruppo: {e}", level="warning")
                 finally:
                     if client.is_connected():
                         await client.disconnect()
         except Exception as e:
-            print(f"❌ Errore di connessione con l'utente {nickname}: {e}")
+            log(f"❌ Errore di connessione con l'utente {nickname}: {e}", level="error")
             if client.is_connected():
                 await client.disconnect()
         finally:
@@ -201,7 +227,7 @@ async def get_group_link(chat_id, instance_id=None):
                     except:
                         pass
         
-        print("❌ Nessun utente ha accesso a questo gruppo.")
+        log("❌ Nessun utente ha accesso a questo gruppo.", level="error")
         return None
 
 def display_all_groups():
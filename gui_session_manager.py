@@ -5,12 +5,14 @@ import time
 import threading
 import uuid
 
+from event_bus import log
+
 class SessionManager:
     """Gestisce le sessioni per evitare conflitti all'interno della stessa istanza."""
     
     def __init__(self):
         self.active_sessions = {}  # {operation_id: {nickname: session_path}}
-        self.mutex = threading.Lock()
+        self.mutex = threading.RLock()  # Rientrante: cleanup_all chiama release_session
     
     def create_session(self, nickname, operation_type):
         """
@@ -40,7 +42,7 @@ class SessionManager:
                 try:
                     shutil.copy2(original_session, session_file)
                 except Exception as e:
-                    print(f"Avviso: Impossibile copiare il file di sessione: {e}")
+                    log(f"Avviso: Impossibile copiare il file di sessione: {e}", level="warning")
                     # Caso fallback: usa un percorso univoco ma lascia che Telethon lo crei
             
             # Memorizza la sessione attiva
@@ -74,7 +76,7 @@ class SessionManager:
                         try:
                             os.remove(session_file)
                         except Exception as e:
-                            print(f"Avviso: Impossibile rimuovere il file di sessione: {e}")
+                            log(f"Avviso: Impossibile rimuovere il file di sessione: {e}", level="warning")
                     
                     # Rimuovi eventuali file correlati
                     for ext in ['.session-journal', '-journal']:
@@ -97,7 +99,7 @@ class SessionManager:
                         try:
                             os.remove(session_file)
                         except Exception as e:
-                            print(f"Avviso: Impossibile rimuovere il file di sessione: {e}")
+                            log(f"Avviso: Impossibile rimuovere il file di sessione: {e}", level="warning")
                     
                     # Rimuovi eventuali file correlati
                     for ext in ['.session-journal', '-journal']:
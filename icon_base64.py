@@ -1,3 +0,0 @@
-ICON_PNG_BASE64 = """
-iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAEAAElEQVR4nOz9Z7Rt2XXfB/5W2OGkm+/L9d6rDKAKVSgUEgEwASAYABIgQVKBpETIarsltiU1lYZasjXclnpo2JZl64PVUtutYNMSKZFgTgDBApGBAirHV/VevXxzOHGHFfrDWnuf84qUx+jvPmNUvXvPPWfvvcJM//mfc4mlfu69p30JACHibx4QCMDjEULgPfFfH/4uRPuPQLSfA4H3Dikl3nu88wgp5p9p7uPD+96D9769m4ufp7kf8W/hz+HJ5r+C90gp26fGexaGNR9OO0gPXuC8R8owXhHHMh8DLE6OCJdtLyakbO8/n5M3fSeO0cfvxiG1zyJlGIQgPMv8Wf38+4B1Yb6lkO3DNOsSPj+fjDgMxPyp4/3DuISYr6n3oJXCedd+afE5nXWLN1u4X3z7TXPmvY/jn++hcD8x/y6iWfp2H4XvgZKyXVvv43hF2EuL911YyPb7ot23C3spbLT2ucIe8e06ejyy/Vx4pnZPtT/MRaLZt83zhvvOn6X5vdkDYdzNOvp2CLiwf7x3c7m64xNhjt68ieNsxb3oEUK2896sezP2Zo7/+BXCszrvkd4vyDvzC9zxaoS7mbT4tCKKa/u9uCGa99rN7wnCL+abvRUwBM75Nw1UIKNwiVbK/XyRCIMNeiZuaBEUTStEzWzE4crm3jL+3IhHfF6x8Pk3v4QQ8Tvz+WgmrfnbfMHf9LHm2jAX6nYU4f/ORYX3pnsuCq9ohK35ViNonnaxBaJVpnFUrRIIzylbBdC8lJKLN203daPfm13onGuutDj88J6MCt81QicW/j43EPhmCnz7rxBzRTdXhm+aROaKq1E6zZib/SSlbNewnTshWoESzNdwbmzmAto855tu+8fWwy/8vrg1ozptv908rxcLc9WOP96uUZTt95mPr1E4cU78/Cnnqyrkwvjap457ovk9GN/FkS1eS4s7ZntxoZqF8XhHO4pWqyxYgMXF9r7ZsHNBlIJ2AzXWFgESgY0aEED4+YwKKcGDi4MJv8eNIEXQNjRWIk50NF/torQWKmxgDyil8C5sQCnDs7WbsTF7C4qjefmoKUXzfAseQqtTRWM9RauAPK5dNKnE3BNamHhx543is881uJDzRW/uNd9TcZ2i4OPnytF7cK0FXvhi+/x3Lr5zrlWUzcaSUuAcdypAH0VKhLlvlXTUDNITFJqYr4OPzziXgMZKSbwIm9S3124EVraf9W5x0PP90axba7SiYEkZxmydj4rANxefe6uNPm0GtbCHmlVtdffi/6PipRHuOEhxx+dEa93vVOTh5yC8UfFHAwYLnm/znWY/ECz23HtrZGVxSv2dz9uss4z7qd2rc1mW7UZ8k4VrXUUpWw3UWB0hGkFu7UurOebbdOHVPrhYeNgFLdlo40XJbd1I3y5u0PKLFq+9PHLhuVsls+ANCCGRQgZtGK22WBinFLK1oIvC3bj5iyZhQUfQ/gkQyPnPzee9aBy29sON0njTI8Z/F4Spva5op2Rxiha9nOi6tc/mF5+yfX/hGZp7LVr8xfsB3jEPGxph8PP5k1LNLZm408y3w3jzmrzp5XHzgTVr+KbPiKABWTCRc0F+k0fzZqFd3OztGO64xvz7YvGhFx6kEaY7nknOBT6qMha9DPAL173TUDYhLdCGrXc8e6PY2vfmYVv7jPHBpIiKVTTKaT68dg7EwvQ17zbzMejl7fvNfpo7jgsXaCxpe+NmEKL9nmytXhi8i+Y7uMgLm5w7X2HvvmlCmng6XtdFS99q3mhNmutKKXFuwTVmvrhNrCtpLKrAuaid2027MAaYa+f4wM0Y2mde2O+IBc8GcUeI1MS4jaJr5qSJ+UW8Z1A84Xq2cdnifRsr4aMZbDcCYJ1rJ7ZZk1aA27XgjnlqhFr+Sc/kXLumzjva2L15pAXrJISMa+CjdSIoWTw4aB3HBYV3x6IvbGQhRHu/OeZDjJN961G03lX7FHNrvOglNJd2jTDdoSTm92/c8HksT7t3/ML+EosXjm/OFed8vy08zvw2C/M/f+75B9zCfpnffy4TCyNtJXNxTRZfrQcX7+cW9pLwcU0WrqgXH9cvPGXrvrHw8EIivce3hkfcMWl3WhJ/58Q1ejIKUgsExom7wxVnDpwIgnC1EcWCJfGAlKDippMxvjeGudAu2N/we5yoCEi2mrABIgEhwjPY+cBQSs6Fo1nABQFrXGHfWP0FT8l7gWsWx7t2d+jo4goxv4b3HqkELm4MwUKc7mWrXOchgWiVdqNMfHgElICo9lp/QMbvLIJttMvuESq4/J65e+8drYvVRElCNJ6RROCxzmGdR8i4fpIAMDX3WPD24hS1f3OusaNhPedgc/jPOh8sXVw/uaBQFz0BJ3z7mWaDN+PVUoZwiMZK3ukOE/dao8iCkQj3DUpz7g05osFtBXpulduQtNln8W+NBx2EM3pEUZYkgqhLFxSKuHOvNXPfzGn83yLgeofX2c7N3Ntor7qobJf6nfaKAhZikPbO7WQvWkeYa/sGrW0sbdAVb/7O3Go1E6Widl/UfmGSPc6F90zEDryQd2jXFqn30UrEGB8WJ7H5R8QNHAVFzD/XPFewtPNrEAXgTtd4rsUdDSI/31TNczjvonVsFEBc2bipFj2URigbHMM3Bl2IYN2be3rumKvFMYQ3G8wg3KtRvgKwC7Fjs9GbWLS1MY1AuWDNPW8Ks5hbyua+SgWEvoktvXftPUJMH/eFn+Mrc7R+bkXxczW9iE2IuGwxagv7CxF10cIEiPlzNbuj8ZoaIZGiFfWwfgufb8bpWRDgRoCkWNhX8z3VKNRmwzd7oRFAIebfDyNa8IIWXYQ4962H2Hgifn6fRjG187M41IXnmWcDFv2PRrH49lmadfSAns/l3GotTtSCab5jIloXqdUucVNLApjHomYM1xDNBEt5hwVoFsR5T21DKihPJFki0EqTKkmqHKkWaKVQSmFtELREza2Zdw6tJM47lNTh+qoRSt9aG2uCtVIiuLFSxgVDIqQg0RJrw3vCO2wcf23DSCXz8KC2jiTRWOdwzqGUwliLtZ5MS4yxIGVw62MqK0tTnDVYZ9Eqmbu4stnPotVb3jWegEBJomfg8C4Amy5a8+CKuzZ74iJCrKNyq+oKh0TJIKjzrJ+kxdPibgkWLj6TUmHzegHeIoRCSkGiFXgwzsYLSYy1OB+UmRTEdZAkicbUJoYVYTzNOOcuqmjd/Ab4BTdXcNAKtfUeQTOAxnsLfmMzj1rpqGwJ1t41KWrQKlh0531UvvM9KIRqvQ3jPMYYEimC8vbBOwoWNKynjxhPWAIBqAhsKyrrMR7K2mEsWASJBCnuTEc2iieIW+tW4PCtgguysxAetZ50GN+C5Zr/3c3NZas4FsInPIjlQWceRjWfib/MEesF7bfolPwJcVXjPSzqoEYRNFY2oO9hEss6rHaeatb6Geu9hAQDdUGmBf1ejjeGTp6RpRqlAvhUVTV4jxEacOgkwZsaKaCTZwgc48mM2mtsXWFqA0Iihae2DlO74OJJSZoIVKJBhE3jvMUYh8SRJjq4jtZSVhVZJydNNdZ4epkCJM4bVNZhNpkinCHrDjCmxhiLQ1FWNQKLNcFCppnGC43Hhd3uPVJp8DWmbtxYG4U0gktSYBCUtcUDwfhKytKgMCilg1LDIdMca2wUwLDBayuQzmC8QCqFdy6sq/NoCUgFgPUOSfDOXBPjO0ftQUpNroMLnEmHEo7+0hKTouLWrX1UlqKkRHiHVoq6tqgkJ0k0SnqkN3ihkFri6oq6qnEkKOnaMMk7i7MepQRISVkHRaeEwziBdSHcCAoo/FuWBqEV3jvyPMcLBbbGWgPOUdlmJ0bsI+7vNNN4L0FKpDeEUE9gLVTWYeqKwdIS3Uxja4MxhsLYiJlIkqh4ytqE7JLwVEWNF2Bqg9QSYxxea5RUTK3geOaYGY/zQZBT1aRe50Lzx9LwiyLm58K86K02IZOfy/ybxZVFfKiRTH0nYDZ3pQV+4YEWRXpB8Bvt1Lpg8e53YAl3uv1SSqx1zKyl3+3wllNdzq2myHJC4muWljqsrK5y+r77uPv8SdZXVtCJRvcGKCUxVYHUXTp5gnMVw8Mjqrqku7JBebBD1l9BSEWaaeqiRHT72MrifUGW9OgsryJ1gpnNmJSecjpEYqiKmiTTGOfIlEDlfayBshiS5n1sVaKqQ2pnqUaHFAYSDJoZk4Mj6umEIlnlrrc/zoVzJxhPPSiFrScUx7vMxiOWNs8ibMHuzh69/grOgy2PSVdOoYshJYJUeYTO8OUUr1Ly1VPsX3+D5V7C7uGYpNsnkx6DQtZjVJYi0j62mJF3c2xZMBqOWD17HlOV+Nkh3kmcVGjhoLOGKI4R9QyZdvAyYTo8JkkTbFlgMORpjvECoRWurvFSI7xFWMvw4IBpaVBSkKeC2ze2ufjIu9k9Mnz7s7/BudMbXLjnNKcefhzncyQGU0yYDIdsnD5BUdRU0zGumpL1l/FJToIj6WRM9veRSqN9TVXPqIsCaz15f4liPESlKcVoQm9tFeoZtXHUkymyu8LkYJe1E6s8/dI20ltEPeGDH/sYxeEexfCAqqoQWYadjslXNji4fYuVkydRWY61nlSAcTXUBcI7SDIQkutXtpjs77K8NqDf7+C8Z3p8RDWrEEpRG49MFRKFFwrjJXvb26ysLLOze4T38Mb1bUaTkq2jim5iqROBkQmTWjKqwTqCN7ogtw1XxcVUYoMH3Rk9NFIvGqsdw7BFXoqYK4goxov3EEv93LdW+o5HoMUFFu15gwovCnZjzeeKIOTbFwNoAVTGYr3g5PqAB88tsa4rRFXRXx7wlgfv5q1vv5+1tWX63ZTpeMT2jVvc2h5iraWXCkbjgllZ0R8MmJaeJFFMJyOKWcl4XCIk5HnKaDjirrtO0elkHB6N6S8vcXg4YXUpY3W5HwSvLtFaMystB8OShIrzZ5Y5OJxyOJyyurYWrG4xYWVlCa08zhiu39hlMi3YPq6pasM9G5rV1T4pjuWzZzFWcPP6NhLPYNBnOp1RVpbZbMq5cyeYTEqOhhOKokbrhDxVjIqaXqZRwiOVpKxMsKRSopOMWVGQaMVyZtkaOsChJYynhso4Op0cZw3ew3I/ZTaZ0F1apq4tMoJdpizpdHO63Zx6OuFwXGMcGOs5sZxyPJriCJvReI3yJZXxCBnCrW6mEAIORjP2jkvWlzqoJKEuCnZGjrvuu8haZrHeU1Y1XndROIrxFKUFVe1wQjGZFSRminWeTm/A+kAznNow13WFQyNwOGuo6xopFYl0aKXJEoGta5Is5XhqEHgq4/Eqo6NtENitYyyeE6s91tZWmZVh7jtaIJTE1YbKgbGGXqJIVMBatJZUFpROsKamNB6kYv9ogneOtaUc5yHXgkxLvK0pSkPlBN1uigKEN2RZyqyo2Vzv46uK5aWc1X5Ov5twPJqwdzjjmUt73DiYMZpVCJkwdZL9AkrjURLUAvbUZH+aMHAu+ovyNsdMFhmKzXtzAzyX6RCqgViKIcAciJsTMlrJ9fMHaUCTNrZoQBQp298Dkh3Bn3iZWWnZXOvz8IU1Vpmy3M95+3vfzSOPvIXTZzYoZzNeefZpXnnlDYrRkNFwho2PYYzl5FovaHznSbVkMq0QSqO0jtc31NYhnGGp16Eylk4no9fLKErD0fGYTIlg3eN/1jq0VkxKS107erkCIRnPKjp5Sr+Xg7OkiUZJGI5mHByOWV/uMJvOOJzUPHBxPShBqTg4ntHrpYwmNcWsYmmQ0elkTMYFQniSRFLXnqo2FJWj1804HE5x1pEnAp0opFQcjwq8h06mWoJM7QSrg5SysgynNb1OQm0Mw6nDOxtCAgRKOAaDHFNb6toiBCSJZDKryZMAInzz0iGrJ06w1rXc3BqxP6o4u5JyYbND7WNqEYnWkkRLispGKxQUhnWeREJhQoxvvWBYGJTW1LVlpZ+BgMmsJkkTEiVZWVmirA2joyEbgzTgBc6DbGJ1Q1EaFIIslUyLGo8IYV8MWF3c2IqANUkpMDaEnZPSMauCAOaJiBiJxSJZ6ad46ygry6SoEYQ5sY6g3LoJ1npmlaPTycDWeO8pK8vUhLBx0EmY1Q5vLRsDjVISrWQwHkqg435q5qqoLIkKuIh1nkwJNlZzlnNJL8vYWEm5dP2I5y7vsz+xoASVSNmfQWEhlY30BlCxBdulbPdEwLTmRLoGK4AwrjfLaWv9F+IFsdTP/Z2pkzc5AQ1aHJCKOSNvgT8v2xs1AIlrUdeydiAk73nwNCd7Hi083/+xD/Hud76Fo6MjPvcHX+fg9hZHR4d08oQszRBK0smSmH6xVJWhk6UIPKNZTZYmKBVCD2McKlEolTCZFkxnFSfWl5gVJbX1rK30mBUVS/2MoqiZTgo2l3O294d4JEv9lLJ2CGeRSlKUhkRLlpf6SCkYjadIIej3O9zcHVFMp6z0cwZdzdXbI9JEs7GUkOYp1oN0UNQGlSQR+AuhkTWW2lhq40i0xljLrDSUlWOpo0mTEN8WlaGTJ5S1x1hHJ1MoJVFSUtVBaJJEMZ2WGOuYVo48CSQn5x21DTjAcj8LguxhNLMkEgSOL7x4yF/5zz/BB+/rsX/lEpcub/G5p3Z54uUh739gjfvODZgWhqK0GOdIVcjulC7EvLWxzCoL3pOmitXlPnvHMwor6HdTSgvrg5TxcMKsdkghUSoKm7Nk0keMAZASrRTGWLSSTMuaTqKojQUhyBKJsVBFZZHqgIeUpUErgReBAtzNFeMSOpnGW8ukqHDO0+nmeOeQ3mFcUADGSxIFa0s5idYcjQuEFNQWJoUhTyR1Ha4/SAWHE8PUwEo3QSrFcFaz3A8YS6YslQlYUqoEZe1QUlDbsP99y6wM0nU4KpGAltDvKO47s8RSrtg5mvGVl/fZG9dkiWRqFVvTBvtZxAPm4KmfI6Vz68489d1m40QQ/yCcUZksECZ0qxAaDeLnF27R6MiZFJGJh1hgPDWfiVrGxZRgI6wXTq/zvvtXMKMj7rlwN5/+z36a0f4ev/iv/x1vXLvNrPRsruZsrC1TWgHe4J2nLCuUDIBVplWwAA4SrZBaYW3YhBawTiG9I9WSSilG4xllbXAOxqMp3V6GM5a6NkxnBTuuZmm5R1EYbu+OGXRTBr2EnYMpiZacXB9Q1DVKwNpyl53DKS9d3mVlkHJ6c4mirNFJwspSzmhmQWm882RaMZzOqJxg0NGY6QxBEOxZZSjrkLXweGrjUEqQ55pJYXAELntRe5x0bWqoKC3dXID0weU0jo6zdDLJZOZx1mElWEL6VEtQSGZFhVIKh8BYRz9P+PxTW3z6Zz/Gn/uRx/jGF55ka3fK7mHBSjfhgRMZ33j9kHMnunTzlKPJGGt9FLyg9LM0AI3e27DaUqG0ot/NKI+nTMZBiU6mnuEs4AReemxtkd6x3NEkGobjCusEiCCUQkqMqTC1Z2wdeIeWkomxOAJAPDM1s8JjLSFNTPAwO92U4cxSWU+iFVVlEEKQ5wmpEuyPSgadJACSWrGaK0Yzg7OWUWmYTMqQzpSCLNHBs0gSDqYGKeDMRp/rBwVZqvBCkqQJs8rQ1UBdkaiEOnomkpBhUkqiRAD6jPVoLXAIVvsZk8IwqSzVuObbrx2QJ5LzJ3v8yHec59LVQ751+ZDEFNzbT9ipNMcVJC1ZsDHGc1KQXKwHaBN2gVfQZnQImZ8597lh3wp0+8tCXjhQGpvc45350+bV8AXmRMaoUaTEWENpJR96/F4uLjn2D4/4Mz/zCd73rrfy7/+3/8Drr73B4dSwuTpg2VimpSXrKoRw1MaTp8EdNsaD8xghMLUJpAkhqKvgHmotUUiklnRzDVYwK0o6eU5V13SzgGyXlUEkCi0FaaKxXqGTjExo9LigqBypNvQyRWUsR6MpUkmWexlb+xN2DqZsrnZYXe5QVgYILnWmJUNXc2NnytmNDoejkkQppJJUlQEhqIxFKYkUcwvfJ5BL6togcGSpZDIz2Kjdq9KglaTfSULGInoOAN0sWJZiZqkrRzcN7qdxkGjJtDA4IcB4Eu1ROngQw1lNvrzCR95/N1deeYOvP/UGW7e2qWvL/qgkTzze1jx7+ZBH7lmll4YKQetimgvP0bhEiZCO9EJhbVBKe4cTnLMoKZmWFVVZA5B3ck5vLlOXJddvHVJIj7MBRZrVjm6mKWuHJ2AAUvrg0gtBnkqkUtTWU5WGugpeQaIFDalDaYV1IbNSVxafe3p5wrgwWOs4mAbhHhWGTpaw1Ekoa0OWBuyncpCmChuFRguHVJrSC3rLXZwrGdXQzRSz0tDtJPTyhNu7Y/JlhbceawxONJITLK+LigtAK0+iNNaGrMwgF9ROMq0cq2nAVa5uT7i2NebkWoePvfsML14b8cK1IzYSS0elbM1E9OAWIvNGKEXkSiz+dSFr553Hi3lo3v69URrLg878/SbfGD/UpBfvVA0L6UIhWsUBIrg/xpHnGd/7yGkY7nH6/Hk++SMfYHg05onPfpGj4RSdZa1GMsaitCTLs5CS0gopoZOnFLOKVIeNXdvAEfDOoRONjFZIaUUnDzHnSj9lPC6ZFDVVZTDO0e12UUpQlhWDboaWMJxVCJVSFgWp9GSJYjyZ0ctCvJskSRyj5NbelHOnBix1U45GBVkiOTiesTzISGPIcDgq0EqwudpjVtZInVBXFd6FOLU2Jua/A1aRaA14TGUCl0ErisqgtcSa4MZLAUu9FGuDxU3TBGMciYK6tlS1BQGlCdbS+ZAf99FV9kAnVRGPSdg9mnLzqOQvf/xuLl055srtI6TSHE1rvIP94ZTLOwWdTsq77l2jmwXwL2wMGeLfaBgSCeM6KNZUCawPa2QaK2yCQHfzlNWuZjgpmdUhrZlqyBLNaFZT2RhixLlpcBnvPKfXO4ymFbUTJNIzKx0OTzfVwcVWIVQQAvrdlOGkZn0pw0VvqyhtwHokOCS9PEUJz6QwpFoxmlU4D71cRUwjSNSoMCSbZ9BKUu1tUZYGJxTLORjn6aSSSeEYVY5T/ZCOHpeWPFF4Z0m05HBc0wkJf/q5ahmRiRKMZhYnBBbJzlHBSkfRSSW5huNZCIXOr4UMxB8+v8O0qJBpzq1pVHpCRH7AHAhcZCI2Zd0iZhCcm9ezLPJ2WhLd8qDT4ojthRYFX9zpETSgX+s1xFhHqyA8K0tdvu+RE+xvbfOnfuaTvPsd9/Irv/hbPPXCDS6c6GKMRUgFOGZFjfdBiBMdNnGn1wkDMRaEp64NUkqUgNoEIChN4qCVopcncdM4uh0FaMqqDnGc1jghMMbT6XeYjcf0cs3N3Qm9XgfpHVo6EuExxtHt6GBJpOR4UjOe1rzl4jrOe4qyppMF8sv+8RQtQq48zxS1cWztTzm92cO5gKRPZlVwb4UIbr8ItfVJonCesLG8C+NRgsqE/LsnCJRWIVatjSfVIb6dlgYlJKZRKG5OBHHWU5jw/W4iQQTFJvF4IRkVlmeuHPA993fZPnZcPN1n56jgcFJzNC7ZGxbsTxydLOFt55fppBF1t77l33e7GUfjEu8CwcVbR1O6YV1kBvoAEgoB3VyjRaDyKik4mobYuptKhJAMp1UMK8OYfLTtSsCgl7TZgRD+BcC2Np40ooDH0QtLE8VSrpkUFVophPAB0ReRVC4lsbIp/F0pSuOojCdTnkQJitohdYpVGvIBs+ERspqRakmapuwcTTmzmqGx1NazPwnh3EpHMCtDuJmo4PEJAamSICR5ApXxGBNAQSGgdp5EJ0wrg7EeXMBoEDApA7Hq9FrOSlfzjVcPuXU4o5OnXJ/qgPGIPyGjL2iJVY2BDhyOxuLf6QU0wKFeRAXnAOBCJVNzCyFQomm4ETREU6AjlWRaGs6eWOe7HxhwuL3NX/y5n+Lhezb51//LL3F9d8xdZ1bA1AgBRVkhlSRVgXlXRbi/jZ2cp64rtAz3nFMYPXkW3KmiqklTQVnXOOvJE0lZGIwPsXYnUxRVTVkZNtYGWBOQ3Zs7Y9ZXelhjsICzFt3JyHNBURSUJgB/tRcMeimTIpCIlFIh/LCeREqyTIUYTAkGacL+sGRaWKSA4bQmSSSdToInMOmE8BhhqWpHbUIaz9owh0aIkH5zoFRAerUM6HOig0AdT0pSpShrg/EgCQCTjq6hkIJUC4yHLJFYG+JRrwXOOhSecen5xusTzqxqnrtyyLgwHM4MVW0RPqDPvajwa+dxNeQarLHoRDEramrjSKVHR4qsdeFnh29TkbX19DsKLaCOz5slOmRdpIqYk6OXacraYp1BCR8F3JFH7yPRkqJ2kZ0qcNbTTyWJDiHPai+ltp5BnqCkp59rZpXD2lhIhMcLgQomERnrOZQXrVKy1pHIYCWtzsg7GUf7e1TGkUQZOJ4UGBS7w5rNfgA0vTXsjGqcScLeqwP5ycdUYZJIZqVlYoN8KRmyK9aHjJF1Duk9uXIIHTxJLwSJDMDmjb0ZB5nmbef69FLJi7fG3NWHGxMVlJu8M5af18/MtUKoyfB3EAXn5chBuvUdpZDMrf8ikUDIUBAiZBsPtFV7SgomheHcyVW+/+2rXL58i5/7v/85Tgw0//x/+regErqpoprOyJNg5bNUhw3qHAKJVmBtAGQEjk6qUHiqyiKSBFs6eplE4hlPAvo96Cak2oOpkR5ms0iqQ5ClAukdVVEwnFiyRFFYwXBS0c8lxawAIenmCd4F61bUnhv7JbPScNfpdTqZwpQFs1lFr6OjwnPUxtLrZmS5ppiVKKmYFDWDXsbhqOSu06vsDg9xQK+bUFmPUpp+rgLzbTJjpZ9yNCqxBHqxc2GzCx08HuEFIpXsHk1JtaCXa5TSjAsTueqQpjFfHIXQmnANiQxVX9ErMzZSWq3j/pM5X33lkNJopIBZ5QORRcLBzFMaTzcNYVy/o5E4nBfkmWZSWMDSzxQgmFVhLqQUlHXD+4d+J2FW2YDW1zYoh9phnaOfNTXvjjQJXqAQkAgQQlJbR57KYLWi+55qSZZKiqKKLmwgq1kHuZZ0M01dG+qYena+SWMHAExFDyIUNAlG05puHsLbsrJ0UxVwKyGRWmDKEmlKltMEPFhTkylFKh1F5ahqmFZhHZSE4WwefTvv0bE+Ylba6LmGeamMQ0gZlLT1VLWjm0ZFHfE074PX5rxjuauZlo4ruzMePtsjSwRff33IRjdly+pIfY4mWjT4XlB8DdW6wfwCT2jO3wmeQPAcxfKg6+c5/nm5KAtKoBH2FgwU8yq9srKc3FzhBx9eZ2/3kL/xX/wlxts3+fVf/C2c1hjrES5sMgSUtUcL6PcSpjXUtSNLA2mo102YzAxHo5JeJ6HXTSmMRwlBXRksEp0oeplCmIqyNlGrh0ns5YETcDSqyLME5yzdfg/j4fWbQ5ZyiRaesnL0eykr/RQT6cCXb41Y6ndY7mmyTg7esrdzTFGWnFzrk6cSnSQggiUSKmxmJcAYQ11b9o6mDAY90lRTxudVSpNqwayyeA+mKPC2RhBSeFXtMM6Tp8GV9S56ZFJSlTXGOrQSpBEHwYe0H0JgrEXHOggJJFowqSFRKqTZfKh5cD7Ewaauubw14amrwxY8tA5mdfC6zq5oNpZyNld6dLNQN2Ai1X88M6z2wvzWJtBrmyYvqQ5Kw0SKrPWwNsgYjQv63ZSqtoEL7x2ZVsE7qy3GNoVkIgpUCDWNC78bF1x2BDHeFyQKMi1DzUgEV9NEMitrIFh0KYJXYmOqzDoRkHgX4uLagUGBNSQypOWcDJwSgScVgQpeRzwGPHmqwnPhSKWkMpZxUVPUhLkSHi0DN6BRXKkOn8uTgBUcl55OIlnKNbMqhEOVDfiDd5ZpHQRXCc9yV5Nqyc6wZlZaHjzT5bVbE556Y0iaJ+xUSciyLJT7/jEDLmj/Pu9fMGf7CEAs97tetCjm/NVY/kYRtL39/LzbinMenSR84vHTuLLkb/yXf5nrr17ic7/xe/QGA6aTKUfTmmcvH3FzZ4qVitqG9NejF5d469kBpQGtJRvLOQejknFh6XVSlAyxc6IFO4cz0rxDN4Glfs50WnI0nJLHvO/BuKK2QQEsd1OkVjgUa6s9EIql1QFbe1OkN2gsBsnqcodqWpCmmlsHBZsrHZZzz2gaNtB4WgUOvQdrHOsrXfCOXreHI4By3lmms4pOluK9ZVbWVAZWBwnOS4bjMhJEDLXXeGeRriZL0wigeso6FBGFnHEgnzgbGJO2rhGEzIFHYa1p07Vaxjy4gNoY8jSkSydFHa3ePBxABJfTxFDghavHvHpryLgM19NKcGop49xGj9WlTvR4QgahqEJqL5GSqqpJtKSKBKAsSwLIZi3GBWUuI4Glk2kms4o8URTG31GXLgklvVqr6BqHZ5ACShNIOiAxDrT0TGYVlfVkSeBDqKgU8kRS1AIvPCoCXHkisE5QVSbS2kP4mmrJpDQIoQhJRBBKg3N4HJPC0snT4FrboAAcnkSnzMqKyTRw/EeFQfmwVkoFnsKsMgxyiRQqlhEHxZxq2Qqa946ZkUgRwqra+FAfgeBganh9e8K4hLIKQGqWwt1rintPdtmfWCaF5bELPb7+6iGvbE1QWcqxCcDmmxl+d1YyxupTHwrf3izPoRgoCnxDIGjqmec9LkRLNAkgYIghZhV89NGTpNWYn/+7f4nrly7zW5/5fVbWl8mk48bulC89d5vz95znve+8Hzndp5qOeOaNCU9f2qafa773bSusDDqgFJNZzVK/EwoovKOT6WABdUInSxDegJRs708Z9FKqqmY4s6wvd1FYet2UVClsXXJ5e0ppBJ1UoJIEZwylddR1yB7gHUoE1/loalgbpMxmFVInZImnk2o8gv6gT12VRPyPQb8TLXhTXhu0vnUeG11vYz06TUJII4KXILUGayhrj0o0iYK94xm9TAfWnjFkWUJRVNR1HVB94wJDrA6uuXEej0ICaRLCtmlhWOunVMbQ73XY2p+SKFiOINqgq3EusOSkDBu2rC27xzOOpxXeQ5Yo+pliY7lLv5eAc22cKvBk0fMxpibRKmALPoxRSKjKGh0zQE0y2ngBhKrDJNFUtSHTUNbB9daJimBWqNRLk2AtaxsMghSCujZ08pQkkRRFTZoErkRQGMGjKUpLnidoHYC9birRiWY8CWCl9VBUllSFtalM8FikkqGgiFi9KEMmw/vgngeik0Yridaauq7RErI843hSUjvB8ahgWtY4AmDbz1TcWzCpLN57lroJMxOptzpBeYNwFiUg04LXtqe8fGPEA+dWec+DG6yt9ZmMpnzzxds8d3NCN/F8x30roQDNSzY68LtP7zCtHZXKmTqFpCkbXyyLnrv/+KCAFjMGDd4nlpe6cxXSIIWtF9Ck+uZaI4CBgklR85bza5xLS37y0z/J+TXNv/qXv8Hqah/qgp2jKU88fYu/8Ge+j0/9+PdyfP1VnnvyJTqdBDM95ulXdvidp3cpLXz0kU2WB93g7icJ3nk6aYghhZSYqmJ10GVUBArt5kon0GStIVGS/cMRr90acjStOBjWzMqQPmpy5861XnXLgQ7poTARkedCIiU2xthNXGdtLC8VoGUA3ZyHyE0KfHoXYsxASgoWzjhig5KomSEItfURMQ+yYt284rpykAbjFixjvL4QTZYmvKdEK2fBoooQjoVrhTcbSyAX1rKhlqaJJNNBu1vnMU2bJ8+8hDaOX0YKsIthXJzSdozGhbkQzNPDdziTcSIXIKZIIltINcXrNeuzyGJTAurmnnHczs2Bz8YTbQgvMUoKVZAyPnswe+F6qunJEE1eA5CJWJUXw4bmGRvWbKIluRZsLuWsDRLObvRYHeQcjmbMSsewdAFQTBMy5THWM6k93UyHGguRkOQZspzS1R5TG67tTXju6phPfveD/Nkffid7ewfgBTeu3uT29jE39iZ88dVjrPd85KFVLCoQvZzhd57dZ9BRHNgs7JHF+YY7FYEQ4Ba8/CjPAhEwgPlCzYE/pGg9gGYSBDIugKfTyfnQfV3OnjvNz/3Vn+V/+G/+J1SSkgpDOR3zq1++xnc8cpH/+r/68+xujUgTycvPvsLW7hEvPf8yN/ZnCBzfuDLmxHLK9z58EhvjsLIsifJFloZa8tGkZnVtibs2OsxmJde3jrm2M+XG3oj9aY0SAQVvWYpCYGJnFOt9bGwZBV7N6xaaRVYyuNXNZmpqwufTJiIJJmhRrYLgV8a19etN8w8ZBT6QfwJgFfodBGRaRWEVYgGwiWvTpNCEmG/QRnAW0zytuzeXsZZsJKJCIMbXjZstxIJXF9e14XfIdtMTcQMRkeYFoRQe5xaYn2Khc0+z6SLgZP28sUUQRN/WE/jIX2+6/zSdd1TTfCPOEwRykIs1941SwM87/8zbpc3ZcYuNMRoxCJiXb5+D9lpBkRgbcSpEOy+KoPADiBhovmXsJeGcZ7mTcs9mzsWTPbRWGJVwdb9iVtZsdEP2alwYVroJEyOQSpNTk2Iw1vG55/b50Lvv4ec//T3sHdfUPuGLn/8yVTXFOsn+8Yi9o4pvXxuz1k94+119RoXlwVMdXr054pnrE/q9hJ1Ct5mSZlDNPoGFat2WByBakdd+YaFaK0/QhC6q7kb4feT4l8bxgYvLpEz5qU//OJ/97c+xfzhheVkwmY559daQVGs++bHv4Kknvsr5Bx7g5o0hzz/3IuNJRVE7RjPDqDScXEq4fVSxfTDmzOl1ZoWhk+cBDKqqGKMJ3nrvSYQzPPPSNZ66cszesCZJQvOOTpZQWjg2MCws1gbAzf4xc/R/vv7P1/9/r4b3oiWkWpEqSTcV9BTUzvL09RFPXR1xcjnl3Q+u89YzXYZll9t7I7oJbPQzauvIlAcJw6llNYet44o8T/nkh97Ky69c4963PMiVN7aYzqYMZ4HINCsts9px12rKpd2Ss6sViZZc2i55y5k+l3cLysLQ15JhLVFNyq9RclHgm9qcxhVd9MbaNGDjkvkoNE1/wDbWJWjWyjhOrHRZ1RX3vu1+RD3hK19+Cq08x0fHKGd5Y+uYh+49Rzk6oDjcI8sUTz71Oq9dP2QW4zFEZF/FOPPWYcH6mkXqQOjopRKhNP1eziCXvHZ9ly89e4ujwtBNFYN+wqh07I49s7q+0+UhWmTmMVD7ZjPyBUvYuKh+8W+L33mzDhELf/J3/r5wyTu/Gr0EH0GwJj6749EWrvXmR1689eIwWov55g8ufOZPev1JH/+Pq8oGIfo/vs5/ZJr+D//2J03z/8Ey/YnP/eZ7zK81/+k/tk5/0jXueLboWVQWKmsAOJgGr6aXSAappJeFashf/dotTq+kfOTRk7z1TI8rW2NK70NnKwTG1WRKUNWWWwcz7r9wkjeu73G8f8h0NOS513bZOy4oTQCFi9oyKgyphEQKbh6W3Heyy6Ry7Ewc771vhd99dp/lxDKKO97jI3mv2dS+jbbm3uy8qYiexzmh60ybK2yJQLEdFAH1tFby6IUlppNjvvsjH+Ab33iepaU+GoPEogkxZeYrLj3/CqWDqzf3MdaT6cjKSxUnlzSHE8/xBPAVhxPDeFbR74lwakqSsz7IGB8P+aUvX+f2wYxuR7PUTdmbOg6P6rZVF8xjtmbJ71hkwR3vL9RELGyMOdnoT1ICTazYuo3NZnrTppILv/u48dzCG21MHt3xEBaIduFk440tXOMO4X6TsmqVHG9y75vv+7nL3tz3zTqtabjqFwcSXwHzCOGLaq+9sDcQrdGYG4rFGVgUqOie+j9ZyBf/XbRSjVvfdC9WMfZvuyfHz8k7vt+Ef+HzzRjufJ526VsFvbhXWnRd3NlYswk9RqVlVAZsaL2nWF9KGBaGf/elGzx29zLvuX+N/annaFIBnlwH7kZRCgojSaopt6/ewriap45HHE8tpQkGcVJZitrHVmOhvdyosExLQzdP2T6uePhclwsbHW4dzuhqydjExiKxQ/bCqtI27IkT22QKNLDQRz/MwJu7tzaLYazj5EoXORvyjve9lyQf8Luf/RonT59iNinAGiSGRCtu7Q1ZSSu8ylgfKK7vFhxOypCKEAYtBJlyzGKDBmsDWaSqHBunTnJ2VfK1b77GV17aQWeaQT9lb+LYn9U0fQYagK19eDG3kJL5Jm+bmDAHAVuhXhAeEYWweb154duWymIuSIhm881j1IA1BNxhoVN1e3pXez8R21M1d4nP1vZLfJPd9SHAjuc8iIUN3Xhr81eDD0gxH3fAR+60iLEVYivgvom+m3iegA/EDl0tQNe2026FpYna72xU0eAugaTS9PSjjdl1M//N+Bbmp92S8aWTUAtfG48TAUVvPVs3/6wkAocy9BKo6nm+v3n+O14LbzR7IzaAbg2hF2GMbWfhha9b59keGQ4mkhMDzXLP8eTrR1zZnfEDj51io6/YnniGoxm9XJOlCq0Fo2lJUYTUYZpotIRpJDy5oGVwNjQDMS6U0s8qR5560gSuHZRc3Mi5tjejm1jGQrXaq8FsmkkMuFBUDAtev17sSNp4DC72i2sGL+MfKuu5uJ4hRM1P/Jkf5td++beYFYbj/QOWeym1SJhNK9Z7ijf2Z9x3MuV4NKQuEw5HNd1M0kklQjh2j2v2xhWz2lFFJHl/WPLg/acYJJZf/r3nePXWmJV+wnEJW6Ma48Lkq1bo7rTADWjXCoZYVAZivuGj16OaC7Gw2H4uIJ5AQgpKI9BKG7ZVU5kI87PlFi1LOIbLI5qyMNFoUyLZI25csZh2FS3KDQ1AKNqx+LgTWwXkm00bdq2Om7cM4Ee8R1hb3UqUuEMR+UiTl2JuQV0cYNONXDAXnGaKkqaIJ06gbXt0itZtaTIS+Hn/CCBQcyNCL+J9GyXVjk2ErAkizIMiYE9OKDY3B3RSyc3tIalwrXKXIpCDhoXlh77rYX7wXecZjgp2jw75n3/92UDBnsvIH/OwrJ0DlSy832wSJT0ikpQaLzKwDcOcGO+4eVxxmEhODxJmZc3//kfXePzeZd7/1hNcO1DsHExZ7QpOLqfc3J9xz3pC6aDfcWwflIwqT6Y9dWU5nhms99QGZsazkc73iACmheGujS7rg5TRrCITjsqLQBOXkYOw4Bo1XaaDQgjAatsTsG0t5Btap2qVQODAO9YGXdJyynd+/LvBOy6/fIkPvusexqMxk5khQTBI+5ybFLyyNeP1rYL1geLWYcG5tTwU5li4tTdjWoXS3/2pJZWhD8HqSp+ltOY//O4LHMwcq0s5Vw4qJpVrF7hZjrBxRNvyqgFrGvdZxg45Udxp0psN0iuilCsl2nSg8HNvqLFsIEjF3Do1PeIhbGpnA6o/R7xDG27vReCSi7CxGhRbisZ1bZRHGEyjkBrMRdAw+KJVJSDrIQ1LS1JqPJ1Gl3nmnpGMb4ZOQbTXC56Pv8OboUHSRSjxFq6xdA3fgdZ7YEFImzbmPgq0iopy7vzHw1fjptMipupaIQsrI0XIsiBom9E2WIkTgmlhec/DZ/izH32IE11Lf5DyD3/heb767A0GuQxnAhCYcVmi+J63rXPw+ksMpwUPnlnlwbvW+dZrOywlc/dYSkHtQrEOztPJJJKwPo1H1pjP5nmVjHshasRmPhHBnXZCMK0dlw89pweatR58+/Uj9o4rvvvtJ+idXubq7SNOLyVc3St4dacgTwSvbo3DvpSS0TRU8RkXDNCwCMVCuQ5t4lxU9qkO3Z/vO9nlG69XpNpSetXSilsPtpXtuaFq/q4bAWkFRc4PuGr6qjvvMB5O9CWdXPHYux7ll3/h33Nio890MgNCM4W6NhyOC7I04W1nejxzfcxbT+Uo6bl5WFJbR1EHgHFWOW6PLKWF5dRxYn2NU0sZv/L5l5hUjixLeGW3it1V2n03fzUS27wawyODW+0XvtB0J2q6pTTja4U6WnofFzNVgUXXOrlCoEUg3cziaSEqLniSCFKloiIKm1jGEqyytpRVKG5JI9OtXlAYqmlZzlxA3ILGVkJGQQxKqmnxjY/8cQILLonYjfMN0cO+CccJTLum379v2lmLRhU2Cmlulb2YC7730WpHAYZQf+6dbxl8zvpYfTeniQsBzjbeUlgrLQUKQRW1kYjP0Ai888E7UA05InoIFnjH+R7J4TWee61iuaP57ofW+MqzNxAitEaXAkxtuXh2A2Frru9NyTPJ7tGMnp7vlUApDgVsm5ur/F8/ej+//+QV/uilffpJ0zbcxx0yry9wcc9JL8IBKh6kC8pURjDGNOvnPbeGNeNMc3YpZetoxi9/5To/8NhJzp3o8vL1Yx6/uMRXXjtioyvpJZLSeqrSth2FtBKMCsfMwnIW+h8kKjAkhRQsdyR7w5JTax36N4ZMaotCtuXkLHqPC+nP1hP2hIYg7aGBix+I28JHd1IrRU8Z7rn3biiGzMYjEgmTaYGN/dKNdaGdthCcXutSWM9LWxPWu5rDqSVRgY89Ki3DwlI6WMo8ZzeWOLHa4Te/dgXrHVZoXtmtomVotuZc7lXzmAvomGgsDY11aiz23PoBWN/E1fNeBiL+LKHlozd9/2Xk2pel5ey5Ezz6wGnOrqd0O302Nnr8k3/1BOPRhDzRWB+EoCmN7i8NePTsBq9du81+RHdXOpJEhaIoEQGDNt4WknQBsJIInHRRMJqS7LgJRdOCohlHUHzWhwaac+s/75Wfiqb2PtTuewgtwv38EFDVKtU5/hCq+GQLULbroeaMUR3j+2C14xFyInDwgxWKSjd6MAmiJfYoGZSbbZWdjN5QUHQm9iV4fWvGXSsrjMoSRM3mSs5KL+VoUoVnijyO05tLHB9PuHVQ0uvm5Nl8XJ5AL3fOI3TCX/jYO1DDm3zq8Q0unlrmF554va2TcF7MAUsRQdDYgdfHvSLkfG289+Fg1FhtmEgYlobpgeS+tRRnDL/2zdt88t2neOD8Kt969YC3ncp5+voELaGTSLQUSBEaoRzOQon3UgbdRNLLQl1Je6gtksmsQq52uHiixzNXR6Spp7IiVgA2VZHijwHJjcenW0d3AQtwsVSyGbhznuV+Ql84vutD3wkSxsMJEkeSauqyJssTPBIlFd2upDYFF9ZzlPdcOyzZn9g2zFAyTPBaBqv9Dnetd/nWy9uUtaFCcXtY3RG/zzX3XBEIQQRkQhiQRq3gmMdISol4P6JwQBLHGAR7gfcY3XclmsULR4OlicY6i0kV/+A/+wAnOMZaw9buERdPSO4/u84TT4/JU5CNtXCSUen5uT/1Nj58X4ej2WmubFd89dVDPvvNK8HlbA/ThEyrVnk5DzL2yBcEa0mQeVQ0mcHVDT/XcZOmWobutl63gtAcritEoIo5ES2zcyRxEgNfPMyCjiCCb1whEchOuQqVmERlEkpaG1450f31reEQEG7WeDk+WiDCvKrGpEeySiKCd6a0bMuijQ+pr+ZUIwlM6dAdLCH2jtk5NNSl4eHzy9yewlvvOc3JpZTBoMN9J1J8OeG73nsPrqrIlOSBWvPqbsnhuGI0KQH4q3/6XYjDm+yOJkxqwcUebPQTjiYVPmlC4DDWxiHx0Yuat8sjGlAfazCCgZrVwZtJVVDKr+xV3L2i6Wfw609u87Mfvod7zwy4fOOQd57v8frujEnpcC56ii7UCqx2Amuzmyn6HR1kR0v6uQ4NSKVk57jkgXPLPH99hMQhvJy3AmscKTEvAmrDL0DTuoExBvShaGCx8Md46CuL7Pa5cO85fvcXf5HptODEej+0vJLxZF3hSVNJVZVkqSJLBOc3Bb1cMS5MaCbJnLaapZrTKx2een0PhKf0iq1RPbfwreTP49pmIA0IFjyC6CJrFdB40dBD52xGhGjpuxBOAzIugHVKwnBSUdbBXR9kgacrEXgh8ZHTPt3bZl+a2M9O4qzj9Ho8gUjICMaFMtkTm8u87VTKa5dvszzIyasZf/5Dd/Gl525wOAydhZyHTMXFNGG+ExnChMA2jIzBVuADsIj1WBGKYjQBY4BgOVQiIiLvFrwZGd3+MBUqcIdjmBQQrESFtl9WyDZTEjZOaFSyeMSXYM7ASyLQZ4VrY3YhgjJQ0ZUPTYZD7BqAKB8LvYK1rI0jUaF/w6SwdFJJGjv/BLwwdAre2z/m9SuG3YOCe+85zYP3nuDRd4bmH1VpmB4f4V3BwRsF45lh0E0oq5pCSO473eXnT9+FU5qXb04Zl5Jqf5fX9g9YWe4j8RQ+42hcRe9pDghqFUKG2oa0TjjMNTx7U83YME3rWEQUMicRF/Ge2nmuHBruXU/pZ5b/8JVr/OyH72ZWOQ6PJ5xf7zArQ4Vh6YLB6qRhr2ZakerY/UlrpIPjSUWeaaQUDKc1Z9ZyTgxSdsY1ihiKCEIZcOPOt77vgkw0NnB+oECwo21aKVqNzNecOXUKX1e88MIb3HV6BVOH02+yLKcylqqsY2GFRqpQL32ikyKlZGPZx9hEMasM/X4H6oJvv34QKLVesD0yd6DRTRy/iEAHN30OdgUUVoYusYhQKYaff6Ypb45lsU282GjsoqiZ1Z6HHrqb/+Rjb+F3nniJ3/nq65xc7dBU7KWpYlzW+M4Sp5ZLjseGyiXkieDMaheAvVFI3+SppCwdD9w94MRKys3jhP1hReU8L74+ZPtgRjeLR0s5j9Ay1I2rCNb4UAFXe9pWTs6HWndBsJYuHi0llcJZhxDxLMLGm5OQSYWOrmrtfas8hA/KxbigKEO3olDMZLyI1GFBcxhFGueqgVxsbEsmlQjNMJvraB3GFLWMbNhnMYhXMfYXSkME7IhKRWnP9lHBhx6/yPe88wL/6H/9MqNJ6MPgVfBSZpMa6oqHHnob3UGP8viI0f4+OzvHYOvoQUnGRU2qJM44JpPw/rTyHI0DZ98KQTfNuO9Mn+nUMO30uXRrxH1nBjz5+lFA5HU7leHYNSFiTYbEi6BYHaG1fEOxlSocE9d4nzrmE2W776DC8/pBxcOnc4pZyWe+fI0//b338ntPG9ysoJuJ0IXJhzXP1FwZSyko44lF1ntSFTy+TEsKHLcOK1b7CVvDikT5UGXbYECiEf7GO56Hd21X4MWYDxrXLeiLLJF0VM29F9e5/MLzrHQ1idZMy5o8SxiOZ6GE0zvKMrglUkFR1tRSsbbcDVVZtWUyqTh3apW1juB3vrZFacEio/DPlU4LVCDQ0rcKqS2wkYFr3TQuVdGV1QrC6asqhglhMb1svBsR6sjxTEvL5sk1/uInH+U77x+gp4c8+CP38ZXnb1HWoW+/8I6iNExmFUcTj+mHSjjlYX9oePjCCh99/1vQSuGcYTgpuXEw45MfeSuH+wex+6+kn6S8eOsIS+NxBQthXOigW9bhGLEsFWRaoX3T6SVUr2kRGnQ670Pdumg4DQIn5Fw56qYDUdggzvoWxwgOikepJswIm1MvhAGI0JFGSgnGxM0j25BC6bDOjSINYUW0Kt7PPYcYvDR9/KUSbY/EEONL6lAYwHBa89j9J/kLH7rA4d4+/9VPP8p/+0svcvtgRJZpqsLwg+9/gL/yM+9n/8YNnn36VWaTGec2O+QJjJ0mURpnDGfWOsE7cyE0bHoElrXBE7oQ7w+nFGWB1JJTKzlnVte5tlvw8q1hMDwLaLnWknFhQg2mcGSJipmxhXMvIjA7BzN96+kICcKF9xIp8Nbz8nbJI6dzrh1MefLlHT74tnWeeOomaaZxVlJWFi8CGOlcOMpOa0mWBc0UajUCrhLCjADs9vMQ0atmzzdWfyEEmL9iTYtvZb7BAiJa7mk9gkQphLTcffEUr778Mv1+h0RBnodWWN1UkSYKFdHzJu0kpeRoYuh0FN1OTjEqybuaC6dW+J0vvsjeJBwccePItIc/NA8pvQAZN48ImzW4tLJ1Bxpr1Zi9JpXkhAgbjoDYKtUUyYTPGxsOGDHW8d/+te/jLrnN9es3MMZw99lVPv1DD/FPfvHJUB7c6XDPuRN8/CPnuGdDYawnzyTOWpyzbKYVf/OHz2HqcBBFv6+5fgz1ZEY1nqIj+zHTgleuD9vp19ENF1KxN6z4i594lPO9mv/5c1e5dVSyMUgRAvK46CIysgSR2RaZL4110TI00khFqH0PBTbzQ1MbJeBkaFPdtM0KKa/QycbGvnlSzL8Twf8Qt8e4S3iB8Q4RsZSGrZZEq+cbJSeasl0TTk4WTSozKObQxtsx6Gf8jR97KzeubzOeFHT0iL//Z97GP/7MJcrRiL/913+Sh+5b5auf/zLT0YSlLGGt16eTQJZmLBvHzrHhuIQrO0OGhcM6iRSOXqZY7WmW8oRTywnGeSZlxXAWevptHc3oJCFE6KWn+I2ndrg9jlR0BPvDksfedoEfe+c6v/rF13j6+pi1ng78eh0ObiEeyprL0O0YEZqWOO+pXROHh0xBQqDTv7pX8dYTXb7wwi73nelz39kVXrl5TKogz4IsVSYe9qpCyJrIsE5SCErrKetQVuzi0vRSGTkmDb4UrH5TyUkTCjQyjo9egm9catke49woAuOgo0Nt9IX7LzLa3ebF56+wuRGaPvSycEJN6Gcno8cQeqhPi4pp5ekZmE4Mx5Oaxx/Y4BvPvcGrWxPWBimvH4RDPuUdfn9IrYS0VwCimiq85kSYJm+eygiExZpfj25d2MarUVKS6DnRw/vg2s1Ky2uXrrJxIQ3ddJOEW9sjPv7ONZ565TwX7zvHu+9f5/yyxYwnvPHyFR59+BQ+Pk9VGSor2Lu+i6lqut2E2TGUxzOG05q7zq5AWSE0HI1r1nP4jgc3eeaNI0bTms0VzeGw4CPve4B3n9Ncu3ybn//+s/zSk/s8efmIzeUOSoeN2JyDIGIKsBmbi2CgsYECWpnQZGR+cEtwYY/HJUVlcMSGlfGEYcQ8/24JfRAbQC9USEY8RUqE9xEdB2eDkkkUMTUVKuaa+yaJDrgFgjRNwprGY8actS2/JEs0O4cTfuXL1/jUe0/y4qu3GBWeq89f5Sffs853/+CfZnK0y+9/5rMsD1KWlzp0UsVyKri2O+UrLx/yrSsjto5mlMZHoHe+2WMSi24qWOtp3nq6zwNnupxczmKbrtCtaOdoysZA8zMfOMlvPrPPy1tT6gQ+9sEH+ehbV3jj2i2+/+E1ppXnyv6EfqaClyPl/MBbaE9oauQnZAViSO0D6JlqwagwbI01a4OEX/nKDT71Hee4qlVsDxbLxGX4PRwME42XCwe+VsZinKCjAwhZ2aBQY6FrqArwc5lfJJSFU5/D77r5kGwgY2LqLNKbnIeOcqz1OzAdcbh3zNpan1lpORoVLC91WVrqYiMwIZSmFgobWz71ckWSKIqy5sGL60ynM7720i7rKwnXDw21DS3CYvq3df8bw24X3m80oRQhDyuYn0FoIg3SxQskomGreWpjI9opqJxrXSLvPZ//9k2+58G3odWYXi8cDWZmY/7hn3sbFsmta7eYVeFIrFMnA1hkvGVWxF72SpDmKf1ugneOg2FBt5uT+7nQzkrHZFbx4Nku732gw6fee4pff2qPP3ruNmdOrPEzH7mH577+DBMjMXtj/uJ3nQQPT10bcXJN46OlDmkziXHBelkPXolI8Qwqocn1NyfsSiWYTAzvfugsj9y7DjL0A0xVaLc1LqpQo2E9k/GMz33zGnsTQzcVNNh/Y+HTSKJxnng0VgBevXMh168j9daEzkNSBuBKao2UPnTMbZoz+JBe9MD6Us4vPXGJ4WjCxx5e4esv7bKxPuCHfvyjfOUPv4Wb7HH+3CpSQF87to9K/tkTt/jW60fUHpZyweZAsdxN2BgkUUmGzV6UhplxHE4s49LwR68c8oVXDrlns8MHH1jj7HrK9qhiWngOJzXdjuZT7znF5188ZrC6wndczHnupavUTlKbGT/62Ab/4o/K0NnX+XjMnJ6foBxDMUcsgZbRyvrYa8GFPZ0qwfXDkpXTOZOq4vVbxzxysc/Tl0eNh46z0eLL0Di3SU+b6M12Exk5OoJMeNI0oZdJRpVvvXcv5tW+MMfBnA2nNuk2WyiiTYmcbmsbEMfjrWGpv8bKxgZbOwdUtWdtkLE3ltw6qunNHEvdJDSENBIrFMX0mOWuIs0yDscleZ7TU5bPPPEqS/2Eg6lnXLnWhWmaXDQYZcPLV9FSBMZVeD4nIBWhg6oXoedbokO7qLqtNZctkCVinOx80JLG1lhrWe5pvvrCDrf2z3NircssHqaZdnJu3tyn101ZXe+TJqFt+fFwRlVajLPgHJ2OZjw2JFLR7SgOj2YICYdjg3CO41FNJw1We9BRzCrH1sGU2jk+8dgmj969woMPnuXGpauMChAKjqeOcQmjaU1Z1lS1DecIiHAsV5oqvHEcDEMHoSyJ4Gd0+xvXXYpw7LmxlrIwfPK77qM+2OH44AglLL0soNrKWE4s9xjXhrPnOlx9TXJ1vyZVScASIoofBDiYU6UkVWU5GBb0uhndTIUMjAAX41V8YAQmSTguPPQWDF6Kil2STMz7qyTh/MkBv/2tW0xGUx6/uMTHPvX9fOML30DMjun2etSVYXOly79/4jV+86ldlBScWU3o5SqeVKwRMmF3VIfjy0wIi9Z6Cat9zYkly2EsRR+XjuuHM/7ll27yyLkBP/z4KUzPsHU4wxrPzqzgIw+v8sXnd/ntL25x/7klrHOcXevy7TcOGRWGbkfPeSdtCjSEqNba0N/Re6yLzDERwFYpfAC3HAjnuX5keGAj5cuXjviZc8tcONnlytaEJImZhugBQCiyU9FVdg6M93QSjakcpYFBrtEqANeCcFqU9FERNOy4xuOPYbVu8rkhleHxuHjQZ+RgK4U1lrQTml0KV2EdHI4rzp7ZJD2uKCrD1BhmdWip5YQnyzOkt1RlOA/t7rMrPPvsZfYmNXmesjMOAFOD5i94bXP3SUikDIBW0oBLQgRSihQ4KfA2pMvCwGVb0JIoiTXhPPppbRgPC9aXMjIlSJTCR7dqf3/MNy+P+fCDHbzSOGfZPxyTZhndfkpZGmbTkt6JZZasx1qLKRyzCrb2J0xqx2w6pagqVgYdlJN0uwn9PBxKOistVV1xNLUMOpqVgeRgWHD1+g53n+5jb71BNStJM01VGe4/t8TLWyXfunLIWj/B1QZ0ELDZtGA0KVheXuaHv+9Brr76Gt++csByL8dhgwuodOQiOKxToXtuKlhWFV95YwflHet9xUu7AXRd7yteGR4yKwyJNxgvwVm809TehsM5ZQC3GqLOrDQs9zv87I+8g2++vMuzl3YYHpVkWtLJQvrXNsLgLNIHwZfMG84aiFRqhzEmdMnNFVf3Kv7mz32Y5772JMf7BywtdUkTyXRc8l/+m2d4dWfK3RsZS7kK3aOlIE8kl/cqXt8dtXto8aWE4K61jEfO9TmaVHSycEzZuLRc2hnz3//Wa/z4e07w1rv6vLFbI6TkaDzlux4+wedfOubWwYSHzg34+mtD/ui1I7pZPKDTNzGrb8lnSkhSCTPrYhepwDcJBT4+xufhO7mGo5mhsJpEC7756hHf9/gZLt0aI6zA+QDuVsYihWzj/n4WOicnqWJqgtshkNi6aiskAwBLW/fRVPnixTw8JPI3WumLOTfv54IphQBnWVrucXgwZDwt6XR7GC+ovGLrYMzmUkaSJFy+cURvENzP5W6CFg4nNEvLHXZ2Dnn6tW2W+xnXDkNFX5PvV2KOUjbpu7SxKJ7YlSVoLS/CxrEIcIGim2jVHrjhLOHgCgdJknB7f8J73nGBd1zo87/8+gsc2RknNwYY69nen/DpT72PDz2+SXl8gHCWPA/CVhYlYjljdamLd56XL+3z7Ve2eeHqkBv7M44nJeMyFEg1mIsQIbc9yDWnVnMeODPgoXN97lpL8d5TmhpTG9I0YUUpjkYFeSIjluE4czJnaWXAv/3VZ0KqDc+0rNkfFuSdjLfcf4HvefwibzmdQTnmGn2+fWmXso7n8MVUgFKxOaUPXYczHXrWpUqz1g2eVJYqisq3908EzIymmyVUxlHb0EBTGEsnTWIX5OCyTyeGv/ZnHuKdJwRvG/Sx7+rw3I7j21cmXL6+z/6wZLmbolTsMdkUozSknoWQTyiJMTZQgwvDX/+//RC7N69z6+Y2IslZBkzt+Ae//Aq1g0fOdskTxXI/pZslYGuE9+xPKiCQh9o0YzQmAnhjv+DkSspbTnbZGdYoCdPSsN7T7I4qfuGr2/xw4Xj3/StsHVUYIzkcTfjIw2t87qkbfOXVId+4OiJVgWVnnUMYG46nWyRxyRg6WUtzTiYNduVFOCXIe1AOJwXaWt44MDx0KuW5a0d859tP8taLa7z4xkHopWg9/TxBYLHOUUtB5aCbhHMQrQ9sTuMstY+dgn2sMWmkP8pZk7VwEbwVQqCbfuJN+aPWqi2WaOi0WaJJpGHv2jUqr4PVTRKu3TpkfTlnkCuyLOHC6WWOxiUylewfTVhdysizhI31Jb7y1eepvaCqPKPSzQtWxEKPu1bpyHmlWDyQNGCTDTEnKKY80SFWcg5jwnFL1sWshYDD4Yy3P3SRv/rxu+HogO/8O9/Nf/fvX+Arz90myVL++qe/ix96qMf46IjJzKNVzWRSsLzc4/TJhGvXj3nq6oTf/sobXLo9xnoYZDDIBZv9hLvWZOzFH561NqHz7qSyXN8Z8cL1EZ/5GpxZyXj04jIfeHCZbpYyHoYTaVMlOZ75cJQzHmvgl754je1xzVKumFaWQT/nRz/8GB985Czneoarr1zjla8fUDvPfeeWuXcj45XdGYNuRhlJXNZbakfkOVTctZqQdnPWupJOFgRutSu5WVVM6ti/rnKseks/DQSXsg5jyZyKbbUVWoUzIN56YYUTXcWv/vaTnD6xxFpfcHeny/f84EmODgb87lN7/MYzB/Q7OiZsROx8HPrxHk3rABzXJuBNWjIbF3z6E+/h9IllnnriW5w/d5IEy/bOkP/x964h8Nx/ssNqLyPPNGmS4EyFVArhDau55Hgaei0Go9IQYcP+Kgws97LQALXjED52FU4D4t7PNb/19C6lcXzk0Q1evHaMlpK9oxGPXFznf//K9ViH0YSiAdzzTmAJnrIkxPfWhxbhQHtIZ5NXlCKk6YQPIVsnkYzLmqMioZdrvvL8Fh//wEWevXxIX0u09EyrcOhIkiqEMNReUnkZDogRC5RpP2/RFnO+c+veGPpIngmMRhcBXzEvHGlbCEekvQEeXFGgtWBmQurlaFqRaslKL6UoKsZFiJ9PreaMpzWiq/HWM5rW5Af73NgZ0u8mvLFft+4HC16GEHPXPyaVQQQUWqvAka6MCy2gZTicoum/7lB4KfEmFMRoLakrw9LqgL/88XsZ3byJzlPs3i7/zz/3CP/id7pcuHCGD98jOdzexRBi1qr2nFzrYL3kF//gKr/8R1fYOq440Ze882I31HJrybSWjEtDUVlmZeidHw6FUORKsb6Uc2E9jGdaGa4flnz2uR2+8PI+771niR987ASVtWwfzUi0RMfMxNbBFGFMk+VkWnl++sNv5y/9yP1864++zZeuHyMEnFjt4AVkGs6vd3nu1rRtFNHLFYN+h+Vc0Eslo7FlOBpjymCtdoc1Sji8k5xcSjDWMS5CrcdwZhF4lhLH/ScGSAGVh8JprAt8hq29Cd/59vspjvZYXekgteaolthZydHRNbpZymNnO/zuMxZjFIkK6Uklw7kF+8OS//zHH6OTKW5sHXHjsOZwWLGiDB///nfyzBeeYLAyoCorVKr5p79zBZ0ozq3mrPQ7rPbTcOSbd2RZijWOXHpOL6dcPQwUcq3CseNNgVdZG06udnnkrlV2D47YGKRUlQ19/gT0sx6ToqKTav7wxUOWuylvOdPnyu4EITwrHcnjF5b5/CuH81OqPJFU5fFRmBsjFpimgUGpY/VpbDSMUApBOI6uOX1ZS9ga1jy4mfLizTEfLg33nR5wdWdInmhyBYW1GBISnaKNwTmLlIrSWDKpQrZIBCyMwtKw/pr/NYHBAgM9eNdNc0aYo5RCBDdaquC6KAleJSxvbNDrZuwfz0iylF6mKCvH4bgmSzWpgmlhSbRACs14VrO8lHN8NKSsDVYqRqVrhb9VVMTDIaIG1WKed5ZCkOtIW43gllKBBRdimeDuVTH11QB2u/slf+PHH2fD7PP6uOREN8U5ye1r23z6e+7C1oatrQM21vpIU5N0c/qDLl98+hb/7JefY2tsObei+M77B/Q7CcPS89Juyf6opKg8xjeF/n/8JRB0EsFGP+VEX/Pw2SXMKcu1gxlffe2Qb18d8kOPn+IdF5a5tXNEVVuWupqR97ztdMasXuGJS8ekgD0+5sqLlzgclnT6S2z2Hd00uOvDWc2DZ/o8efmI0xtdljop5WzMcFxzMHRMUoVXCe997AI6z9jen9Dr5xSlp58JJJZBJyGVVWhdbcMJyTrN2B9XSBtOwEm1YjkTCC84s6x590NneeorT5ElKStduHEQaN4bA01RO/YnFmsMWZ62+X9UOLL85GqHB1Yst2/tce9AcWEl42jfcOLet3PrtVcRpiDLB6z3BP/9r71O7QV3r+ecXOmy0stAQp4IEp0gnMFKh7eCU8uafuRMpFqidYLWMhw3djzlQ4+cQmJCutM6SuNJpSeVcOu4pjSeE0spznt+9ckt/vonHmRzKWP3aMbesODRCwOevzUOVNtYazGrArmo39VkSXA9EimRSmDMPCUoZQCusfOmpCE3H9qTpz6QwSZ1gveOb7y8w7seWOf1W8eQBiHOlKewlqlT4Tw/H8IxrRVOyNhBO13Ygw060fhBjdQ1ikHEIq6I/C9WCHgatDG8nyhJnkhu7U24uT/l7vOnkFJwajVj77ik303JUhUOrUSQJAKtHMdTw9kTy/zhq9dQOgh/6DUwF/4APcQy2OithNJX2aYjhQisMamCux2OSvakeLROsICKB23qROGtY6mf8h9+70Xe8VMPsb5mmEwrkjRhZbnH7t4IJTydPGPvsOD82WXGM89//S+/zWef3eLMQPGeu7ucXkrZmTg++/KQSRX6wSnCwmYLQErDyhNiDgxVxnP9sODaIby0rXjLyS4XNrqcWzbcOK75xS/d5NKtKR97ZJWjacXeONCgR4Xh4TM5o9Lyzasjbt0+xIpVdoeGcWVQXjHRgT7rnOSBMwPSRHH72OJTzYV7H+B9Z5c4udZjLfN0Mkcn73DppaukeRJKdiUk2uNd6E9X2VAibWJb8b/7ybvJlgYYG5TM/uER2zPFlav7/OT33IOva27szji92Wf70FLXtrWKS92ML790m9oGILJ2PpDEBByPDe+9b4PZzPDKzTH9XGKcZevYc88jksvPXSfPMlZ7ks8/u8sLN0e8/WzOiaWcUWFxvuCutQ5OBuVljY2cDNjsSnrKc3tiWdEpUiqcUIyKmrL2nFrJuXlrN7Q2Fy6e5Asv7Uz56hsTAN5xrsdbTubMKsf/+oXr/LVP3M/ecUEnDdWX77tvnV97aovCQD/XPHC2z9vODPjapQP2pxXdLNaFeMIZBoB0NgLSTUoukKFcSM6HLIiUCGnZHVvOLGU8/8YR3/+ucwx6OcbUiBgSp8JhvaAWGo2lqgw6CYB3WZmoEOScTudZ6A0wBwbnhjd2BQ51AIHzLdtkvG8JBD7mM4WpWV/p0+9qdvdGHCWghCXTEoUnzRJmVTibfTQu6Pc6KFexdThBKcnxyN6hnYIbEpSMik8U6qBlyPNHxVD7iOwLyBKBEh4TQQsl4jHVQuCUABtolKuDDm9sHfPX/j/f4u/92ANgKzSORBl6OezuV1TOcs/5ZV67esQ//IXnuH5U8tYTCRv9hNV+xvmTA2bbMybVkLzpJ9U4U6LR8DGNGcfSKAOpwsmrzgcK9Leuj7iyn/CBe/u85UzKZl/zws1Dtg8LfuK9m3PSivCMZiXvOJtz66jk0u1j6lKysZJxNlVMZzV5JjmcWnpZ6ELzn3z0HjYvnGNzOWM6qRgf7HO0tcP1Wc14WqG8pXAapyQCy0pHYUzIHxvjqF3wsBLpyFLB7b0JW5cO0YmimyuWeymPnsp4390XUMrx1JMvcnq9Ry8VXNou2ewnnFnVeEKO+oUbYxwwKSqyJMFKSYVh0FFc2xlxbTvlvjM9lBS8fP2Ac/fey/HeLnsHYy6eW+H2/ozf+OYW51YTNgcZw5nhi68dA/CuCwMev7iElyHOd1Kwfzhjv5T88Pe/k9OnVkiJzTNsydHxkJ3dIS9c2uLy7WPObHQ5u5LQ0YIn35jyrRvT0KQWwdM3Jpxeznn7XQO++NI+X35xn3dcWOGlNw6ZlBUX1jVvPZlzdqPLXSsJaz3NaFpx76ri9tCRpyGcNoQ+AVoE4lTb4isaDxM5HVIIDCFsTWUok1dKczw23DosOXuiy4tvHIZKUxEKqTppgkVQzgxZGoqEahsP7MG3XYEbzKGR+HlD8Dt7RM5rAcT8uCAZwTcbj1ZywK3dKd7WrPYTDo+npOmc1eWdDf3ivaYsDUqGU11PbqZcv7HLpLTIJGFa2bbQRwrauL+px9exvtxHwE9KGXvoh4xBrgWplBjvI5kisLCSeDFPEDYpQ550dSnn+t6Yv/2vnuYf/fRDeO/Y3Z8ilCTPBMt5ymvXDvm7/+ZZtPJ88N4ug07Gal+TaMX+uOIH3nmKV3emXLo9oZs0LMIILsnQwUUK4tkD87ZqDQVTeU8SNfKoMPzhy0M+eCFHK8m7L/Z4/lbBv/jDm3z6g6fwSPbHVSjK8Z7vuHeJJ57bY2wdJ9a77O5PQYQONmfWMmalZ1wYOspz8PpljqTncFxT2XhGAuClBJWgnYwusEJJTykEk1nIVxtvSIRgWITy544M31M4bOXZL2uu3BrTTxzrPU23m+K153hqOb+WMiott44rVnsZr9w84vbQkHY0OY7E17FfmKSfCC5vj/iHv7LHubWMd54fUM0q3vGI5vb1m2yudljtJHzmy7dD3n05Qwj4+pUhWgbl+uTV0Ifino2MlZ7m9u6E9fPn+YF33U01Pmbr2mW2jqYUpQXrUYngrpMDHn73Ca7u9vnlr9xk+0iSp5qnb05DeXJMy2kBX7085MfescGj53t87cUdHjr3AIlWeO/AeVZ7GaYsmc48x9OaSenY6Ct6SaD+ahHwIBv3R2kjWBgP8wx9HsA0VjrKgFJBZowNMrgzrLn71BLPXNqjG0/EllKCNTgbDxEVASgWwsWslw59FBZkv00E+HkAIERjzOJJHw1xBppOLrHbS3MOm7Osrq6Qr6yjhGfQy7HGcjycUpvgPVjrORiWjEtLXVesLOV0tGdrf4RxoSLLR9MZEyNRC8ZsQ9SIDYmlLVEmFKAonWCFCm5UzK2mWsUjsUU8CajpeiIojcV5QUcrBpvrrJw7yWxm8Ghu7xaMC8/WQcXf+ZfP0EnhHee61KT87kvHVF6zPshRUrK7P+HPf9cFZHTVtA4xXpImJIkOBCSlkFKRpQk6SUiSBKUkWapIdDzjUIYw5sTpE3zsR7+XK/uG3YnjHXd1We0I/s1XthEqHDUtpGRnVPLs63uc3ejTWV5lMq04mlQoIdgfG27ulYxmdeiT5xxL/YTjQpB2OiwPMjrdnJXlHved3+DciQH3nB1wcq3Duc0Oad7l7MYKp1e7eC/oZzm9Tsq9Zwac3+ywttzh/tNLnD+xxOZSRq+jyTNF0ukydYq9sWd/6hnOwjFaDaBVlIZhAU4qjiYGYyx4g60rnDHMqppUhd4St44rPvPULtcnEqZDrt8+4tLVA77+ygHPXB9yYjmhk2le2y2obKirV3g6WvDta2Ne3p7y+ef2eNu7HuFj7zrJ1vPPcuu1y7iqYHOguftUn3MnB3QSybXbRzz72h5d7fkrP3QfvTwLwq/EHSnoPJUczWquHZas9jIy7XjlxiF3nejhnOW4sPRzxbWDKrDtpOTcWkYiBZkMlZI2Mk21CClJIQReBNBaREalEiGMDTTlgME1reQmlWOlq7m+Neb0ep9Ok972gY1aGxvBfEkSO7UKEfbatJw3zG1d7GhRfWPoISizCLxrAW1OsOGVi5ioFVHrKiGR3kA9Q3jPdDyhlyuQCaPRDJeoIBDaor0MxxdJQVlU3NybkiSKo0nj/sdOOzSWvznGKfjTSjZoZqMUIhfeWzThnDYhJTNTc1zYcOQ4Ig4qoNkucuads9RO8jf/7GMk00NUItHSsr6cMDYZ/+jfPUWvI3jsXJ/tKTx1/QiAz72wz//lO0+RJbA3Njy4qvmR99/FZ75yjc2lNMCOIuTPZYM9SNXywb33sQKMSFZyHEwMP/WjH+TnfuwRprde5W/89Dv4e//vbzLIFA+ezHnu9oxffXKH913Meeq1Q5bXV/mJH/1OPviO01x/7So7+xOWuinGBYJuvxNSnrPSc2otR0vBA5nmeAbDWjGeFbx2a8TR7JCD4xnDWU1lLGVtQ8MTIbC41rtChHZTnUwxyBM2l7oMOoLNJU0/z7iwGerzh6XgeDSjKA15ovAeOqlkWIb5vv9sn7/1wCmu7I74o2/f5OZBwSAXDHrhXHvhPR3lSbuSo5lDCssv/MHrXB9a/tyn3svTX3+W45mjG8Oc60c1HR2yQb7JtyP41rUpf/NnPsjbTgie/daLbG4ucUILLt0ccX0/nAtprGN9kHPX5oDDScXWQcHh2PBn33+C4guGF7ZmpKlos2CCcHDnK9tT7j+xwsWNnJdvHPHeB1d4+SpkmeL0suTS7TFVbVnuZNw+Mjx3c8z+tCZPNbWJ9HTnSRGhc7FSHE7DeZKOQOtOlGhJOFUdmrYmEo4Ly8mNlL2jEcZa8k7CpLChWMuGkALCXDsXTiq2IhzB7nwsIBLzWL9x9xfbw7V4YBMCEDctkR9vrSPRKjyw8ySJQicpWafDzCl0qrE2UFWzNJx6W5cVUsRjoj2xGMgwqwNIE3uBLLj/DSkkFDnIiAxqGerMEbEZhoo8eDxWhp4CmYIk1VTGMyo8iYZJYfAWClPhvKefafYPJ/zYD76d8z3D5Zd3ETojSwSbqz3+8b95lklZ84H7BhRkPHV9r12E3XHFUzdmvP++PkcFXL59zMceP80LVw65vjdmuZ8Rqg+D4Cgh7ugp2DTO8B6kk0yqmr/zcx/nRx9b5toz3+CVq0Pe+/hZfu7HHuIf/9tneee9XU72FF+7MaPb7fCf/sUf5v777+Loyit88wtPMp7VrK0O2Dsu6XUCUWm5n2FrSycRXN4qeGNrxLX9kttHBcNJxbi0UXmH3HjThalJuRbOtbxw4zzGWXxl2Z/WeD/F3jgOYZiATMF6P+fkcsK9pwesDTJWe5o00UxLw6SsKSpLbQRmPKHYnfD2e5Z576ce5tL2lN/+xjWu7Y551z0rnF1JeeX2iN1xzVKuubE/IQX+h//ik9jhAefescq59Zxf+uoWB7PQY0Fr0TZvVUpxNKr4xPc9wnfc3+VLTzzDXaeX6Gr4tW/u8s0rQ2wV6lBcHOu59Zzve/sa68s513cLvJ/x0YdW2RnWDCtDNw1el3Wh3fY49vvfWMp4beeYw6kLmaDCsJxLlnLFK9sF37o2Y39mQopTxePadTQCUlETsgxSRJfdhVN6vAhknlSr9qBTFwutRqUlT1JqB4cHk9DsNfINmhZ2NES9SBF2LlSbpiqQ4pyv75C1gEvP5bs579N5jw4VdOFiwjf87FBlZr1HKoWtQ8svGU+0XF7ucbi7T57IWL0kmc7qUCstA1gxGZfcfXG5fRDnmwzpPPZf5Cg0bboMzWKLWHsePqa0CA0whGRcebxSJNqTaM/Bccm7HzrNp95zhtd2x1zZmfLS5QNOnujzp77zItvXLpNmOXVVc/GuZf75b13m5RtjHj+XUljFF147aNt0ew8dLfjs83s8dvcSRVkjBNy6ccR/+uFz/L1/90qIt1RggzVkFinDqbSBbRlCKKUlw0nN2+49zU+9e8C3vvkCJ0+v82i/w60bR3zPoxs8/doZPvONW5xZSvn5n/5OPvT+h+mbXV79xhfYPy5RWtPtBBLOfecGLPczbuxVfPu1fV68OuSNvSmHkzocZa0C+JWngqWexkbuvnOhA7M1PgKqbXo4jDlaDLWoMBLREkocguNZye6w4NtXRyRKsdaV3LXe5eHzS9x9okftBa/eHIN35Inj5TcOEeKYsyf7/JUfvp+nXt3nmSuHXNmecHE9Z7mjeOr6BAz8k7//Y5jDXZ5+8hIq7/DQ+SX+xlrOP/3dNzh2njzyJJSWCGdZWerwA+88zR994VlObw7oZ4p/8bnr7Iwq3noq56F3vIULp7uM9ve5fOWAr72yx//2xdv8xHfcxVpPszuuWe2mvPvCMp99ZT9YRilJlcR7S1k7bh2V3LOuSCS8sTXh7HqXg6sHSJlxajnn2duHeBEtfGNAY57de0dtwsQKBLPK4USoS2myWMYLatssQjQWUlLWjtKCt47NzT4nVnLGs7DHQi/DAH7OT6J2oDSWUBTnnZ+v78I6Ixco0j6k+QMTMApkw25qus76+AcV03GCUGeubMXR4QjjfduvbjStAorsAW8oioq808UimJZVYADapgV2PIRCNMQk0eb4G80U3P7wSjXkKvCgGytrnW8P55QyFAN972NnSSbbPDyQfOfdq9gPnkJ1B8y2tzHGMJk5zp/s8tL1Eb/5rdvcva4YdDt8+eoI71x7CKSI5KPKeP7917f5+R+6h2ev7HM8LTmz1ucjDy7xmy8cMcgTVld6bK6tYOtwqtF4MmVcGvIsxK9SeDq55pVLN/jcHzzF44+e4+C4YjqrSDspR8czfuZDd2OF4uMffQ8PrFme/cYXOTqecHpzleUlxbS0nDuZUVaeqzsF3/zSdV68fsThzJIpyBLJck+ifDiWvDSOogZfgEHiVYbXCaKbIdMOMs1DiKdC5aPw4J0Ba6lNBdZi6xKMwdcFmAqNJZWQJ7CUSASeWW14+toR37xyzMZA8/C5ZR65e4X1Qcr28Yyt/RlKwRu3hly7NeKB0xnvuf8iX3p1yBPPbuG8gdrz3/ytj8H0kOefehmRdXG24LnLE+453eP/9afu53/83Wu8tFOwsZSSJglFWfPQfacotm5R1I5MCn7/6W32x4YffN/9/MhP/zjvfes6f/Brv8nzNyY8er7L6aVT/PZTe3zu2dt84t1nSAvLsCg5v5Gwdl0zqh2DRLSl11I6JlVIMQ8yyc39CfeeXKWooaod/SxY/DoKEg2O5UMjEC0FQgb3tYwueR3rkhsiTnNga1Nd6SF2VfYURpArwagQFJWlm4e+A945tJDY5swGa3A2ZG8MIrafj9dr0g5RA4iF7ppCzEHzNgvQtEFu8IBwKEaw8FJC3kmZjKaUxjMpZqRB1eERTEpLv5OQphLrJeW4Zrnbw0tFURlkmrXHZje9Axvw0RNLkUVABhrloGVsoCDDz0qFRoeFsQzyUIl1VAUa64nNAZsdz972lE6vy+TmAS4CMlmWgAzKK00T/vXvv0aq4J6NDq8fWSalpaNFq4mlCL3dB13Jpe0xv/vMNj/46DovXjnkV7+0zb3338ff/8A7OLm5hqumQVvXlulsCsZx+/YO33h5l0vbEwqlyRKBEZLf+PoWb3/4LibTMsTc3qGUwljLT753k/3Lz/PcG540z5E6Z1IE65/qhC88s8M3Xt3n6kFBojz9THJyoDDWMSsd0xlYraAzQPY66G4fNVgj7/UjoUuCTlE6wZezGD+GXKWwdcBPpAQC2OpMGTw26/DVDFsWlNMRs+kIijHa1eTCs5wLtFJMa8sXXt7ja6/tc/dmj3fdt8mDd61wPK3ZPZwyyCV7E8fucJ9337PC43ffz2e+dpMf/aHHyO2Y5558kc3NAa/fnpFI6HcE2/sFVWn4f/zEA/zT336Do3HFfae7TArDw2cyDg/HnF5NGE5KvvTKMY/dvc7Hf+QDXOyX/Nov/RavvXSN4+OKkXbUleWhs12eeOWAF6+Pec+9fZ66OqSfOs4sJbywXTCpDLYwIYOE4K5TSyAMeaY5ntb0O5puGnL4eaZJJZRmXsgWxbtNoIfDdKHyIcvgfehRGXgYzdkSLgJxwRU2PmTdbKT0WhNCh6K0ZKkM/Qhl8KaNCZY+YGAO6SDVKc0Jz224sBD0hyYtjX8QnlXL2HfOR0JQaCElWlAw0Yq69gwnFUoLZtOCXr+Lj3XIdW3p5qHTyrS0TAoT4n1n2NkvidhctK7z52kyALSPMycnyFYYg9B7Iaidp3KEajchqY0lSwT7RwVvP7/JWu64WTtS5+hkmpmXGO9Y6qTUteHURs4zlw555tqQh8+klF5yaWdEquaZCBE5ECKm99YGiideOWYgDWmvz4d/9GNImXHjpWf54tPPc/XmMcOZQQhJvyNZW8rZXF3iu9+2ydvPdPnDlw/YHpVkqeaZa0e8cGmbM+tdpIDdg5LahBDr+s6UzZUu1ll2DgoeuGuJWe144pl9Pv/MLXbHNb1Mst4PjTxmM8ehAZtmqNVN0vVT5GmCTnP8eB8vNXJpBSc0FOOQyK2KEBM7i/AOleagEqhrqAtc0sVjcWVI93ohETpF6IQ075CsrCOkxhZTzHTEdHzMaHiAKqZ0lGejK/BScnl3wsu3Jrz17ID3P7jGA2cHHIxrDicVCsGr14YoPB9//CQMD/nayzdYXupwPKnbzs6bg5RJadkblpyfzPjA/QP+2Wdv4F3N4dTy6FtO4E0FON44KDG14+FH7oPhFt947ptsDw2HoymlE+RJypWtMUp6zix3uHFkeBRFPw/HdZ9cSnl1Z8b5lYwzawNObPRY6vc4PRC8fOkGWilGs5okyyItHSThKHnvXXDFRYjzUWEvG+tJRAijRbS/qRJYYwnNxRbOoSAcgW6taw1vc/zb2TMrvHpjj/HsILD8Ih8nZA1UbMgbKiorY6lqE8v4o5zFPKCIsW04mDbG3NEIz6sBGySdpjFocxiCR2pFbSz7t7fopIGFdFxaytojnGWpn9Ht5uwdFaGDj3XMigqpPVqHuuRGD4WDOYKwazkXto4ONefWyzYm8giEVBTWUrnQ5y9JFLWD2oUmlzpNuH7rgJdeT7h4dgW8ZFxUdGIKTolw/qDWms8/d0A3gTMrOU/frsDP0VelJQgZNn7sjKSVZOdgwrR/gU984v184Q++yQvPv8q1vYpuR7O6scKFk4piVrNzXLN1uyDdnjHIFRuDlO+6f5lXtqa8tDVl4gW/9PuX+fQPPUCNpDJgxoZex9PLE27uTji72eees0t84dltfuvJbXaHFYOu5MSSoq4dRyNHrVP0+imy9ZOkS6uIJA3ZG1PjywmiGiFlgmQTgUFkKSrrNo0UI6gUrBG2RugBQm9gbFAMmBphaxwSW5cIZFAcBKqwUAnJYIV0ZQPMeerJiOnRHuPRIZmd0cvCgRWvb4958caI+050+dA7TvHw+VV2DydsH89IlOb1G8cYs8/mWo8Ey87QsNqVFMZxMDb0s+Dq7g9rnnh2j14WQMxeKhkfHGGUY5CGdGOWpvQoefrbr7HUEbx+9YibhzNWuglVVaNV8Cpz5dmZGsZlCIiV9ORakirBqYFko+tYocAcT3l1t46HbUJRWmqXkKdJqPuwAWAdZBolQ4mvsYLCOoR0JCJkokKr9oCpaWK46hu8KzSwFc7GXglNg9GY6XAOmXcRUkQuTPCgKxPc/EyH8C80PgnHplnnSHTThp3WzW9kfO6dzGVcN2/IxjVpoAIRc6QynAYzGQ8x6X0keYaXgjwVVHUdOqJEbnOeCKqKSEIJdzQWZENKWXCV8PMz30LTz5Dbd8SmFkJghScVgSkFtCfqWBtyrcaEJo2TyvAPP3OJi5td3n62wyPnunQyHbr5TgzWS/bHhm9fPuDMqqZwitvHFXkSD77UAi1DQZHQOhJ9BPuHY37kI4/ywx+4yL/6Z/+O4bTioNL8yEcf4fG3X0ALKPZuUhvPaFKztT/iKy8fcPuoBEqGs5qVTsI77urxzdfHvO+7HqOzLDm8tUevm1KWlunUMRjknNzs8dylQ375i5d5Y7+m35WsLymq2nI4Atfp07n/PrprJxFaY8ZD7OQY0emjkgwtPUKBXFpH2QJhx7jOAJcuIaQOCSilEUojqxleRDqKEPgsRZgKKTRYgZvVCOeQ3V48ZyGECs45vJC4YoIvJjhr0L0BydIa3hqqwx0ODrZIpkMGqWCpI7h2OOWff/Yyj50f8EPvPMndWc7N/QIvNSfXEmprqKyjl0uOZiHddXYtpaxrzqx1eHm74qXtgiyVjMvgdh+OCk4vJwxnNbXxTCvD7PiIVDmu7hZUtQtUYOCejZzruxNGs5rKumBJnQ8tuKVhXNpQ9FRbJrOSqnas9SSZlqSVoZaQJYokz7He4a1DiUBtvn9Nc2oloZ9qBv0Bn3t5n9tHE7JUhCaizoWGNviY+pNIE8KD0NknNJjNU0VlHaWxiMgUNDFE7OYZK72UmQ0CrLVkVprQSj0eumJ8UGJF5ahsaBkmXCP3fkERxNA7YgGxI9BcUzQVbaGOec4omtWhIGRjqUtR1gwrT13WdNJwwow1FqXgYFiE3GSS4p1lOq3vACSa/D8EoXaAcNEjiFqqcY1cVBZFFfrHeR9Dg6ifmkILYz3dXJPpPlf2xjx37YjfzBR/95P3ImX47lIv5cmX96iN48xyh63jCuMcnaRJiynQEq00KtFopRmOpjz68N38qY88zC/8fz/DxArqtMc/+Cs/wEpX8s2vPc9zL93ktVvHrK70GHQVm0s5H314haeujnnilWPuXQ8daq7uFPytv/RRfuCdp7j64oucO7XErKxZXcpQUnJ7d8ov/N4rfP21IUkqObGisMYxmjjqrEv3gfvJT5zFzKbY6Ti4iEKQdDrIwSAAtbVFdNYROkENtwPwt7yJrEp8miGSPIRc3kKSRCBoGVFN8ZMjpNQIb0BKXKcLdQVL69S1DV2HvUNai5seo7Icl3Vwo0OsNbhiAkKQrW6QnThHdbDD/s4NktkxK5mAruT5m2MubU358MMbvPfBNV69eczOcYlFofGs9kMqeNDRVMZgnGClI/nsU9t4KTgsHMeFx0aW3GZXsT22dDJN7eGZ1/Z467k+3W7OqrYIWbM+SNk9Kri+NyNLFMOZIe96bD1tyUXDad0WpDkPWRLSccYGVN7YkLpLmIXjx6RnVoe/l9ZyNJVMKyjMMV3VeNANI9SFg2hEQO9D23DZnvnXpGBlkw5Xob1aw9gpZyXWw6x2pEkgE0kxP29hVgUMIdHQwGgL2f4oawsuf4NReNomoToIl5vnCGKcEMg08xxyWXm29w+Z1j4Afv2E8XBCL5Us9VK2DmYcTwJPff9wwuFYsZq6kNLzcw/AxZs0zT6yRMbYzwESJ2QgPRBaYCVKxjPeA0BY29jeO0Cv7TFPxnkGnRThLGdPLHP+4iluXdsGHJ01xeXtKYmGXqbZ3S3jAZsCoYLVlyqAhdLHo6rSlJ/65Pv47c98juPSMqol/+K/+xlef/YlfuO3n+bqbsG4d5af+NkP83u//gW+9OIup9Yzuonk7s0OH7yvz9cuT/DG8rf/+qd49Izm+W88yerqMpNZRZ4qsk6H3//6NX7licvMnGdpIFEeRlNLmXTp3XORbn8pgKn7WyEV1F9FqASVZ6gkQyiFHu/B0gZ0l5GmCCCrToIySFK8rXHehveSbiBXVAVCJ3gVqv8oxuGIdp0j6hIhFH5ygB5s4pzDoQJwmffC/E+OkHmOlBorPNQlvhjh6oqk0yW59yGq0RG729fJJkPWuhKH51e/tcUrW/8/tv472Pbsyu/DPjv8wkk3vty50RmYbqQBBmGAyRkzwzDDYFoiWSRFllSkSrZLlu0q20VLtmmVJdmmXLLKolU2KVLikBxO4JAzgyEwyDk10I2OL793870n/MJO/mPt37kPLL0qoLtf9zv33HN/e+21vusblvziey7Shor94xVzFxlXMtqFGDlYJHanFb/55QP2lh6VdRhD9MHe3PPspciyC1ycai5MC751e86kjFzdnRC1QafAm3dOuHPcsjMpWLSe4zby489skZKQaEKMHC57CqMFJC4sMcHSgXNRbNBCZDIaESMEFzDZ4szFYcWaJMI7ih9EHxLOKpILFNmcoLIShKQVlBpSzFgTguYvcuT9YDFmMjfG+0iMgd6Jm1TjEtFLm19YgzKJsyaSvGANdSHj62Cd90AtYLj31xmB+WK254cprRHE9a88L2ojwobgHLPNCcZYbHLMxiWFihwcndJ2iYszy9EyUFrNxe0pF6YF4dX7KLPeQOZql5uTNLQ7ZG9ztbYHL7Uczj5E6sIyqjQrF9eVc8iXlxDLoYJKiuxzTz9E00ZuH67YnFj2j1revN8wrcTvft54cbtVilFRUFYF2li5Va3i4GjOz//Yezm7cZNbdw+5dez5O/+bP8Or33qTN775XV6501I9/Az/p7/xEW6+/DpP/7n387uffYt/+PuvMJsW+LjiymbJxUrx1/79X+OZXfjD3/kczz59hRgSly7M8DHxX//Tb/NH3zpgc8Ny0cJ85TkJluqhJ9l67Dlx0d2/QXId1cVHsL5BVyW6LNG2JI2mEsAx2ZACqiCaCrXzECYFVLOAokLVU6m+tpDiGz2pKMBodFSokNBEfD1BVVN0uyCWNXiPjkESg10PpiAWFbRLKZpFQXAduqrAGlLfErQhBEdse4q6pnj6Jbr929zfu8lMOx7eLri+v+T/+a8afu7dl/joCxf5/KsHLLvI1lizbAPTSnF81vDl66doqx+wjBMW6cHC44JmXApu9PzVEV94q+dLNxoePYuMCwlc7UNkd1pw1kZevd/x0O6YKxuG+wdnTCrLwdxxfxEJwK2TQGUDm6OSzkcWTkg8zkUuXJoQyhqrI+Oq4HjZrw9ZaTWzyjAuxayGPH+7kECDShrlxaFqanVOGsqdRTxPynJe0qeUJjNwFcumI3SdEK6cpBI1Plu4k7kLBXgPWkXaPuBDlJyG82b5geN83h8Mo78d/mGgscXscS7thBxSqxWjseXixV2Ozr7DuApMbQBjOFn0GKXZmkgq6c7YsOgCo0ozHtX5ylcPvAmp4jpjBykpGpeysWf+mjGhVZRIpEKzNS4ISXHW9hKHNQQmuICxMhfFJGu+six49ELNajHHarGD7l3keNGwO9GcdtC6SF1Iy2WMMB5VSutsurKo+MDzl/jCJz/H3XnkR97/NCM6vvOd7/HNm0vS7qP8b//dn+D7n/8MzitGteGv/ckXeP7JS/yX/8OXeeVey5v3Ov7z/8P/lIfHPV/41Je5fPUCZ4uOzemUW3sr/qt/9m2+f7/h4o4l+Mj+aSTtXGLzmXej6hHu7ASVZ2xttinHI3QwaFuAMaKWzJoINi7KzW0sKjhQCq8rVDFC+Q6KiuQ9uqiFVZaivM7qVH4i3hHKCXq8hWrnAt9UI6JuUb7HuI7onfxcNi4Sgoc4huAw0YsrcdAkY0T0okZE5wi98Aiqi9cop5ssbr3J6vSU3anBx8RvfOkOd45W/Pz7rnG8WHD93ordDVkZr1ziT77vEr/x1X1skfEfpG0/XnmuH/c8vGk5WQV2J4p3Xt3g9b0Fbxy2jArN5kg49LdOevbOPFd3xvzwE9vcPzjBJcVGoXnlzpKFl4vv+/stbx60TOqS9z82ZmdsCClxuvL8yNUJ9+/OaVxiQ4srkktwsAyctFIIOi9OUKNiWG0jiFZUuJwmlGIiqcyeScI9iUnh0pAuLH4BMUaqSrM6OeHe4RJSQFHgk0So9UkRfaIqZBthS51NQtf7Nn7w+ItB6yA/Tpzzb/TaBmCNA4AP4QcYRc4FRqMxbRvA92yNNd4FyXrPcUiT0lCaxNXdkTi0Kg1BQI1hyzCsOR7sNIzRoBU+afooFMmIXisTTX7Ij5c9KqOrgmvIzHh8suTopOFs0bFYOUia3VnJctUxKaVCH84bVn1iVts1Wrqm76bMpsqrwPmy5cknr6C7Uw5Ol7QBfvSlh/j6V1/jzbsn7IUt/td/7SPc+voXWXaSsqNIfP0rb3B5Evibv/o8j+5O+F/8rV/hYjHn5S9/k3o2pWtbrl2c8vbdJX/7v/0ar+21XNwwtI3nqDUUT7/ExksfIdgSt5hjU6CoRxQbu5TTDWw9wu5cQdkCqgmMd0gxQAjEYoIezzCxFwNOW0KMJG1hsiUgYDUCW4LvUKMJrM7QvkUnhx5NoZrIejD/nJRvsSpJRzCaYuoxqqjlJi4qEUClBLaSAqrFw9GWJaoeY8oCO92QlXK3QpUV4yeeQ118mPuLSIyJa1sFX3r7lP/6999iazbj4taEpgskFKve8/wjG/zJ919i3on9Nkr8IZWCb99e5gBNxSt3VhTK8/SVKRujisbBW4c9148dActLj2/z0aemnC4WLPvApFDsnba8ut9n9mMWG2nFadPz9VsrdBIwuk+ax69usn94QkQTQ+JwKcnWJ03k/tyxt+g57fz6HAFDQjgunkuBgxIrd5IoWIVLEzPwP+BcOV8wf2/jUSmJUFlCnJDORLqIiAuRPij6kFOjslnJegQY7v4frAdrioBFndtwDUq6B4UDCgmsHJWaqohcnFpKo9GVpm0943HJqnWcnbTszioOThtQilFdUpR2SFP+gbqU8gdEfrNGi3+9Xef6nYcydj6S2oC2FpuNECorv9+1PX/tT/0wj+6OibqUUEZt6I/2OF0uaYJmV0uGuo+R0sBpH7Ba7MFlxaIpyoKBn9x0kUeubHL7zgkHZz3TSU3tl9y9v88Xbkb+s//dz9PeeYOTVeDi9ojF0vPKjTNWTU+6u+DpqyP+Z7/+TrZnC66/fIfxbMRy1fPOd+zwyvVT/q//+GWihksbmqPTgJvusPXSh0ja0B3toYuaop6g24AdT7FFAf0SXe7A6hQ1u0Cc7ghPwvXSBUSPas6ELlsYkmtQ2kLowRrUSFyPlO+lGwieNJoQknASkutRwaNSICoFMQjg2i3RhcyhaCunT+u8VZihqxqaBclFVDkidZboHZpe/ru8Qg5mRAyJFDrqK49STDY4uvk6U99zeWo5XLT8F//8+/zVn32Shy/U/PHL++xuVHzv1inve2KTeeP5rW8fMrJiWjKrNaPa8J3bC0ZVwcc++Dyf+8bbnJw1PHN5QlITSJFRXbFRaXrnuH+yxCfF1siybDxfur7CP3AoRJMifz+uLMkYbu037EwrsbE/bdiclMQQuH6wErWfQWjKnAeQPHjGSKB0yhbcms5DbTMgrgb/CEm/Ckr+fkgf1lox2twghFvUpQjPOpcDe5WwPq01WM65CJO6zOvzfHiHf1DnXoGDTiX3BT+Qvn0+Iyi1BhMGV54Ueiqd6Loe7z0nS8f+qQQuOg+rLkhrqUQD3TlP07bo4bDzIP9IvsZQfSWimkzDVaQYs1GIosqxXiEkChUZi3sDzkU2RoqntxVH19+gv/0qZ298l+NXvsHq/h2mtfC42z6hlEWlLIzIjsFt7+i6nqZzNL0jxsBq1bFoPRssOTs55LRJbIwLuqbh29dP+NVf+Shb3V1u3T1FI5/Fd944ZLXqubwz4pErMw6Wibv3Tji4fZ/NzQm37i947OFdPvPN+/ztv/8dKDTTSrN3HIhXn2Tz/T8mKS9nR1TjKeVkIgDf5i6qrOUmLUoIHboeo6PDuA7tO1RRooLD+h4FmKJEdUt0DCK2KgoZKvtO0NyyxiQvY4GRzUDSBamakowEm2hjoZ6hiopYjEjVFDXeIo03oaxRwWGSF7DRtxL6UY3A1qhqjK7Goo0YTVDVGFOU2OkWdjTGFBW4DjvbYuOdH2Q1usjBmWdnYnAp8J//1musguGdj24QfGRSWV69u+DDz27xJ9+9S+MTlzcsD28XnJ31jCYb/OU/96Nsqpaff+cmCsUr9+b4vkETWa6WvL13yt68JWLYquQy+KPX5izcgL7Lc2GNXDg+Kn78XVcY2cT9k46Pv+8RThctTeuY1rA/dxw2Ya0ePF9tC4414BT5PqHQak2+Mfr898R+b3AEEqmzevAMJPErRNtzGrHWOXdTfDJUkl2ZIVCohHNxvVXg37zxVVqfu+F9K6XyFgAgCsFAC9cQbcR3XynhPa+ChG6ECPNFi3OB7c0RpUqosWF3akkpcmGjZuValivHxYtj1gZD+ddgiCDVR63z51Cs8/8KJV7vYrIhhcwaEQO5EEVXnWnK84M9zuYNKy1V1moYVyZn0CWKQuG8UDyVUuyM4MqsoJptUtdV/tCFTzCuLdNCsRkbjhYtdWXQaPYPF0Q94ieeMnzr29e5dGGcq7vih57eoSoMb9465Y1bC67ujrh2aYaPcLroee8LV/ndz13n7/3+22xuGAqdODiL1M+8xOjRp2hvv4kezfIBseJ1OJqhrEG7Bl3VMksGh8KiCOh+IWOAW4KxYCpMGBRgGoz41msrT2GqRsIAjD2xGqOUoVgcCOOvnhEREYwKnkQi1ZtEa0kYUjkS2nD0Oa04QfKoGKBrSMUITIkysndX5Qh8B95hrSV4A64VfcdogjKW0K1IyrDxxLPMb5XcP77NpQ3LaQr833/rNf79T7yD3U04XXaEaPj2jVM+8I4tln3BH33vHvvHjp//wEP80k+8i8987mXOThc8cWXCX/jQLv+X37uHdy2PX4CqNGzUEhR6vAq8erfl7plnVmv6CH0QAZVWispqFl3g2Ye32SocL99uGI0qfujpC3z6868xrg3zpeM7t5ZUVnQAjU/UeRefN+5rNmtpJPcR5GvEJP4avY/0Spj5hRHmbRyUeutzEgkhMZuOGY1qFCcZoksUmUZcWHF3DkFWhMEDSopGWu/+1wjfems2dPeCVqpzObAg/ucFY/AGCF5WcKHv6bueO0cNj17Z5PLuGAUcnyzRKmGswZiC44VjUigWXY/WU4zR+OFLqPXHJFhDlBWJ0ZqUK2VdGkpj6ZxbRzKjpABE7wSRTlIhY9J4atr+jI2x4XTp2ZoYWpf3oyaHcGYgs7Ka2aTmmcsT3v3ioyydwuhE7B1BGepC851XI+O65ti04kTcO1T0rNqer3z5+3zoxat85/V9tjdqtmYlVW148/YZWiXe+/QWhycdTevoe890NuJffO5t/t7vX5fDryL788TkxR+h2L1Me+tNSgumKlD1mGIyA+9AJSkG0YIt0f0KZQ2qKNHVBDfaQrsG2y6IhbDFkm9F1GMNaCO3TvCQEtoUpBSkyNsSypo430P7jpimpBRRMaGy0SSuzTdbgn4l44TrpYtwjRSTooSiIIVIsrV0HSkSm7mIekrRFChtMMERyOEgKZCKiuQ6QtsxuvoonVbcP7zFlQ3LvAv83d99k7/+i0+TiOyfdGhjeeX2nI8+M2PZbfHBdz/Kiw+VfPGz36AEZtOSVRe5tDni3/7oRf7uJ+8T6SmMiNAWXWDZC+i2OzZsjjVqFTlYBgHRjHD8t2djPvSOLW7eP+St/Zaf+ZEnOTlacDZvmExKFm3g9qnj2oZlZ1Jw/cRx/8xRFcNaWy61pMhuv2n9nFutsnWXuAa5KEGhQ3DtwBAcLkm0YrlcEIMTFW4uGD4nX0lUnCYQZTWuNGU1wpgFJDcs/XLrn2/Y9IOXcUrpfAuglM4KpZRNCnMrrgQUxHlMOWI8KqgKTe8izgeMEcrmqvGUFvogaTLbtWX/aIGCdVpJLkwMTUFMKYdaygeHEnKD055y0DcbI46nSRDLISKsriwnJx1d53jh0SnLRkDJmMeDUSXI6KqLRETg5JOMEdpYvvPyLazyLDvJXJd5KfL2cRSZsZYP7nTZ4aNmVmv+i998ldWq4wPvusL+SUvbOEZVYNk45qsACbY2K/aOOx69usF33jzm7/3h+eHfW8D0PT+KHs1ob75GubmLnUxlFLIitVZFiapqucsnG3Lz2hK9sQMhoEcTSt9B8lBP0CFAu5JDqCHUU1QIsrIjoXRBdD3KWtJ4BiGAawj1FlGX4HzmBxTQLzC+J/mOWE4FMfYOqgJUyjRphXINmAIVPDrJSEVRCY+iqok5r1GbAlVFUk9GuEEZhY6JUJTSDbQrRlceoTGWe3tvc3XTsmg9/83vvcZf/7knaPrA6dJhy4Lr+3M+/MwGVVzxpW/coyo0e0sBCH2IvHFnwUuPTfnYMxv84ffPMvFJWvytWgkoXIir9IWJ5nAplN4YRYDzs+++gO8W3DnuuLgz48Pvuswffe5VRqOSibW8drDAx8isLjAGXrxac39i+f5+u75EQybR+RixSeLrfOLceAXWh9dn2/6khJY8dO06r7mn0ylFWeJ9oDCFOHTn2cJ1UZyyjGw7iBGslQLBOeN2IDkNBzAv+xiyQO2g0x8aGfLtr9LQ0iRcgKg1uqpIKBaNY9F4SWkd6XWIZO9hMqoJKWFswd7BXFJjBx1whh6H+cMYmWli/qB0FiiEFLGmwCrovKcurYAoLq9WkpAyytLwd//lm9gsppjWlmWf+BPv2cVoWWf2rqcSG2H583kGu7RVos0IpSwxBTHHDBDMnJOF57ELJVvjgtf2Wu6f9Tx9ecTNo46/98kbnC07Pv7uazl3XnFps2JcOloXeeXWkqeuTbm9d8b/63deZTY2WAX3zxIb7/koerJJd+86o61t9GQTNZphNrfQ7RwVPWm0IbN6UcpNHh0YQ0CjCkHcsSU6x5jZZh+HQdUTginEfkoI66BF6oHRJFNIbl/0xNVcNgLFSHCb0KP6Fco18nBYKzFpKSfJhAi6QAWHUpZkSlLw50hy6kmdI+pCukjvUSmiovhFYkspZCH/fbeUg0lCWY1rV1RXHqVLibv7N3ho27BoA/+fT17nL//UE3zn+jFN79moLfePG1xoqKziuJOl+3atmZTQBcvLN5d84MkZX7mxZNGJWCYkiem2RuZrHxMbleHhLckSmJaGn37xKoVbcv244c6p53/1F5/n66/e52TeU49KTHS8em/Flc2CcWmIKJad56HtgtIqvnZrRZmdi3Rm/2kljDsdzi89gJCkAx6wB6NUdroeunBB/OvJSDIuQqImp/oi718ZI5yBvJlwMWR7s2ztd97oy5Ymd+DDBm34N+eOQKS8w1XZTus8H74wSEbeYk6dFU/bswpSJKbIqu1BGboQUT6ybBwXLozZnlWijMqmCfqBDyEmRG6qFOVQxUCok0kisUZVkR1OIi6qtemi1orgo7RcheVo0dD1gbtzhw+JxlRsKs9i1VPYxM5kRKlzGKI1vHHQ8cW35iSlMbak0Im2D3QB7py0TErFCw89zLQylFbztbfmfOTpKc9cGfHKvYZ/+Pm7HC16PvHhhzk8aQBFXRY4H3j84oimdfyd//672EpTF4l7Z4nZSx/CTDfpD24x2t7FlgUUBXo0RjVzWdltbpFshfEtKiUxW9UFZmMKqwXRFKTo5eD4ThSbIWDrCm8KwXS1hVGR5bweUpSVID2qrPBnhyhTCC8geYgR1c5RzRlUNRRjYtcQ+wZsRdSFiIC04A90C+gbeY2iguDkn3WBEmGqXCUZoKRzpKqG5ZkUhKImdUv0aEpqFmALTHTSCVy8yio47h7f4dpWydGi57//4xv8tV98mt//+n1WLlJXBSZEwaBGio1KHuYYoe8dC5d4uDZ87B0zfuvlE/F5SLDoEztjlX0AFVWheXRLc22r4pGLU1ToePNgxat3Ov76r76L/aMF3331HpNpzdQkvvDmKUopHt0uCUnwA2ulO1046UyVGoJus7lNAu8lqEantMbDQhwkwdIBawVdyN6pSZR+ITjaoDK3/3wrFzNn59wbUJi2CUV0PT4E8RBkGLc5/7sHOvDhBQcl/PpoPmgZlPJesbSacW05PDhhseqJyuD7npRgOh1Rjyy+91ikxQZwvaO25685lMDBDHQYO4Z2JyZQMeGHd2OkMzBaLjNZD0qi7fodK0MyUJVWVk5KcbLyzFvPwxPD0dJTGHh8NzGpLIs20vrEH7xyQvfgDuiBX1rBfoI39hoeuTjm1nHLjaOWa3uGrZHl2sxwqOE3v3JIXY/5yfdc4s7+nKQ8s4lle1ryf/xHL+OVYqNQ3D8LjJ55D3Zjh/5oHzuVm9+YfEhSRI02UP2KwjUyq88PZY6ebMst7Pp1okwyBWZ1LG14OULVY1I1k/Lqe9BGbuyiROmKtDiBcoR2LXFxirKCK6i+RblOcAPfCTMwBBIdKnp0NZZLIQjgp4gQelQhRShpCR0BRapM1m4IgGy0zjZWEWxJ8h5FIioN/Qo9u7i2jVN9Izv3dkX0htHVx2li4t7JXR7arXhtb8UffPUOH3hmh8++fMB4s2B7pFC1zkYaChcSvVd4pbiyaXj9fsf1vTmV0Zl/L2u6szaKv2CZk3uT+BMeHZ9y0gReud3x7/zK81zcsPyLP36d0ahgo0zcPWm5ceIoreblex1P7lbsTERPcbjoefOwy3T2DKIrI2vBKIUGhOxDEgIc+ZkvssrPZ3A9rF2lJd4c57GQtTRS5JoQifl1lRrMRBKzScnZqqfLEuEUhiN9ftufX/bD+Rfq+4O4QP7iP5h646OibxvGNrAzq6gLOc1VJaj1qLSMaiPyRO/ZHFsmlWYyqR/YP7J2N80YB0plPj6DB4G0RIU1bIwM0Xs6Lzz/ECNolRNwM2/AZrKQMVgrJiGFhruHLbtTS2nBYzhtHFtjy3ET6NrApBKj7spIgs+kVEwrxazWjEtNYRV/+PIhV7ZqdqeWSan4wpsLvI9sTQtiilzeqflzv/5Bbh0sQUkQxOWdMf/v332N1/dW7E41+6cB8+izFBeu0e7dwkymmJ0r6PEUbQvMeIaxBtvPsbEn9StUc4qabJCKEqoakwKx7+SH5nvoVqQYSd1KHjZbSUR6SihtSK4H1wmFt12SjCV1S2LbkIwVwo6TNVksK1I1IRVjAobke9k2aI1eHKKc6ApMFNWgKmt5WmKQVrPvhAtva9kGAKpfSJcQPCZ02NhT6CQpPUajoweiqBIHpFppYS3agtg76quP0Y022TvpuLZd8i+/tcfeUcs7rs24edxz2iROWvmzo9Jw1kTaEKmN4tvX5/yzrx/w+nE2PH1g0T0tNaNCnpHeB5yPLF3gzqnnjT3HX/3Fp3j0Qs3vfPo1qtoyLiUG/Y/fWDCrNfM+cXfu+eL1JV94e8XePHD92NH7uHYXHi63gZqutfj9lYUlIkCgVkismBLyUVrP6nI2QsxYF6LsG0YGpaHOQbh1nWndSkxznA8UGiorI88a+U8PXnRqzfglg44DTvJADyBiII1ap4oAFFkS6Zx4/1mrGZXy0Hjv8S7QZWPIoe0c/PKGuWb9HtLw1VQuNsIW0Nn5dFA8qeGnF2XGDz4QQliTG0qbwzmzfXlRCBX45evHNC4xKiXTrvGJxy9UzBtxXNkZFyTIgqBzQxBjJEpqOi65edrzpTfmvPORTTZHiqQSn3/zjMJYDo4Cf+vf/ignh3OUFxxgd3PMZ7+9z2e/f8KlDcvJIhAvPcLo0WdwJweUm7uUGzuYkbDkdFFTuAXF/B66W6BVwKyOYHksu/millWbEeqo0lmM4zuUW0lb6Dtol3JDpEB0vSD42pByooyypQB0tkBZi+pW0K+Irlsf+FSNZDvgJWE3+p7kOrTr5PVCL3+uOZPxoJoRVEEKPbRzeZ/KoHwnnUMI2OSx1RgfI/ODA05PVrKdqScydvhe/lqPha1YVbmwS9ZDfe0dLKhpOs+lzZJ/9Pk77MwqLm6OKK1meyy79Df3OwqreXir4gvfP+VTr81Z+YiLw0pOhDWXp2IC0gXoQlqr824cOYzR/M//1AvsTDS/++nXqCvNxEoSzx9875RJZWg89F6KjNWKw5XjC9fn3D1zlJnHIsm8ah2uKxsAQe1jjGgzrObyGi+IqEhrCYpdax4ydtD1js7F7KcpytcQIwYZs/ugsIXN4HkgKcnQBCkw6QHMjcT6nwf1rwLpAHjwP0D+OgBAIk5IpKDwvfjd+RwIEmR3wbLpaTqfUUnwPjCqS8ajWtxPHiQD5K8cYzqnQCKzUAhS+axVdF7ciAf+NwlSNmIIUWCN3of1a5alYdkFiqLkT//CS2xfuYDrOjZHBeMy8ciFUmzEVo6rM7OuiZLPZiisxRZifGq0YWtW8anvH3Mw9zx/bcrW2IKxfO2tU375J57ixecf4ptffoWikiJ1+7Dh//vJt9iYCkNyYWdsvPA+3OIMU9WY6baEbTSnqH4FroH5oaxPiwK6FUy20LsPkVwjBhJ9k9tGS7E8xoYO4xtSDARTSttcyEyqUTCaSVvdLqVgSuXOCL1GGUsqR6RijKpn6Nze0wvnP5lKcANlQRfQN3IZ5FY9NcuMJwjIlYqxFBuVqcDagK2wFx6mKbe4u3eMPjvhfQ/V/PS7ttkOJ5wenmT/R1BFeY47ZfBqSIRSRUH16DPsNwpLIBL5o2/t8b4nt5g3nt7DcSOgWNtF/v7n7vHNOwLE+byCmxSwPVJcm2lmpXjmKZVofeTmseP+IvHhZy/yV37qCW7dP+H3v3yH8ciKE7aCT746z9wUOFoJg3Qg11klQTXF4GaXLxHU+Xw/dL4pX3FDUGhkuNGz/d4Dvv3SHYsXZ+hc3pIJEBgyazYkeWbRMv6EIOv0cZEPde6uh9H+XNqfaXj5bKcUBQQ8p+afewCsfyUJPEi2IOqCwlqUtYwKmV9Iki9XWMO4lHDI4J3IJYNbE3/yq0t1y2+SlItLOichlVbT9omykBVUmXX/hVWEqAhhKO0a5+O6GziYOz7wwkP8+Z98B+nskC999W2MKdExcrSMbNSWq5sVd046nr9WMymNeAYajTEWYy1K52yE/Jq2Kvm9l4/5yec2uLZZ0gfNzcMlf/4T7+LT/+pLLByUTeLxKzP+q999ncbDTg33GsPmBz5M36yE8LG5AyqiMOiiFt5E6Na5h2F1hq5GorSzNbouSUWBqLQVSkVSdMSowdRye+ocGBESoSzRKYpNljLE0QiKEtAk74jBSXRZtxLcoG+gqNCuRbkWgidNt0UwooRHkJIYiJBE/5GUyilDldxwVsYJ9KZgA8YQp7ssFi3u6C7PTXs+8Uvv4D3PP0RVSoglSvGf/N1/yeduHrO1uyXc9RRIzRnESDSWFLyEwHQ9phqjdh/m3uHbPHah5ts3Tnh4e8STV6e8eW/JpBLC0/5Z5O1Dx7hS1BaWXlEZmJRyMPuQ6LzsxHuf2BhZPvTMDi89scWiS/zuV++iU2RnatEpMTaaP3zllJWLPLRlOW7i+gIT4ZxaHxqdtfly06q1nZ4me/2pc8v7PkLK3QIqswHzqzoffqBbV0rR9o7gPcZoysLgvOgEdFFkYpFwNxSCEwzxemtM74EihBos+PLBk12gnM1zQdD5PwzzzNAsdE3DZFzQ956kEBAtJXTWUWulaDuX47E09097+hDyQRdff6V+8BvUD7yXQkvbEqJsIHoXcDFx1npcEEAphLAORuhczAYNMjP9Oz/1CH/lI7u8/c3v8PmvvLnmdsck4p9F63nvYxscrCCElid2S7ogAEXKb8xqEVW4pKhKw7jUBGP4nW8do7Xm9v6cv/CJ93F2vKCZL6hKw9bGmC++csjX3jplZ2Y4nkemT7+IKkvSaoEZCWGKYpR9+aNw6LVGzS6QbIkua6Gl9itUkLna9144/v1SDqjKLLy+IVQbxPE2cTQjeScRXlrIpKkaQ1mhXAfRobxDeU/SVm7xrpN2fb4PiyMRF1kL3YqoCyH8BC87/GKEjrJSTCGA1gRbQjUCpUnew2hCmO1yuuhp79zgfdV9/uNfeYz/8j/8Bf7Ez7yHycgQ+45VG9BlzV/7U+9jZoNsLVIU0VF0qOjQKaBtKV8/OVidUO1coK22OFn0XNgs+ONXj5mNLOPSctZEOh957tqIR3dqei/++DbT0c86OGkSy14O55XNmo8/t8uf/ejDPHl5zFe/f8g3XrvH2Ep0+c5IMW8Cf/DqKV2IXN00VIXh4c2CsT0flbUWnsj5TZuGuzW3+GpN2x1m/DC4WuU/46NcfJaISTGvKDPYF8Sqrln1nCxaYkq0QdyelTYUSmzIUhBNgLAzY97cca69yYdfMZyzISHwvA6IGCi/eSWo3BqUC2mdM0pdi23UqnPYukQrWPWRkYayMHS9z9xi4SQUpaHthIIrbzG/rnrAoDgNgEnOUxvQTiD6lO2R5IMvFKhskiAtlbyz3ots+Eee2eDLX7tOG5Tw2JOYS7R9AAzHrePJKzO2x5Y3Dx1PX5pw89gRQhJJsYGm7XnyyoyjM8/eyYqqkgy5cWHoo6YaT/jZH3mEP/iXX6eqCyajgsokfuuLN9nZ0PStJ2xfZvrI0/T7t7FVgXFLzHgEkwm2X2JDgzo9htGG3NjlmDTehuUxFHKwtNHCegxBDDx8T5psk7oVqRzLzF5PiHGEbhbQnGLqTQmdqCdyq7sWHMLv1wYWZ9Kmhp7UzmXvX1TEvkVXFbFtUeJ6kTc0EJv5GidJKZJUJbt8FLooaHXF4t4eO+GEX37+Er/yYx/kmUe26Lxn6RTH81OKoqIayaFcHB+zuzHiiUtjvrfoJE8viKmqtlYeYCTzITUdIXhU8FRXHuXg7ZfZnCi64Pnjlw/50Xde4JtvHdEHWHae9z0+5a2vtaBgXMhxvDCVqLXNWrM5ttntKvCNN/bxQQCzaV0yq6S3f/Vuy3fuN4wLxeWZAWWYlIZCwbUNw40TwbSMykagSKxXzhblQZ8KsrW9VrKB0EqA6yAWWSjUOitDKUH0jdZir4dcXOPZiPGoRJ+2GF2gysz5DzEnaMnzP64My27I9FgfLUgKdd5+n5+5/N6VyqagMbsHGASIiBl1H1x4BKRIdKmQnWMC5xO2EOCt6zyFlS1A13swhu2JpW36ddV8EIDMvgkPLCVl9ViVlhi8pKDkrEJrDC4milLoRiOtWHlxYVUoxqXh9sGSr79xRlkabtzvKKyi6RJbtaawBcvOU1nN8bzlhx6a8KnvH/PwpuOFyyO+cqdhNNKsVh1PP/UQ/+lf/xBvvH6bl2+e8ftfvsU33zrgsQs1b9w+4S//6R/m7Tdu4vsOW9dM64J/+ZW7HDeByxuavdaw8fz7cCf7Ipcdb2AnMwwR7VYYv0S5Xg5UWRNRaNehqxF6tkNyPcE5GBlMELAuVDPSeEbsW1AWVVbodk5YHGOthb5DOVnNojJlt1mgQ5+tqGQUozkRF+BJzZDFnoLkAcSYgdXUC8JvLAGNDo4YPWm0RaKVeHZbcbZY0d7f57Fp4C99/Gl+4Uc+wkOXp3TBsFg52s5h0opKJ7wPmLLEBqHi9iGyaj1FvSGaBi2WmQKJi5WcioCxQkGPDluNcVuXuX9yh93Nmm/cOOM979iisJZm5XDe8+7HZ3zmtTMWrWNaa87aBEj60aqPGX1XlBZKq9kaG0qt6ANcP+z4/r0Vizx6ti4Rk2FrJEBdnxJXNyz3F4E2yCw/xMSjhEo8AAFKC0aVYiIOc3d+xkMcjqYUKKOGf5IRw0e53AZ68LQ2jCornaOW2987J7v/vDLUOoOD6VwqHYcuRGU2wAAuct6trLsZUQeptQnID1SKDFSEKJVmtVyx6rOnfM4FWK36nLUuFl7WGlwQCu2ors8np+H1hm9aSQUySm4HQ6LvffZiOwciCqNwEU6biNaKqhiMjHUmCUln8OmXD7m0NWZrUrA9klnuM6/NWbYxC0Ii88bz1KWKKxsFbx93XNsyPLZd0vSBxcrzp37iSe6+8Rr3rt/kQ0/P+Lv/wYf5T/+9j/HwhRnPPPMoH373I3zvtT3G0xpr4fis4dPf22d7ajldROqnXkJXI9LqDF1WIuxRUXj9zRm6GMvnnBl7sRjBeEZq5sTliQCBwYtc1xhivUFIkdCuiNqQylqQ/8WRrNB8kD196GF1BiqhXCOzuethtZBbvV2K95/SkgkwuyDrwUwUStFngomMXzEmki4kuKIYC3+/nnDsCo7u3OW50Zz//a89yz/6O3+Rv/kXf5rZrORo4Wm9RhlDPdlEFzXWKAoVKbRFxR7lViw6uL+UbUZynZA8MvmMooZyQrKlCKKKGnRB6B3F7lXOYkXw4t3wpe+f8fCFDXxInDRwuOz56DNbLHu5zBSKxkX67MajNdnWW2OAxSrwzVsN//r7p3zp7QVKQ1FIiO3SJV7Z68TvQYv77+2zxLxPa53/sGGIKW8V0jDvG4yRMB1jjdzusA7fHWbzlHkrw1wsPBahAyqke9XKMq5Lcd9OQZ4NhtFjEMpJXJ5i8AJ4kAV4DrwnyFFwDzYECZuxACHjxPNgEHIbYtDyEGtDSh6NzOcmK5yGVd/QmhsT6frIbKLXxaNYf/MZ6UxKhCk6oo1k3QlZI+W9aQ4JNeCdlyqWxDXodOWFS20TTe9xfWBSab7+9jHvuFAQfOBrb825N/ecdYFbZ0f8lY9eofWRtk+crBwffnLCb3/njKOl45ldi/MtG9MZL14p2X+r5eHLE26/fZOjO/d416O7PPXrL7Bx9RG+9fmvEXzkxMMzD0/5zc/fka0Fnq6esv3wE3R7tzBljapGGCumGfLAKKIpUbNdQi+rOlWMSYs9VLtAjaao5DDW4n0niHVVS/s+/GoWpNATqxk0C+J0W3z9fI+JjrQ4lKDU2QUZL3wHWsuKr95AuRYdE7GoiMqgyhGqawgyCQrQFwK0gvazeYFgRxzevcmo3+cjj8z49V/7AB9818PYasSyc9y6cQsdE0p53PIUXVT4pIVmHIOwDUNPVJadnR2+/e37LOyMzdGMmIT6ppoz6Tz6JRQT0S1EEQ0pHVFtC8qgd65yePw2l7dqXrk754PP7bCV/f5uHvY8dmHEzrigDyFn9UE0kd4pSDLSLjrHaRdZdQGthANybdOwURtunAZmVcJHzXEb+ebdjpeuVtw86Xn7uBfbunyTqwxgyYyv842e8uU4bAPkchWHXnkOQgxrGbJPg/muJgQpvCqPrs4HlNb0QbQ4ilJs7kNcs2FXvXQ4JNmgOR/WPJt/85f8fB88+lIk7fpGzr8hrLw0tAfrF2+6nslkxKiQSG7nPGVpSVZCD7UxUmVACoVO9G2bga/cBeQ3I5Tec9zhwZjkYVQIMWKS7Fa10oJ4ZnkvPiOwStolmwyjquAffOHeGvSwWlFbzVnn+eybCz7w2Iiu7/BJsTEq+MDjE7709op3PzJijOMDH3wXIwspelkDTkectZHj/VMOThra777FeDJhe1rQh8TJWcfX3jxla2w4XQZGL/wQoWtlbVdV6LJCVRWqXcjKZuMirM4ESZ9un3Prg0NVtXDmZTJEOUeqx/IQBYfKvHxtLapbyK3fLQXw00bov24lH54uYX6QC2wBy1NUPSEGLzz8vhE2oNJy4CfbKG2IrkPFiBkZkoImlSzuH3ExnfHrLz3Er3zsh3nxuYeIUbFsPL034hg0Gq2fHtcuAIU1lq5vKOsx3nlc3wkQrOHr334dNZqSlCaVY5RrSaaE7BtpYk8wNclGVDTY0ICBEDzlzkUWJ/e4nGTn/bXXD3jf01t84/VjtDF03vP0lRHfuHHGpNLsLwUAbH0iRLd+8F2E7ZHh2lQTlbTis9pSLiIxSARa7YWG+9XbLZpEbdSaeUdu7RMyCijxScke/ZFJVZKQzqAwWsaCzEg0OYhH57E3oYhJAnWHw5uSkp+1SsQQKKww9kOI8joG+l4uRB8ygGiEDzNc5g+o/s+rwAPvfWj27dDPpPX1/G+CGQq0xhCJXYsy4k7i8iEcaLzCWjIyuydLiDCuyrW7z/D1UxqchuW1jZIPgxwPnvLfrv8mvxcfI1YZSmvovZeHT2miVlitGVUWoxK995KRlpHQkVV85e0TrkwVVzcl4nrZBR7ZLjlcBl7b71g08KEfusadm7eEg9B7bGHZmeTdcVEyqSzzlaPpPc8+vMlvfXmPLgQqD368yWhzi/7oPsVoInt978SOuxwR6xkYg0meNN4lmQpV1uhuIXbbCLoeAdW3pLqGxSmpKGWkcA06JnS3kLWcawCwvsX3nej4lRb1plGorgFtRAkYPCxP1zNqqqakvgPf5t27IzVz1GyXWE1Ynp3RH9zjHduWX/rxJ/iFD/8oV69dxHU9RwfHJGUxRUlhCyBRFhU+jxK2GguQpzQqFShTZKUd6BhoW8/bx4miriF2+blTmEJ0DClFCB4VOlRRiVZAK7QtSF0nfIOtKxydXefKZsV3bzd84NmL7G6U3D1xzLvEi4+JLbtSMKtkTx7zRTLMyEUmA2mjiRmBl/tIo1XIcXRqnUSt9bCxGi6t7GuhxAh0zWjMa7Xex5wzyPrZHyjvgwv3D6b0krsFfe7OlSKmGtNFOT8yxxuUSnTOo5TJzFn5a5dXnX5NgFrf++sisG7/1fk/WDlgeQzIN/Jwuw5/XitDWVb0ycoMZSxKC6hSlRrvhPkXonyoVktL48SyDm3O38xgepCStExWS0HwDAGGuS3SMssYJV1FSAadREKZsmGJc3m9qBUxir2X/Km4rtZWK4JPHPSaZ6cT3r5/xqRUnLnI81dHnK4cxZXLPDSFO7dXNL2AJ6Xz3D9upVIlBcnlWdLQ9pGvvH7EpNbMm0j1xMPZ0dVgEGMNXcpnwngqLboqIUTU2T5q8xKJRHStpC8XI3w1E5cfJZ1QDD2GQEjyE1VOEG4Jo7QoemKzQBcVJIPXFsIqW3cV6929KirwPdE7KajlmNS3wu8vLaaqaYoJpycrzOkbvPfxTX7t33o/H3vvE+zubnJyeMDhwSFWG4qyRpWy1owxooKnaRboogRdEIMj+o5ka5QuCSGgtaYoSpKKHB2ecvfMUW2UpLNTVFFkD4LMP/Gewbgi+Q60kHIoCrT3+G5FtXOJk+P7XEkBHwNff/OEDz67yd7pAa2LXN1QPLJTc+dkhTWaIhOLupDoMsO90MIN0ArGVta9O2ODDz0jqxgXmkUfaRyCq6B+4DzIITpvtIf71mbmqtiqyaGXjIG0vmAj+fl9oB0Xm+64vnQVwlLsfcAHj/eBlIq8H1OAwWgJKiWJlFkhLUTMF3iW5OTXOy8CKV/aA4ZhY84EGCrZ0P4PaF1S0ti7kB1MIyw6sdVWUVox4YWYnIAiseKzsqK0JrcjP9gCpCRxUwa1vjG0Ecxh6CqkDEZ0FNVVQDqPQkMHOVdPE6MmIokySQnZpOs9PkTK7Jv+ricu8Nc/8Rxf+NJrjKz88KwWRthIR97zzl229JJ9A8sQuLhtmY4KOg+nq55xrVisIqWFC1sjvvTaKQfzns2xpjMlm5cfxTcL7GQqeveyEoILYpKhtUK1C9i4iEJYfLgO3beE2QVRzXmHMqWIZXCkaiyjUfBCyTZWxDvtXNh6psibmoKYtCD8owKMJRYVSZfgGnk4TSHEIW3EDFQpzO41egyHd+8wdaf8wtNb/Om/9LO8910PU1rLskscHC0xxYSJhdC3RG1Q0eOdHHRrC6p6RO+DGHx0K3S9gXc9oW+wZU0MHtc1jKYT7p7c4bSNFKOGpAY2mkL7Pl8OsslIaHR0xEH+3JzKxeA7GM1g+woH87fZnI34/u0FH3nnRS5vFRwvPXvzjndeHfH9vRWVTbR9PlRajGu1glW2ztpfBi5PC+Zt4u2DlrPWs71tKQvFtNKcdjG3y3lizrN7iudhHoLOnzP5jBEfC6XywY/C/Y/5VlVB5vYiM2xjzmYfLOtkCyfU+9X8jH7VCp7hRR2QTZ5ysUk4n0HDJOnGsrYd0PYB9TsvLCoXrKHptkPFHc6ntB+sGQRaKZouEBWUpeXeIvL85U26xZy2d1grYp2uDVzaHpNioO166sIQfZfn+vOZQ9qeAXEWQMXaRKklFjmmRJGJFoVRJGUyZTFmVaDGGlh2gdLKawvDUtKLtNI52QhOV46Hdyf8h3/6Ob7xjTcJKVFYTesCnYfCRDZmNd/55ht8qljx9CNTUuw5OnP0XnHvaMnOrGKjNtw5lJb10o7hC987YDwyNG2gvPKwtNt9g6kKTC1CHx26vIYL2L7FqEDSY5KuSas5zHYI2sDyDDuaguvksPsc4uEkqjtOtyBFdIxZcip9bFQaRjNCENvvWG0IYUdLvqGml09ca1LXo0hYY2E0oo0Fy7v3uVos+dM/8gS/9LEf45knLuNcz9npnOQD5WgMoSdFTR9EFYjWIlvWBfVY2GhHx2dMJyMhvtgK73t838rBTZHoOrx31GOJBGuCpopelIQxoHQGbdDo0YwYAjoGgqlQ3mP9kqggGFExRtdS7l7m+Pg2Oypy2kdevXnGpZ0pJ4tTFm1gVFo2K0M5Lnnvwzu85/EpRbegsCXb44Lf/9Yev//qCffmgbtng/5UPP0qq5iWBlTiuE00TlyDUFpcqWIi6AEElNZfSGcqbx9YZ/m5KGpDrTWrPi/ntHBlQoqMrMFoTdNGgobg5BbXWpyMeucYjwpijJLLEWOW1+u1cU+f/HqUWLQhq2WHsVutD7w6bwLW5zAlECf+dVueBgAzzzhZs5wSQRegCy5ulCzPFuyfCpV1u05UVmMLiw+B+bLHGlnXBRVYOw1zXpRihKTl6yVlcvySBIQYrdFJct9d1LgoM9moMvRBWnqjFdYK6FgZ8UN3Ib9eSlTWcNoHnnt4k//lr72T7718HU1gWsF+l2izu+q8T4wKxcky8X/73bd44aEJP/rOKzx6qYbQsT0tKQvD/pnHWMukNty4t+TWScPmxLDXwvjCVVgcYXwLYUK0tTwcxkC3QtVTYjVBhya3tRFdlsSugbKG6HEhYEwhSLHSqHZBLMdQS0SXslZUeq6TP5MqUQSWNaZp5XCqfFOFAHl8StpIuzircSGxXDWEgwOeu2D51Z97Bz/zsR9iZ6NiuVxyfNqK8qw5QesCYklZjuibJaas0KXw9kOMjOqC45MTfuP3vkShFH/+T3yUxdkCWxSYpDH1mK5tSMGBNlT1iNS1fP/6gYiBfCc3UL+Q9ZbSIkzqGmmN2yXJPjC6VBPIZhiEiC0s3XiLZXNAZUu+d3POL1y+IgE2WhGi5xPvucJzT18kAAf7c5rWsdd1HJ/A0xcsn3tDs/SJwgxxW2Jos+wTuxPFRCmubVjeOgz4BJXOGnsNNq/85KwM/PqMFeTxYpjFhSaf1uDc+UpOZRLbcPhYH+QQxfdyUleEqNcuvmRwTyEBvP1AJc47vkFEF8+Rygeg93MwMOVxAa1lBBhYQblbyGk78gdljtbQt+gktMWmdWyNJavMp0iz7CmN47gRQGVSWYIuKErJRl9nkufb32SgY5AAJ7TQckFIM0ZciJY+UBqhY7qY7ZOj7IHrQuYtoxK2NPguiAgx0x0jiouzkolf0HRiMXa8EHrx5shwcCZCC0keEoeg795b8Y2bb/DExREvPjrlvU9u4qLnYO6Y1JatSckfv7kHClwfYLKDLUvS6V4WcCByVy25CKoaow/egtlF4fabgbPvMcmBb6EaEbUloDAxEpSGckQyFnyP0oXw430vUl97nmKU2jOpqK6TtB9jSX2/XunZ6RbOB44PD9CLI97/8IhP/NwTfPyD72Q6GdO0kcOjOUU9Rsde7MGiZ7T7KCkGXBBfAKUNPnqMglJHvvHdt/gXf/AlxuOaf+tXP4KLRgRKAZQZEV0DBLSpMXVNaOYslw1v3V9RVDPAiUtRb4SiHDp5gPuFFLah8Z7uQNmImYipxJTEt+A9ZnOX43sHPLZruHfaEEJke1qwfyw4SlI9333lBosm0ARFWUjQ6s7EcnXDsju1LI77c6FM/t9JE7g0s1yeFYzLSKHhraMe5yOjQmcrcUWhxVpMhD0y5moMMWph2inWvgh9SOsbNw3sWiUkpN77c/xtIMjlX23viHrY2Ajj1ge5KIdt3TrqC6hLCc1J+fDDgC8Mr3heBIa/tToTcgbZ75o7DLLH1VZIPl1PrcQIwiAtu8+VZnNaMaktyvYs20DjAnuHc3bGkrWWcvxxTNLeCKI5fL1EVcozkYDSQl1aGheH74CVkw+tzgw/si0yKdG4hCJrrLWi9zJabI4Mn31lH987/tLHr/GFVw5YtDCrxTz0D79/xoWp5V1Xx3ReVjQbteY4RV653/L1Ow1VWfPioxWF1Sw6z26Eb988Y1pplm3EXrpAdL1gGGWJSgGVPLp36NCio0ORSL4hWYvqWxkXlofoopJ2OstFxYBDZ2mtzp9Otknzjtg3IgIKgaAhVRPoHdiCZDSpW5LqGbYS+a9bNRxfv86mP+GXntvmEx//AO965qrcdMFyeLyisAV1XeNdkzkclmp2iRB6bDnGBy+odrOiLBQuGX7rk1/mlTfuMJuO+fWfew9VofDtSh5iZQXjUYZ6MiG4QLs8oa5rDs4abp32lDMDyxPUaEaypWAbrcdUtWAj3sn37nvoW2JWJqoUAMkZiN2KYjRhpWpiCDgfuHXcsznb4Pr9PTbHUpB0WTAeW7Ys3DjyVFoxbz1b44Irs5K3j/u1X4BW4nx11if2F56N2rA1LrBGMyo1bx15Vn2gKvLzq6X1D8LzXef6Da8luJ48l9ZqusHBSqks2smQXiJrXdIauHY+0hkY1xWjUtO5SFXIylKviUXSrS971qlW4kWYhlv8nHzHORbAuocYtAi5GKRhZnhgTpD/j/S9x5Q11cYm7WrF1sZYXG9HRbY0UiybnrGF6YZl1YvZQlFYweTVOQBxjqKey0A7n22/tYg4lBNb5YCAKipXuy5kpUOSFWBSeq23HgwWCqMIaHwIXNsZcWN/xd/71G3+7AcvcO+g4dZRz+9854Q+Km6eevrQ8I4LJdMyZw9o2BkryrLgfe+8wltv3ctosuHGvTkHi8DWGHplGG3uSFouUYAgW0menluhYwejDZHiFmMSoqZTwQsoF2MGWHMFX51Jy56SRHxlNl9KMfP6e0QeGCEqknGi1utbsKWkHFVjlmdz3M0bPFo1/PmPPMQv/MRPcXVnhHc9q8ZjS7EZH0+nKGwG80q0tkTX4F2LtRXOeRJiTTXb3ODlV77PJz/zMm3r2NoY8+u/8mOMrafrHcQ+E1I0RE+MAeM90bck36F94u0be8y7RL2JFMHFIRQjIUeZgpCCMCOTEiwDLSOUHZHKGtWconVJMBX4HP9db3K62qMuLTfunfEjL1xmXEtCFUrjghx65+HiWNMG6IIixMCVDYt54CkXN1/pPfaXkY3a0bjEU1enbI09hel466hn0UnHKK7UiqIw6/ZfOoEgVPYccqMGYD0NZ0w0LgOBZxiRk0qySVLCCxBsoKd3/nzVnhSq0LICjxrvEyF4xpXBRxkLzNDFr5H+fK4f6CwSCZXkvFkgE3mEARhDyEYg+YPJoJPWiXv3jhhXBSGKKs+7kKuioI8uiGfbqBAl3t5xg7WaPle7IXU45dCPocys2VMxMSul3R+cYnovMd4ogw9gtMh2UcOKhwcqnVAuQxBbpEUXePHKhNf35vz9zyee2B3xz79+xMoLmpqAO3PH0cpzdcMyLhSz2kLwPP3EFrOLU1bf9di64KHtkm++eYrS2beg3kKVFXF5jKpH8sO14tya2lMJ0qhnAtZ5J6i8LcRdRxvBQpSWcSE6oXnGAAOLz3UQZb+uongn5qdAmH26kH8/3cGbgrP9Q4r7L/PiZc3P/8xlPv6BZ7j60DVWvWE+P0MBRVUJQKcN2vWEIHwCY0u87wTFrqa4vsNUBbPZBov5Cf/0dz7Nd165waULm5ASP/fxl5jWhuV8gbGl2I+5Pl8XCWIg9AsxJdEFhsDbdw/otWGcgow3qSSFHj0/AKUJk21SCihtSTEXiZTEGs4UEkLSdwRVoIz4DprZJqf37/PoRHPjYMX7fEJnj6uRFZfrs0Yuj82xYZpk1TytYXdWMikUbYiMC/lvY1QUNrHsI4erSGEii1XHOx/eoCrEfOZ791pcjBTZwANA5+fQJr2+4bRCANm8+kNBoSRJWAg74gtgNaBkng+CAmGUUNe7riXk7lQj7sfRebCK1gdiVExrgzKGpnUYndY0+gd3/gNOoB6sAkqYiue5AAw0xvNbOuU2QWuJRJ5NCpZtz1Y1IYZAH5IEeGSqo9Kato/4ELgw0tIehogtBp8Bmf+tPmcH+hAxRoI8jJHwEXFHGeLBLC6DH2UGTLKKl2XTc7bsSSTqQijFpIEhqFm0gbPW8fCG5RtvnfHVN8/Ymhh2psXaqCRG+b7nrWd/nri0NSL5yLOPbHK8L5rwWRVx3vP2QceoyGYlF3ZIyzOBN8oRJId2DSoVpNlFYj0To4eiwhiJHovOYZXJw54HW4ngpllAPRHevu+hXUgxqMay+lMaipqkLTEEzGgMKbGMhuWde1yoAj/3xCaf+MiLfPB9zxFdw6pN7B+uMEWBtQXGlgTfgTbYrCcnP6AhONHgR+GXQ2JWG67fvMU//e1PcXSy4tqVHZq246c//m4eurLNyemcUT3C2EJoEoh7Ud+1kDy+bfBdS9AlTpW8fn1P+CNdS3IdscwMwtUJTDbFNbhdSpOaEK2EFRMWnJNi1y9RxUS6qUZAxyYVhBAIydL0gY1RyeFpS+cjV2ZCnNkoNcRIXUg7f+/MUWnF9qTg1mknvvq5+y0UYBV3zwKlNdjjnq1Jy7ue2OLm4X0uzwzXjwPW/OC50XneN1YzuAIZrXH5wvMhMDFy7/U+krSm0NIZlFaCWWKQS9FasU6bjMeMa8l5DAl0SpQWUvCUWuF1viyDAN+k8wzBNRPwf+T0q3z20hAMcn6LpnUVV7lqJcg64wJbjXJIgfx7a3UOEBFUs9RCxrEWaV2iyeGe5ytJASyHCTeDL0i1dFF+CC4kUBFtLaU1VCax6j0+6CzFVLR95Hjh+A/+/AeY7+3z//jtV5hNa0alxSXN3sIxs7BVJ65eushLTylOz5YsGsfpyuMz/6EPIhiZVrC/FGvx005xYXfGnftzfP5w+mg5mHfUlWLRgZ1ukHpBrVUMoqsfupp6JofVWNmk+I5UjAT9b+fYKBJYXCPc/bLORB8D7Zy4OIWykjnOCrFHkdC2IKDo+p7V8SkPTyN/9Scf5Wc/+kNcvTChdz3zZU9RTtC1ErGN74Sc4yuUFgCxX81JCcrRTH5+2koAJWKJVldj/vDz3+LTn/k60+mYa1d3OTk546c+/hJPPXaZxXxJXZdgDN730o5jUDFQViNW8xPJsZ9skXyg8ZrrewuK0WVSWIkteFGSMKRiLN2PdxkrjiIHDghFOUZ06IQhOdoU3YQqUNFjNDR2hA8LiiJxa2/JpM5AWIJVn9isNYs+sOoUdQGHSweI8GZsWa/uYpLDH7WSIkDixnGPViXfv7PkoWtXePqRXQ6+e5sLE8vdeWBaSxJVQtR/JqdWx3xhpWwuk1IUgxAj/poxCIW4yM++i4mAjBUgrfykspwen7FYzBnV4voUfcKW4ux02kZGpRwsraB1HjBZWr9G8daFLZeB9dAjZzI7Ag1VlweAuqEwaDXMK+Iea5PYEXc+oVSkstId1IXBZZuwtvc8vr2BUdC5c6rlQEAAGJwArR681DNZIgOSxoi/WQyOohDgsY+RoioJvWfeBP6jP/NDzNo9SrXib/z0k/w3f3SDReOwKfKLL13jY+++CtWE+/tzXn/1bU4WfSYtabo2UFktLkOQDUVFlTgeWa5d2ORLr99hWheMa8veSYMLijpFoimFntrO0XUpLbwPUNak6NCrU2I1lQLXt6TRVCLN2zm4jkgSPz2lCeUElMaUJbFbSYjHdEf08SgpMrNNojIc371L3Z/y3odrfurHn+ZDL1zl0uVdFm3geN5JNmAKuOYMdHkOnBWVOCnFgLUFqZzg2yXBdURtCF2D1gXT2Zij04Z/+M/+NXfvHXH50i5lVXBytuTjH3yO5x69yOmyA3nUAJ1XuVoujRhQpqYcb+BLoQVXI8PtW3e5c+axW5D6gJpsgeskgdpWa9MSygqVIOaI86gVqAJooZcwEsqxgKkxCoegLFm5xIUKjpYN13Zn7J0KBdwlOF14JqViVCpWfWBrZHA+sne0oum9dIFINp9Q07OSz4hV/I3jnnFRcfPOPhtjze6koOwSBwsv6tc8Og8kHh8f2KBFmfd1UkSt8RnLGjwFXBLQLgxMQcVaJeh8oh5X+TdjdsSGVQ+VkbGgD5EYEnWh8mgBRS5+w4kX7E8NW8GhJKzXl3aN+ueqN6zmBtBCiA4QY5C8wCB5ZAP1MASxNEZFeiex2z4kTpY92yNhAnaZxfRAE7JWHxbG5Hc5xIErbGXyFxfyy2njUSlRFTI7ny4dP/niRZ7cCHzxW6ckrZhV8Cfee5H9Jfz8hx/nyUc2+PL39vj6F79FaluqWrMz1ax6wSqm9QhFYtUndOvofKYk+8il3Qm1FjMTa8Rl5uC0IyIFLlYTAX18g4pGWnSlSO2cNNkmmpKYogCVteThxW4pIZ3FmNCtUMETpxdJ2qKjWKwr36G9F3fc4FDliFBMmB8es9kd8YnnL/KnPvYSzz19icIalkvH2Uo+J50SOka864VebSH6IByDcoQua1SMhCCgkqmEtJVQ1OMZo1HJV7/9Gp/81NdAaXZ3NtBGcbB/zIfe/zTPPvUQC5dp3coIzVdlA1Fl6NsVprAU+SGXQrSi3hjz2hu3mHcwiS3JFpI2ZEp0bGT/LysIkneChmeJslIatIwWFCNZi5pKOBJe9A+2GrE6k+dk1Tou7Mx45c4SayJdL4epd5rTpuN45XnllmNv7lkFEQVJ05GyL4FaA+LWGOpSseo8N048144XfOiFx3nj9px57xgVmnkfKYtEYVk/zyLnOsejIBGSePv3QdB50Q4M7ttZNZsJPMM6XisxyPXeZ0OR7CakE32QgjVQikNI1KWh6wN9EBp8Suqcdj98ZwrUuhgIkG6H9l8O/yBgSOcNQ5J2yZqEb1tZM2TUrbBCyDFRVoYiU4RxJbrzlcsA4rrC5Gii4RvVYpNcWgMKcYhZI3qKsrR4F+m8rKPoRYY8HVn++OX7vO/RKTubI+4c9xydLnn8kQv8Tz78HK9+/xb/7T/5Kq5pmYwsyVZiFWXA6sTB3HGychwuA40XW6kQISnF0bLl6WsTTvaPmJQSdtK5wP7cYYzwbMx0LASVTGJBS8hHKgrx9StqmdmNRZOIPoikNXhUXEmqa70hwql+Jdz9HPqoConpchQs9o94fBr49Zcu8vMf+ihPPn6JGJIkM3VzinqE0QZtRgJ+uh5rNK45w7ULdDnCWHEXTkmBsaKKCz3ajnApMBtVLDvHP/uNP+bV129x8eI2ikh0PScnLT/8zkd49wuPsWp6yQjEEqPYjRldiZ23qSiLnhACMUZSyM45hYXoeevuCV5bdFL4QfXYzDPfJEoHlQqhKiudgWgt6kXXiUR5vAHNXABEJ5qBhEKVNX3QmfkZiD6wUWk6l9ioFTcPGj7z+oKQV6oxgWdYe8tNTMabYkzYQq+vTq0lpLaPiYMzx6L1XNyZcO/smLpQnHay6nM+c1pymI4x5yu4Aa9KCTGfFatWWi9nosoGuA/+0koBgd4FIcp56QCqQgDuVV6RF0a654hoHXyUTcEwAgwXrlr/73zTIcrfoQNQsn5I8bwVGSi1kHXUTSS2K4y1HK9kvTKpBaUnV02dKZCrLjKdKqrC4DOBhyTrQJtLrFLC6w8x4WLCKgn7VEo+tKowxJSISonIJqsFvQ/EEJmvev6z33qNv/lzj6NSy49+8Am2r13mH/3TL+FXZ2zWI1RdMS4tzsPto5Y3Djvun0oEuIvydYZbYPhAXUi88OwVeh85XXmqykIM7J/Kzeo9UNUiqLE1yRSi5LKV7PpjRGfzDeUame91lvMWpaz0RjMCmtiKx79yPaauUNuXWZye0d7d59kdzS//zDv4yfc/waNPPMz8dM7xyYqirLNpSCD0HTEGqtFUPBo0pBSwkx3MGvjLBzcmXLvIn6/GWs32bMY3vvkaf/DZb6OU5uplMQYtypqToznvfddjfOTDL9H0oBAbb621RIPFwOn+fXauPY5r5sScSGOUEQOZrpHIcTPi1VtzirKUVKMQBBMJHmUy7yEIyGeUmKBg5UIhjwJoTXJONia5ZY1aiciqKOkxmf9usFVFNapwbpU59QVNhI1KnHqcl2tIyG/nopzhkKqUMoX7fIcffMT5SEyeS1sjNMdyhJJclirrWaRoyGzfR3mejRKmqpSrLNaBnGeY8uUzhN74c0vx3GFtTmtSmmdvSxkxjNZSzKLgYdpogg8Yo9YR5OuDPMwB6rwTGDYTSoEd2pQHCUMPLAKISWYLHxOxqDFEjCpymolU1RATo9JkUxC5Ubs+MKnJ1MYfrHBDempC3rDPAErnxS9dKQFCBC2P2etc7I8TUpy2pzWH845/8Mk3+Vu/9iKbF3b5x//ky5QERqMJk0oxrkpeudPwudeO2V86sU4uFVsTw6IVBuHmrGY6LhkXhulkyuXtkg+8cIkvfvkNIOF8pEmw7ByFVqxI2PEGqZuDKiQOG+m5dY7glg2mJk22BcEOK5HG2kJsrpSVNZ/rKcdTXFFxuooU+zd46eERf+oX381HP/gMu9vb7N16m7s3b1NPNqknW6QUKYqaohQsQSuDKWvoWymShkyCGRF9lo0CyhqwluB6ZrMZjQ/849/817z86m12drcYj0pCDJRFyfHJgueevsaHP/BDHB2eUBbZvdj1pC4QOtH3m6KkWxwJeGUKMeNcHuPaFcaWpOA4OGy4fdxRTy4S21OhMytI9SxHlylQAeU7sRnvV5iURBiWY8aTNkRbSr5hJ6tLpQtS7NEWvDJ5LO24f7zg8vaIk+M5hS25tFExshICc+QkDWgQzOh/45k3BnySm9IMOYJBxlpblJyedYSo8/pODHC6PlCXmQCVknBCUnbmMXLwrRnW6krs9xR5Zs8ddv46w/4uxIQKMto1bSf7+ryxcvnCNUa65yKPxeTtQj9wAfJIv0byOf9G1/blgM0b9/Ue/cEPBHUubFAxslwswFh2JqVkAfSBQivKQiqmC+ISPB1ZxqMKUsjKpyzzHTDIPNMo9FoWDKCtxkXpJEwClSJVKRTOZeuoCtla+iTkH9/2/MjH30W1fZH/4R9/ju3NEQHFoxcqFh38/z5/nzcOGrZHike2LXVhsRpuHnc89+QV/qO/8EOEtqUPgtSXpcUter7ztddpGo82msJAWVhaF7AF4pWnNAoxecT3xLLCai2AVnSoEIi2EpJO/kx1cmgfiUrafWUMvSk5u7fHbhH4pWcv8ok/+xHe89JTWK1YNh23b1zH2JJRVYo3fLfC2AKPFz5E9CIn9g5tMmXU90TfY3wv9l/eg9K4vsMWJbOtbd546ya//ftfoms9jz56ha7rRFloLKcnc55/xxV+9P3PsFrMxUlYlaDE66Hve7QtSSkyHU8JMQNoWt6Hdz3kzs0ay/VX3uKoU5SjIOBebvN1ZjsmbVCqyhsrORDCkAvQnMl4pbSMT8pKYQ1enKOM5EZgSjq3oiotRycNj1yc4ENi2QcMmrHNIKU673aFAZjWxp4Pbsuslpu995lWHqFxad3tqiSGNsO47PMsXxs5+Im8EVCSVK21WnNrOB9ehBMT5ZIdOnFZz8kF4p1DqXzQo3TkNnepfUiyFk/gYsQYGVdMxhfWG6lz4I0H6UDDWbcpip5ercGAJA9SGt6IiHdMUTCejOn6SD2KWANdH9FWi60bYukVvVgWhxgIISul1iVpACPkf+cJqvKNpHgOphhtCDGx6iJ9H6iKgnuHZ0xGBXVZcnja8PGXrvKzH36M3/zNz/HQpTGkwO5UJKL/8MsHJBJP7RqmtRWPgpRYOdhbJf7Ec7ssD4749JduMB0XTAqYjcSCqfOaLmTj0yz17EOiLJVQobPHvTaGZCu0yWYetiQFTaJFx0jKkk0depJLqMkGerZDu1zR3bvHo1PFz/zY4/z8x57jkWs7uLZntWpJCI+8rEf4dimiIKUoygqUER9+hHeRlBFveKXwfUvyDltWsgkwBdH3xCSkKVtV/MFnvsnXv/kadWm5cmULlIhrysJyeDznHY9c4GMffI7V2RxTjqCuZUzRoJSRjiMHqDgfCb7P5BMvyU1J5ssYE6Ox5cZJpFElVUoC5KVc/V2XH65M/V0/f1G+x04yA2PoBTgbVQRlxFMhxdxK58balvRhySQv58cjvYacR6WlMDLqmbyJ0lmIhjrfclklKb1DMZBY70SMSmJJkjwLJ3O/Juzk4ypte97xR0SvYrXOCjy1XhMOFgLiAAw6QjKSdyFZhechHhoYj0pGpRVsTmvBkpRiVhucD9SldD69F9lyCGtTcjK08YO/HqgHMhU8YAk27A7EJeZcYBCTMJB65yQptZK1nyExrgxtH+h9YlTZbLwowp62j8w2ahRiY6zWX/S80oUQSVrME2MCFUM29RAkuLSW20cNf+Hjj/FTL17kX3z5Dp/69j3una54eGr5K7/0Tj71qW9wZXeED/DwzoivvHXGf/flQy6OFVc3SsaVYVQajIKzNrC/FGuozdKwXLbo0nBpuySGQBcVo0rhlKYwgRgSk0K+d5+yws4UwgDsCphsoMpaRqNCYq9VMUJpaX+1sUTfo2yJHm2IqeT113jxas0v/Zl385H3PcHOxojj4xNOTpao5In9MdF76tkmyliK0RRtxLPP9y2klqKe0vctKkujY6YH26IkWouoI5R0CUXBxqjg7v4p//J3P8npfMFjj1ym73uC99iyoK5KTk4bnnj4Ej/18XezWi5J2uJdjy4rCAFtNN5HirKS4u4cKUZMtvOOKhGV8AlSSLSrU4rC8L2391HViORa2fGj18zGlB2Ipc0XrEVuLkHQkpZCkFKUaPTUgRIHYR0dEGVVqOXAxyTPXfCJiMYljTVR0q3DA6Y3uTMeOPuD8YwazD80shpWmqSyew8D0a3Ps3zK68MMbidJtyoLJXHuSa3neLH+ErZhilK8fBI2aswbh5giPiddpQTGWpwLdC4yrguMTpA75pi3Zc7n7iIXnaqq17RjaabSeRUYfi9/v4OIyA5qoXVuWK5SwwuTyUGaRO9CVqMZRqXGuYgqReu8bD1VKX6Bq94x3ZxhtMztOgxegUo82NK5AUKhZR4SKzFJ/imsfKNN53n0yiY/+77LvPnGfd512fL+J5/ljSPPi09v8/prtwltx8panrhU88XXF/yTrx1yZarZHhs2xgUXp4U4+SgxgdgaaQ4WUFUlXb/ixYdHLLqIMZrDM899H9idlcwqxdlKUNjOh/XnoIyRDUYWQukUSN0KVQqnnW4hYKBSpE5A0zaAvn+Ln3hmg1/+5Xfx7nc/i/Itq95xcNAgDMmA6xpIkXI8xq3mmHqCHW8wyMu0toDBh0BZTaWI+l7aRe/EQDRzy9HyfurC8oWvfYdPf/47zGZTrlzcllsriI68sJazRcP2xoif+fi76TonVGXX4fuGUmv5Gg7Qlm7lsKMZMa7k1mo7WT2OZuKsW5a4FLHGsZw3vLW3ojAFOIdSRsA7JYlDigB9DiQtKvEICD2q73KxUMRyIsanOZ4MFeTUxCBAYQJlCryXW1sbMabx3tN5Te8C1lh8FNHW4OTzIE5udOaC5BOiMhju07nE1oWEKTS7G0X29s91ilxY8lnrcpSXyVThgZ8/dAw6E15C3hDEJIdXANTz95MING2P1hL8aazKpqRAlBAQk9OPjRbOw/BVlBKu/4Pz/9CvqDSI8VQeAXIlUJyPAAnwMTAQBjLsgIqKtvdYoxEjabGRrqyikVxJVl3EWkvfe1ojJp4xI5NCLVZ5PZK3A+TMNJU/8PwBoDTHJw2/9PGncG3D/slKorROVzz71EO43vPd1+7z2LUphda8fr/hn31tn6sziTLfqC2bI0tZGIKL+KgpbeLCxPL6fk+RHCol7h5LRZ/Uhivbhnuniftzh8v25OO64P7xiuzYjCLPRCQJzqREW0PqGigrOYTNHMoRUSm61jNxS/6Tf/eneeeTF/DNisXpKTFEJrNNPB3B9WAs9eZlEecYg61nhHYJKILvslecJniXb0wtD7samJoSHooqiGhmmxscHZ/yz3/vK9y4tceVy7tUpSQbp4w3WWM5Ol4wm1h+4cd/iL7r8a7H2AKtDdVkk75ZSXeTHyD5dxCNJfSNjAW2XBO9NAIaV+MJt27uce+4RdlsCx8DsZpK8k/oRfde1ORTnEdCI3Ro35EmWyRTEnUhyroClG+JSsnvWZ01EjE/owofFJPZiLo09CFRWCOqvShK015lP8oMQIcEfRTzzpCSbBNyC23UoF2ButQcHbecLB0oLevMYSOR8kWZsntVTAQvHg1F9vQnKSJC+jEqj8tpwNoURosEXuUDTEwUVUltFVYJUhfylsJqOSNtdgVOSn70nYt5e7du6Hmgzq3Ps8o/y5TIHcD6P/xB1dDwZ4ccgKgU0fWE0rBykgEQUZTWUBZicJBgTWBwUZh2Sad8y+WZiWHvGnE5S13pKFHZetihRrZmJZ//+g123CaP7RactYlb91tmmxv88ae+zXhS0XQRrOLvf/Y+F2eKixsF46pgd1KwPTUsukhSmlGRKFSid5GJhRgdF7Yt9w8Vu7MCFxJ1mbiyVXGy8izayLITV9beCaEkRkmtAQEoSQ8YnmhF8p6gNXq0TYoOU485u3GTP/NTj/P8Y5vcvn2XzY0tbFGilCe5hr5tUcWIwlSYosIaS0gBQkSXI3wvxUFrLZr7vqMoSkhJ9u6uR9sCZWSMUcYwKS3f/N51PvXHXyO4nkcevkoMDu89KUonVJYly2VDpT0//ZGXAGEealPQr5ZrS2tthIYcgzBAdTWma1vAoG0NSgxjXdcKYJe964k9N/fmnC0aJrtjmV+z6ScxSJBJUWSGX0ksa5E92zqLqrJkTsXco4spCqaEmGfwfMiwltBmgMwHXLKySjbCtJuUWtJ9Q8QlhEijYFQ84FS1Ll+c/54asC3ht5wuHHdOuvMuQisGu+8hAixF8deIKnMMEO8+Y826641RNlsp5lh30povEFNWunrPxcs7FDf3hahkzy/okKSgSBZHovHyro3KF/fwxv9Hfq39A/JIcC4HXtf484M/PNyFUYQQOD08pC4041LMOWOAcSk77iGXzGcgwoeYZa3yijG3PEaff8ByK0RMoQkpAyVanFoLrSlKzZt3zvg/v3HAYxfGvHjF8vEPPs39+8eY6DlrFde2Cn7ji/cxJnFpVmJtwdduNaTU8NMvbHFxoll28t4WbaKuDBsltEFx97AjxMCqS2htOFlErBFd9ryN1EZozDmLQrq+pESYEr2IVnwPuhJwSkWwNVEZtGuknVWJyxe3hDEXetHY24KkC5bLE3T06KIWhl7fyJ47RWw1gVRKpQ6eGCUqjKLGR4dvltiqJgJ926JtYDqd0HSe3/y9z/Gtl19jazalLjSrxRllIexE50T4s1i2WDy/+rPvpxpPcTlPO3iHa1fUsw1STNhqgsvGI8pWBOfyrJxoVyuKSgqP1gV9cwbKsOoj01pz/fYh3nt0d0YMkVRNUFFyHogBFVrW9PAo/ngKUNVM/AxNIYdKAUHGsaQixE5GsDQUAXlirdZUZSGtchJRWdsHnr864qfe/wSL5YKTRctRo7h5tOL63hIfE7Udbsx0fvzzOk4bTWUTvZfU6ke2LfdP5X1rdd4xC2whHe6w70dD8LktD9lfMH92wzisk6D8MYp/YMojQVkolvMVbevWnBnJxhiew7Se8QfjU2sUo6rgZNWeI/75oKkHtgOD1keRC8AaHRwyhNI5xjkYhc6mNZeuXlj7kg1A3gCsaAMhaIxJjCqYTCpR+QUwVq8rUAZMpWjkFsh5AZMSQ7qQeAEQEhuTitIqXttb0naWP/uJGV/40mssg4Q63Dx0vL7f8NSFgnFV8eWbK5wX8OV3vn3Mx5/e5KmLlpNVYFobzlY9vYML04rSO0qjabxm2Xlqo1EqcLQUqnNQmtbJ+wsp4YMA1MQkev0URegRckJPCgL4KUHl0/KMyc4F/smnr/PkxRHPPvsIIQg1tGtWEvJQljJmdUuIVV4hyU3a9ytsUVEUBbGXFZpOkRSC3ArBgBlRWsVoXPDW9bv8qz/8EvNlx+72Jrawa+WlMorQBYwxtJ0Qb37xZ38YFT1N02CLkhDkcGoja0O5/RLalvhuRXAuZ/gFYnSUVYV3nbT2UWzGYzZBtWXF2/sLTFXKTaGtAIGmBCNuwCpKR4KthB4sWfQSUmoRcE9lWrhGXgdNsrXkJGY1Y3KDq05ka1awu7O53iJ1SZipi6M9TGG5ulXy5EXDjz+3wfU7x/zey8fcW0ZqfQ7WyaZASDyd9yxbzx6R1+54Ipr9hSehxZg2X2guy+gVWta8+aY3Q8eYre7EpDXzBmJarye1gpBByRByPmaImayWqFCEJPZgKQYUiaK0+KzJ0UqxMS5/wA5saPXX7cAwcuTitO4AQOWKEh8wDxzAQfkD3nlC18uWYHjDWtH6bCmWPdZJ8s0aralMWHv8qwcL0rq7yAUhVzebd8MxJpKSXSpJ2Ge1VXzw+SvcuXdM37UYpXh4Z8I/+Pw9ZhVc2Kj53l6P80Fau9xOffr1U4ye8dBWwRt3Fow2t/nlj17hs19+mx96ZAMfNNNaM6lE2aWBcWUwztM6R+fFC+/8zQ/MR2mJo66kfXQtTDazMEhWXMlWVFXNmx7+5t/9LD/85AY/+u7Hef+Lj3N5d4oPnpVTqGQZV0WGpA3GFEKOsjVKafreYYoxqV8KXqAkFbltOyazAm0L/vBff4Uvf+1VtrY32N6e0XfCthNk2uK8X49nynf86i/8CHVhWZycUc1KUfSFRFKReusivu9oF3NMAaoag6lkF2/Ew5/kCTEQAee8JNvamtA2WG04PT7j9dtn1HVF6hfiPplXv8RsgW0KVJJ5X5U5H9D3mR3Yk+qpdIWukwRjpUR3EXoxWulaWYWmyKjUgm4rRbAF3nkqW9B54es3Ldi+4/SgoQuRzdry6I5lZ2y5Pe9y2ObADJR73YXIZl3y7EM7+BDpqgpcz9VLnug90y5w96QRUxqdCTwKdEbqdX5eQhK6rkFWiUol+qwaHBD58MDQbozIg5umJSWLQtH2QYJ4lLAAVcbSULIy9t6vL7615wbnYJ+cufMRYNj22QetwIYXJD2wBcgVIcZA3/dkLgS9k3ISkHk9BZm3rBH31KLQWZaZcnuk5LXy/DHMWEYrCqMprcr4ANjCYhCddEwiV7VG866nL3J4eIKxlgul4sbegluHLU9fKjntEvfPOiaFfAPGaCptsEnxjTsNJ/Oep566yvuf2uEr33ybL752xGdfOWJUysGvC401lkUX+JMfeYTNStOfSDEZVSaDQkgbrhRKF/JB9nOwpfwgY5S2zhREK7FesVsxNgX+0iN85uYhn3ntW1z77a/xIy9c5Sc/9CwvPPsI2gqrsuscRVFiTEnfnGLLCt/HNaOsXWYgtCiJ2rI10dzbP+YPP/NNDk8bLlzYQg+Fs66yJbmhbRrKqiQlcH3PL//0+5iMa1bLhtFsi6QtAskKAAgy8lWTDbzrzrED7/FdJ2tJWwndF42txwJSao3GQui4fuc+h02kmlmiy/OrreUBC10eKayIfmyF8i3JVPm2kZUhKclUrpJ0CClfHLYUUYbwz4nOUY1kOxP6QDdfrBmmWsPxQrCCqxuW0kpwqI+yPw9RLqHeR6zVkMQoVAGFUjxzseKZh8ZUo4JIyXKxYNX0vHn3jLLWNLXm7lyCT1OMhIFlp1jjRkrn58cY4QhkrE1rZHQkB5H4zMjNGQHeO3rnKK04D3U5YNUF+VyKIYcgn6/WBWJ2FRo4Bw+O9DD4cjywBkwMB1R+wxjRYIOs7qzShBgwuhDX11wlTWFAi0bZPbC/lKTSgFE6c5NVrm6ZBPRAR6LIBAxzThYKUapiFxKnTYvzgidcmtVcmhpeu70EZZmWhj+6c0ppE5ujgu/s9WsKpFHiSmytpVaK/ZMVT77vUX7y+Q0++bnXaH3i/Y9PuXXSc+fUc9BEyWzTnpVLeN/j0PiomK/8WiFpjCK5AESSLaQ9zrvspIX7jy3WLS4xogp5WI1rmO5sQ9zg8PSQ3/jKfX73q7d44aEZP/ejz/PRDzzPzuYYU1a0nRLv/dDjfWK6fYF2eYIPATvZwFpZw37+y9/k8199g9G4Ynd7JmQg73FdRzWqct5cpKxktFgtFnzi5z7CZGI5ODgUEki2/w4+r/+igyi6gjAATjGRnJObiSStuJLnJA3/niRWbAlGRnHz3hk9ilop0AWpKEFnAb7OyUkhoUxFCo6kBWwkhaxiy3yBXAhkAR5QMQhQ1jWSqIQUZaOGWzew6iXEJeXZWivNtExYLYV2s1YEDy6obNyZG95EjuaW3xhXmqNFy5t3Ihc3SharjjsnHa0LHC09nZfDNrDvBiMQrTMOFoVLIF7+2Q8zyu8rLetGpZQ4qYV0fkiBqigYFRaCkw4iJGFcxiBjpyZ/Xvk9GEVd2vUtP3T1UgEGKvLgtLW+1yUefEAy9QMtwg9WDUVVGqrROIMUIg+Wwy0zitFQFdJGtU4qqnfy+25djc7rUcha6YTMOl2C0kqyat97trdmPHZpAqmnLEse3RxBCCx6hVGOptLcOXVsjWVOPGsaiXFSElJi82udLTteevYKv/juC/z2H3wXWxWMTOK1+y1v7XVgNLNKE6PwwFdO/OhcMpy1EWtF5zCkFg3KuhQTSSexAVcaFXpJ4UkK+pXQdIGktXjclyMxufQdthqxMZ4QfeCr+x1f/+++yrXf/joffOEaH3v/O3jX01fZvbBD5wOHe0es5mfSohaaqipoVi2/9S++yM17p1za3WY0kvl9CJgsqkKAOSP5cinB6dmcX/ip97O7s8FytWQy3cD3HbqcEF0jMm/fU9UzsAbXLvH5YRtsx2NE1GQp0DfHQlQqK3zf0fctuqhxLjIdG167eYiyNdq1pORJaiQblBBBK5SRg53KMXSLPBP7PHYacI2ImIwFbc+jylNCYc6VgpkQZI0w4a5dnq03FoXRzPvARiWU35NVZKOWOR8r3albHzx5Qo3Kz2MInK0Si3ni5v5KRg2kyx08+kJMuJRwEfDS2tvs8qO0JqSIVkIQsplyKElXGcwLaa1QPAfp8nYhJcaTMVVdEcKKAjmgMYkNv04p+wCm9TrTZWHRAPDJNiAXzwdn8PVf05ALIP/hwMU+jy2Wm7vQmnbVMD8+k5Yr7z/bzHMeBDxijKCzD3oESkjnBIdhIsl/nEIPgKC0WzFFSmU5bQJ/9ecf4pGxY9nVLJYNUQWaJrBsA5e3ChoXOVs53nGpog2JLkTKUmUzB3mPQgyx/NqHH+Hr37pOPSqYVYp//s0zojb81V96Abda8srNY+6eOBad46iBsrI8tltxe++MyiLpRAqRlKYcYlYU4FpUleW/biW7aW1l05GKPIsFdPCk+QGYElWMxDZqdYpBPAjT9AJ7Ef7xV/f5rS/e4PELFR95zzv4qY++i0cub4BRxGjRyfH662/yh5/9LsTI5QsbKBJ9n11utKYoRKPgnZcbFMXxySk//dGXuLS7wdnJEUVViy28LYTKm2KOezOEvsnot5G04iSgpVi+WRH5pERVRkIQMo5SBmyN854YYd5EXrt9irUVMfQyYngnP3ejha4QPalv8ypV5ngVPSkkCE6whr6Fosqx5pGsIoMkZqkpRpTV6OCY1iUuaGKynJ4uJVY9Jq5uikPwWZsYF1AUlmUjyjmUrAbTAzdvSonORWpr+OnnZrz4xCZbuzMWS4+OjpN5T+eg95bOdZwsWuaN5/X9FfdOHUZELIKT5eddlLYR58Q4RyPszdqqc2Q/5VBeJYS7stDcvXuA6122uBss8sR1yInaCD2Mz73HDZJgHvhfOncEyr0AA1WYRM6Fzm/2wQKRouwWkya38JIDJzbWQvlNKeB8wli5HUKMkuYTE12AqhZb8AGRHD5orZC5Rku1E0FFotI6Cxs0OM/33twjmoLlYsXu1gy/lIpZG9g764kkJpXh/kI8642WNshaA9qwbByPX54y0z1fO2x55ELFH7x8zGQy4j/+936cO9fv8skv7XH3zNOFQFIKAxyeNDx+IYdpdJ6pNdg8zpgUiN5RqEwGSl5ue6WI/Qo12SS5RDAGylr2991C1G4qoQgk50RSq5Qk+PYdRTWm2t4k+ClvNIGX//AtfuPTr/PeJ7b4+Aef4V2PbXHn3jFf+e5NZrOpzIJ9R1WVqEwQ0lpkvi7IWOLajqPTOT/+4Rd46Mo283lDPZ5mH0RhyAm/qKBZzuXQZflwVJrkegFktSV6T1KeELzIXI0iBGnjtdE5F1DEYfsHS+6ddJhRJdoAI8xI5TugyDvhILd4TGJ+ko1C0uAFECXNOCUkN8B7SVbW5nz+t+KROFDTbV3z6LVtXnn9DlVhqaxmXCRiFLaqtZrDhWPVJ0aFZrMWb/40zK9IFxFj4ondghQTdw8a2cI4jw+eN2+fcvfUUxkNhHW3O7Xn5hzRJIwSFWFl5PV8Yr1807ljgaEhEmHAkB1glLAItbHZgi8itG+JvYOcBAxEpfFJ5ck6rUN3HyQCDRduevCAy3+W04EfqBgmtx9DSzL8nrGF7IaVkHu8D5nBJ/tbrRQuBoIWclAMgdOFE8LPEHDJgECSZzPpOIY5zEUxN+x6AXV2Ls84WzlSX0pOgIa29xTFiONsTTUuNW0vrinzLtIFj7WJ2Uhoxde2pxwdrxhXmhsHPTcPO/723/gQX/36W7z2/Zt0UQt7TYk5hQGOl46qNoCmC5rtKjEuDV30kn/oelIlxqLKtxIDphVpOpWaYMtMFEri/KsMpqjR2TI7JgW2yvOiEfzA98Qk8t2qUFT1Jh2Kf/32ik+98jkuTgtefGjMO5+8hEtJOpA0eL4lbCHzdVLi2eidYzFf8JH3PcUzTz/O2ckZVT2S8S0ECexMIb8fLfwF34t7UZA8g2I0pe97BmPY4Hui86IGtDUpadrVnGo0zlXeUFi4cWuPuYtMpooUjWAA0WMgg3npHM3PsynBgyRqCtIdvNisJxm7SB7lA0mXRDTJtShbEpynUJGqLgghMhkZVp3YgKEVrRcG4LhU1AacEgag1uCTFsWgWmPThDiAgInbR0J3ntYiutkcWyKWk1XDZi0jROdTluGmPB4nityZKCXQamG1+PmphPNOhFlKmIpRbl+izzjBcEhTJCmD8158MQtN00fJBMzMRhcSRgfROSCX8pBCrDP6P+gbzofvBypAeoAJqFSecvN/qdW6URCRhYvoBFqLg29htJB98jyPziBZErqjc4GuD5L9JyyG9dwhwg2hYFotJowDndF7CeH8R598jVkROWsTh/PIL77vMrMqMhtpYogczJ0YdMTElQ3D5uYuOzsbVLXmQuWZTWbcPXJcqHtO5w3jUvHK3RVPXJmyf/0Gt27PSWXJ3t6K1ovkU6GoLBye9UzHFaMCVp2n2CyZ1iXNIlBqWHYdaTwmaItFSyJPPZW9bxRtO+VYDn8IYvulo/DvfS9qttBDMSaGAFUtIriul1vOlBB6rLaYuoB6m/vB8plX7vL0oxewVd7exkgfAuPJRPjgfY/rHUVRcHY254dfeoInrm5zdnJKUYi/XPRBRpCQi5EyOaMx5tsJAQPRdG0ngFNZ0fcdPsohTyhCs0TZElNWkhRsC/q+ZzwquLE3F9l0CCLdliuBmGd8hrSbaoJyHSqnClOO5fIJTsaqlCT6nCQ3f5QsCFIGnbXG9ysmhXwWOztTZrMxB6cNfQTvArrQWFUwrSJNH6ispRwLPvDWfsu8kzE2d9/rYiBtt6F1wmrdmtUYbSltg9FaqMMxIVCpHPyMhwqhJwuemiSW+lbL3l8hmRernPCjEJBctmsiPsoLFYrCrH0C4tC8505X6MdxrWRMSbgIw9kdjtvg/DO09wMGn/JlnF2BBeCKD2AFg6GhqPPkw1ktF0h+uiYk2dkLycRmj7is8UbamVWbDTDT+uuvAV3pNOQbC7k9MkYLdXNccvMssmh6vHN0TowOBjqxVOmBDx24tFEymdRsbxomlWL/yMH8gJO9FY++Y3cNjjTOszMdceewxcXE7kTzZp7BCiOvWxaKu0dL2qaXwIVWitD22HL3VGyZz9oFqG1SEJQ6KS0utUahl4eC1PoeM94Anb3ugpPIr+AlujspmXltmUk9otsfurHBWw5TkLqWca1pdcWN+6e86/nHWK5adIiUdZm3NvLkGqs5Ojrh3e98jGeeeoRmtcKSwV2j8N2KopgRgsP7HpSo/pSx+L7FkSiyX6DShhQSfdugyzHGeLzrCAm6piHRUdUVPiWUlzEoxcSbd2WFSfKyVswbkWSEwqyjl8JnJ/L7tkTijlKmC4fMSYsEWwrA6ntiORJcwLU5eEPj25aNUtH0kXc+tEuKkdOzho2xwerEd27NuXHUi38+g79FZNVFVmFQ/T3QHieV3XcEG2t9Ym8eePiSEJKOFj2VldfwGWSXkWqYuWVCCUGqiSYzHLWIuCIKPOvROORNgDWakLcqRmti8FirqauKEBpCFLftFCWhuy4MzQNaAFllCmg7PEM8cKE/eOujh428EhCQYTG/JgLkapFSrnJiWtg1XZ75EXBL55hu5BAMqwajNGUhH3iMuVqpYQnxADGB8zcvpUBYaIMmwKoC1ycOgmPZOi6MND7Jeq6yrEERaxRNs8LSs8jdzMIFPLBqPRfHirNFYlqV7J+2vONSSVVoDs46apNYAqtOqmddaGLSeFXSODEQlTWk4eU7Sgwgm8WahpmMMONMtwRl/v9s/Xmwpul53of9nud5t287++m9p2ffgJnBDECAAAFwJ0VQEkXKpBTGdizJW0qu8j+OlaRSlfyRSrmSuFK27EpZcSS7JKskMooccQdBEAuBwYAAZt97eu8+ffrs3/ouz5I/7ud9vzOUGjWY6dNfn/Mtz3Mv133d19UdTOVqGO8S0n7UjEcuQComIkEbsfJul0p8NAAxRnTvfNuceshEGz6kObd2xjzzpEMbQ5bnJGkSffkctqooK8cTV87w9OOXxSzCGLyzuNmYpLdCkhdU5Twuq8QS0Ttx9fUBk+bUVYmtS1EQBglisT9WKiEAaT6QABUsOItD+vyjScntnTF5NsC7Cq1TkSdXJiqVxkuglARGmUGLIUg7OiXO/ZNIsXZikEK1EBDQOYJRhKbG1RUrGwbrFGuDhFu7J8In8nBmkDCpAwsXKOfiCwmcwqWWitRdclJyyYwKTCsBKDeGKbvHFq1czL6Bxiuqxsuqu1LIAnLbSov1fKZEyUehWFgB5LRW2CCVVqIUdWhdsuM+AAJ0JknKYl5jsDQ+kMbE6QPoEJhXjUjwRyFbadVNJzja3uMWG2j3fCTBR9A/RGuwEF95txjUzhHCkgy0sIGV1aGYGRDdVJ2AeFkiWbyOVso+Bo4iMRgdOrsilEgxtVOBQBBRQqLPejwA3kbHXx8wSYJWDYsa+nnGZD5lpcjo57LwkWjNIBGG2aQMrA8MBk/tFcMU9ic1F1cl81zezHlv94TjWcNokLFzsuB4Loy29te89IxnjuACQYlfIArWVgqZMGiDsQt8YyMiLk43ynk0NZ5ENAEAgo6HWTJtiAdb5QN5M2wZ2y4v1tfBy7oxQQKJl+UZFUu+JM/YOTxmMRdZrcpanE+FgmsFBT67NeRTz1zk6OiE/mAoSzoK2VG31fKkK42rF6RFn9paoaoag20aQiyxm7okkBCwaBco56WMWLOMxfiI4doaKu2hbUM5m6MM7B6U7M8aklUt72G9EK2tppQ+23mZ82uxRxMRFSe7Fe2pUBrykYiXuoqAIui8K/29SeLugLRbG4MCbTK2VjJu7Iyx1uFSQ+MNVePoJYqpXWJd7TE3ajkClFy9BMsmlWelkBn+W7emKELcehWrbkPEymIJnycy/bJ1DDLe470kCAVi52Xa5R9FLxVp/VY9uiPvKGTpDs+gl5BlWSdN1m7KGqNQTl5NKxZCgKO5o2wi2zBi1Cre+lOd/xLulwogdOjjx/4whKhrJn8gJIoI4gVx1U0TE0t9S/t9vEfMNsuGvK/iSJGP/fiI/XXRMtUSP0OAlGiPjCZLJWMkGh6czNG6R8BEICVKGiuRSW5C4MxAtqFMmrB/XPHu/ZJZveBTl86jjCEFHt8u+NP3jnn+Up+6kSpGecVkYTlYBLbW+/xHv/oZzlzsk7x2HWMyFrXl7ErCKE9xoSbxDa4uSfoDwmwmgFxaEGT7A6VlXVcas5i10siCM4kg7a4h0rak/Dep7MQ7i/KVjLgIkPcJdQWuwWR9To4C48mc1bUBCjFtlf1cIfx8cGOX1WHBpz75KOWilgye5Nj5DKUaCB6T9eNMX1RmnZfdguCsZMCgQCU0TsZRTb0ArUmjYm49G5OlRrgDvqaez0En9FPN+x9dY0HOSsvzdw2ELGb8Wnb+vUPZMvanSrK/0kKhJkilgJCsgrdxKuDxLi5EtQBZ01BoJ2YgWcFgdZWr37tOYhSZhoNxxbTyJInCNy0wJudZq+V5JEDQSzDah8C1g1ok6nWNiQo+zkk2DS2bVcmZr6zUtmXckWllvH1YOi05iJuu8vNdkMDRbu61k/f2aTUuyPN2gqOlmYxClZYqYpSKzHi7qVjWnmFmOuD+1GVeBr7ui8vfJW04XEYFyRAdRRg5KFUD1bzsOAUhyBaSBAEhT4jJQRtN2wj58RfWrgWJhroIg7iwbAxUYqLeuZRGB+OGQMK0DIx6wjTLUsPWSBDP2vqoXZDw6p2So1nN3tRxXLpukenlqxNeutzj2kHFU+cKJmXDj27P6CWaw4Vo/T97ZZV//6ee4nPPP4zdvcV3v/UhK/2co7mMtpzzbA4Tbh1WDFM4Gp+Q9fpycLX0uaJ0277BmuAF8NMIlTpUcyiGUJciZpHmMSMZcA06XkJnoi+eb/CNtAQhgMoKSjIOj6acO7/BYraQ3jEEkizDOsd0bvnqyx+yszfm577wCZx1NOUcpRw6G1Av5rLuCzTVgqwYyOX3IusNQi7BNSRZigpWSCzBoYymLiuRQouMPOsctXUo5bFZnw9uHaLzPAaeTFod7wTL8FHuS/h7sSEEgo224AETZEyqnDxGxn5WEpRuq6JASDT1ouJcP8WYhLWVnGAtDw7GeB/YHBl2j+Z4goCXUQqnBbpVGwRUl+8iDhCiCG7U208Ca72EzCx7/DpiSo0Xht60CVEyTDK0VkvwTSnhu6Ai3hAxtdq2Exyp7trbJl8NZMbgvKJubCevNyxSrHVUlSWkJhL3lACqQUxLs6jh2Sb0IC+pq3xCFINo5wKxBZCHLkG6JWzonaNIdNz4coQAVeMY9RIenJRcvzcmSQ0BGA17nFtJyRPNqCcsNBfA+Lbrj9tlyOoiEQxsQiQFGUPjhR8waxxpVvDLnz3LE9s5r324x/644dxISv2zQ1gfpBxMah7aKHh/r+H7N6dCi0ScYaQXVHz9/RMe3sjZHqQczBqePj9gkC/4cLfiK5+9yC9+8RHODzT3dsb86GvfBi8ahLWHItFUVg7/2ZWUa/uKlVxxOD/BuTNSONqqk2f2SSGLH97FpRfxgcNZtJ9FZl2DMpkAgiaJl8TL7N2IAq/ytVBbbYMziFVYJTbjdx8c8/QT56PJaOjo22Upc/tBL+fND+7xYH/ML/30pxj2E8rGxC1GcOUCn/QYbZ5lNhlTlZZgK/JeIchyM4tQeCQMpTmuKkXHP0lxjSXJ+3ilcE1FkiY0VclsNuPuQSlz8+DiBUhQWU6wlVQBIYBKpKfXWqTAbA31IgrEBEJTx8SsUFZckINJCdbSjj4DYMsFly/kLErHJzYLjiYlVdmwtlqQGdibVCQaFqKkcbqz7ZJSO0HvHKajgGcS7beHhWKYK3qZoZeKBJ71gbKxzKtASCCpWsrxqe+rQBtpK1yQRJTGEV7rjuF8tIZXiqaxtJZiWsl9Q8sELUsMWaK5/WAi2ha9grtHC7QKnFnrk2WQZ4kA9m0Aksj6sYnAx8qC+EQTFaOSj+hhO6dvA4E2BudqNlb7rIwK+rmmyBPeunlCnhn+d3/3K2z2Km5+eJ3fffkOr9+Y8eiZPquDnFRMACRSEvXTBOPAxsWg2oNSHrzGxZXM2joSk/Kf//qz1EeH3L53zHg8YVqmnFvPuf6gBJVyZpRx87ChtoHdsQWgl0RSk5JxSJLIxuJv/2ifX3lulZWe5s6RRWvDIDf8L3/2cXbvPeDVtw6k5C0KnFNUjczLRTRCsT9p2BgVaE4IypDaObauyUxGaObxYIlLLolw79GJyIHXc0JWSOmoFCrJIugXwFuCbg02ZctLJTImU7YRFBzZ4AshkPQG7I+PsI2Ak6IRL1hMVVvKqkKrQJ4n7J8s+Cf/4pv89Bee5qnHL3NyciKovMlo5lOmOmEynZPlhag42YYsyymGKeV8SrNYiLlH0LEUFfozyjCfzSTrpTKF8NYymZTsT0pUIdlYmRRcI2BhVDFWTQlpDxUs2AaRf47puKki0UzjdeS1IwrLISi89qi6ISAS9JkrObu2yWTheejSJh/cPhTzFyVFx/6kwcSZeQv0IYVAzP5LYCyJBJr2gsQtXvppSj/LGPSSuP8fAd0gNuPWeRIF1anrFWCpIKWEPpymBk+rJhx3XpQEGxHBVQS3xMa0htA0UYZcc3Vnzk9/9jG+8uUn2bl+kw8/uM2bdxdcezDl/EaPNBEgNLTJNkqC/cUpwGmYTysl24Bd1xA41UGETv46BDrJJZTi2s6Ui9sj/h//p79OaBpe/sYPmM4cj5/pE8Kct3cmjAY559d7oomu9fKtiZpkos0eSw6lur7KekfjAr0eHN68zTu3JiSpYnWQ8d7dOZ99fBXrFsyrik9c7PHhgxmV9Ty8mXHjcBFnuMto6wL0U82sCfzzV4/4/MMDzq/k9FPNtb2SP3/7Flu6pvQJaEPTWIpUo5UnSzRHczEPbTxsDQKrPc3CwcB4jsfHZNvnCPMjVJKinCeEBqUTnIpZxduY7T0hLSLjQ6SxlWuE7EKIoJjMlENcu8VL749JRQNAKZK8YP+gYTKd0R/2pG+N2W2+KOOhk8+tV2isM/zRt9/j+GTOC5+4QmURJp8GW1ckaYoKsh1n4taaUylpXkjGBepyQQgCzAo33VFXJVnRB53g6hJj4NqdY8aVp9cjTjLieLJtKYOIrXhAJ7lkfpOi6rngIDohBCtVUtaLGMJCWqZWCUgZUAnVZMKZgRiCbK/3Wen3uX7rGkWRkBnFybyhtFGSLoRuvt8GAHU6IKj2GKru7Butqa3j6n4F1PQSFam7HuuhcVB5GSGfSqgdJZ6ojqyQJNoR7rzvsrT3AR37itaNKwRRNvKxKtdGc+v+Cb/2i5/mP/l3v8wbb37IeFqjteb8imFWKXaO5lxY76ExH3se/6aLvwxSHYGv3WQKsewK8UFtLBMCA8pgioKmcRzPGv7uv/d5FpO5ZOdZTS+RuahWin4Kdw5LpvMGWRT03Q/X7cVHKgzpg+JWV5RVyhPFyaxhEVIeOzfg0lrGw1s5R9MKby291HA4d6wOU86vZny4u+DJ7Yxzo5Taig6cMgZjDFmWkhhDmohT0QcPSv7o3UOu75dopdgdB4aDnGll4yhGM+qbOJSE3EhZmEeRksubA2a1F3Xk6SHW1oSkED9AkMsagmQ3ndAWmRLgIr3aWXEGjsYn0qf5zqCVdvbtJAAEWwtKHhwJjpmF6cKysjKSDzKOAatFTZEXp6YaMrUYDQd897Wb/M7X35KpTWaoyVA4WfMN8qlXZUVjHbPJMTZ6BTTWCc8/6Ch5HVgsSkxWkPX6tESYvD/ko7uHhKQA30SQ03bjTKlIJZNoW8l0QClxSvKxtNcpXieEtIey9dIZyPsIEHoxCfGWZjblsTM540XghafOMqkct3cOQRmKBHbHFTZOmFrjT8nf7RU4JQd2CqSSMZq0KmJlDwpPL1WcHWkurqVs9hUruRB6ZAOxLf+XuJeJ40WjdZw2SJYnyPqv+BEsb6XgMHIPpTtSzMua2aJmY3OFr3zuPK9+/02USnn92gF3jhtmVSA3mkLBznElJrynXt/pX+Ev/Lv98xiA5I1qxxo6Zq8Q35wkMXhrWUymHI5Lzp1fZxgm3PvgfV79/ht8/919ru3M2D1u6KWK1UK28GrrhK98CgPgVIQKbWhS8ga4dpfZyDzzz9475O07Y77+3oQ/fHvCD28t+Gi3ZHOUUFnFvGz49MNDjuaOReP4qSdGAvwREQ1t0NpgEnFz+eSFPo9v52z0DR/tlexMLe/dGZPnCYNM0y8MZePZPXGkSqoRlMgvV9YznjuubPUwIRC0ZsiCZnqCz/rS6yFgTGijuWsIXkwsA8K+IyiUFml14cZHeLmc0oqNACKM0SxQzsrjQoC6llYgybl7/4SmqoXk5FqTVunxtZKFEefkuVRNzfbmiHev7/G//S9/jzs7J6zkisnxMbPpnPm8pJpNqRYzynKBayyVdSwqS9UEpmWNDZokzTg+OMQrQ14U1GWJs1YkrRvP/aNKtO+ccANay6+2xlSRyx8iwq+chWouATLty7ZgkkfdQOEnKNpRmooVgCj9DrXl3FoPGxTPP3uBV9+9zdbAsJqL5dal9ZQiMRwvHMpAZiAzKu50LLP/MinJhQzIzoeM11Q3RjNGFrdWe5JMjNhZSiXbfY+4Uq9F1MPESZWO9yjVosLsYxXcbhVqhWT9eEHEYSiwurHGwbRmrZdy86M7fHT1Jr/z+99lMV8wWVgWVgJPnoqJ6axq1/Lbimt515eBoUX74munjYAxTLe2QV3ECIjxZ5ags77sUNuS+zd3+OF7e1y9fcR0UbNoRMfMevHYK2vL/rj610aMQreM0S+ODb0XIEtp0SsDxaif8vbOjN99d8z3b024cbigDoFvfjiln6cMC/kgHt7KeeJswWu352yv5Pz4w0NmpRhZtHrujQtcXi946lwf6zwrRcKVjRwF3Li/wCM4ASGQp5pZJePBeQ2HswajhCmYGBgVmoc2CyalY5gp/PiIgOAF2jUySouUV+0tNDWhqeRrWnj6oakI2sgikK0lSyLZUNdz9HxMiNZoup6j8CKgGWHrdLDK3d1DMREJgcQYGheo6qYLIkrLIauto8hzDsYNP7w54eqx4+/9/T/kq9+7xuraKnkiyyneB7KiJ6xQk3QeekmWSvBfVIxP5iJuEcRl2NcLqpkAhkcnU+4ezkiUFxKPj+Qd75YjT+/BVWjXxODgZLvUZEJJRlqjoA0hzWX6AQICtgCi95TjEx7fzqhrx+WtHk5lXLv+gCJPOn39UZHwn/3SJX7mqTW8U8ybqEoVkfk2QydRT8/EtjR2uREXUJ0xTD/TbA5TVguxrW8FP1t0ve25jY5BJlYCS6V2+TxsrIaEOiwVRnyVkUgkwHmaJNRlg3WKpmq4ceeQ6/eOmZci1dZL5TMfV8L+8yFQN1GQtb3fbSEQPg70n64HNDHrd0qhpyNIfCNkKiQ6dmmquH5/xitv7PL+zUMUsDlK6aViFDpdWAHQUBSp6WadXcxpv2fk3gtaqgCP8k42BBHF22EvY3OYs96XCz/KNXdOSt7bKTm/mnIyt9w/afi5T25QW89bd6c8/9CIlx4aMF3YKLboKCvPL790gaauGOQJw9wwyBT9zLBzsuD+VJ7rZCEuRKlW3B9L9hz1RBJ7smiYVZ7j0nNls09tFVmS0Gum2MVcRl7u1GVWSrgNSRapwi2nmyh1HQUyvHAAAkpERO0CVY4hOELWxxsREKURBx3fNBhbsj+VsZ0iUPRyFqWw6mQyIJTSxaJGK1lu+pPX72IxDIoM21vlv/6Xr/Jf/0/fRSUZmZZ5e7UQEw7Zl8+oLdRNw/hkwmQ8FefnlSFZUVAtFjRBMroODbt7Y44WUQMvICu98fLiHdrWUM3RizGqnhKSDG+EH6CdFRJYW35juslI+Fg14ajLkqSe8dSFIXtjy489f4nX3rmDrRfdNcpSzfHc8s7dKV96Zo3/9Ocu8dz5PvMaar88h8QRXHt/QyTkaG1oW+MkkQufGE0/U1E6TFSsWj0L+bhbNZ/QtXwugPOxEm0fHDzE5TOjhCDUXg4fM6VW4gWgjWa1l3Awq9k5mDOeVkwWDeN5Q9k0HM8aGhuY1YI5mFjWqGXKjxGKf/3XsuU5RR2MX5Q3QfzbQJFnCeOFSDKNBgWTRvHmnTlKwayyHE5qfnj9mDuHJZXzHMTZ+bBnYp8TRzcxxjjaKBwZgERVlaje0j7xxsk++1LgQ8wRvvrOAYNeTmIMtfMsKsdfe2mL2wcV908qPv/IkC88PGSQaiaV5jd/9im0LTmaOZLUyKxeKdJoW/zDq8dcOjMUafAiYdjPGaSaWa343odjXDBcXC9oPOTa8fBmwmovpfKwlgfqo704Jg1CBLK19PiuEaAlLeS9XZyI+6wWD7+AAIPByeUOSRZ7Iy/7Ak5AOOq5iIxYsfY2RjMtLYdHY9JE4ayliZbZLkqDV01DlhrmlePrr97Gm0wk1rzH4Fg7s823rp7wf/hvvsYHt47o5YlYp02OMcqhfIMOIjGV5gX9YT8KwUA1n6PTLCYJQ5Jm3No9oXJaQpxvpJJQejm717LdELQhDLcj/z+S4psFqp6hbSmaikoyfeg858Q8JASYHY954mwfjWJ1mPHwuSGv/PAjijwX/QekJfIhcDBr+N77hxxPF/z6Z8/ymz9+gSK68oYIvrW9u9EqbnAi+gdhmS+lOpC/kxkdzWpZtsvtnYn3RimDeCmqbhPWO4tttQfay6elYva+NSxV8XsCSghfg0Kkvt66M2E8txxNG0Lw3D+uqazsAkwqF52DIs05Prs2GJ1q/ONNVy28FzGANoohyPkpTAQfRMNsPK04PBG9+MfO9vnzmwtuPpjx/r0Z792bMK89KgTGJRwtPP1Mdz1oJ1AYlmirUUIXMm11oKQ3Xi5HSHkk/ZYWrzWgX+Q8fG6VP3xtj8vrKd4HZlXD2sDwS8+v8eqNCXePSp67OOBvfvYs//u/8Rxn0oYP755QZCk4eT0B4XIDfOfdQyYzx2rfUFnNGzfn/P9ePeS3vv+AV27N+Nb7R1zcHpEow8JCg+bFKyPGZWDUT+nVY6qykktB7O1UIplbQbCltAIoKf+bUnphZeIBifugXpDZTjW3KVFtRm518b1FBUvtYXd/QprKyHA6XYioB4q6tqRaU1nFN97Ywac5qXKya29lBdfWNaNhn71a83/9x9/jD757k9WVEWnRwzaWZnqEMZDnCb0ilbl4KkQUTEJTN3hnWcxmNJXlxv2JZMG6jNMkFdl9DaBicJSph68rWEzlvWl5EbYilNNIrDLQzFE2fi/nCCjqusbYBZ+4OOLm/Qk/84XHeO/ulOl4Qp4Jat84Oe39TMdWL8M5x6vXDtnILRdGhiqaC7VEHdEGUUvXYJaoeSuhlaeaYS8CxF1LK5Vy6+enOiKA0KpVa4LqnRCAIl6gIvHNxmUyE6vepMUcECC7LitpczZ73D1puHlU4VwQ+noQotzhXEDYYS4BR6Z38v1U/Pcy46t4p9sKPxKg1ak/b01BWyBLKZjXlotbQ55+6iGqxrO9WnB2vc+P7lTsTxzWK8pGsTPx3DiqWS0UW6OM1GjqyMGWyYiK5b+4m1YxUree6O2s1iiJXDoi+Tpm7EkV+OtfeJiXLha8eWfCG3dK1geytHP3qObh7YJfeWmDH92ccve4YlFWfPjOR9y4u8fGKKefwlrfkBk6n4JUK06qht/6/i6//+oB/+O3bvPVt/d4f0+0388PNbePKt6+NeXKVoa1nlnZ8NzlpBj5AAAA5FZJREFUPutFwryGs0ODHx/jdNYh9gGkbHUOX4mbTYgAGMoIVtCU0h87QcElI0rVE4yMJUWbQQtwlGRxDGbQ/RV2jxdYr5jOK6qqju+tJ88NDYavv3qLJu2RZhkBLbLlBLRr0E6UbVOjyFbX+Sd/epX/8h/+KbNS0ev3cCbDK41rGop+j6InuxCNlcOX5AWNU2ASxuMJtx9MSI1Yjgl33xBdOOMYOJ6tdtypBZgNaSZ7ECjRDVBKDE+tjR2qEKm8MsxOjnnqbI7CsbE24NknL/PyDz7izHpO1XgqK+NfpTyzypMZyJPAWt/wyJmCo5njzontyDHxaXVn0CMTqDRaeylUlP6Spbc8Md2laiuHNqvGuxcxBcl2Wi83/Fqg2yOBwnqxyNNE5h6qW0uWlRjPoN8jSRK0gkfP9Dkp4eZRw97U82DieDD1eA9rPc2gSOT5RQyhqwRiNj8N/6lYbRCi/kAHCfjQoditdbFMbqQ8n0+nFHkKaB4/O+DpiytMbWB36tibNlTOcW6o2RxmrA4LenlC2wDE1BhLKimV8qgp4CKNUmmFUwrrVTdPbUkXVe349S89xlbWcP9wyrOXhvzx2wfMG02Rpcwqz4c7CzZXCv7m589zdXfBD29MCSZldZDFdd12e1DLcgYSjJwLvHFvxlu7FWOrqIJUIJUTxaH1vuKVjw7ZXslwCLtwUlq++OQK+1NHLzMM3IS6LEXooy7jgkvsYQmS4Z0leBcZbXH7LxBZcjrKXxmpmEKcGZu4JWdrcF7UeYLDFD12D+ecHJ1QlpV8XkqRFymNU3z9hzdoTCaGEq6hq/q0BBaSNIqZCmYwWl/hB3cr/s//4Ov86J17rK6sYK2jri1VWaKSImrtBZqqopxOMUbTH404OJqyN7Xd5mEXzFxroCLTFJ8NhdQDKC+YT0DHLck+XhuhAccdgAASLDw0VUViK164POTeQcXP/cTjvPLGbeYnJ/gg4hwbA0M/DfRSw6wJ3D2xshBkA4nW3D22zBo5a1q3Fzgu4sRK1IbISVFtWd9V1FKBZglJxA4EP/j4ok3wrbNArAQJcYExtNdPNmyVxikdBWNi9RtazE3uyaJcUCRa1I6M5qHNnO2VTFS3jWKtr1kbGEb9nEGRkqex4ginnxCnQMDut10roLtOJyxRUhEuUKdelMdkKS4pOJmUYkiYaM6t9Xj20ipPXxjwyJk+lzcKLm0N2V7vs75SRJnwuAQRqwlAGFFakNheogjOUzU+Zn8icSMipK3mYJKwXTgOj4/JEsP51ZwnzhT89iu7BB9YK2S8cndfwKB/58sXOb+a8sNrx3x0f8asXgqR5KlhtZ/y0HpGlsqHnBv5OaNMcWagOTfS9FM4XATOraRc2y25uTfnka2c2gV2jhsubeU8vFVwMA9s9xX2aB+X9gg6ixe+pnXEDTqVrC5qkMId0KabdfumElwg+G5EhDIike1dF7kFsEpIB0MOas3NO3uC/kdEebFo+Mart6l1Sp4KzVa19FnV4swxG9gK5WpRJWpqVnoJY2/4L//py/zT33+NJJEtyvm8ZDY5wTaW+UJER5qq4ujwkMnBLnd3T1j4uGrTrv0qBU2cAtlaMA1CB+aJ/p0WNqSt8UpF8pODeh6fqxLAFM3s+IQXLg9Y1J4rl9Z59pnLfOf7H1L0etSNJTPSZuSJwnrPuZHm3MhQ1o0I2tSBaw+EsZkoJUq98bwZo8jSSNNtGXRedWNAHUv3xoWIa7XkodMAngCBAaI/hoiCGC2y8y29XrQNvQiEoGiCovaRoxD5clorMdTRCfMoEiNb5prVQc6ljYKzazlrw4zVQU4vE8k6712k2p/i2nysxD/1nx3g2JYxp6LGcv4pUUIkoeQJ9nNNZrSsMipYG2ScWetzYaPPpa0h66Ocfp4KYWhadWzC2NqcwiNCB5y0qqY+tCqn3WoQeWoosoReZvin37nH2qDPI9s51jpuHNbcnzf8k1ceMC0Dm8OU2jruHy748O6YLz+1yq9+ehNtDK/dnvH6rSk7RyVlI/PSp85m/MQjAz57pc+nLma8eCHjia2c1Z64yhglew+pMWwONb/36iGjPMfaQJEZjucNX35ylUXtyVLDupqxODpC9YYCfDWVeN8FIdwEnaCSROy/XCXqQNUUFuN4sWPJ64N4DJhE3jOlZSymTpXSzqIHa3z3rR1u3T6gahoenFR8843bzJ0iz6JXoILlumkQZmII3VRCoSRIxAOdGkVvY5PfeeUO/8V//3UOxg2D0ZB5WdMERZJobCNCJlVt6RUFB4vIhY+jPyn1xekptKkytjLUYmxCItUURLm4CJxqX8c2yndncn5yzLqpeeHKKnuHC/6tr7zIH3/nI7A1lZNt0DyRxFVbL7sktVR3pVMYk3H/qGRvWotqVcSeWgDPO8naMhaU+X/ra6G17Lk4J3Teo2lDGcG3Npf6sFQDkkuuukXPeG+lpTgF9DnRWycEL+1EW/qHpcbF6tqQJElFSCRI5Zylhn6RMOqlrPUSeiKsGa31JMAEdZp6p7pL197l019OurqgQyb16b/aPWljNMNeEUG6aEqgQBnFIInbgk5AFOdF7ms0KFCEuGcgb7wGMq1E1th5KqKQAaLCkihZ5RS9dy++9C46EFfwT39wwCfPFnz7wxOqAEWqOCkd//iV+/zV59d56sKQ63tzBrni7TtT8jThxx9f5bOPDLm2O+fe2HLzoBIENU4Z2g8wMVr01xPNxbWCEBQPJiWzOvDQRs73by149faEpy8O+eH1MWXP8PS5gpceGvCjW1MuraeM93epRkOyfECoSxH5idtsphEcRJx1VPceo40IiPiGoBK8CSgj40evRJwy9kLdSijzMUlaUI/O8vK790gN1KoAZUj7fZkGhIi+tyoxvlXaaXGZJRNTqLtxIcU7VteGfHTS8H/57/+E3/zFT/DiJy6xqC2LWhFUwmJekw9XsCrl7Rtj8iwhNFPQAoSqIEo/sn0WQEk7SNGXcalSaO9EJyA4eY8EukL2/oUf0CwW2OmYL31qkxs7E37uC49xMnO8/Mp7rK/kIshZJKLarKUyTXH0EqFvt6j99f2SmRNmZ0BK/aTr52Uy0GJQ4ibcruzIL4eoTDdBeC6JkdaY9o6wBA6VasFzjTbtZQ/dHzrnIulIxD2UopMbJ0QLOpFxIs9E+8A6JZ2bhoAmNWJqkiSKItEsKmmzukn/KaCyve3hFBAYYsXS2YPLc1suAqHaMydoyXw6Y3/3AaUFVQXQ8gYuatHJS2MZlWqFrSzDnjC6OtHl+Oa4IEKKPtGdYKLWEhR8COSpIYlobO0D89LRkiNW+ynzyvL1D4/IEkW/faEGsjTh21cn7E09X3xqlfGiQhtNaR0f3Rsz6mc8tN3jqQtiaDKeNQQtm4XWS1kIhkQ5yqpmb1KxM7b0Ms3JwrLZTzm/YviD1/d5+nyfSxsFx4uGa/sln3tijev7JZMKLg4DN3duYy4/iklz0QF0Qt4INmZCrQmqB0HhVCKbg7qdH0uJH2LZr9uj01RSQUTFXKVFYEQbUL0+znmSrJCqo6lRSRrXlAUbCNbKYdCpXEoVGSreLVd2Q4iotQB9/SKlClv8g997ny/fOOQXvvw0g9ywWCwYDIbMyoZ/+C++z80HU3pF5DIQgaOYObtk0gLMrgE0KrZCJBmqmS8tw1BgCgnKTc10f5+XLvfJtUKPCn7mJz/F/+0f/DGbo5TJoqGXGUwI/M7r+5xbLXjm/ICtoWZ9mHCyaOhlcDRe8P5eKZ6Fur2wAnaruD6LipZc0Gn+hxC69V5QlHUTK8O/OF47RZxr71FkFTa2fWyIwGIrsxcrjkTEPqpISNDxHtTWU9UNZeNZ2MBGX5aRqtrhvVihtWS/xgqA2U4QPgb8I22AWoaC7teyAmi/EHtF+c4ddEhCEHfZCM6ZREZ8GEOW6bi+GcupEEijzVeRJqio+9dOFNodA9cypVRsF4Nceusc3qkoj6ejFXLo6odBIe5Ede06wsu88vzUM1vU5Ywf3Tzh6oMZX3pynYsbOYu65rBWnCwsZW1ZNIrUOLLI5cxTQy/xzErPpBRK8awUDUKNJzOKtR4czDxnhwl704rffnmHX/vcWSpr0QEenFT89LMb/Msf7HFhLWGzXnCwe4/+uUuSXRXS7yoEG2gqcB6fi1yYj047KiskWYYoB5ZGXX0UBNkhEHknWQDC1nFvXsnCibOEKOOlbC0uRdHQQimPjhJkwrdM8dqI+UZTEoKTgIGOoh2W4DyGmmRtlW+8c8C7t1/miy8+yvpqn72DG7z1wV1uHjUUvaJbbVZRtFM2HUW+izSLGUgAR+1KWv1DkL47aCPHUyU4JQ5Ek+MTzvY8n7qywls3jvk//ic/z1e/+xGLyQmDfh+tJDB/94MjFg5un5R8eFCylsnq9uX1jPWe5v37c8a10IG9ai2x1ZLkFi+lb5F45yMrUJZ/WuzFeziZW6L+zSkr+1M3qoPxNUqHzmbdt39E1LUMYILq3LMTBbWTK6rjBEH5hlR7eqmMi1sdAh9lwBMd245ABwzq0ze/C0whtvNLUp6KIIGoAreEAdqyX3XjQK3FzyztHHt9FLmAXAnLOySaGA+6v2etZw602mMd/7hrSQKgaXxAE3XQiRqEWqPiJCLVESQJMYvEklWpiCw7uLA15NMP9/nGm8c8d7HP/qzhD97c5/xqxmceXmF9kIlhgnfkXnTeZo1nWnpGuesmAU1cRS1yRWoFBFHKU9aWW8c1m6MU72H7zKqUkEFERI9mloe3C158aMhrd2Y8tJ5RHx4zOyrobZzBhzQSSeLB0hqnowSUPyWM4awoAocg6rCtAo5O2royOtTE0xi8VAMmZvWmEimoyC5UdTypOhHtwhDQvpKDmMR8oJRMBrySwBI/JOWlRyUEgoXBqMexg//Pd2/K6DKAyRKK/iBekggytuR228S5fwHoGIiCBATfnl4rExGTAgHvbdzjgMVkQt7M+Mrnz/P+rRN+/S89x2Gd861vv8baSo952bA5MOwcLbhxVLHR05xUgZ6BmfW8v1/x4b6It9jQavPFBKlb/r5czCz+XkxLWuFZonhozbzy3PYV3/hAuC6ldZQWFk3EroC0bSfie6rau+EVSQJ4FbN/9PZTgg2IMpA8D1HUipqaRjEYFDJQCZ6qdp14qdGK2smkKngXGYfSGsRLEhN6BCtpF5+WPYpI0usoydeVAMtK4PQXffA0MUobLRHIeUdVW5LEyPYdgcZ6VCJc8SRJCK1nYBeLVHc+QhDAwkVL6TzRoAR8C1FP3eBpvNAwJfZIeaSNQWuHMZpFcGjl8bbi3FrOtHScN9BLNa/erbi+t8f2SspjZ3qcX0npZ4I3WBtIFRQJWAfBaHQTuvZn0nh2xw17M8tJKTsCd49rfur5c/zHv/opvv+dN6mibmCRaXZPan78sSF3jiqOFp4LK4arRw+ok4R8uCIZ3MvmnvJOevx6BoBO0m5bUEaC0qbgnTDmvCV4OTG+LbNtJe2AEZtyCRKVXLxo8NmlLeci8Ujjkt5yPTsGWdWJkgibkJacBCgVg0AUvBgMcpTqSXAKQSYU3eVvd2PTWPVE7EHFxZo6gqJpJnZgaEgzfC26hVIFgJ1PqA73+Cuf2mTvqOLnvvwJPvHcY/zf/9s/4MxaQe08W6OEwmh+/9oxa4XIcdl4eUOQC+kQLcC01aFU7YlWUZOoVQKMmdT5bhEOBVVj+dTlVc6t9XCIEi8KxuM5B2NZ0JrWnltHNc470sh9UEqRpol4AMaS3MeKoeWe6LgWLUlWlsNMBN9j6ABEESiNLOImzglbZ67QyPdqK2lhGoZlBXCq3pdzHWXR4v0OwS81AeWNCQTEURZ5PApwQZxnepnYR3nv4guQQ22tw6j2mksgSH2giW7Cqt2yOPXr48YgcWnHi7iCjr6DKNlsy2KfsPCypJsYhc4zfAj0c83xrOH//e1dPvfwiIc3Uxrn+eo7J6wVmpUcJlXDD282BKfo5YpBpumlhsxIceaDcL4rq5hUjmlpqbyidoL2Zqlm3nh+5vlz/Ad/7Tn+9GuvkhnfWYovGmE7Xjus+eJTq3zt7SNcMDy2Hnj/YAe0ohiuEkyKrxop05qFnIosj9ncRU8A6e1V6/bimniJ1DK6Rzk1uexCyRV33UTQ/RAptzoRR97O3y9mCCdjQ7SU7LKHEGnHRhOcl+CCEJZaHS2lkyjZLRqCyllCImi/8kGqPZVKleKcjPVAAE4HWFmIEsnxJNJ9vQigWCsS8dWC6YMHfOGxEbnRDDbX+OtfeYn/4r/9KgkWpTIUsDHI+P1X9+QQG81hKWIb7tQF0LQU27ipR0TriGc3AnAqnrUQOQBicCvMvFEGVAu0MjS1p2waFpV4PIQAOnhGGRwu1JJPoETQtm15XRDKuw8yqUjEkO9j7TDhVPyMFfh00XTy+UpJO1o6aWV0kKqcoCLZSIBJFWI1s8y8HwsGbRsihrdqaQyyBAM//vsWCCnLmoODKQ6F8bId15YxiVZRBdWToini5Zo3tkNV29grPV/LworVRAgoLwitC0iJHA+8oLFyIYo0EbRUCSIqO9OOsyMwvuF71084t5JxbjXnpPScHQkTbaVnaKyUTmuF4nDuKK1jVgXGzcfiEqNcsdXXMSsYFk3gwczzl148z3/8a5/g63/yOht9z4O5ItWBeSX74JWVfjHrp/zaZ7b4Z997wOWNnCfXGt7fv08CpEWBbyqpttMCjOks2drhclemBTr03msdPw9D0PFCeRfRc9WZZShPvGC2m/kr2wjYFgGvLuO3LUQLAMYKBCsbhQGkEkEOl9JJ1+OGpkGlGR3BS0sFRdDyeFtL24GS5+itjLnU8iQGbcCVglvEDURfV5zc3+X5S30eOTPgwRT+7q88z7/4g9fYu3ePlZU+VWM5M0p5+9YJ904atoZy+eUFKlGdavNnvIBai+RcI9wsAQFjkeuUIlVaVtDjCUUrbBM4mTneuD0lUxbrBEbLM01ZB5o4JajscqrQqgPZoMmImT1+zxDvVBIdlisnf8+oaOhq4ln3Ua1YKRorTNpF48kzQ6I1acRuW+ZhOz533mFUIiBihP2W7TYRg4lHLd7zEFjKgp++8JIIYuSJIM2glzIaZtjGkWjNwou/mkaipo7/OCcjQuUd1sWgEtrOsh2XqC6Zhfj9CY5cG5qotpKodoQTxzLxlRijCFE33YVAL0/QzpEoxfYwYee45MbegrW+YXuYMimlDTloHFuDlLMDTZF5fPDsTT3j44bMtGBOYJgZNvqGadytrmrHZx9d5+985Um++kevkyeB0mky7Vk0kmGaoMiTQJGl3DmoePRsn1/85Bq//+YRT5zr8Tg11w52YX1bfA9ZlmRBSfkXbCNim4qoiku8xKfm9ZGaGdDyeAWqmaF0dMtV4pRMksrBa9mILU7Qoi9xz17IKi4ehoAOrsODtLdAKyzihRijZKQYlAdbopQBY+IkRsxSIW4kcqpisS4GlHgKdQKhDVLSWvqm4nhnh6fPFnzy0pDdqeV//avP850/v8mf/+A9Ntf6NNaJQctBzQ9uzkSdyQp41o70VByFtWUxLZtPyc8XCCai9FGNsz1v0DL4PFsFfObhDc5sDMmLgiIT3b7Z8RStAiezmgfHNXXjmFaWuYWjhSNROhLfpM9OtHj9OUL0wGgrZd8eApRS3aKQ0tLPW+cYDBKKXoFnRuNBNg5lLE5cmYjDE1pLsPa+tpe+7QRPhV5aoF8pReJDC1wse/+OgiviTSiisirQSxV5Km1BEwI6KHIj804TpO+alJaeChRFKn1Z13O0UUj+o+15TOxjGheYORmNoBSWZUWSarFSyo3CKfFdc86TG00Iip0TR2M9q4UhSwMX1nJGhRxO6wIBx8ZKH+8qAhK8WgmG9pdSiuOF49JaylpfMa894xI+canPa3/+HpULTOtAL5ODUySKSeXZHmgmlbi6rvQ0V+/PeO5Sn1/45AZff+eEx8/mhFBy7WiPYm2LtJB5vULJ7rz88FiGW5RFdAVV9G3Bxr6eNgqi8qG0EUrouV6LVBauJpDGjNbIIlKIG3pJQdAmUnN1nDtb+VpLvQ1ta6aWwcdEEc94SLWOPoTOghfdQ2wpSz06hvmICQQfJxcgJzvJBQdxFhX9EW05Z3x/l2fO93jpyip3jyv+N//u57i1X/OdP/+AjZWcVHkWVcA7xw9uTSU0qcCkin3wqVPezhd0N/KL6+dadWedsBz7SYALmCSlahyrqeexjYJPPzxic23IuXNrrKwMuHbtLjfdgvtHJdNpRd3IyrlRgVyrFnETnIoWtVYoXIx9cTciCNAHUf7LiZpW+zZJgjQYrcmMSJJbFygSTasopGJ1nLTVTWjvbNt6LCNAiwu01aWoHnWVxLI3P80JiNVeR1gIzqLx1LX0PlXjqCOxZbJoOJxbZrXHesFxtVasDgryTqYo0I5e5EUuKchxIEsVWqEQZNQR35DOdgl5oR5kDAnUTjwI81RcgS+tDxhkIt3Uz0U0ZLWXoIFBEnjmXMGVjYKzo5yF9V2mMDrKQYfA9YOae8cN1w8aFgH+1Q/2yPOcM0MBJKelONhaF2gczBt5UxcW9qeWQa555+6Mx88N+blPrnHtQcnZ1ZxHRoHyaI96MY9SX6V49CmpotqlKBXLcuUbYe4h6kGqKbt/ZNU2zoJ1Kghw+176ppMSU0qh0mhhLncGlIkS3ZGi7SOlpfvs4+q2t4ItzE9EnizEqYJrJP1kfZS3UM1kAkEEHJsSVcs2X7vn3+1CWCE8gZBl6vmE8f37fOqhPp9/bIU7hxV/9zc/x9Ql/M4fvkqvMCwqz6QSmq/Rms89OiTXKr7v3b3v5OaUknPbVqVKR2fn+PVW8UcmSsIENIgCdt3Ia7TBc31nzMKB0glXr+9x6/Yh43nN3lgEWl1s0ZoIQBJkctCuIwcvj6lsnG7Fx6i2Womgrjj8LEeF8nyFIOc85EYz7KXSfkcRWKOJqsMifOt86MxDWn7AMvu3lXy8T0FuU/BBQMBlno9BgAiM0AomBPIiE5ECLX2JUkL+wS+tjbzzNFb083T8sVpJVXCaitAGGY9IICspAwhBRjLi7q26FyI9lo6YQOyLIzuuqj2ucaQJPHl+xJObCZPZjCcvrXF7b4LzGUZ58lTx8tUT3u/L2mTj4HjRrmLK4deIbNS4chyX8vx7ieJgXvNbPzjgb31xm/uTGf1MlIttLL2sczy0lbM38czKwHghwp+vXD3hc0+sYK3lO1dnPLxZkOqSaycHLAarpL1B3EOPL1QpfFCopBBabNuLR7tvmQZI5gy+AaVFctt7tIsmILaWC54AKiGkufToPkSyTwTw2k3DCPgGlQhW4D1RsUEOqLNSjXgv4qahbVsCykcBFC+U46CTGICcEH60YAgohYqipsrFxSedUo2PmO0f8qWnV3l4I+e9uzP+87/9JVzW4//1j/6E1Z6isopZ1TDKNat9w6yybI0yvvTUGn/8zhEt/6T957TTb2vB7QMRVO4+7K4NnZeWR7d6PHs2w3vHm/cC80a27LTWTMZzDo9nJEbR62eMF43oKgQxr3HekRiNDYKBCWk/RK3AaKcWy/rUePl8UR3hR7CegA7LxNk4h9eQGWFmOqVJE02ijQjCKC1TC9+2PFIRLJySuxYvTTvRUqeCZJfs499J2j8IsX/qxoghDkmCIMLT6ZzJpKLyYGJUt85htCExml6uqRspZU4WDpMp+omOa7ehK8vaX+3PUhrQSTcmUdH0s+0ZW917136Sqo32ilkTeHS7x088fYWyCbi65N6DQ9b7CRc3U+4fKlZyLcKMBBrvOjfYg7lE7SRWHHJwRCQkjWYbwgZTrPY0b+3M+Bc/0PzlFzZ4796UaeWZ1Z61nqGfpzwYe/759/Z48nyPn3pmnbfvzhj1DW/cmPD4uSE/qTXffP+ES5s98rThvb0jKtuQ92TlU+bxMk7FVmCypW+gIhJ1hLgTInEo2KYbA4ZmSfwR5522okwJIYnZO+aDKBqq2tFjWxN70SBAa0LWl9FjoiRI2AbvI9knCKFHRWFP1fIUlJb+niiIGoHK4ANetUQfqVQmRwe46Zif+8Q6Z0YpV++X/Ed//QXylXX+m//u91jJJegbZaOUtrRYeWKYLhoubuR84dER37g6IUuWJW171E+Px3w7QUHIWDbuGSQq4F3g/GrOs49fJDM1B+UO79ydMq0c43nNyrDg4GgewT9xGLZB2KPWt6u3oTPj8N5HiW8RWzVGo4PwAgixS/ChwyCCouO8xNlvnP0rDk8WVFbasNpCUB6DRgeHiZM1a33cFZC+3sVx7WkIJirwfywYtPhAsnzLIvmHJWrfobwqoE0aeyhPnmaUdRzpSIEqSxdpCo2jcpaThcVEoEP4IZ3u0BKUUFFiKboJpypquisJJr1MDBHquCCEau2UljPqarHg3Q9vcTgTIokLilFuSJIMpTR5Fne9gyZPAmeGmn6WYH3N/jx0fWK7+tmKlXT9WCwTh7nmu9cn9BPNZx8b8NrtKaPCcHkj42Tm+Fev7XNiAz+4NePMasoLDw15996cPNW8e2/OQ5spv/T8Br/3xgnbqxmfumB49/6YSVNTjFZlj7yd59cVKo1IuZL3RwCiKCFmq/hY4njPIK6lgRAcWhmCVt26MbiuZRCZ5kCrUBz937oLHIxwCJQV5RmiqYks8KTxVEmQCrF100FaQfl+tqs0JKzEoKO1bP0FODk6pmcX/PXPnaWqLLtzxd/7O5/HJn3+wf/wNfJEHq+88N1XCk0WhxCl9Xhgf1zy/OUBx3PLGzuLONI9lVgUUTKdaGsvQb2xAlKv5IqNfsKOhrTf45OfuISyc3700SH+9kRm9VG+a3tzlfm8openUXtvub2KEiESee8lRwnJRsW32S/1EJB+3fpYhisVCUcyDfPxzjkXsDrgvXg9dKvyVhSShGcllmlJtDRLnIigaNUuJYXurinoiHSngUFFNw1ZfqUtKdoLoJVCI/LHvV4qPyyRHspERk9lPYkxGKPJkwjUOeETeOguVtebyO1FEXejAYOM9wQBXVYB1gn7KnghB2WRRBGQD3Jn6vnhnQUfPJhzd+wZ9DJBQWNJX1rhGQQVhR+Npp+LKUgIy1mx9FyxfIqBqeUiBEQVNk8UX/vwhDdvL3hyu8e5UcLt/QX//Ed7HFWw1Tes9DR/+MYx799f8NSFkWwKJnD7oGHYy/i1z2wxKx1zq3j+8pDzeUN5dEBd1YAAcz7N5fLFFsC3A+KmwgcvLjlKRXk5Ka2DEbZfiwCFACEpBMsLXlaTW+wgyN8DlhMB20TCUEpIs2XwUUuhTuJUgaaUNeWIOXT/817OkW+1AGTnIERfg6puONrd52Lh+I3PneHguKQMKf/Zv/0SM1/w//wfvoEJNSZJmNeB3ATWCsEp5rUAXv1UURg5SPePKz732IhzQxkPm24A3tptyRlLElnhrZ2nSBTPncv52U9u84WnN+mnCSvDgqtX7/Lu+/e5+2BKnorrbu0Ui4XFNp5BoSnrOrap0r+XcpMjthATqw9dry2xstX4bxPY8vy343DBLiKNN4LjRsPaqKCXJeK16S2ZcuSq3dmQykHFWt96H7U1llm+/VHdnfs3/EpU95AIjIQlX3j5XEXUoCobIOBd21/JEzGAayp8I2O6VMekZNqAomIwOQXSKEBJCW50jFfxjXAxggbv8ch2oEUAliyatOkggcColAUwXZScVA1PnhvgLMzmFS4IkSc1ml4qqkWZMeRGs9VPuHFku4yhW4ed7q1pKcfxIIVAauT1/vF7R0wXIgX+ys0FTcRJag8bPVlm+pc/POCXX4AXr4z44Y0xxhjevTPhoTN9fvOL5/n6m8fsnJQ8cbbP5szy/u4J08aR9nqkyuDjxVXESsvF+bxKI11Y5usoQ0CLxLbWkaijoutuDVaim2p782Bieye7+0oHydbeiiw3MsJFJ1Jl2CpShZuYWhLZM1Aab0zXOsabL4t8SoEWb4VghTE4PTnBL2Z87pEVHt/Oef3amM88u83f/MoLfOu1Hb76jbcYDXIhzbiGXINWhgczRy9THWMz0YH9eaBIFKkJ3NidCRGGVmg2iHtulOAKQUhAZRPY6iW8cGWFX/r8FW7vznjl7R3mjed4/5A3Z8ekxlM3LsrVCQV3WjXM7xxyfqsQ6rAX4VMXGZAqJpC295Z2wJ9KHKa7hgIcygUQyvESdwsR0dcdOA4nJzNcIxb2Yh2n4oq36kb2npYmLwQmo5bnl0A0jTl1y7szLhhEu3Aeq0HJNN1KcOw/ldKkOpCnsp8foOtNVBxl1E6xUhgBCpWsD4sBaHzxtGViSwUO3bzSuYA2ChWEyaVj/2aI3mZIr5poQ9MIBbhqfAwk0gf1k8BTD63ywpUR33l7VzQE8pRhbklNImYiwdLPhES0UiQyQmSpoSaEF9Xx7XWg1U0nRNVVH2QD8ns35xgVNeaDtA/TUsCz80NxrPmd1w+YV44fe3zEm7dm9LOU93cW7I4Dv/TiBq9eO+bVW3POrGT8+CMJb92bcHg8xw1WyHs9tEkJOqCIxBofe3ZddPReQojLQ0FuQFQiRhtpFQBUP1KNBbhrJwCq8TKaUoaQZBJEfC0KPc52AF+bqmTcV8X6OhEB1HjL2iWjpfmJeAPWTc388IStfuBzz23Q2MDVBzW/8pNP8IXPPMY/+9p7vPHmNbbXenjvWeulTGYV3/rgmM89vsmT5wo+uj8jyTReKWzQnBnIbn5VeT54UHMw991ijNFLBLxNYLPKsd3T/OwLZ/iJT13COcfBwRHH0wW1cxxOKgqdQ7DMo2yw9R4ahXeBtbU0VqGSnOaVmJn2E0XjI3CuAtHZRU68j5+FCuhEdYq/0mq240Afq1DaiWEUCg04ApNFzbxckrhcZMK2xKHY9nc4RGJ0B9ovE/iy7u9astjWRxBQ04Jt7UO99/GbSXRxzkWPQCUaf5nG6xSDWBcrL+YETSR8BA1FIZRW66OYSAxBPp5TbULnjNL2Ji4+1ujQKQO5IG9wEiNeW/4QPI1TDHLNr//EZVZSQy+Ftz56gA1CKNpeSTieypuWJ5rGOUT0QtPva4aZjPCMVt0yiEOhg7CxtBYChzwXRdAp1nuyNFDVgTMjQ6IC08ozr+U9KBvH7lRzZphig+Xr7x3jQuDpsxmHCxjlmsm85OtvVnzxmVUeP9fj9149wKN48fKQ+8cV1w8PmZU98tEqSZZGTMKJfp7SaFon4qgo76yAgRFIDN7LIUOjfBwzIvP8EJwcVgnFKGUIrpZA0YgOYmgZbOHU5Q9BmHvByRgwxNYsuh91H65OAE/T1EzHMzJX8eNX+lxYy7m1v+Di2VX+w994gQbN3/8nL1NOj7m4NcD6wMW1Pocnc/74nRPmFr729gHj+QrPXijYHdcUiYy6ZgES53j1+oQ7Y9/1/B3ohZw3oxR1gPXC8AsvnuXLn7nCK6/e4Oa9E+4dV0JTD47GioKwtZY6ZuY8MUwW4nw8Gg4I9YJpVYvVXKZpnKdqpO0om2UJHyKIF5SK3ZbcrVSrzhI8oyXdK4wSDwtnI4YQk2aiDVmqurViH1sL2bGQgNK40LUexADQYgCS92Mw7mqAZVJvsZzkdJxQehk2BTgLUdRAMy8rvApYkxG8JksCeNDKd5xuGzNy8DCbN6xtDiQy0w4AhXQk/Yv03y0xowWRU6NoXEAZTaYTgvNCnW3jl5LqwxhDE8SS/HjvmNf3F0wWDaUL1JWs9g57OXtHJTWw0dcoNNbLCvAwhdUiZVyVeK9liUmJIKRe8lbl8iHzfw9UVcBaz3MXh9R1TW096z1FkXpmNXgDc+u5O0YoxSHwyvUJn7x8jlHwjBeBtX5C4+Dbbx9xfrPgb/3MJV7+8IS3bs5ZH+Vsr+bc2Ftw++gBVdYnH45Ie6kAc0rFcVqDbH8hoz7bCOKujFQwQbYJvRObrmAyyQ4mB+Xk0vsaQjwC0Z5L2UpkurWJm4pCHcbWnUYByNZciF6CPj6XALhqwWw8Q9dznj5T8NKVLcYzy629kr/2c8/wpc89zZ9+532+9cp7DDLQmZCBLq6kvHp9zI9uT8hTxdZAc1IGvv3RmHnl+PTDQyalJSBu1W/ennJ74mWxWS/dfkRhSrb/HNA3gV946Ty//pXn+Z2vvclbH+3zYO6ZV1bEbK1I25+Ujl4az5lSZIkSoxsb+OjWIf3MM5k1LGofXZik2vCuxY3ksrfK1y27VrOcrrVkf0VcB473xUeQsnGuu39VI69za63P7skJSaKiHLmQiAISfJSSxNkCbC2GdbrvV/Dx37VRsh0D0pYLoX0Dlg+Xr3tZNDAJJnh62tP4QFU5skTkp1RofeaIOyfSWxqtZHc9fq+AjAVzI2MhH6O1D6C8yIwJJVbRBHmXFYpExW0pHeXIkOc6qx0/uLGgcYHSwlo/IU9rrt054tNPbjFt5O+eW8vIjWLReMrGsVJkXNnIuXlUCh+B0zsLgi+0kUlpLaWZ9Tjr+dmntyirBbcXgcrCmaEhqRXgmNVQpEISOiwVrgr8h3/lSR45v8KffPs9+r2CaelYKRTZIOHeQclssc+Lj6/z2FaPP/vgiKO55+kLQ65sOa7uzrl/VFJOexII8ig9nuQxK0eA0IuijkpMHDMJG08rLXqDITL6fEvLjXgBouEfgpHMn6TSCkDHbAtNJVRfk3XS5G0G8U5m1VVtqeYl1Ase3cp44aEtVIAP75U88dAa/+nf+kkOZ47/6h9+g70He2yt9plVjlHPUJjAn7x5wIeHNRs9OegHi9CVuj+4M+Ng1vDpKysEH3j7/oQPD2x0oeqeSjfR8SFy80Pg/Ejzb/+1z/BHf/oWr727y37pGS8skzpwUnpqFzg7UmwONMF7qgYaL4d4XtWsDQzbW6vs7B7IEprWOBcwxgu+EpNSqyB0+i5Z5yNpx2NbT/Ig40MUMtuJLUSIybkt5Y2OS2CiG0yqU+GtBnBBxu/tdA0kYCmjuva57fPb9lt97OJ3/4quRPHct09EgkNL09WxJE4wSUKeyp+VVUOqhUCktQInJb1RhnllGfQzFmXdjTtaYEO1TyY+Px0vvvB8FD5GcHlCKgZNT6PirD54ikRT2hDLLsWJT6iqhnlVU6SKFy6tcmOv5MeeEPsuYwxrhWKtb5iWntrCSel4/GyP1+/OWDhHlpjuzLf4RctQ1FGxdTav+bXPnMPVJfcPG3qJZmEte1PH9jChcdLXzWuhKJ8sLJ+8vMZnnrvIP/4XP2J1kJOZwCiXcaoNmpVCYy386Rv7XNku+Oln1rg/dnz3g2O893zy8ognasv1/QV3j+ZMdE46GJDlBTpJMMGhypKQpIIP1KXgBQoBD2M5KhffoxqhzymFXOoI9HUIUWtuGmTnQBlBm723KJPTynaFIHz1cj6nWSwotOeZzZQnzq2jk4R7BwvOrff593/1Uzz00CZ//P1bfO/779JLNb1+j8Z5tocph5Oab1wfM2kCF1YMpQ3szSWoJXE0WxjFraOao/kh/QSOKmkt03hmFKdov1rHrBpQ1vHF5y5xsLPL91+/zUnjOVlYjhaB49KL3ZuCuycNqExchUuZFDTWkhjNnb05RZ6xtZqzezQXpN0HaitcgCru9rv2fMduqO3PFQIKiqVanEvEu+Xc8uKHCFwoBOw2iaYJhtm8IotTDGdDrG4ErK/j75WS5aS2au+y/8dSf3sPw8f+IPGx91dxLNfKUygVKbhBemGCY2fnkPHCkWXSjw8HOVUjb3rw0hcZ3Sqo+LghKJhAe74CS/omgTgt0B090QdZR02iiGJuwHrRV69cINcaHVojTE2mFBkJtrGRoai4uN3j+s6Eg7FjpZ8wKRuakPHkmR4v35h0MmV18Dx3sc/L18cEZAf+tEecR4sIpofjkwV/4/MXMb7ho8OSLDXUpWWYKGoH9yeO9V70jdMiGIGHv/1XnuXr370WqdSycTavXBwryiEOQdqIW3sL7uwvePLCkN/4wgXevzvm3XsLnFc8c3GFZ7zjzlHN7eNDjsbin5fnKUmaktgGHRV5ljLgqvtclQpgLSFYUJmU9CYhYAhJT8C+CCoSxUklIiZRJTrgmpq6qakXFTYalZ4Zai6fz3jkzIB57dkbN6wMU37tF17g+Se2ePODXf7+P/oms9mcIs9BBTIdCM7z1u0p7+4uyBPFVl98Hya178aybVmrlayAzxrPtJbfyzaqUH2DiuYcWiobJfmI9V7Cp548w/devcW8thzO5O+PS08vkcvmjYwHP9wru+y9PTD4oOhlirWBvH7QpIlMoJrYjyslewg2gIsJnhgiQZKTOVWVKNWaf4RYc8rjjVaR2h66tW/ng1A7vOvGiKmJAH0QuTzrZXqQpcuRfEsnX9bbf3GiJ3eaeDYSrZcXv738bVSSCynRBZ2wtT5itdhDG8VCGR4c13hg1RvyKP9dW9EH0EoEFEIXjpZRKZz6GVprai9P3ihhcBlE2dQ6wQTSRKGcTB9qL29emhmMtQQF47Jha6XHL3/qLA+fGbF/cEQT4MbenIe3M/bGNbWzXNkueO32lL1JzdYgpaodn7w04OZBxe6sZs0kXf+mtSY1WgwYx3P+zs8/RuIc7944xCSaurQYrRgWKbePGm4dN+xOFNsDw+YwY2+35Fc+d5aVzHP33iEXNgvKxjOtFXkqY0nrPbNaUVkfP0SZP793e8qtg5LHzvb5uU9scPuw5Or9ObUNXNgoePTsgFnVcOeg5MF0wXgWmGHQaU6SiW68doKTqOCW3A5lpEUIHq90FB5V8fLHD0obAQ0jc9CWNXXTYKsSX9WkODb7hsvnMy5tbJAYsXK/c+J45NyAX/jiZZ54/Dx3dmf8d7/15+ztPGA0FAnraWlZKWSRSCvF3ZOKzIg0/FEpfJK2pCcmpVYao52VgwTolscvnDAFkfvfglzOwdow4+jwhPduHbNwisoGJlX0oIiXQRNH161ZjIdZ5dmfiqvx6zdP2BgsMBoOpw2L2jJvxMq98SECiTJBanWvWqRdtv8USXcFYwb0Aa9D13oqBGtqqwgNHee/qyji5bZRUr1V1O4Q/0jRX1639pmcwvhoBXlaOn4QPQClpBJs+//lWrC8oa3LLgTKylL0xHN9vaexAcazis1RJpxmrT62cCHaZ6F7/Qoij1o4+TYICu99NESISrUuVgGVjUinimoHSjKyir2vUVBbz+W1hLXM8r03b5ElmnNrGW/fmfDcwxcJzNFKtAof2si5eVxhnaPIEk5Kx5eeXOVfvbZPZeVrLkpIORc4OFnwv/rJywyTwCvvP0AbQ9lYlIKVXsKNg5pb7UoxgftTy4OZZXNg+KtfepRvvnKNs6sZ3nkyI6u/eaIYl/L880Q+kH5m8JnieF7Rj1uMf371hNW+4bFzA5777DkOppbXbx5ze7+hnyseOzfihVxzMqs5KR3j0vJgUjFeOBY+CoKYRLYHle7am24HoFnIMfFWGGzWiuuv9YIpOEcSHINcc2ZouPxQn41BTq/QjKc1R1NH0e/xzBObPPfUBc6t9/n+O7t867deZn/3kDQzrK/2MMgBXsl1nCzA6jDlC4+u8NV3jzmqpQaOFA9OG9UqltyRFgVvx78dIUZ9fMGnxdhH/ZzpvMY6y7SUpRzrRFijuyZtMIiXr/UrEAKXYlo6ZuVCJBO0nNEQhM3XeiW21a1cLsn07RJd+6vF17smu63720lB+ydqyeSbzUqU1tTOY5XckSKJMvru9Bat0I5tort83w7g4dSmZPs6oXvSSfeiWV5QKXliz6Ba1FJmky6WI0YFamvp5Slbqz0WZdN5nGlkj15ZAZM6A4X4d1uuso/B4TQF2UYgNDNxFKc8ldUE5chSEz8o2bJqI2c/S3nrzpjxOGFaBx5MLY9uFRxPaz66N+PcWs6tvRK85pOX+nywJ+66j51NOZhahr2Uzz865NsfTUkSQ5EKor03nvOrnznPZqH50fv36RcJx3MBvc6upLyzU3LjqKYnqgoorci0ZlI6Xnr8DNODCbuHJRujVJSHtbQulY29KiJOmir41ntHPHm2zycujziaW/bGFf1MUznFe3emXL2/4JGzA37hhW0qG7hzsOD6/ZLbhxXWBga55sL5IU+dk3nxtGw4mTdMyorKKaGvukDThFiOLnODUsTqK9DLFb2RaNKtDwasDkRvsGkCjXUcz2qOF5qHLp/jx84NeeTSKpN5xRvv3+efX73PbDJjZZAxGBY0VtrAwNLwJTPQOMX9k5oLqwWrhWZv3l7KdsQbmXWnkobR6pSQ7JK8FSCyUOVQeR+61me9pzk8LplFwZCWJde1ojoGkngfW/WgxnksmQjaWt+9Pz5oqsZ2Sz4uAnpayXJZe6likkerKJbTze8CLtbYOv65gHqhA+DleQmZybrAovYdSS1Nddea+7g8lBrhqFjr6WVJpzzcZvyP3fc2uJ7qCZJWs/9jM9RTlNhYEqCUpqktWSb8/9rHrzlPnmpWhgVl1VBFDXRrHanMVTr99BCDgUY2/1RoxyYtaTN0bsGNlT2CxEQl2bbHQSS6XCRlNAHSzBBCxnv7Jc46aue5dRB4ZCPl+1eP+Guf2UQbxWrf0MsMz5zv8f5uydYwo5+lVI3l0kbBp0rLq/dqtFYcj0t+8aXzXNrIef2jPdI0YV45UqPZ7Ce8eW/BRwc1/VR1pSRaoY1mZaD5zrt7JM2CR84ULGrPvAoUPR2zhrRWvcxQJCl/+OYBN8eWu+Mx7+8uePGhIQ9t9bA+cDC1NE7TWM87t475cGfKxfWMM5t9fvr5TQ5OKlyA43nN3WPL8bQWE4tEk+c5vRz6uWz6tQYsLRNNZL8E35EpiLgYlbWlcbLdOTkpSfOMM+c2Ob+a8tCFEWtrYol2/c4h3/5Xr7GYzQjOkuUZ/X4BylOYQF3LCDczWnwDvVyULC4NNs7ywqUhX/1gHLlosWxdJq+ONOND9N2jRctj9latqoPqdAuJAe5kWrKR+w50agPe6X54edalBfVOzuKNwxIfYJAqRrk6tWsA88bTuA6iYFK16H37nNsXIHJfRqlu/C6CNjLtapexpAJeYnERDmNtfURmTlAhkJuogRE3UInbsi60xLp2zcMTWNYB3evtivBTyV61kmAdbhA67n4bedu/4FzAW8t44VgfJRRZgo0gX+0CTW3ZXutT1TVHU8ui8fRTF6mYyzKr7SzayUAbLWU/WpB476PzitIQPINMCDptQ2Qbh06kZ65qS2LEX2Cln7IooZ55HtoacGUj45vvHXDv2LI+TLh7VLM1SvjsIyNuHNRc3St58px8agczy9MXhox6Nd/8YMovfPYRntpKePPD+2yu5OxPahId2OwlvLWz4L0H5fLyt/9EYreJZdvvvH3C01sZX3pyjUsbGXcP6yjioCibwOW1jK++dcDtcc1qLqPDvWnDV985YnOQ8PS5Po+cHeGdBNZZlLbeP6m4eyDlYZYmPHKux6PnRzx5JaesNNNyxmIRmJYN07IRrsTU4xoBoAIyul2ULvrJgckUWZaTaNguElaHA9YHCdvn1xj0ehyOSw5Oal69useNOx9xfDzBaMWgEKeaxKQkCtZ6CTtHC96/O+f5hzc4HM8xqQiwJpliUko6WOvLe/TIdo+NW1PGtSc3S9q43CE5fYJ0q+gkHWLbKAGjrWQMENrLHC9fbSU5VREtP72R2lYSJiaoTv9fGbQWZqH1MMgU59cy1npJdB6yLJrArPaUjaeXGFxwLKxcuxa7bNsUrdolMwSgjS8uiYY3ct5DNxqE2FoE8UOUEXno8LKoekhbLwSEhatUBN/b0e2p19o9n3jfVNtHAUnwp+aE8b86YQpkfGG9ROAsS+ILlEyRFwXBOax1NM5xOFnQM7AxMMzrwKJuoi768k2XFxgwRoAMh/Ds89R0j1G63f4ScUXnHUmaoPBCAw5CxmlblLoROyrrYHN1yN/8yTMMcLz64X3W+oZvvnPEb37xHOOZZVoGbOr50hOr/P6bR5xfs4x6Yj12NPc8sl3wiUfOs76W89Z7N9leFfeZ2sP2MOPD+yVv7SwERVaRehpUVLoyUd9AlpZML+G9/Zrrhw/4qSdWePp8nwfThqrxPH4m5zvvH/P2Xk2ixbBiJdedeMTx3PLdj8a8enPK5Y2Ux84OWe2lsS+1FBmMy8B4tuDPP5hT1ocMChGO2BolaJOxsZJxdr3HcNgjyQeYAHlR0NgGkgSTpxhn8UG05OaLBXVVozWUTWAynfHW96+xc/8YX1aU1qOMYqVn6PVychPo5wmFUejg2BtXvHN7wr2xZdIEHjtneeRMnzv7c7JCgl6WyA79vIbSQpE4ntrOefn2guwUALi8/nKoO89IrTEmxAQhacW0mJVCFtBcpCUjqlHDXLGoFb1UcVK1ijkRNFTCtktidWQ0sUKVWzjMU/IkxSP+fKGJmR5HkYjeoPXd1ela5jbjBYiWb3KfcAI4du0OrSQ4kVAXkYKgyLMkiobIc1M+Lsw5IkMwypcj4iEB0BFHA9UpsLXv6V8MCp6w1ANoI27nEkS7HqziOBAWlZMKIe6th0YWPYJ3DDKZd8wbj4l+7ibNCS4QIsLsWdoxBZZPQCt5I4XRBEmqpffSSuTFvaWqLWmayOJRLKNj4wRGo73M9x/ZKtDlnD/7YJ8kM1zZynn37oLXrk94+lKfq/fnTGvFmWHCJ88XvHF7xmceHtLPZe10Z9zA8S7mjsUkGcdzS+0CwxRu7Ff88M6MQbqcpoYgGcokutsKC/HQqqAZFgZrPb//7glv3Z3z448OWO0lwnq7u+gckQ4WgXmjWesp1nqaRbS7bnzg6n7Ftf2a1Z7h7ErG2bWc7VHGdt9T5QUzG3DOUjtF3Thu7tXgZ1y7FzntMbjnqUGbhMaKJ53SYr9eu0CmPNY2UXpd0C3nBXBK0oQkN2wM825MOoxtWVPXvHdQce+kYVyJL5/WssD1p+8d8re/fJGVnlSLk9ozyoSaXVlPkRhq68hMOw5tW1ApT1VYLhppLRRtzzKztgda5LeErNUuBpW15+qDkvFMvPyOS8/CSs+eOIUx7UiuFaxp906kPE+j2ejdk5qdcUOmhertQqBqJIjEZcCIytPRctvWBNSyXVHCa+hYsaE1CIlVjGp9HIl3hcg6tJL5YyAIvh0VSkugghdAXMmdEF5CbHnaYHT65qslK5cASUfS6SJDHCuc+qJXgapuGOSGLDFSHrmAC1aUSoxCGY13XswKgpQ7eN9diLb/D1Hu2vvIwVfy5jUO8QNQBmuXcmHBe7Qx+AgotiNGHT8gH0shjyJNAq9+dMD+nuawhP0HAqR98nyPlz865sLWgF6RUk8bprXjc4+PmNeW1+/M+OT5Pqt9E1VZFbVPsKWNoGDgeNrwvRtTemmLMi+JUlkqn3yilswsyTBymIyRPvLetOF33zxme6B5MA+giXLqcjhK69mbwiRVrPUSRoXshpdWALyTynK8a7m6V9JLFaN+ynovZVQkGC06CNbVMr6MarKVN9Q2kGpD4w2J9iSJJniH9pbaCiFp1sTNyyjEqoxi2Eu6EdRKnuCDxzoYL2oeTBoOpg3TWp5/aiTDVg4WVghik9rz8vsHfOHxETcPSrJouZ5qWO0lzCvPm/em3Di2tHoMy+W50GXnNimZuFPi2qY2BgalBQhrXZaC9zx9rs/FjRxtRE13VjqapmHnpOL63kL27wOdICxo+f7aUDUOHaRKLa1nrW+4uGpYyQyLRkxpc6PZnQdq50lPYRPt2E6ppZ9FS4EX1L6lw6tu6tCO4tvbr5UWI9BERpdGAdEAxCOr6cYonBc9AKXAWx+Ziqdvc1tFqa6lb+Vf2nIlaSeHCrV8AUr6WO8F2gxBDkSaSxkeINoRq+hIonC1GB6KLHIgzVLS6FmhDN0PDchKpI59jfOSMVqWlI2MQpRwAoISVLOXiUORj71gANIsoWwcwcmLMklCUJr3DoQVmCea++OGp8/1ObOS8LU3HvAbX7jEteaYPIGT0vPZx9b41gcnvHl3znOXehRpQj+Tyz2rNKlI4fPKjalwFGKl1GrOGbO87InRot4agx1akSBS3k1jyRPhkN+NC0pJBLBsPNAruXy/sgnsThpyIxuWgzxhRYsFWutVMG8848OSm76MhA65hAHFSiauMufWch7ZHrA1StgcpWxv9MiVsMzyVJMoxUnl2T9ccDx37J/Mmcwddw9r5lXD/kR2/ltC17RyzGqpTBINaSKHtPFy6ds2tj2DqYY37i148mzGel+zPxW03wfNhzsLPjqsOSrlvUij8WU0GScoooQ2nZ6fC1JOKyWruomGJKpOpYlgKNYFNnuGz13p88XPPMJglLOzc8Td3SnHkwUraeDBScWsllbLtvW3krPWYk9igGtITKtOrdkYZhxNa/JUyR4MLSchdDyFEHv9VlIvsAQFG+fjmHyZlrWKWZ3IsVSC8PugqcqaJMmwXtbwHVq0DVSQCi0YUiV3bhaWFOCPcYFO9VRL8HP5taRl/cWYEHPXkgcQAmSJ4f7BnFc/PCZJU8azmqJISRODb4SDLm2Np/FgvRBRVCpli+nideieiazfejyJREUts+qWNmmU7F4rAlbJXF40z2NrouR5tmMPqSwkIPVyTaoTjheWR86s8ImH1rh6RzTev/7mA37x+XXevTNlUCSUjefnn1nlD9484u17c56/NMBozcncUznRfV8r5MIsFo5edH5pG71u0UOJ4ky3Ch0EsW0/0CRoQtRSTOKIp3FxLyJRrBfSQtQukBu5zIsmsDez5FqMVweZZr1IhILbiL6c84GFhXkTGGjDY2eH/ORzWzz7yDobw4S1tT73x4F6OmVhHXfvT0gSI47LqSZJEpqqYXst5/LZLXqJYlFW7B9XXNuZ8f7OnJ2TmpNSrNRSDVkipBUpqSX1KU1nvxW7WIySse4rN2Z8/uEBIcDOcc3to4YHM9FUTFp/CdXSaaNMm17axrcipV3GJ5Ci28lat1DjvaexDjF5hf7qKm+/c5Mbd494cFIyqRw2AoI2+OUIECm5vZeWwyRGEHUdUMrFhGdYGyTULuBcSWKW98vEO9SOC5WORJ5T2bitjK2TxJcmWvJxLLXbVgGllhyCyMBNNXL5tcY6R/BSbargqQKkaUo/iwSh7h6HU8j7Enxv6/2ABNukAwgifNqJYISWmCB2xturI37+p55n93/+HocnDVUl5pFayXqtVgrr5WDMawfKUWu/REQUHULbVhnLZyfyS0qBit9LfrYRjYJYmiQ6thVGEYLG2qW2ndKQG0ONcNQbH3jpsW3+6qfP8uG1u2yNUj7/xAZ/fvWASxsZT1xY4b3bJ6wOUo4Xnl96foM/fueYH92c8ekrfbIkEXJFUMxt4KefXOXPro7lQiaKXm4kKMUAhFqSmtomwKiAc/IcjZE9idoFqkaWUIpEsTVIGWaKReNoXOhso+aNkD4GWZwHN5557fBekaeKQSaTGYthY2D48pU1fvFzl3js0gbTJnBytOB7b+1wMqs5OFpgdLTO0oZUeXTSbvvJ4WqaI/qpopfLzsf2asanH1vhxUdG3NlbcH2v5NZhyf2JZXfciAmMFiqsKDCFKCXKxxar0gRuHjboMKVxgfsTLwIqKiwFWdvsFJaXMYulvY9+BF6prk1YXjxii6U7hluLJV19MOONf/wdbCSS+UDn9mNdDDheLoGKFWeLtKPAGIOPoHMgym3FJbc8kdfcrlVrtRy5tcFMhFLaFqAVJVWEThIoBrYQzUK8rAtLtR8IJlAUGVpJokgj18S6eP7jxidq6RLc0ulV9//tG3sKnGzb1/hfS3twFW9oCLSTxPaFVJXl/Plt9g9n7BzMWBn1aJzDdr59gcZaUe5NUgaFOJUWsTdu1U/baEuIiz0sn5yIGYroiEIu0+nyySNjntbWWiHIv0Tx6HGnDUmiKUiZlo5nzuTcvb3L3rjhzfs1mTE8c2mNb79/RJEZHr844uq9KaOeZt4Efv6ZdX5w44SXr814fCvjzGqGi8akWZrwa5/e5u5RzbW9BTsnJTMrY7ksMzH7CWc9UTK90EaTGxGTrBvZO9cEtgaGjV5GnrTUU8E18lTEH2dloJ+JhVljA1ZBLxWP+FkDC+uZ1IqzqwU/9eQaP/nCeV54+iK7Jwv+9Ac3uXXnENdYeoVhfVRw6cyQQZ5QZBLMqyoQMMzKiiJPSLXw7xvn0QSO5pabuxW3dgN5YjizmvHSIwPOrhhu7i+429fcOLRMKwHHtFoSX3R7tE+XmUZx88R22S7Ry/l7ezDbsVkLoLoAKigBv7wXBSjTAoPCKOwybPCSHRHln7vzmrIObK+krA0SlE4pa4ethSsxrmSt2QVBzRMl1aOOz6tNmcZI354aoW2PBj3Gcyuvl2VuW3IYEAMQpL3yscrQRouvhiKyZMVdeznaizhAZBZqrUgSzWS8oGoEszFaWsUsaSXdNahAsE4Gg0F2V1w4JT5yqu5umd5073fcBWg/JNWG1baGi/FAxTFHoj1HJ1PS1MSZvEgjozW1DzRWnHI9cpkHfRHz9KF1TpWfrmO/ZH0U/giho94qpaOgYoirqkrcpogjjbih51j2OamRZRzvBFltI/Kwn/C7r97npUt9fni75KQUEDFJNZe3+/zR67t85cWzPHZ+wLX7c3qpJ4SGLzyxyvao4rvXxhwuPI9s5igM1joOJ46tgeGh9TWcMtw7mnP7pOFgUjMpRYqrioYPbV/lfaAwcGHFcGbUY5QZFnVDYx3jshFpcS06ioczT2VhY5BSJKI8hAqisegVs1rWsAd5yqcfHvHLn7/Cs49usney4H/63dc4Op7RTxVXtnqsDnMWtWdWNhxMKj66X3E0mTNdWKqm6ZxojNHkBtb6KZujgq2hYdDLWC1E0mu2qHlvZ4EmcG4t5cceW+HioWWQTbl1pNibNvFSt59wzGwsmW6CC2jQoZvf+yj+0gaPtm3otCNPJQjdyvzEM6rax2lNbhTz2lFXDttYXrg85POfOMeZlR5n1vuMJ3Mm4wlZlqEVHI5Lbu7NuXp/xo2DirKR9dqVIj2lWCXf2/mWbSpciY1hyoOjNI4jT1N9lzv/H5/7i76E5D95Ua3Yjkws4nkOMp2QqrtVow4o4jq9F7k5begWs+rGdvsCIfaaCsGC2pvejkbbKw0f7//jZELHt75l6LXRI85dg0YnisWiZGWQxRJNxcjlmSzEvTTRwnJrnKMsa3q5yHDJAVjGIhfls3TL7mp/lg8o3U4JJAKq2NNIH7j8QIQUIs+jjpFUKlr5YHxQpEZjU8N3bkxQQVR9Z5XnofWUzUJzMM743R894Gee3eDRMz2uPpiTOk1iHI+fzTm7ss63r854427F+RXDmVHCINfMKsfxYk4/UZwbGa5sDVBqlfFcnHVmVizPDYIk56mhl2UEXzMpLfvjiuOFKL0OMoMPgaOZZW/u6WeGKxsZlbXMK5mgJEpjHRwvHJUNXN4a8uWn1/mVn32Gsnb8ycvXOD4e0ytyPvnwGoNUcXO/5I13Drh3MONwZml8RM7jWFcb3R2JuILC/txybb/EgGzB9XO2VzKeON/n8ZEsft0/qjiYNGwOUz7/+Aqj21NuH2nujhumpYsTEpYZMl4COVuy9amUfNYmeuGdnkIFVNdDt3oPWrUtnrSMSrXORVKq1w6qJvDI9pD/xc8+wZVzIz64uc/9+8d8cO0+TePQRsajXkGRaLaHKeeeGPHSpR6v35lz9bCmbCxZmojgSixTpSBeSnYXmXAY2qWaEGK7E1+Bic/RqBYgNtSR+NUGyFQbPEsjkbYv7sbJceoRvMIhzlCNkyqAyIOwTqrlTtkZh3MQghF6vWpJQnGq15Yq8rK64Or9KUUg2gjMMtgSgTqtDOPjGc1sDDrB2hDHD4bUuLiyKz8wVQFnEKJOorrD0EZ1HZ9B59HAcqkheE8DpPEDFwxEzDt8ZFFbiQboxHRARpbKG++8x0cVYa0UeZLgM1ErmlWOZy6O+OzDK/zg2iGfuDRk52jBH75xwOcfX+W5S33uHtXUjedeGTizkvBvfWaDD+4veO3WjNdP5pxdTbm4lpMnsgfuSo+dlphoVJobzWqq8UGClfNQlguOpjOqZhlUh7mUtZPSszd19DLNSw8N6CWKu8ciblJkikQlnJSeBxOLVZpnLg74937hMT77mcf46p99xPVrdxn0M556aINhYfjue0e8eeOIw0klK6oRBUqMokg0WaJJjSEzdCMjCdo+YhOWxsG4CUxPKu6flLx3b8K51YynL67w0NaA+ycLbuwt2BylfOrKiCKZkWnPzhQO55480nx1ZNa1hJs2GNCWu9BlXKWWEwQI0UtvCUS3WdUF2dL0zhGCw3nNog785HMX+Ft/9UU++ugWv/1Hb+JdTT9L6OcyfZDMmhK853BuuXNYogKs9Q3PXRTb+JdvzljUll6WdGBgnmrqRkeuvoyk01MZtq1k2w5aQdxOjFnXC/EpBCEkDSJuNKlsbGNaQpNgC/JzQSu5d5vrA5Q+6ghSwjkQKzLUsooSD05N1bhonrtsqz7GrAJQSwRAKb00B+2Qf9XONAOte7pRgSKPq7LOkqftDkBCkim0d+hWEFKJ3ZGPRAeBFnwHmHSKw7GcawNNewBMDBLt+BAlixdJshypeCWiCcQDESIcnBCoYsRWSOmYpQmNtQx7mr/03DYf7uwTUHzzwxmX1lKevTTkex+dcDCz/MQTq4wXlvm8ZjyHo0nNpY2MR7YLbu6XvHWv5PVbM1YHKauFop9pilSTaiFlzGpL3XgWjZRuidGddFQ/k73z2sqq6ax2rPQyPn1lwDCD/WnF3sTHUZ60BHsTy/2xxaQJLz60yq998TLPfeIyv/U7P+LB/WMev7zCpY2C9+/N+eNX73E0t3ilcYiTzFqRsD5MyRNFkRryPImkLvnsGutI4xiNIAYTzsm472jaMKsdi9px67Dk3lHJ2bWcT11ZY2OQ8dGDOfePHY9uZwxzjdqRjcsHExFlWTb4S3D5VB6KOJAcEBeWNt4qAkWJERp48AGhuaruUoFIxM+rmr/80gX+nV/5FP/zH7/G+x/d54nLa2wNR+ydNFy7P+FwZikb6cXX+4aLGz0urBXU1jJZCK337FrC51Wf712fUlXiaelc6Ci5bWByiGCJZFnfIevtY7LYV4vzlMjBd723lrJ+VrdVsFz2oJYJV7ZgxYfTE5jPFmJVFlsQCSQil9eWIM7FHYBWi+x0Ag/Ee3cqCLTtSKymTkmCLR8YTn1Nx9EcUWwyeCea/0qcgRKjoyqpROrGOilTfBBCjzqFSKL4C/GoW2LIEkH529IqFqsi1Bm8CCAaLZZ08RnauHjU2jDZINRiqU4UjVNAGiuQwJ+9+4DtvuK1OwsO5rI6+/yFAc9e6PPWvTn3jmp++ukNHj0zYPe4kvXR4xqlYHsl46+cGXA8b7h9VHFzX9hviRa5cDEj0Xgvh3dhA7VtcHGUWFoZiw1yzcWNgnMrOYlWHM8q7h43naJtahS5Vnx0ULM/c2R5yqcf6vObv/wso+GQ//G3v4+1jhceXyPLMv7JN+7y4f0JaaqxGHKtuLSWc2Y1IzFSEmpjyFNNvyd+A955vn/1mOcfGtDLUrRW7E1qBkVCZjT9xrHWTwl49sc1t48bFo3jwbjhD9/c4/lLqzx1foXbhzPev7/g0a2cFy4N0PfmpCbj/riOSLkE/I4MFpWVIz8mTo6kPWittFvwrU1GOmYLpURgIygZu00WlhcfWeM3fukF/vnv/4j7u8c8e2WNsvL87g/3uH1YkiaKfq7JjKF2joN5w9uRxv3iQ0OevjjgzmHJ/sRxZq3HZx5S/Nn1MYtKWtrGR3UenZAaxdFYCESnW5sOp4iVbqJkHyCJJgW6u01QOShrF8FFHaXHVLcU197Ctko6HstiV20DeSptW7slqJCzYoNCK0/jxLXbKHkiyyp+eadb6vFy8tdKgp26jTE2xJ5L/nqaaILWlLHEGBqFtY4kSzsrJOvlpWaRkKGCY1wud5vb5qKVk5IyJXT/hij77ORCpalGm6SbRGTRiCEogw8Og6KXp4QWB4gvLFGBYRJHkkEicJGn1LXl3b2S95xn1shOfmUDtVdc3igobWBSen739V2euzTi2UurWG+Zlg2EwM3Dkl5SUaSGJ8/1eOZ8n4VVHE5k+WnSWMZzyaIhOJkGGMNqXxRmV3uaIs/JtadsLA9OFgL2xMPUT6Q/vD+xXN8vCSGQZwmfemiFX/mpR9k6u8U//mffYn2Q8dSj6+xPHL/1tY+Y1434KirN5Y2Us6sF/V7GorJok7DSSxg3mt4g4+x6LhiOh8UHEzZXe+gkY3u9x+zmmLWBZrWfUJYNs8qye1TxyLmM1UHN4dSyc1yhguP1m0fcO17wxSfX6KWaW4clVzYLnj2X88btOX6UsjexFIn4SQSluw02QquHH7tUpSIDT8eSOsTtPkk+aSKkMbHAlvZvWjnOrub8B7/yPH/4rXe4fe+Yx8/3uH9Y8bW3Dxn0DI+f63Nmvc+gSOnlCZN5xaR0OOe4sz/nW1fH7IxrfvLpde4elRxOG56+OOBgWvHOXo3JVQQvJUjZIJWp9w6tAs63bUmscoltcByLmziv9AG8ioYg3pOmuiOytZVDNx6PbUWiBePY3uzTvzvmaNpE96AYbLToZbQOQ0opskRTia5rtx3ZPq8OYwl0SsWiHPAxJmAXIrqWAOhAtYPDKevDlF6adL2OsxYdUXlnAybRcb4aQBv6aTsUWvYkpxFJQIQyckPAY9ptQJRMCZTrPNgyo8kTzax2svyAR8WFIh0rB41nWBh0NARRSskCR4hod2pYWCmzQc7jpx/qUdcVSglg8/B2j3d3pnxwf85zl1Z4/OyA0tY4b6lsYFbV7E0astSQJ+KT8PB2QZooqiYwKlqyh2yL+QheLmpPVZUcVo6ycVGFRhDiVMOihvd2FhzOxV14bjUvXVnjl37sIo88fJl/9tvfYmtgeObhNV67PuZ3v3+XXq5ovGajb7i81aPIE3p5xuGsYVgkrI1yhoOcVWU4HFcyasxTeoOCYZ5yZnuNXr+gl6dszjSX1kXSe9U77hw2rDYi3zXqaVb6nu1RwrUHJbOy4XhW8XuvPuDnn9tmcCbho90Zj27lPHNxwGu3xjQ9w3HpKFLViVcmKLzSNEEy69IPDwKWIjHd3L3FhQhB2pog5aojUFcNf+MvP8X9wynvX9/jsbMD7h7UfPu9Q566NOLcep+VYY/RqMA2lnMbPe7sTrh7OGFzmHF+UzMsSj7aW5CaYz732Dpv3zlhd6L55OUBd44rJrWTNWri3kmANElIE1nYSgz/2q92RwFi5ZPI52uttDCSFDSaQNm47q61d6RNvs4HPJ6qcSgTsa64pOS8aCy0eAohyrX5dgS5JAN97PbH+9cm+RAf0DEBW0CyLW9OF+2ijd7n0vkNTn50D6/aD82TquUMH5QwpawjyTJ0ki4pnKcintHtyrG8YWUTSNO4z61llOij8YiLI08XHVlSI1t/DqgaT5oqGYkoGRmWjSjFohUmKHGqIZBGtdzEWEyAael5/soa2yPDj65ZXr1bsmg8F1ZSnrvY5/6J5Yc3j3nn3pSnzvW4uJYSjMKGhKoRf4FZ5ZgsGvaRkm9WSfiyXpR+oqQBqQ6C5Bph+416CUrBrPTsjWv2Jo7DhRWsINccLzzPPrLFS4+O+LEfe5J/9TuvMMzhqcurfPu9Md94/S69QjNv4JHtgq2VHGM0iTEMi4Q3bo7ZWOvz4tOrzGvP2mqfxmtGKyOKtM0glv6wx+ogxZOK/3ymMCYT8tPOEefWi7iQVfLgpEYnKc8/lHDroOTW/pxRFvi91x7w85/c5JEzfW4clDxxpuDR7T7v319QuagTGTNe7UPH9iR4zq9kETnXaOXYObE4K/sIRCKQjp8bCBmobjzPXhhy5cyI/+833uf8Rg9C4M8+OObJSyPOrvVIk4SzGwXnz62S5RnBOQbDHlvrAw6O5xzPap59eIP1O0d8/719tkcpj54d8OHugqfPFTxzvs/LN+ZR1VdamMZ6FrX4XWZGY4zqMrJSy0mALPYs+/k2MLTJ1EbDlBCWI9B2qoUTmfMIj7EoLWXZRG5C1HCg/fzCx8r82nl6qYnvtbxfS4m/JTnoNPM3QFsBxJ4r/uQWBAwh4JRCJYo00czLBQHVLYUYowhGU2SKumrkw0aUSyCgvGTwELnPHSgZpAxNkogSxgy+qGUU07GmOlTUCAIcorhIJIRAXOFsRUWVEYJF9Mjz3i7JQk6capPE4H0gS8Vg8s6B4fbYsWiEW155xUo/wwfF1ihhZ1zz9t0p7+4oNvsZ59cLtkaZ0ETxZImmiXRopRxlI+9llmgyPM5BYhIGhRhTVrXnYNqwP3UczRthBKaalZ7YbE0WnjObQ1681ONLP/4k3/3OG0wmc559eI1vvjPm22/v0usZXNB84kLOaFDgAowGPYwOjIY5P/PSJX73lTtkeY4xljQxbKykZBn0ioxev0cvN6yvDugVmqb2vPjEBlmqSNOEj24dkyno9XsE7xj2PX/69jE//vQWK3kgy1MGueHtOxM2isCfvr3Pzzx3lvNrPa7tlTx5bsDhzIL2PJhKglCx1LdxjKaUYrWXspFLNeTJuHtsZf8kimaEECW4YjLyPlBWni988hIf3D7iaNpwZbPHKx8csL2W8+SFVe4fzlkbZJzdHNDLE/rDApOkrHgRIn3k0gbv3Dxm56jiytkRJ3PLm3fnPHp2SGYCDyYNF9cyCjMT3EkJtb1ygX6uxY/CiWBn2wKEABi66qXjrMjt7858Y30kQPnuIopuoHwTH0LUF4REGQb9XGjkZrmAlhgVVYOFFq8iXpYEHSsHOK0E2GF7XfUdOs6PImIAXRMQe6ywhOkjeKAI3tIrcjaGKUmiqQydiolzgtprLbJYzgVy5ZcrmxHdVbRLE/JkdBsQlFAvtQITUWkdouyXFo/6wCnt9YjyoyB4F/XgTBQYFVKS0sgeeYx1nWKsBoWnnycczGp+7+0aF4SWW9rAY9sDvIey8by9W2M0XFzJUAQOphX3xiVGyXbfaj9nfZCQp4osTUhNSqIs/V5CWYvxROM8i7piWnlO5g0npSxYGS14SZ4ZThaexnnWeoosT3n2XI+f+vyj3Lp3wvfeuMdnntzi2n7NN9/aZdAzWK/41JUhRSajrSQxXLt3xI9/8hxpmvLYuTVevXrIK+/t8Td+8VlOpjWrw4L+sM/G9iZ1VfL3/s5P0c8VKklkb8FZtDIc7R+y0oPB5SFV7RgO+rx61bK1kvDMpR7HU4s2mn6esjIoeOWDA9YLz3fe2+OvfOY886rhnZ05L1we8Mq1CU3PAGKjbkwL9HoOJpYrl7b4yadWuLE742Q8I7lTMVCe1YGwKZVW5EYuyqLxOKfITcozl9f52g/vMMiFqLQ/s1zaGvDWzWNefGyD554+T5ZGaSydcHw0IRUPN/74B3f5szdu8/B2nycurbG9NuDuwYKdo5KHtgfsHM5Z7+dcWMn58LAmSwXYHeQG5+FgWpOZZQZuzy+hpa8LoY12ENJV0qLAlCQGZ+MlFSFOlG+l9uTxSQyUVd1uScpUwHkn5zyOEIMXlN96cQmyHYLeXupTPUD7pb+AwifdQ1oAULdbTaqrAkIQFZ7joxm1hX7f4CpHXhiclcOrVdRto3U6MaLwc+pNCBDtvWMEiO1Gp8wSa5pW/MF54ZprraJKUCCJoKCLwuvtxiE64J2TEWLwJFoWN1QEmpQRI8xEKVQw3Q43EAVNhGR0adWgQ839ieNwLuzBIs/44pWcG/vzOAZSzBvHjaM5Hx2oOLpcgkGy5hHXleMHoZSAqf1ckydGHIuDyImXsd05WQSevjjgZ3/sMo6EP/vuazz7yCZOp/z2n91g2NN4pfmxR1e7sWxiMi6eW2VtfYVb9yf82Ccu4L3nZ188x8G4pFqUbKyNGAz7pHmG84Hh6grDYYOzDus8qdZYp6mrmtX1VbRWHO4fsXV+lfE88Mrbu/ztrzxOtSjJ8pTGOqzSrI8yXnx0jdevH7FWBL759j5feGqTB+OG/bnlqbN9vndjgjGGh7cytkc5s1KWVpydcfHsKttbQ4rhgOvX7+N94PJ2j0fP9CiKNMpwyTtaVjU3DxvmpaOuGybzkkGR8OCkxhjDubWcvRPZEF1bHwm7zjoSDcZbdvYX/NGP7nH11iGPnetzJur8n9taYWu1x4OTksfO9/ngrmel8GwME/xeidOgIpB0NKmFB6D+Ip7VZtioOqRC93dMjATayLjTt0YuIXTYgtYKfGse0v5xoK4rXAiUjQiUKiVSea20uFQbS7xORxJTK3Tyb7jv3a/26yIIopb9eZv8275BK9nVVzphbX0FG3awjTzxqhEFz+B8ZHadkvciYKLTacuskqwvT7dzRm2fOLIU4ayjnxu8NgKUKFkvlpGKuL1opTHtREFJwDGI+IXWhuCEe9+WVi1PX/o5uZiywZV0VUwg0MsUb9yZcHEl4e5xQ6qF07/VTymtHMSr+xXGGK6sp5xfSUWB18p8Nk/o1pmNFoszo2WenSaaw3lgZ2JBiV5hqh2oqEDsAzrLeeZin6cfP8uffOt9hv2EC5sj/tGfXEerQOUNn350lWE/58Fxydpqn62NPr1exvPn1zg46OGDJ00Tnnn8LJtnN7Ck9IqM8cEB1Rz6q+t4J7RZjZStyiRo78nzTMpLBaOVAeujnN/5xjt86YULWJXxT795jd/48mV8knIydpzf6LPST7E+8N7tYxLtuL5X8olLA354fcJj2z0urRV8tDfng10RuBAMSEbHh/snfOtgF1Nk3Ll/QvCOIsnIEsXWIGNlmKGUp3EJ5WLOzcOKfpFSesXhpOLJcwN29iuyRONDwtMP9Xn8kW1sUORFTl/B99/e4drtPe7sHnP/cMFDWwVnVnqsrxRsIjsnZ9b6HB0ci9tVLKP7RdrRknVkufZyHYFbFTkq8SrFM9n+XqPiopIEBO9FDxHapaS2/29hv6XQSUDF5AYmLUQImxAJcK2KEbEdkOlIojVpTJCnp3ftWPFfG76rpShJtw3Ygn/tpelCHDLC8N7SlAu885SeuNUUyPOkk2HSOhCcKJvYuAfQpsbl/pHQfcXWSXUZmyiymCadhAH9PKGK65MqrnS1og+J1nGtk9iG+Bj0QmdumRlpEXx0w20391pquff///b+69m2LDvvxH5zzmW2O/bavOlN+QJQVSgQANlogq1mi2wqukmFOvQihkyEXhShVz3rb9CDQhFqJ6m7ySC7JYHdLRCmCYAORFUBVShvMiszb+b19/iz915mGj2MMdda+2aCipD0oAftqMp7ztl7LzPXmMN+4xsSawYdrGlM4P55z/2zTrSjhT4abq0cNnnOGhlcAZFZ5XjjqOZs0/LuSYchcWev5K1jS9snfvrcs+4ExPKFOzPmLtB6SQDFGLlqEy+tLPtV5GQLfYTP3qj4+pde4qPHF3z44Dlf+9xt/tXPTnh4ck20hs/eXXKwqAFDVVc8Ou9589UFB6uapml49ZVjYkwsl3Nu3L0lz3OzoSUy39unmtcDerSczQjeE7qewonS6HtpdNm/ccisabnedPytv/Iajy4D/+E/+j5fffsml9vI6SbxhTcOMSnw/Dzyzkt7PL/qaDZbPnp+xRu3b3N7v+b5uue1GzUfnTacbzzEqF11Mj+i6zzPmoaLxxc4HWry+FKmST0+3Ug5TPkgjIHHZw2v3zqgbzYsKiu08SHinBCMGluxWFTU85p5YfiT737Mb/+znxKDpwvS7/DOvUNuHC7ZWzg2247nl5Hl3HKSoI8FlZMJPg7JU1VlLrklLq46hS+TE/CSY7I6iSipB60lwMIJ4jOolS4K4QmIPk0gurLHMvpwGlZs1sLHIEpIyUNyaKEfSilzBkonaTa0TDb+JBAY/ibhkdWhvXmD6SsxXpzIi1yBj/IZa6Wpxjlhm0nO6VgwKRlKLV9pmyIDGGLAAOhvIYShCBTR5ACWLsjQhZhGy11IrnBg0DFGrzmNFYbcOeys/l/r48ZJ4i83SpSlMBuVRUFdFVSllTFbzrKaF8wqSyXcZRQWHl/1XLaJj867oYtxVRpiDFJbFp5mGi+lopAMm14UZBeSklIKFDeoArpuAzFICNP0if3VnK+8tuLOYc2/+ubPKKuKdQv/9PtPKUrDzf05Lx8vqGcC3Xj77opfeH2ff/6dj+mi4WB/SVGWrFZz9g9XhOAJfcdyfx9Xlhjn6LtA1/fK0mwxttTnbqCssGVFCAIUskXB/l5FU+zzn//uT7i957i1hIfP1rx2XDKflVJ68p7ZrOQrbx6y7kWAf/TxJS8f10MZ9O5BjSVx3SWuusR1G2h6OL1Yc3LVctXCZhsgScvzo4uOB+c9T7T1+NFFx/2zhottoI+GGISjMaNL60KqH4tFTdcFttuWi9MLfvbzRyzrgtXMYYgc7Qk24MbhbOiui6GndI5Z6SBK/31uusKIsvYxqRERCi9nRDZzjJ+7HIcKFgJaC8rxJyPnNd9tNMSNYr1zu7u1Rhq0IkRtISdJz4h46GZASybdS17XoLQi29aNezhv/J2XmfxjRHkVuRwhNzKhC5qqgyRJruWiRGqHRqxZFEhpDF4ILnoP1g4uU9P5Ic4fL2LslgLJCZTaxkiS5IrThF3no/KhyWeFg13uLOiuT6B00Gbs5kK0YtMrz5o2EQmMONMwo7h1nVBcOoJBCCVcItiEjTKX4AcPr/ihBviFFUTXrJTKyJC8sQxNHxkHH1R5nm89rx7IcNKU5P76EPnpaWY/hs/cXvDWvT2eXTQ8O9vwK1+4x7fePaf3Mgb8M3eX+Agn5w1ffOsmWKEEm89Kri6vefPV16jnC1LopbxTlsqnKEi7rg+4qqKsKiCI9Q/yry0rUkh477FFSQiB/dry4w82/B/+4Z8R+o7PvHaMtZZ37tYs5jXVrOZgf05yJd/6wSM+e2/B517Z590HF8zLDmf3WM5rTje9xOdXLX2UIS7WSC/FpvFcaxel1wx6FxKFjWw6KSmLE6nIzggX64arbWRZF4QA8yJxHcSzqJyhNBGTolB5rWZ8+90TytLS9pH9ueNgv6YqLb0tKEzLonY8vGhZLWbUpbQT+wjXW68hrNlp3bUk7Y5VeUqTjZbyqPkco5shpxZD0tyHKAxhDRLIXhzyAeOWjclSzuY0/nwIya1WFFIAY0UNZGNrNHuf0ljmm274Mb0w9QeQuSQRaVZIKIpIA/c80KAqDJtty+X1BmnIEcHto6H10HYyNdc4wcbHJJRV580uJ2B2T7LFNoqQyqUem0ST5eGcA3BB/SKrbr91Ajm2RuJuw4j/74NY3T7IPREEOCGuQqTUHEAfMiRTfl9oqbMsHXUlPHKFlYaQvdpRWcEXOCsc8Q/PW947Ec+gcpkdNtDpMIxciCnU2r930vHs2itp5qjJAfbmFbf3LK+/fIPvv/ucsiy5Xrd8//45EcOdw5rj/Zrrpuef/uAZ33nvlHt39jk4XPGLX3yZt149xlU1yUA1m2ERgSuqGudKjHXsHayoq1K4FaOhXV8DUNYzfNvSt1tpmlpvKG3g3Udb/pPf+i6Xl1e8eXtFVVhWq5qj4z1u3FhxY7/mOz+/4D//vffoo+RwPvvKHnVdsekizy9bXj0q2bSB1cxytJRKSt7UAFetl0YbhFjGRxka0kcLxpGSepRYNh4anzi5lJj/1n5Jip7beyVXm56DvYrV3PH+kw3NtmO5v+L1V474S5+7w8Gi4s3bC27t10DClZbFcs58teS1ewe0TcfbdxdcBwsmMi9h3SV1r8WyloVhVjmqCdhNwlkk6WdGC58x+4PNG2jidNMNYbfE/NmFzy3Fxgi2ZV5ZlvN6mC1gQAeCyjmIkk+JaliDjm+X6xoVSsrhyURRoeQjxdBkMbyZOQAl5s7xV9C530EXRcYTG2Lw6LxCLIa2j1pRMOxVZuxYzBpnYv0ljpJFcGZsvqhsEs5BjHRgGTckKXvFXk5HQ5VW+qVTtvSakwCjtdxR95VG66jGSJkF0aBol5VP0v8t5Z9I8F67/aS/wSQpd276yPcebSmdEVorLJs28Cf3N1rtQPMNQibx4bmQYdbF2B2XEPbag3nBGzcrtustHz0652tvH/K9D9dcbXvqWclrt1b4CG/d3ePOrQO+9dPn/Ie/9T3+5q++xjtv3WH/6ICydNhCaNVIEUtge3lO4UpsVdF3LdYWlFVFs76mnM0wVliVjEKu11dXzG3i42ee//3f/2PW62uOVjU3lgXLRc3h/py9Zc1iueQ/+q3v8fDkkv/J3/w8RzN49PSS4D2v3V7y7oMzHp2uOV4dMq9Emd89KHl+1bLuDc/Wkq85nAv9We+FM9HHxHUPZ00AwgBIMyb3doBJkYurLbPCcr72vHRjznc+2nC+8Tw8u+AnD675D36zoq5rjg/3+cXPF9y9ucD7yPH+glldknzkT370BGvg8y8tOF97vvjObX7vm/dZaF7q2XU3disi/Sp9SLhi7BYcoDMqzgMRh9Gp1kaEP6oxLRC8inMyS4Ak3mLvw7D/jBHZKQqRz773Qytxzg+I6y9eRkwSNiTMMGR3QCMOLsDUozdjtl/C62n9UpN1qsUk2yhKYF4XxBCkTh8iMQRiDAIqSAlXOGmGcMKftzd3zAoznD9nI7NiKp3V8cwJk+Jg5RncpVwtiNrrnwFG8v26rqiqgtZDYWW8VkKx271X1hTRzjIqe6Qay5l/H2S+gMn4qySjq0jyN2cQKm2t7RaaLBQmYMN+LW6nJKvSwFCTOdsKl62CYVkKa26mDs+DKJKx3Dss+dwr+3zw5Jp55SAZ3ntyjbVwY1VxvD8TEs7ScXfP8T/7G5/lr3z1TX7/O09YrOYsVwv6psGEgPeeoihJyVBUc3CWGHpShL7v6H0v+YC2xfcdoe/xvWe77ZiVJU/Wjv/4//4t6Ld0XeTtWwtWixl3bq04PlxQlJb/3d/7Fvv7Nf/b/+Wvc+94xuW2o64LugA39yrKsuJsIzMYjlY1z9eeRVVQWlkHcXnhounZeiE63ejIMqvVI2egsAlndFowicrCxgd+9vCKo2VJG6St+SuvLfiXP3zGjb2Cv/NvvsX3f37Ke/fPiClQV47XXz7mi+/c5vadfZIx/LPvPuH0bMNnX17xw48u+eLrh1xtOh4/u2AxK7ncwrOrfhgk4mOeJ21oOj9UrfKmTUkH50Sh7PI5XxBl28ocDYacQErjrKzMapyp+HYnBI24GafJRYshz+pMWn1IMGx8Q+6/GTtth5h/+N0Mf7Mxxp16v7HmkxoEtCNJMqSJREyy+YtKsrchxKGVNygBQNCbySs1aDkkBs7ZTNlYDCU72aR50S1dL/kG3wUKa2Q0t49seglZOp8G+iWjYYLRlSg18y8KK+oIc/ECjJYFpZ4uiSDnpHusVuZcp5zshRMARlWVMnVXgjslcbBYnU9XFsJPUBSiGEp1H4tCciNFIeSOObxZ1AW3F5b9o32eXTQcrgouNpFnVx3WWe4dL2hbz9l1wBUFh0crUoIvv7bgf/0ffIW6quiahtneClfNhdDSe+rlipg8bdNIIrQsxkpKUYErpSQVPJvrNcu64OGZ5z/+v30TGzuenje8drxgVlmOj2YcHcyo6pKiqvi7//13+Nu//jInp1e0PrKaV6DPtCostw9qtn3kqg3cOpxx1Uhz1KquKHQElzOJ5+vI/bPI/fPIg6so5TE72IFBeeZNkLn9fvJoTYiwKCwPThveurOE2PPe0w1d03Dr5gEXF2s2m5aiLGh7wTJcXbfEELlct/y1X36ZTRt4eNLy7/3GW/zz735MMgZnLO893Qz8hjlUrQvD1aZD6MfzNlLjNsm25VA0TbTDsrLMLNgkEGgpUcdcihI5GeMCNcgSfvsoQKTsVfgoOZSoycVeS20CXgsTOv+sssxk3xlVDCNZiB3mx08agcb7EbttDXjf47teGH5jInN9Jy9udG5aSOI+qKtsRxcpybs5HyCuTr5IWbRC5zYbI9l+lxLYgihR7RBzFcq4mmG+xsgGNuqxJCMVgqAlwFlVUhVCMBqizC2UjS6485w87ZJkeW3hyJNmA1I+LAqrwxnld+fkZ2PlZ2nFHBtC3JAQFK/IWaMlUalKFM7hk+HGquLtl+Yk4MHjS5azmmeXDT4m6qpkWUts9/ii45/8+VO++ZNntL1n0/TMFuKOG+tkhaI8o7Ku8X1LUdYUdU3btjpQwrHdbmmbVoXJsO0CVV3w0cmG/+i/+hPmLvLR0ysO5iW39wv292qO9mYYkjboGFbzistNN4CzHpx0/PjjLedbTz0reeloBrbg8mpDaQXQs+kjq5ksdKVTlawd0XRWrb5F1rCwedObQRk4K6Xdx2vPDz665uWbCy6axOna829/8Yj3Pzrnux+c885LNW++vEfhHA8fnXF+ueWHH5xycrZmPnP83b/xOa63Hb/3jQ/5n/71t/gX377Ps9M1d4/mbLvIB2ctpRPostN432C4fTjDmjBSvw/mTKU65Wk/DB5hLumJ0ZT7tCbJeK4k6EBMThbmHAKDUQWpSHgvhrpwVkfCiSfuh4qZXEMemDMoEXaNcLbp2eAXoPGoBjS5gQDSEDuEICCRsirwIbKqHV2IuKIk+CAMPEVSiu6I95HeewodAjr4G4x9zEYBMFbfK60kAeOwnJZoIoXRWQFGcgIo84nRwSA5418YKy5iGzBWhlFWdUEXIk3bDzTNBont+z6QbN6wVlGDBuMsrQ9SGTACtshY9hQjVam0aUkaXbx6MmXpSFFom7PSzK5antdqVJmUTgZzJOB47rhzY4/z60byFSny/rMtAMvKYpI0PX323pL9vTlPzjacXnb8pa+8Rr1YsLm6pKznyiEvlNbb9YbZfIYrK4kNqxm9l4z/Yrmgms1pGwkBkg1s/Iz/4z/4FxA77j/Z0DU9X3xjn/ms4vbxHpXmF0BZd51luZoTY+SPv/0QQ+LNe3M2G0cKnqP9OUVZsukDyVhqHcAq5TgZxtEHpbY2o8uKSSO3oNEVM5lrQnMqLtEG+NMPzrm7X/DqUcXD85aXDmf8D75yzLc+uOS/+L2f8/XP3+D2zRWrecHB3oz/+d/8HOttx8nFlt/5k49ptg3/q//hV/nJ/RP+2Z8/4GBZsSoNf/DuFTAmaWMSWjasdPU1/WCoyRx+Nu/yvMOMYPQDUv7tveA8dM9rCVKnFQdtLw6ZlEcO7kOgaVtlFBq/mw1m62WXVIXMy0BD0V3vw+xwKw5dvrrnjCFTgpnx2lNOUJnhZCEmAVP0Qam6DO3WUxnh7YspUSQktlGtbRXEYbOfpJrdoH0DToA4kYh1llnh2HRRJ/w4Cu0drx2yCRRVl/nhSQgM0gkewWs+wumUlsLJps6KJyf+xGMyOm5aR0klIEUd2Chss6W6YqL9dd67+ntmuAZRZEP44gxatAISpXODfYhasszhRwiRsnAsKoMl8vDROVXlmNUFm8aTjGF/LjP7VqWMLN9bFtw+PGS1mmNcQeg9MUHbbKkXK4yFrtlSL5ZY5+ia7dB9JtWcxNOzlg8enfL85ASbDHfvHvPb/+xP6Tbizp9eNnzp3orVvOJof8ZqVWGtpa4rqb50HfWsxvtE0274pc8cY52l6ROWay4vA1VhZFDruqNrew6WFY9PWm6samaFYeu1Yz2XhFNmFTY6Tnt8D6NzJRJDCbgise7hD39yxn/v88fc3qt5fNHQ9gX/xmcOeXjm+e6PHtGngqouKYtE2we6YDGh57N3F3z9197kj7/3MX/+s6fc2J9xe1nwjZ9fcbIN1MUudi7GNIS+OVeUR3rlOuA0zpYEfRqqVo6ECUZ1gxDWVCQ2MZHCCCQa/GM1xjFJWDXsWbXtIa9VUQl4S72LSSOwXo9qDgANrSTJb8hMQUVO9unRd17jDHnxAryXhWj7KHBdnc5igN57IEl8qyWNYWbaoF/SUPqzGu+B1FlDtEM1QRZdYvS2l5Jjigmcuk5E6qqgrGa0nSQji6qibTpx/UOg8VYJFP1AthhTxCQj+Owc/0dD9D1OmY0k2SdgE6PlHdSlt1m7GqudXVA5wcb3PnIdJNattFV020UVbKgL6ZBs+yAlHeeobWJmPfPlHH/Rs18brpvAuu0pneFwURCiTAz2GPrn17z+0iFlXXF9eclyb4+qrmi3W4roiUEGrMSUaBvp/zeuIMXIbF7yjR+d8nu/903Ozi8wRcW27QkhsLc3pw2JxyfXvH5jwa2DmhtHS27f3MMaQz2rtAlFmpX6vhfPoixxVhB1TdPz7KLl7Lzlzr5jXldcXa6JGJaLGnN6RUoSejmb8fAMLvLAFvyCq2oZh2okEimaofz7dO35Jz8+4699bp+XD2ueXHR8/+Nr3rg149/64j6BgovWcH7dMKsqjg5XvHRU8dHjC/7LP3yf06stN1YVN+aW73x4xccXLbNy2sCWX9LJOa9Laq0OjbyGuxsf1DMwWV4STUhEowxXCo+PScKZoHwXzqiXIBtPqgWFUOYKf8XEcqtdCzEr0pGzYCfhP1FK2TOY2GMxlDs0wUNxenRHxMURl1wm2kScdqBZk3HNibIQt05Ghms8ZPOCyDGnzT7JZPckUTknAuWcantRNkXhdBCioSw1JjKiZOrS0ceoEGSjbCzKHGysjiyTREmUpScmO9RZQ5R6qnUGa0t877VEAyEYrUzIwjsdBmGQjkEfwaTAy3uGm6sCHyzXrcTI7z7bcrlpmZWWu/sVy7rAR/jwZEtIiZf3S77++h7zyvDtj7ZC+R0CJxcNVWG52gqWwLlCQCc+0HSRj5/37M9rvvR2KaSYFLRNS+EMi+UCVzi6pqOqK2IncFoKh297lrOC7//8nN/6b/8FKUa+9JXPc35+ybYLXF5vOT27wvjI4azk7kFN4ST2n88FXWedKGlXCI6gqio224Zm21JVNX/+k6c8PV2zN68EYBQL9maWRzGybjsBJAHRFJTWAX7Y4RkIZdI05pd1tzY3f5kslqCWNZIogafrnn/8g1N+9c19bq1KLtrI+083vPsY6tKyv6yYVaVUVu4/47s/6Xl60VJXBW/cqOn6wL9695KnG689GaKMctl5OK01XDcdfR/FEyW32o6bKnsHRqdHiWufN6B0reUEHpghtyCUXsPtjTkQKxgcOb144jBCjfuYsBpmlpPk6ZiUnHgyE0d/mAUCL5KCxuEN8cs0+4jBJCmtWWuoC6mJ54eRkqToCmPwGGIKdCHppgMz4JyzCyUY/GhzCU0hkXncgjFD5nwYbmsEqNN0MpA0Jeg7L4AebZIoC0Po86x1KSeGzMNuxC2TbKoOXER7tNFRTvpe7z2z0o2z/lLS+W2SL4ihx0TPndWKwgaiDxzPFfeQSr71oedoz/Jrb+6xmIlb//f+ZcOTS89f/vodloXh7PJaRjMV4PtI1yUOZpY2iiWoK7nHorB85mjB/mpGXTm2TU81r/A+UlcG3+mUHlV8m/U1VVlhXMFmvWU2W9Dbmj/6l9+ibRvuvPoqjx4+4/TpKU3XM9/f5+Bgj5OnZ9zYK3EOFrOKo725lGlLR1UVzJeLAekZQsQkGSvWNFu+8Pohn3ttnxgjJ2dbghemY2stNgXKPEcLbdMmu/daOk1JS1w5EZaIRkBAfcrhVw7mRLol3hWpvmzhn/z4grduznj79pJl5Ugp0YbIo9MtnV+TSTecs9w7qmn7yEcnLe89b2l0IlOa7BKjGy0z9ybg7NojtOTQ677JFtiQPZiITVa7WB19ijiSgHls9oaNjrazwqLdZxM9pBMxRliHQhIcRTSSKs+5kZDiMGBXSutyjpgyJdh0vaYhjd7fVAGYidrIVn+KB7AGUjRcr/uh91gokYxuNsbmoMKKm22tYqYZNpuZXIpOYCIhWndW6thv/VvM16QZkECURTOWvo9sbCBGmJVOLGUQzdzr/WSqMJm4EohRXLcUBUmYALwkA0NMQ6wPIzlKiF5VZmSDotiSeDkVhndev8V+KfRbV43Htw1l1fHN9zcc7i/59a++gbPw5Okl87oEZMMdLxLLZcn755eE0OOMMCIBrLddvgqqqqBwlr1lxWJmuXVjxf7eQoSgrNiuN7QGDo4PBbBUz3BFwfXVNYvViqqqKErDs5MrHj45BVuwvd7w7PFjbu/V3FhWPDg9pz44ItlCyVkLVktZ08JJWdQWBX3nCb7HWEuvzLRFn1gsa9rS0XY9vYdF3RGKDJOOYBx1VYkhSJIBl40wdptmwE0OV4coQN4kZasXGWdXmMydlySflAw/etrw7rOWu/uOG6uSg7mEQykaes3zXLee59c9Z5sgG99lktIRzTfdKGgCsvcyjEOm0RlF1pnBpU8JHRYqcayPgBev0haCKo0xDd2rfhjmIRqkUhBaBs2URcF64yEKnB0rfOspeg2JDIVOxJJk5IgBGDySiaXPC5v7fHJyvogZR583p0Hj7LwOookxhj7mWXwCfDC5pqvJuT6Ie+MKGbpZVmaI/6fLKrX+nCgUjLf1aOLPKGY6YcusRKSElRgTCr4P2MJRWgT26jRussKMIoy4Ai002n46WCG9v3UXMCnKZJxVQfReEoDO0PdCGhKT0DTnkqPwFEROrgIvvXyLv/qLxyxWS775Jz/m2fPIVZzjOOFgWXPn3iHb8ysOD/dZzWsqNswWC7709opHT8/ZfucEZiBjzsKAsszlIEPi9Lrj4eUZRVFQVdfUVcHVpuNX39nnl778OkE3hEmwPr+Q2YrO0my3pATNOnK1rTlfd9RFYrPeUA3MsmJ1vQ/Us4IYA2VRUJUFVV3IkNaiICWBphYmkgL4vme1qPlH//Ih7z+80A4/8RSuLte88/IekChcQe8jZenIGX1njcyMyBY9jRBYkDElllFu0iDNYqElYSamwyYZqxWSYAiWhaXrEw8uPU+u/LiN1brm9c17e1ZkLH/e/OMgkpgY3iusw1nLqi44XXvNyGdymkkHn94PRnparM3WWjAAKUY84g3lmQxtkM7DDIk3ei1NHzjYq+HpRmm/Rw9Z4OYMw1ONtSNt2pBeMSTzYlJvol11vxfDJNIci6k/M2g1FXosrObaARa1x17TtJnqKB8r+MBs5hi6pBgXOV9eaZT2ySl6jyT3qPFNhk9Wijzsek9ROHIZLzmhVfIh9wXY4RoKZS0GCCEoR5tgEkKIbLvAqoIv3S7ZL2SDH61Kjvb2mM2kc83YxGpe0fTS5LRperwPXG88be/50+aKqjT87h/9gMViTt90nF1Heu8oLMxc5PxsQ9d4np9eSQ8Covnf/eiSJ09P6LwHCq43ga6XOclGZ8VJ7kF6La5az62jGWBp257ko2DmfQ+2ZLNuqBdL6sWS68sLqrqWRp/g2T/YZ+4bGXLR9dQzy+UmYpInRAFTHVUlV1cNq4WAllbLmqKQkmUCYt8RvKdcLsF78J5mk7ixX9KGA+aLOd16y6bpqGaVzmMotesysd1s8WjVJdnBKg0x9IT33lrHOJMiDWg8zAi/NVYqA9ZYfN4MKrvOBmpnOJhZmeCbYNsnffbizV71htZHxdKPTv9QzTNoaW/sB0gpcbhX8+C8U2c57ybdOBP3XZK8ssHyPYYkHmkfghhcHRPmQxLKvCTdrDGNPAGFtcNIcaNoQmulX8JaCQumr5jioEDG+nvS/2WyktH9T2kyHnxngGd2KfT41khnXSshILmfvyp0lp8zw0mSydNOE9HG7NGQ4YchJoIVdpSUzOB+oQ9Wpp1I/LjxkSZG6sJSlVBVMuQR1RPBe8oyA4XG8KJ0DmJP68NwozFFQow0reetGyVvHBW8fnvBK6/e5u3Xjgl9zyv3bnN9ccHFVYuJnvn+irPztQBnQuLh0yu6tuNq3fCjhyXnp9ecn2158vSKTSfMv9etWIP1est3/vx9UgqcX/ecr7cyN7Ht+emTcx49PaH10v12vWlZVA6bAusmDA1KReF46dDx9VtLbt9YUlYl+6s5dV2waTpsMZMH7wrJCPc9ZVVKfbco8L3He8/9x5e0faDvetZNz2xvj2eXVzhgb2/JtmnpupajW/s4K0pgvliANXTbhqquMBi6RvAJRV3TbLZ87Z0jfrWswBi264ZN23N+1XK1aXnyfE3XBeazknpWQQoUttY22hxq5ZAzIn3/KrAGQpKQrlRZsYaBYDYkM8bnxmgZeBwbZ2yiKgyHc6eEtZKTahOKQtSMuBVrnbPqeWNk9ZQJPrOb/eRsy3UbFBo8tt5mJ2U0bwmSHbyJQTFYCWG99q2o5EtSGaVDVwudFU+uCAz9IwnGYR8jhielNAxaETCeGXgzh2gmq4QcGphMCpqyBpz6CNOTyMNq2p7OQ11JD3av7brWGHrtYS6cpfGBlRPqq+kFRF2omCTez2U2o8sZYl6kvCiGyigq0BZ0Gq/nA5aFHWYCRKMJIzIzkGi8LuiI5yiW/+tvrHhtmXj53hFf/uIbvPHyPt/7/gdcrTt++49+RtMG+r7DGsO27ZnXAnWOMXDdemZlyVXjaX3g2dMTnp5sKApH2wcuth5SQUAGQHz8fEPTi/BtGk9ZwM9+/oBFkYQxV/kEjg5qPjr3tJuWVV0jjS9JG5lkbNeTsy2reY8pCryxWGPZXF9RLxdgDF3bUdclVV2zvt5grGNeW77901P+wT/+LtZGQjRsrjbU8xkHh3vYlOh84Ox8zcG8YDUrODqYUyicmARFVeJ9oKxLfNvSNh2uLCmqksurDb5vsEXB5dWW5bLm7KoVboTWS3eakbVoe8HB5xbtQeymQq+ep7N2yD15zQJba5gVKOu0jMx2kyRiZpgyRmjkZpWjLgsNKXuaPg5sRxCH8rRRa2KzbMbxOvLLGukJCdFOMviiGJxuQBHuHIlnOVfsShIMSq8UdYURtqBoEi5qVcCMsGdZEoGtG93cGR8RUZxNTmarZxn05odEu6hYdU52cQ3TVzFqY4XQanyVv5JSHNyJWV1QFxLzd14slbGWtpeyTi4TJs3Ce+UKHGjQmGgytNyin01Jsd6g8Yxs4j7IApeFoPOcUSKHmGREWDJDUkSGLkbwUXMHcQhjNn3gC3dm3Kojf+fv/AZf/oW3+K//r3/I7/7et3hw1nJy7Vn3gjLLo81FtiQpF4akjxCArNvA87MNnc+9FHLdfZTa/7oThXOx7XHGDh5W00c6HzjddHif6H3BdSOj1ToPR3NBCnZ9oO09i5nj/tM1bSyp6jlfCte889Yc4ypIkb5pKauSlKRk2LUb2q7j5vGKb/z4gn/0Bz9mWYtVaLvEZtuzaaQ0F6OgNmel5c5+xd6qZjkvISYuz6/Z21tIydR7mvMtJiXKmZQF+9YLnLmPvPdoizGOk01P62FVQBNESA/293ly0UJKGGRwitGMu1UxjQlSiFgtBye1vjLzTpCDMUbaIPG/s6Nxshpz58Ru1wdCMpxvAk0nyV2vYK92mFSVrfaInMuYlDx8NOcEfEzMtA4/qwx1OfVcVK6TIRiZgi0KY0wke7X0Nnu5qvwKJ6xI2ZNJSBUuf78w4LtOlJu1MusxTrg7UDyBwrGtEa6FEFEUq95nPufEEOefDRNSUGOza8YYC+mbfUxDAkdcJXG6QzJCKWUgj/YOSbR01CkoJmsiGOb9DSOU0cypQrxyrJU1nNHEiE2S+EjWAhZjovZjSwA3eBN5UfSaSVCVjuttz739gltl4K//5ld567Ub/P3/y3/D7/7xh6yDo4+JTQ/rbmRr6TJ9tcaBEpNn/SqJy3UrLDZdgG0buGyiUprl0c9iUUIKQ2NU34snkJJwuTc9PLvwFEXB6WbL0V6gcpbLRohKK1fRRqEof+n2jOWq5Pq6YbFakpIk7TJyrus8KcHx4YJv/PA5v/uN++zNC56dXWKdpfdBwymppFTOcGNZc7xXcetgwY2DOa6QZ1Er6cdmvSHquLfOB4paFF1M0psRgufGXsnVpmOz9VxfbamWluu2ZW8+YzmrObl/Ql1I37r3fjA4eUqNATBOiT+s3g9DcjAZJl1vYp4K/XuI2jWqeR/nLFsfOdsEFpVlWWaeAVj3I71WVeRS5Bi+Sg+HziwcrDjs1YZ7hyWfefWQHz8SqHAbctia94TuK3XDTUpa3VCDqvcTFdkXNWEek/bMJBmwk3Rtgsq8YFwihYKIxBZbfAyUzpEj6D6oItDrHpqAhn6AF0qBSdavGOIdxotNaVQG4sLIAofeY5I0JmClRGS0OymkOMx5y+zASbW7sTnKyAnHJEy0SbnQbMrxiCCmjCiSZIyAgVJOAEl7qFXUSEYIGscASbbGSsNFUbLZtvRBSDhe3S/4/Bt7/PIvvsTf/3u/zz/9ziMug6PpPW2vJRh9sNYYJQ6RHnCBb2Z+e4uPAty4ajx939MrmitqbJOx2leN0EtVblS/nU8DZjsm2ITIyUXDzYOaslDEWeVg3bFuI8cxcTSDw33HsgwsqxofItv1NVVd08VAVVmij4QQqJzhm99/zO//6WN+5Ysv8YP3Hsl99YEUEy8dz1hWjrJw2pbsWMxK7hzNhfRiVgrtWkpcX21E8TuLMZaqtrRtRzWvaRqxTqv9JQvg1tGMrvdcXJZcXm44vex57UAaxs4ut5SFo/OGLrfZqTeo1gfQ2F6tmVixpDwMsnkco5cYNUjOgzCCF7nNALUYE4vK8sZxwboNnG2EJQgrZcjSGpmkoxbWGBSjkKcJi0xZa5gXcOdozuPTNV0vyecwdKuOGy7/kg2GxeiczIBRBYaRkCDkpN5k0m/S+xLdIr01fchVM5mJWDoNAyhISaDzQYevZJISRtu9a+5zSsAOf9XhoInBjRhyATs1RGE1zaWKUpaJ6L0mYmTjV04w/KGV8VsZLpn5cTJtUUSpn5zGL1GGHoJYe1DcvUJunQ6K8AoekrFLTpoqfMSp8jFa949BymrWGNZd5PXDgr068WtfeYN/+kc/4I+++5irUHDd9HQBnm1kACP6AMZ2KHXNlEVPdKlAtmbOcHrdahJHPZJk6IPwBrY+qUsmg0qMldCg8dDFwKaT6UJND0/Pt9w5rIXTzRpuLEseXzZcNT1VsaT1ka6PPDv3XG42vHJ3Sd8nqhnEGOj6RLsVGHTlSt59cEEMDSnJJGdjDdtNz0sHM5Z1ybxyLOcly3lJ4SyzyrGYF5ROuJatc3RtjysL6rqUpqEUFGYc8Z3HGPFmTi8aqllFSeBq3eD7wOVGIMa3j5Zctz2bbcvhQhiNevUSYzJDadYYqeUbDfHEM5QkYDTZlonHZ6xYf5FPxiYaI+5zYS19Sjgnz2R/VnDdRmmeMRLeOSONOtYYUW4qpzYblSQKYtsF9mrH4bzgaFny44/XXLVCw9WEEd8iRjmPqBO3T8Bn2vuv+YAQk5Lg5rBXY/uYG57SzqatykJ7GHIrtHw+hCiMw0aSidYY+iiNcyZfUEoMvQATb37ISOqJiqwdXkwSDEQh5BSAwZWFkGjEhFFQAymyqIQnwIdAn4S9p/eJVGXtuHtuVMMl/VfcOin7GG2TFbhuHIMt1ZAhaogQozxEl4EiVjkDlYwhjOWQVRF56dYh87njD77xIRetYes9IRkeXgXaoFDKhBKHivKT3kbGcigMyLA836DphH68jwqJVqXW9FrbDxFbJUUiSv99iIY+ytr5ZLhuhRy1LApOrj2ryrCsBBbceklivve4ZRMCrx85bh2UlPOZkHeSuL5scM7iuw7fdRzOSz5+csm2+Sl1JYNCl1XB0aKkcnC0P2NvUXK8P9dcjOHwYCaC1QdcVWJKrQ5pEq6qCtptR1WV2CR9B86VPH16yelWnt6qhuOF49lly6qy3Lu5z9OLLV2fmFWO5+soca+W6TLyvPGZGyIDx4yQY5LAZo8AcsCQkZuJJFOENASy+lyKwuFCYlUb7hxUPL3qBmtNyslo6e9IJud28kaJFHpsYwz7ZeJzr+yxaQMfPhO2J58kpChtUqWV6brNcKzCybm6kLQBLGGSJM2TFd6B0kWhDjNCROODCFuhFHNC0uIomjjkI5pewgJRHCLrubFt4LfI5nbqBrzwbzbuA2NfLiVILB6H2CyzjpgYSNGShxyOB5RkTRakqMP88gU5m+fPj8mLkIu5JpdYNLur3oEDVmViVSIgk5Q0zhIoriFJEKXa1iSJngonddPsUbSdZ1EZagdvv3rId374mI9OGumfjomTbaIN2nFoxt7zgXzR5Gam3Tgv5x2uu6iEjAIqccbQeNHmmz7xbAvbYHl8Fbhupf2316RUqx7QppX59ZdN5O7hjKaTjPu8cvTec3rdU1eOuoh84V7J7SNprcX3/PDdZzw5aajLAmnOKbje9NxaWb746hEX68ij59f0feLWXsmsLjjcm7G/rLh5tGC5KNlbllSVI4ZIXTlNzIo1DTEMm6vvPClF2rbjT3/0hMcnayBx78act27XzF1ku5EehIenW+4d1ewt59x/eEJZFRTWcrHp6COsSnhl3/LaoePtGyV7lVVSF6lKNH3ApzQkex157RNJOR7bPgyAmDjE4sLN4JwA42+sSg7352y6MMBjcyiae0RkIK34elFDPExi0wVuLgvevLXkq5+9zc8eXfH8Wry2jR/j6uxXGzVCWd5DSJqbYmiKy2FsjCq35ORyGo6U2+TLwrFaSHdq6UQ5kj2nmAYEa4yS/BPPTclDhjtNw13nxGVWo1k7FDtKwozABfKim2y1I83mGqeaqPVJateEIT4WEI5l00l336YNWsNNQ6ffkAyJkvQYkieMSRIZCW2GJKFxsPU6izCNWjyzGAtgRTD8hszMGul95GBumZeW2hV84+dP6ZOh8YHOw2UTqSZAEJs3Ozk3NJZGc8xurJHeBmd4fBWYlRKnGZOUbBScav8PTnsNgdJwLx9dSpyuz5OrPrH1iYcna968Lcy/zkZurSout57H5w2v3Jhx+7CG4JlXJVcbz29/8yEPnm/5H/+1t7l9PMM3Pb2P1LOahOGX3jpib17y6GwLoWd/XlJXjnldMKsLqtKJsBUWCCL8zjGbi/svoCsJBXvNH1RVyfX1lm/+5IRHz6/4jS+/xFc+d5v5rGJv3pFKwwePrjEx8dqdFW2Cx2dblnNhH7ra9mq9ZL1jEmZmmd8gnaZ7tTAZt8rFn1tzgyrMEAMhiGAapJ1cjpWRoCIjpUncPZjx7LLjugm0fpwvMIWKi4JX0JF6vZs2cmtZcWse+Y0v3+HxScP7T67pApLw7TVROBxr3EQR5ZhE23bJCL+J9SVzIKCkto5Ge1KMhjxlYanrGW0vHoIzBluINHUektLKpVxhS2YgDckut9E8yqCm9PzTyUHFxJCPuYLEkOgwSonV9oGqqikL0ZrJBRxRa5OyoG0fBKVlRYjnZSExi5EFC6MKIicbB+JHosxVd46mC8wc2twgO7Sykt13TogsZdCkKJ5trzMENYBLWpONKTIvheM/xMC6aUG4HWjDiJtOqOtvRk8gQ3LznHdjFJugSiAzI227MFGSucdBBKmyIhAFiqZUQd6EpGIrG2ztDc8uG966PWN/5li3iVsHNR+fNaxbTxsiyzJxvel57/GGH94/56WbK/4Xf+Mz7C2kHl+XMmK9a6SzZG814417ltp4QioJCRZVwWJeM6uV2NLJOLWqclhb4LtemJWsw2sNervpqBc11gmKcVYX/N1/5x2++/ML/vDPPuZHH13wV7/2KrWF0Hbcf7rheOm4d3OPb793QkxwvCh5etkOdfFlLd2CdWnZmxU8uRIS08PacGvPUbmESY4fPO3xJlHYAoOQZgQjsZRzDGFVFt5Mwd10PccLx6994Sb/j298SB9F9oaR3oYBv5K/bjXfFFLi3n7B7aXlb/3lt7G+4ff/9EPOtjL1+bIVbyEPl8FkIyH7xlm0P38XEyCbfvSUgUFBtCHSxxxWZlakxOnFVsrq1ghKVr2OUnur8vAdg04mYvQycpg9XEPed2rkc3qgyB/OrcAp61ajmVggJYk7tr0kzUoT1W2PQ1dWGxJl6YghUZWOunAs5rVk0zW29mHccFETFYWV0kvprFJ6i73c9ElJNBMhyUANSQmMHX2FBa+bSFpk5egWq56HzhSMlo8/fj5JgGjpyMiGtZOHlNcpA5KSegY5bjRWphSD5lfMWNLKr4zTRhUpMFj8oc9CNW1IcLEJHFaWD5813Dqsef9Zw/684s3be/zo4QUfPtnyy2/XvHvR8b0PLvg3f+EOv/bF2/gkzUPzeamZY0uhk5V66zneK5mVN7het0MydVZJEs0gLE8pSvUgA1lijDLcpI+0XU8yAqIyuQPTR1xh+do7h7xzb8UffPsxv/snH/K3//IrXHaBdRv46tvHJFfy7kenrOYls9Lx9PxqWNu9mWN/7oimYDkrmFUeZzrqUmb83dovudwE/vzRGX2SKc/GCs+CMxZbjJtpKBVqonbbJmzo+c0v3uXjk5YPnjV4xdqKm65zG+wIc2+8GI5FZbk1g3tHFb/+5Xtcr1v+5XcfcNVJkriPho0XxQ5G+QtzilIfuLrURhVOH9Pg+eZwOmjY26tfHlJ276FSstzKGq67hAcqZcVNgxGRjgmnXnUKiUBE+g4nXvUQs455v2zg1TlQSjC9kez9j22R+m+S+HpeuaHWOtTcI7R53DEZjyyDGEKU8V7dtqcuxHVKWVUmcWmGKCXlxJuYZYu04PbJDZsrBpk9kNSjMEYUS1Cq8ELLhyFrOL2+zgvAp64KZZVRcVHQR25DnazXsFpOFaHJE1kHmFgaMrdR+ZoytsFYPbkd2WxyeSifIytBwfsHtsHx4Kzh1ZtzCgvnG8+d/Zon544HJ2tu7hV87t6SX/ncTUpnuNz26pY7uec+iQUvC+aLmr7t2LY9+6ua/dWMtu3ouo7V3oyycLSblr73QvaRpMHHJINxlu1aLE/Teo6OV8Qo7cqZsC34xNW2IXrPb/7CTZ6/tqSyiZ88WHN3v+DO8T4/+PkJxiQWpeXhWUPrPT5Jo9XBouLuzSXe99zcX/Kjpz3WwP7c8erNBZ97/Yh3H14T0zlzBzdXDh/hbBuxNgxlsey2W42zfUgcVIbf/IVbvHF7xX/63/2cZCzXXRoaZ6TrPGKDzJF01rJfWQ7njsMZfOn1Q7709m2enVzzz//8Yx5fdly1sg+ue2EsnloKYwSoJNTxhtIK7iCqJTCq/GPSpp8YlXh3lM/CiCz6kJhVls7D3aMZzkY1ZzITM++VwjmSAs4saMVMrsVZiP2Arhi+k8OfrDStei5FjmOyxphqK92n8p4mN/oQWQwLkN0hCzHSa9NFSpEQA5um5WBZcbrpmBeWM70UoxtOSDkSMUr5q7AMNF/55Yz29yMlvpBkc1unMB2N4W3KoQuTzWikHt8m7j/bUDrDqrJs+0Tt4hi/MUn0wUBmmoeJZm8hRvmAXJ5wBRTq7uUYNicxjTWjldJHod6rVBWQkAZEiT1fB/ZKx4dPN9zer/j5sw3784LXb624+viSnz5ac/d4Tt95OgPWeFzhKCrHdt1SFMLTl2Jiu25IxjCf12y3LbO6pKoKqkLwDUVhKPfnxJBomk44DmLCFUpnZi2+6anqgqbphxq5LUqZtajjw9o+4qNnb2b5yUcX+BD58hs38CHx4/efUc9KlnXB/efXRCPJq6NaRrC9dGPB5XXDswth6q0L6DrPpk8SgvQy/We/irxxVHCxhSeXW+aVJQWN8wvJAhTGsijhi6/s8eadJcf7c/7+H77Pug1seskx5PxOVRjmOuJ3UVn2K8Ni7rh3vOQX37rBjcM5f/7TJ/zpT57yfBPY9rKF1l4wIaUb3Xqy4VD5sBomDiVOFFloGXgtEhI+llYRsgXC628kk7+oHIUJHO/XPL3shMYueknyFsIR2ffS6ahYMxk3x8TLzHKdLX3WANOXKoOClNlKlZ9vihJQ9SEos56UJIEl9UcRbpmxZ1h3StKQ4lDL7XrP0V7F+8/kIeSeaGMFweVsQrFM+JgoNfDu+iiarMg3YrQtVxfcytioUmO60sqQ0JQAhSJH9Q6u2sidleHJlefeQYm18uAbH1mW8q/TGqsV10MeqLqKmRBF5gyYsXVajx8lR6M97mZUVibp9zIJiiK5gva2kygYw41tH9h6x8PzllduzLm9V3G+9hwtC26sSh5f9nzn5xf8yjuHFFVJUUosV5UFjffM5hVN0wtluZN4yxjD3v5CmHvqir6LOjNBrs2QqGYVzlm6plforUwsdqUshLHI1Kdo6Ps2CwQhQVVXpJS4uGj4+ZMtv/DygldfOuIP/uz+4GtebgJXTU80FmsClRPhv//kiqttz6aNQ6NPWVhOztZ8/6eRRxfCdXdjWXKwqLnYtuzPLF98acGrt1bc2KuGtatLR10KdfuPPz7jH/3JQ86bSOOlwrOoDPuzgkXt2Js5FnXJ/qJib245Plgyqxz3bu3x3v0T/sV37vPx2ZZ1b9iq53DtBdqdCUtVnwv/pBqyElFKeSDQ4KWol4iRfplMU++TYBJ8SMrqKxWNeSFgpsIknl60kOIQyYcoccJYxhSvWBTPyLiVCX7Ef/hkGDD9ZaQEM5BRUNO7NHpjzjqixvCC8RdqLkh4n5i7zKAiJZ2UItfJc3g0Y14K3LYuLNsu4NSzSJocUyCglEhCzgtob7M1wgWQZApsZlcx1oobHxNeY9eoHVBRXUMTAxsfuWoM8wrazjKvLK2XazlewMPLOEJCkcxw9oqsFWvoENc46cIFjesKK9wC+e/J5NhS7sUlSeDknvEIA5FKRkjm/MPCGJ6sA28eOr730SVfemXJu89a6hLevLWkD1c8Ot/wvQ/ha5+5SdsnQt8T/JUSrCZmdUkrUzNlooxzOijE4fteORJhOS8HDrquF7ZgjCZ9g7RMV3VF13R0TUdMhrIqhqRX3wex6L0Mr/yTn53y1q2Kz75xxPtPr7j/+IJZXXA8L/jeR9eUznDdRx2vZmj6xLsPLokpcrwvkOagTTHbLnD/2TVbL6W8667j/vPEttcYPkaurzd0zYZGkYWdj1xvPU8vGtatQMa7CMvKsKjEqr5xa87BXCjKbx2v2Nubc3mxwVn48Qen/P43P+Rk3QutXYJOmvC56uCiGbkvQSkpciiXMlKSAa9vSNrvnwavNShqsbRj2y8ptxtrZ6yJ1IVhXjlMUbBuPEUh5LZpCB1GBOzQD5C01VlJSEcjP/EEXlADGqGOjEBRa+dD9D9xX41JQ+zik8GFhC20TTNJomNv5gQbrxsneOi6yHUPt/drPjzZSIa7Q9MKclXJKDmIEay44Kft0EhU5CAqazMjVjV3Qg03nKQzq4tjD3dROIJeQ+0iF9vA4aKgryRp6VzilYOSjy86ah037XQICIq4yrESScOANFlGjbtKACMYieDDkFS1xg11XzPJH5g0NjWBaHFnDOs+8HRtub0IfHjScHe/5vFlx92Dgs++dED/8RnvPtlQ1+d8/pV9YWfatFjnMMZRz0QJX15uKKuKonRKrpqo64quCxwfrXh20XLVRPaqyPFKOP6t3q+U24R3oNNpPV3bsUgC/DIW+jbg+57CGv7wh8+4sSx4594+e8c3+K1/8R2qqmBZGe6fbGmVlVjAO6Jw2q6j8dLtxnXLugnEBFsfuW48pYN1L8bhcpvodaLxpo187+F6aMTNidugCtY5S4+l6yKLUsawxSjW+Pllx+PTRsqQD6/YdlJm7PogY+UQee69Un5Fw1WfJzuLslYHcag25PyZdQJXjhpmTGNtQSxaSEJl56Nm8FXhZfHtfGB/OaMuDS/fmNME2AbhNXQx4M3ojeZhNjGKF2JTog+7g0pjZv4dkmyDVth5FeSygSbdcnLFKawxIbXGro80rbRyukJcwNKIxisLy6YXASmsCP+slNHhmy5y53jBRycbVlWeXxaHDKZj5AQIyZJLaE6x070PWv/MgAohquh8kASJFUKQQvMGFof3UdGEllnpONsGjmYFT64l2TQrDbeLggfnnmUNrx3VPLwUVuO6kCGgGJmdblSwkq6PtZY+SRMQujYZSx40N2FR3gME0GGDQIIL5PqlY0t6H3yEZe2onIQmp2vPqqp4cNZy76CmdoYnFw2fubPkzdt7xMfX/PD+Fb6PvHV3xbrxVKXD95627Tjcn5OJWEJIlFVB9EHIQErLn/zoKd//6WOIgT5avvyZO/zK5465um6oqpIQhXwlxEgyMJ/XYtGcEIpEbcYqLPzR956yN3N84d6S1169zT/4/R+QknhXMToeX2wkvPFR43V1eUPiuhN25G3XCWoSlFo84myiDSKXPgrKUtZXMvHZqkUMIRrlegAIlHZk2228GIWLjec0JSISs1mriEMrXaRJDUguhV/1hk0nOyaP5542sA3WVS1yEHC+yKzO/JPqwIhwlEYjybVkA0Zu7kG8sZvLghgSX3rjmG/8/AIZNZY09FSvsxDDsmk9ISRmqriLQSkxJpsTAytQNp5MWYKM5LDkdgyKW7ZjxhqBSpJkNmBVC8VKzmpWZUGvM9GsopdCTNJ15nLXWQ/LGUfLkssmsKoMFw04dS9CEnYg8QO0ZIIwAfUJOq9xjqpfq1WJbE1MksRVplaurJhqr5jzsnBcd56LNjFziQ/PO14/KtmfOV4/rjjbRioXOJiLErhuA7aLWCu031kwJEeS58JLaGTVMwlRJCd7BVKJUCHVWm2n0OSoE1wzout47vjyS7W0r/pAAXx80fPmkeObH1zyG5875sPThp8/XfPO3X0Sjvcen/Ozx9c0feRLr+5zve0oipqiKHh+uibGKAm8tsN7YXMmJj44bfnW9z7ixtJytokcLwzf+eFHrCrDOy8vuVw3AqpS5SbYChml1rYejFSCLi5b/uDPn3H7oOaX3j7i8595mf/y937A6dWWZVWwqmd8/+NzjDVc6UYyQUvBGnaUNs8C1OYd7ZjsQ6Txsu4xJoJ6XUlj3JiEOSkkYdO1Wnc3mok3GKxjoBUzjGhTo7yS6oIKc7TmlrqIErSgBsoMmfOdl5EkMWTvVOTCJEPSZzvSdRttRx7p5EzKzT6ipAK5AUxa7VezgrKyPDrZMKsKrEnCFqWDcFKMuWIriiOILIGEl05zZBk3MKSgjSiiaVegTgbKBQN1r/PBtazJJLNIHMExBRorOjtqsaDknKC9zlKr7/vA4bLkfOM5mjsumhFqnMs3RSGQ3z4mTCmlrd4rS0oIJGuwycqAUmcpjWThpZQmFxBipNBMtjUyp27beqwTOO7rB+ISP7gQN/1gUfDZ2xXrPvH8ylPYgnUXtbtPNq3XrE4iUVnR6qIEwlAaBKUQz7V/g3oGotScsZSlsChh7KBQus6zWNS8+fINnp+tuWo6Qmx4dOU53xr2Z4Zvv3/FL7y65Olly8+fXPHyzQWz127w44/PeHKxpQ2Jr76xz6KyXFyuKcuShOHsYkvhCoiexbxkMS95eHLNXm14ch1pek8XEoczw4PTLW/cnYvi6gLJJMqypCodzbal7UQAVzPDhw8v+NZ757x+o+Yr79zglVdv8w9//0c8fHZJXRYczB0/e3xF6wONl7KYNYYuQqUJs1bJVTPhCUxAWZpUjZpQ60NOrMmGDUbWObeJRzShZJBGspTLYGl4FmgeK+kJEuJ+J80XKX5Mn4tm1NVntsYM8p0N5VAdyl9IjHMC4tj3IXkiDVHSyNg7Fr8ZYPBv3aiJIfCZl4/52cMr+hCoCknhFU5o0K2ij3LnYEYNOitKSdrxJ8i/6WsIXeVGNYARHEDM00rVb0hoPzNmiHU2rbS+ljoAs+8l8RbII7ABEykzHsLoKG8Mmy6ynJfUpcxcO144zjceRUxK5jzmfIMZEE6Z/NGpV4IqDKOueGEl2aj5FBEUJfBEFYSxlllZsA4dj64Dd1aWTRd4eCmC2IXE3cMZt/ZnBAxX65bWC+AlIFjrppeHWhUCVmp6GQCS+8fbXgeOBm3P1Cx75RKlEyajXpNAWBn7ZLA8uQxUZcHtW0d84dUV3/nZcx6eNtQKdNn2lhg7/uzDyC+9suDp2vPR8w13j+Z87a2bvPvojOfXLX/803PevjNnWRfQSdwojUitIgQhBk9MhrO1Z7VwxOg4XBRs234gqyicYBIKJyQgl03HYjFjYQNN2/PHPzzl8UnDF15Z8qU3j3np9iH/xe/8gLOLDWVZsD8ruP+84Wrb02meY1GJi7wNkv3PDat9ECNROlEKMTEQlRoTcfr8tn3C+rFLTtJMmUQjZdOl/8kWLgv50BYz7IP8V4NWlHIXnh03eFZEea5FlkurG805q5WcTF4in/dp7MfPPIXWGEGwpqxM1HtEoPAhyXivw7ljXlX80mfv8l//83cl9jdSLdMKIj4kpViPg1Iqi7H60PpcaxSMQEbZTl+74KA0jgabLlTKQBl1AQTWmJjV0j0sLZhRBxsydFUJYai0QtbW0BoZcNH0gi67ezTj/rMNN5cFF1szlNAsmrQz2h+tDyDfZSDhkIm8AgmV4SOlM1RWiDUymtAgwz0yUWldGJokbEbbxvN8HbkxFyzAx+ee803gyUXP0bLkpeMZt/ZrrLUsFyWdB5IQNy7mBQermvN1YH9eUFeOj5+t2W479vdm1IXEo+ttK/RXsrhanjTUlQjFuvX4ELlce55ft8QYWdTw82cdfdsrz6JhWRlON54by4LzTc+f3V/zi6/MOW8iHz3fcGu/4hffuM2Ts2s+eHrFjx9cU1h4/daC1++sAEvTiXu5brbszUtuLR0dBZcbz/GyZNt6mlTw2Zf3OLloSUlyBtvGU1UyPHVzveHB6Zb3Hq3Znxn+jS8c8dnPvsTpRc9/8t98l3UXKcuCZWl5fN5y1fS0UZqy9mt1TbVcGlTGtn0cNqA0zSS6CBsPVo1Gyp6h0Vq6SmPOxu82zqqJy5ZNrXYu2Y4Cz/D3/LvImuz6fMSc5c8OtHFmDEGtxVintjL39GtCywBGoOoG4bXIpWAQHIkkGyOZZ7DrE6/cnNP1nl/+7G1+/OEpj88bysLSa/dgDlUkL2eUuVo8ZJKwZnUBDmorXbgTr2UMAia5gfyXNGEEUi+L3AaZFUXUWKxPhrly8OdYKoaEK4y4dEaaZ3MJLPPpmCT46ouN5/ZezbOLFkzixlKScjPNaAqJKFjs6ELp5VsghkBhpNUzJKfJF3ELh6koVrwHkhInpMyrJ8qBuuBy2+MjHM/lvs+axKZPbPrIs2tB193cK1jNS5k7UFXMS3h2FpnPHKdXnoNVDcBm27KoS3zYcHbVcbgs2HQ9TSfXXheGTStiP6ssXTBUhaxP03kc4hV88PEZ7z94TqmmxGvZaFEKfuHGwrFuPd/84JqvvbqitIKuu9p6Xr+9z/HejEdn1zw97/jo+Zbn657bezUv35ixXNTEmLhetyxnJX/tF27znQ8uuNh69uYVX3llRfCezktbd7dtqSrHuvE8PNnw+LSldonP3Kn58tu3OD7a489+8pQ//dFDqsqx0FFZD05b2i7QRMNVr73p1khCLsk9b3uonVgqQ+6Hz0QYcNmCYug0EayutQqpU+HNFjcLbhbqqFY7y27mVx43uvRm5FxNfmMH159DuMRQv3eaALRWa+tGmYvUU7bZC0Ug6Vk9WdAKkJw3hkg00raelEOiKgqOF5aDec2X3rrJf/VH70ruIEg4K96ReA0+RmySKVzWCCy99XEyZDdPCf5k0j83tWWuxWEwyDReMIPmGBscJKliuVi3NE2n7lGGwYqb3sWEs0LggPoOPkR80oeWJDY5X0du7Vc8PGt4ab/kvJHx3YUCcUwSd9Azdozl/wpXu1BxSVJLjhsZCRa0i3to/DDBDLTP+XpTLNh0ns0l3FxYlpWQNZ5vIwapw163LSm12sGYKJ00johrqU0YZAgngl6cEFkGdacTCWfcQDMWNKzKgtr6SOp6if9b6alv1Dr22h5dF/BsHTheiA385ofXfO7OjFuriovG890Pz7h3NOPVW/u8eguenG94ctHw8HTL/edbFpVjNS84XFXMQ2I5K/m3f+m2hG8+smk9l+sOH4U16GITOLlqud70HC0sb92sePuVI27dPubx8wt+53d+yHrbspzXOCLrJvD0osNY2EbDZSdWOwKnW6Ed89rosumlvFYWhoKkFHOZ9fZFgdXNOUBvzQDjzm+avMs0qSeVpcztn78j76Ukn1Wyo9FiY5QQRDWKYjNGg65pM32ueeYlMWrjV1JlkVt75ZUJQUKIQ7UhJOHMyIzAbYBffHVJ7Lf86tde5ps/fsqz8y2LWcGm9UQ/kvTkOQIxRnqf+2sMAWkZzsN0lXFsLFentOP2Tz0bJAcwLvaoCMQiG32QyQq23xgpicUo2s45K/PJyACIqPPVZPptXZX0QQgznDFsPRzNC1YzR+sDbxxV/PRZg4tgFT8/HVaan3dI41Td6ANUTsqHmjjooyxwnjxj1RWMUcqDQ0OOtdSlXHvXBx6vI3VjOKwN81L8vtYnJJK3ILAGtj4OViorI6Oz2sIQuugw0UHZ5FCm33kAOcaMScpUyfZcXLecXvesKuETEMWK3gvULnGyDqxqy34Nf/7xljdvVhwtJHP85HzL0/OWe7cWvH7ngNfvHHCxablues6vPRebnsdnG6x1YKwQZlgRTh81rjUWi2dZO+7uV9x4eZ97N2ccHOxztu75nX/1Hh89uqCuCxbzEhsjz656zjeSF7roJF4vtaRrk9zDplfJMqIQfUx0XuLi4KGKUVFsSvaZcqItDQAtMx5CrKMKh7FmYAOOuTyo5TBDBqYBdkTSWYyWxszg8UKalATTYC0z/0ROQBZOJvzYgeMiDt6CMdJkFRJ4nydVSSVF5lUaQpA2dQxcNZF7x3MWZeLu7WMWs5Jvv/uA2bwGdmnjrF6vVKXM4J0kBHeSEuzXDmOUls+ZwSgO+1qrWXkv5LcHJGDurc+4gLHLCpJxdH3HeutZzgqutjJBpygKQh+kXKTMJ20vbMGFEyptZw0p5DYScfNu78/58PmWeZV45bDio7OOeZUfYoYvjig72XxRqxCG6CPGqgVB4q8ByJQAE/FRa7FadC81fkrOUlEoUMLTh8iTtZAwLEshi6xsoW6exqMmb/xx4Qxm4Kk3jFhzkCwyoNUUM7iqIqggHBQCYur7yMl1h4+Ry9bQ9mMW1yHdkNEYFiVct5Gtt9xdGd5/1vKk8rxxq2ZvZvHR8Oj5hienW24dL3nt7gH7K8vnXjNE7wkJLjctm62AbvpcNnVQaNt2XZUcrCqWixmXVy2Pzhr++fff59HJOa4oWC0rKgtNG3l80RGijHZ/3uq4ODNaFimKSCUo6b1nXMrGJ1Tf0isZq8CBZXM6/X4+Wo7Jc+ddBgLJiGx5/v2gYM3w+aThQq78DSFByghXddw1vk567Yr6HuU/oUlChduGOADWokq2j9mjYSDY9VoRsEbRfIhxan1kb17yzm3p3fjVL97ht7/xsQDQUqT3YjRRJWr1uDEk9Sbj0KNTOhnMY1KiU2p+DdJ1vSdroPduh190NNjUA8hKYJzeIomLxgsJ5qq2nF1Ll9e2j2CkF6BIgbZXHLm6Pz4IgrDpBWDjnCyELy33Dis+OGm5uXA0vuRk3WMLoyWgCEbbHXMCRTeeVAEEb+sjSrjosFZc6MoZrY3qMAkr7rdPoxLKgmNwOCNjpUJInLcJ2hGe6xS2OU2kTORy0KTDz3m/Z0UBgwKDMdmZryGmxLxM3ElSbbA2kUxiG6BvxL1E40fplBSqsfsXhptzQ+cDP3qw4c5ByY2VoO+2PnH/ySUfPr6kKix7yxl7ixnLRcXNgxX7+3NmdUUbEib0XG82kITp5rINfHRyxfOzjzm57Gh7ITy5uT8jBGn1fbbxbDtp3mmT5XIr7mwxWRNjpPMtl8Jk/0mmPSatAJCz+EbZgBkz7ylXAxiab8Z1Y9ioRjdr6RzGjnV98XTSABwjjT0k0zKZ5KtELQjfnlWDJ55IPpdVYtwp2UaKUQlKGK4m6XM0aM3faI+LymZEAHUhWb76xj7rTcO/++vv8OfvnXJy3el8Ca+erCoSZdtKUbZ11BJqoRObSbJGdWm4uAzDdYqhGuv+WYYlnNFkqdUwNr8rOYCIDj/TZEmiS47KwuOLjjfurPjotJXPKlFoFbQ2jmTlrV5wRKioZ6WQihTO4oPnYhM4mDtePap4cN7y2mFJHxJXjWdurGhXRUFZI0hDP7jfIkiZgdioG1c4JSpNWWunQUmkJF2MMohErEBhjfa4W6yiw4oYh15twSdkAy6uYUpiRXKiZYRdj3yB4m6ZQTOMwpqGDZHMmBjrvcwPgMxfMCqWcYtApo3OSdYn68S8sKxqeHDe8eSy53gp5JX7tQhmSImzqw1PztZ4TZZWZUGuBUvIpahFL95QjIlF7VjUBQcLYedZbwNPLwW+Wzrh4H/eCHdDbvzK22o0IrIOQlYxxqR55FZuVhmorvQ7CQYNWjqj5dU0lP4ygi+X5WalVdYcBjc3ETFxVMTOSUktaa4gxqSbXpWsAWuE8DQxEnaI16LP3ZqdpGJ+Lze4ofco3nNuVMvIR/l8iIJk/OU39livG/6tv/QW27bnuz8/ZTEvh2ahTPMjoYwZOAWcMVIZMEbGjqtii6pEN4rU7fNifuI1eqP57ULkVB6C0QeT8uIYEe02yODFD581fObeUuiKnCGkID3kSJ+3yQua0jDWeKblpHUXpRxoZEeu28TtvYrCGR5ftLxzs+anz2DTemaVU342MwKFtAvRpLG2mTuvKh3y2EeJ3qtCqhUyxUUTQCoI/TCYUuM7a8BEEpGgtevseml0ocKQ0ZHiolqbGzp0XRM68ll3r5Xv2MkGSWk8nlGB9DHx6CpSlwZS5LKVDVPYyVPSKxjcUVUEbYg0G8O8MCwKeHbteX7tmZWWZWXZW1TMHCwrCapiLqNGQ2GTekrgCjC1jBTzOnew7RKnreeq6fExUmo8e9FL5tkYnc6rKs6mrFwlL+JgaHnO65BV2tBijaaMDdLOzVjcy1yLgqkYlWvG2msf2gCVzUrZqOsrNmR0fxNCDiOyapVUg504OSLt0nnUthm1AMSkrv3o0eVwOQIpROXBtAOXRcqU30l6LPqQ+Mrrh3jf8fUv3OPGwYL/83/7XRbzkuh7Qkw0nZa4VbkFzCBnOQ+RBSkKPZV4OMj+cs5w3ek+nG78fB9kHIQow2LQ1PkBDXKnPyQl6ywcm23HukkcLQuuNr0Oe1CWXB8mmXtZ7MIZ1o3n/nXPxVXP3lzChcYnjhYFpYUbq4ouwNOrls/drnn3uRFPoNZxyOpaeS+aDxVia6Wv2hVACpho9IGrW5YSqLaManX9kBrNxSYRPmfyZBk7uF9eG3R8tuTZvTOKzrKZ6y0nXIal1s/lRBRafhqMYjZWwxcuu0gYOm116AXTBHduCFXJ1oeb6Sy3HrZeyE/nhSH2iU0nyiDP+ltVAl7JeIlOFUpQNGXbSzm06QM+RLXYIvQey3UrU4+y8jF6XZmYRa5NZCZvqbwl0RAGDWNGI2SGjHtWyvkVp/I77NMxNEUNhFdWXWGIMowPwg6eggh7VOucS3Njzgu13NYIjkW65GSt+5RIMQ8MkaN7hdn6oLDelNdCNll+zkHD694LUvSXXj8gBc8vvHWbN14+5h/+dz9iPnOcbXrOrmRSVFVI0tBHmFWO2/sFs0I6WMXDEOOTVKhDTCxnBb0PbHoxlD6N8peTnC8morPwFQzCNbo2cu9WZU0O0UZJzNx/tuWVGyXXW4mbMzV4XUinklfsswGeXvRcrls+/+oNfvPf/ywvHc344fd/xrd/fsr905afPO75/B24dTjDGoHjfvZWxcfnlsdXHbNCHmCvm2EECun1GqEZyyW3lLQ0ouPMMpVy1tryr9HYTdspFbEVkURhdlmzrqyw+lmDdbmMp9l/BUL5aHBpVJ4y7yApkxAKV5Ull6SQTrQxCYOVhGbMDyUNimCIi3Pyy+TElWLc1PMQgZMGmuymV04UQkoJ38sos6x4jBmVSz5tzgXlkpdP0AZD36nVZtwAWYByck3yJZqNHzwcM+grcfdHzyWooI0V/xGBN4Rw5EBBw4pkR9w/U7DOODxTDiIbIye1U0q6IeRcMabBE8jrl88EaUhewqh4c4t3TALsiWqAhrwEEaMENbWT0LFTgWt66RT62luH+K7lK5+5zZffvsX/6R//GFLgYuO5vO740pu3+JXP36awjkfPrvjw8SnvPr7i/acNr9+sqUuLHxL2EwVp5FlfXkv87zM5qtnBSYqSM/m30T8oBpHLxnGSJRTBklpqEx1HteWj0y1v3amU5FOw3sKGK7XwwspIo2drz+VVy9/89bf5H/17v05VWH72w59wuCz5zO0Zh7Xhh48bfvJ0S1EaXr+5oHZbHp13vHOzoi4NH511FG5ka40qsdZlTS/Jm9arwKkCyvdjNZbLgx+cuu1RM/A+BI0N1U21CYxTbIK0J5MEWZi/J23IdlBAhTEE4rAZEiNPezbzkt1mXNMkjRsGoTcL2nI6fmLw8iYZaHmNG21U25ncwzppOY4psengmpxdZxh55bTKYibhDSo4PqAKPG+KibKAoRU2f2fMzg+PY1hjw+j1oNdhVWCNekxjWXU45AC/HXAX+efsXRiF7g6uu1as9HpjFHjsYJ3jiDEAdoAyeUhHjqNTkn79nAYD8fQGdiwGtMCQq8lY/FyO7KNAgkmw7gL785ovvbxgs2n4+udv86U3j/n7/+RnWBM4vfast55//69+jq9+7hbf/fFjiJ6ub9mbF7x5c8azy54PT1pePa6Vjt9QFTIWPQFRIda5MtcOcelUml74OXsIxkzKgGTnXWMETbigicEuGWJR0Gw6kim4uZ/46LTT+HvUmF4baZ6dt/y7v/Y6f/vf+SWePn7KyUXHk/tPiV6gsH2IvHJY8KMnHR+ftJDgleMZZWF5/3nHS3uOvXrOu89but5T64iwaBQV6JwMj0iqz4b4VqRK5hVKnB9iJKMTMXYka3BO2o1NVnoqtsZoIjLuLl82PQYlBo0DK63JC6umtTDaF5Dydai4qqV16iKCJE6TMQMff95tuRyV6+HZ9qvqUI9jF+89bBQlT8nWImrmfXRGRiEZnz0aEo0/50QT5I03cdk1DreTv2VPK8KQw0G9oajaT+bdpcnm1Q1pGI8/hDv57/IpAd7oeHnEGGQvwxqhk89TpKQOb3RH53szjKtshmu2Gk8H3UBDrimJBfcpaX9MzlTI+XP1I+g6xCgToZo+8vLxklcPKy6vWv76r7/Ny0c1/9nv/kTWJiaeXbX8m1+4w2989WU+fnjB07OGxaxg6+HpRUvTevZnlsXa8Piy5/UbFX3MU4bltZyV+L7nYhsoneGq3d30Y9w/faXhH6luJnX9VDhGptOpYBk20VKUlm+/d85rx9In3mlsXhV2sFhnm57DVcXX3r7Fz376IXurGY8ePOanD6749gcXPL/2ijyL7NeWk40MwPjwpGNeFXzuzpzeRxZF5Jfuzbm9mtH0ojRyQs/7qBBJuc4YIylFpSQzg7scJo0TlVoho4LknIBiMrBDavtWynEKazYu44xFSAorPAiFFQRjimkoY2VTaS04JRXJQ0ZU21IpqrCPSBJH3UlnJMFTapORxQzMSMbo+0ZCnDySyurf8wYZKNaNAqJ080i3mHy3dFL7r5Waq7TCclvY0VsYQ+mREzEDc7KyGAgxjOQR8sbPCsMZQfFJwm7ElGQSVlFsI2pPrlGscKZXM8j15crHCGIZE7v52WYykwTDLEHRREo5ZgUQZowcc4D3asgnx4oD2UfKro2ZNPCoEhrvb2xkCimy6WUATOEcX3pln5dWhq5t+Vt/+Q1mleM//Z2f0kcpVT+56jmoHV975yZPT9acXm557e4e55cbTs83WCN0e5dNYK8WIF7Tia8npKNiNCqXuFj3Q/ekHxR23tNmqktVPkajUcQ0WWDV0EJrrSQYafzC1hsWpeXBRUfbBe4e1jy7bElRHkBCHt6mDbxyPOfq7JSztefhozM+eHSGifJAmiRJp6QPISWx3K2PfHTa8vadOb/+ziHvPd7w0XnPq4cFt/YK7p+1XLdeUVIWM4w2zbG1HZNtSRM61kqCL4qAFSlPZJUHXhgzEqGkRKelHWcYMNvZDZbKiEhdTiJKTDuGKUbjZa8BYoYnqxYdrF6R0VpZeaiytkauLQwx25h5Fg8nQ1LtkOeY+gb5ITP5OU0EQNZLLZxWGjK/Q4bKymbN0fcgNUSyshneUcXIsCGNzZBshvLZsGGRXEXC6GCNNIQXkRGpl+9gEGSTCTEG90VDQrBRimC5QSeEOMJ3x7gWiNpwlqs5cYyjsyegeyCpa5NzWSCKn8lzSHrclKSdt+0Tdel449aMo4WjC5HX7h3zV758jz/78UO++ZOnLBclhRUU7Kb1fOm1Yy42np9+9CEJOLlsOLnqqEsZkNPrxJ+gmnXdRQ5nbqiYlNq1+fSqp7DScTk12rkom/Mr4i2aYU0h9wIkhuRS7rjLiSvV88K8E2ATLIWFb71/xdffXPHwNEmcjmTMoy5aCpGnp2vWred664kJrhoZ55R0I3llzYhRSBdXc3CF46ePG072Al+4t+LeceBHj65pOs8X7s64aBJPLjrWXWDrA3UhbKmJCVZbTUMydoBi2iQz6AbpUXfN2UxUKpY56TzCPBI9U4FbwzCiKmDG+xwWNofBWXGO4J2cS5CpP4J2k5q/5BNsGjPGw6Ylh2PjRs2bKG+MpJs/x58poRRrY1IvW+zxvs3g3o8eA2QFkrP0JHZdZRgFafJ7lhFMFrTENHAaLDUjUnJ8Zc9qPE6OxDLhRco+OlPKqzHBCsqwpMNXU0oCnjHZO1E0hW7gqOhSm/I9amSvHlTShcxeolFvDJT9OW+hJANgYxTq+9dvztivLb33LGcVv/bmMa+8dMhv/bOf8eh0zd6iIsZEG4L2vhiK5Dk5OefZ6Zq6Llg30kXY9+LddkF2dAh5TFokBY9xBT7CQWW4uvRseqhLQ7NT/jOqqEcJMOM7g2dTDG8M0pLGD080sHwtsvaW25Xj/knDZ27PeOmw4nQtVFva70npDKfXHc/PN5xtZZrMVRO4amTOWamNMDI7QF2oEGQuXgXzSvrWv/PRNS/tOX797X0eXXR8+/41pMRbNyraCOebwPk2KBGmCFKhvdo5eZbDm6C+gbifAlsNKiB59+aRzz7LSxpd0THjOyb1UhL4cWYJSsMyShecSUIGoRDuMWk2EaJM7jCstTXa4ahsxGQQiLrZulmClp3yBsvIMZBpxfnnlF28wZsbN2YWlfyvm/5uGIAv+f7ze2q8B+8wu8X5HJlEY4DPMs5xyC87HGu09mMyMA1acMDtk+vXaVgHo88yu/thonRDGpl58kRyidE1JNRcTuZ5nEbJMeWNwxCuZGKYXkFvZWG5uaq5saoobNKW8ZKvvXOPN1/e53vvPuM/++3vE2JkNS9FtoVQS3EtlmeXHXMbSDFwcR2F+4Ck4+flmIJizfvP4H2gQOndY+DxeUfljE66SoM3ZqZUYJPX4Ltlsd9bzZJYvvxXEeahkcJMyk9JMOSHZcT6jsNFya99Zp8fPNgSlJetsIbLJvLRWcdnbhSUhQXr1J1RkkMiz686UoLLDjZd4nhp2asdq3kJGKpSypCbJrCaFXzh3pLbN5bcf3rN9z684LrphUapdHTRctWKgmk6rxzr6iKK+MryaXxPSurSTxKdZPdXRMxp8jPrh5TGGW/Z8smONQN6UEqIKkpDPWzX+mXrnP+W1J3LIKwhC6YWegg30nhITQZLDZ8xFp2622MyjQEHYdJYWMtlujj8TTc6uT7OaLl1Q2GkP2HqqZA3u8k19kG+hnXKP+dcRfaeMDrlNudy0ggSijBgMnK4FVXpoJUMac216sXlltwdaR8Tlroemdo7h4r5UWYZH7wI9TKGCoq1VGXBorKsZo5ae1E6H3nl9j5ffusmRQo8vuj4/vvPOb2StmqmniRyjrKwXGw8JxctX35ZhpfWhRDhNkG8im0XFO1qONsKcc3tfZ3tUBbcPSh5crLhg5OeWWU5bcb0pJk8wNHL262kDH/fX81GdavaYqih6jpazf5k4UgJblWeq63nl15ZcGO/5ufPGgZYZ4T3TntKk3hpT1h2I5qVTYl1G6QTDsPT68iigoOZZTErWdbloN0z2WZKiYu1587RjDdvzrmxV9H6yMcnWx6cbOn7TsxNFgYjXW8hxZ1kYR73lTPBLqO+VCAz+jFn6jvFGBhyaUyFRjPLGXhEzp9MjjHQRqVcWouDN5H/k2mpsms9tJNONu/ofchnnbV6vWZofgohKMhHwo8w+OAyT0/i8hGfDiO1ea5vZxkonRvO65PG3RMQbCITto6953ZYAzPUx6Pebz6u1U1q7ZjoDEk8sTxbUsbBx0FA09RDQsBZ0mbLoOimBi7EF++H4fpyiJXQTrusfPMaMCpwY+xgGCor1G4hynulFSO2N6+Y1QWfffUQHxPrTcd333vO1dbjCp0QHMdkrFdFOGBHfOTD5y3HMzhcCGrWxySchFGJUFNi4+G8hb1KKOycNRwuS+Y28L0HLQZoUh5YmnEM+gR3FLX6EKqEDVIKNvureRqEcMJskvMCOwgi/Y8PidpE9p2n8YnfeGeP023kbCuY9iygPz/pqF3ipZXQUuUR0K2XjXWylfTx/sxSl4b9eamswnZowCgLmTPgFadvk2jgV2/MuHu8gCjdiF2A5xcNJ5cNl5tW4zhx+m3h6Pqewlqa3jOvikHRYfKMNzsgADPDakIVUD43UeYjJHGzs3BXRUHbq8a2VucgSjZ4MROm14z3j5rlzust7rTArVEvICugqVLJtfkh3pdfh355yahLZnjbSUmodIKj9wOT7oiEQ68zewsxRWZVoQoDVVxQFBavManT8et9TCxKp7IgLeBZYQkqb6zxC95CNnWuaATtsBJYsCVilTEZQhQqmUE5I+zUeWRcSmB1VmXUTT/yWMhmFYXv2HSesnBCdabt7FlROZs59rW0NyT8hAA3RFGsrnCUTlrYjw/n3Lu5IvQ9riw5u2w4vWr42cNLvA/UpQz06CPDHjCy3+mjNBt5xelbmzjfeB6dtdxeGmodEpJBrDEKwvOig3kB8xLq0rE3LzmaG959tGXrRbGeteqBMcrMyOeRf5ck+eiNqnewt5pJyDVo3TT8O9iR7JqZ0Wr1PnBUJ4oQqArDr7+zx3ungXXb44xlXho2XeDD0w6SlJ7Q+LBPsO5kLNh+LdN7l7UTTjtjhkELmo+j1WEhOdlnUhKegQjz2nH7cMGrd/Y5XhTSpdb2vPTSMbaecXq65eriksOjJdWsYjmf8/jpJXsHK24dlDx5doX3nrbt2T9YYYj0fWRey7WWZUXTeoqyojCB3ntaD7O6IKVIt2kwMbFNlrouSb4jREPTCoX23qzg4rrl3kv7NK0n+sCiLmj6oMoFGd5RViz2FkLUEQJ94zk5u6LvRYj3j/aJGPq+5/HJlhQ8d2/uEWOgKkuMNbSN5+rqEmsd+6uKTSsMSova0rQy3nu7XWNcKeyyMTBfzPBtS0pCQrLteqx6Gn1IbJqOvdUcUpQ5e9dbDvaXbFsvZVRnuLxuONqfk7xXNmRLVVmKsuDqaouMv+452pvRtn5okxU26axspTFqf2/B1dWWEKNsKAsRy3sPL7l1MGNeO6rC0HYRq5smxcSNoyVt19P3QpMuo8sC2zawmgvNWURgud7Ld8uiwNnEwd4M5wrKssSUFZdnl1SlY1lbOsVqOAtn1y0/e3DJ47MtMchzEmBWIsVJpsKM6bTRb8penQy6TeoZXm56zq77YWiK5DJE5vtoZOM7MYR1KexB5+uOh+eBZQWXXtiMbTb4E4/IqNXPPwPqDdoBw2H2V/Nhpw+wy4lGHYIDMwkNVHv7kLgzkyGSdw9Kvv7WAd97uB3cv95HuhA5XXuuW8FD63rKyKZSbmxWOmaloywtmevfIAmXPsD+vBTPIolLS0oj+y/CMdcr2cLezHG0N2NWF6oVC87WLbO6IhrLfm3YNi1dn7h9tKBtO3yIzCtHj6PtAsZo+i1CWQjUd16XInhtYNP1zCsnYYQrabqeRSUei/Q/BPYWFU3n2Wxb9pZzjLO0nadtOvbmlbIee7atxxgZB5Um652SjFYrnXLJGyOeUZIZfts+EXyPdY4UAjqhAt+HgYeh01ZImU0nHY+hT1R1CUhVRgRPBGjbB4SuHKrSDqXTHAx2QTj/S+foQ1BLKqGSQe6nKjJpHEOSMzcNCTBIx2bpyCuhHbdD/F2XhSp3sfJ5COZlE1mUllmZQTkCAhK6B3G1s+XL4U1ZOKk6KXktg2wlkg60xVqdYJ176sS4GR30Yqy0XYcgisMr4tXZxKx0Qvah4VVS4o9xvU22oJBg61ESE/FyuyjVgKZpudr2Mh8hU3xbmBVSpnOlo3SOm3sFl9ctD869MFd5IZWZ5mSmmz6DgAYEppl4BloqneQAGB70ED/E3MQxRAbDW5IUE1fuTh1YN4HXblS8fWfBxxe9NkCM2f6mF973ISmEdDuVhbQJl4XDxzRk8Ufce6IsRCiGrLxRsIeVerLT0eLEMLCyGITnr7aGsnSiPEyJ73rpNsRQGyFfyF18QS2fLKRaQR/JF20YM83OORGKpGVCmBCSoG4sQuqonWfiaosHMyvFtfVJGGa6kChNGpJUmy4MijiXqXISMkbd8BjdvJIXaPpMuwmllRxLiDroJIk7XjrLybrn5LJlUTrU/ePGXonkrAw+Cc3UrBL0ZTJiaWXktdVR44LN73uJy3vdsIbcIy916kIVROdloxdW7tHHtJPBF5XrcKkfeB5FEcrzXveS21iUKCtPToqO8yaTlnNDHL1YWQNNslo7UMo5ncWX8xheFZVzI8R620lzTV06cg0i8/w7zYEM3XlIWVvxX5qPGJOyErLYsQkNGW0fMdgUdRKTl3wOOZek3BrOsj9z2Bj42ZOWuhQg2WW3C3Oexvwvxv3kf1XWbQZG7a9mKWeBByag7AvkGFljhpQYWiKjAmRCTDgiL80ip5vAK0cVv/jaig9OOlov2rv1kRBk/JG4KnLcWenEilujySV5AFlpRlUIUVWGQc6XlYQYONHmy7pg04WBShmT0V86874sQEEYpSbMiF7PMc0Aqyo0EIISRk4y6wYj8/1MbnAZCSWsMSro4z2UzqhCU56/mHvojSq8PFDUjOfCDCQlhZXzxcTAuhTTWGvvep0Zp48+MRVQUYZ7tSSlrIGnlz2FTfy1r77C3b2Cj59d8WfvnvDRWc+9w3rSgirX3YU8dDKTYZpB6PI8PzTOrctCoLAhUpdWrT/aFyGbzKRRUcgADh2amgzbaJm7hElBr1c2nLO5yUwqHtmDQAU5v7LyzZvHx0Tfa4LUyRqUhSSIY98N30lI1cknITLJtNqZlr50kqHPFbKc10gkJdRAuS6ijrQzg0KxJpchRUmKp6cU8sZqEjcJeWoIQqcXR9JUYxxVaXDR8+C0I9P0nXeTTZ7STqPPNNeRDU/e+DnUz8+gyO581hwDOm1amB08gzRmTm2+cfDB8aQ1vLQ0fHzaUZg1n7234P65TIa1SEdfWRZUliEbnTPXQfMKGAjBaFJLLGoYSmbTbHDAJqFL7qPhcJG5B+WafZIHE/QhWQNNH3CFHVzEPgRQQtKmj5TWDQkhQ54FMKpXdYiwVjR9H5UWPYbh2kaueDTfodWDKBOL0Qee69wxJXwnLK8hikWqKmnt9GEMtVqvDxm1iKAMM9oaimSXrRVEmlGrnUg6j076/68bGaf2v/m7X2e1t8+3v/0zzq87VrXjaOa5f9rw+o0ZuSMn05NVGpoZnRgkPQuSkLSF9iwA3gd8MswKM7i9nZeAoHRyxXkQpjXjRnG6Fkn75qXqIsMyE8jY+YTy8ktFKRkZEpPXJYN2TEIZqWUTOCcufsZtBN9DEkao3osnVdlE0wUFjolHk1KislZnVKhcqBfs1dU3qgSdE0XZBynb9Zq7KqxA5fsobNCzUjzVgborJZK1FIXVNm0B25kkxKE+JvbmBb7r+OC0E9yHhYvMFqWGOXvlu5781DWYhAcq00kVd7HzYb2pKeTSkBs79D+TgEHnDeFMoI2GR43h7spx/7Tlug185fUlJ2XJ44uOWWnJOG+pR+cMiWi/PthBW+WNLkwv0u5oFbpp80SgmHBWsq4X26AgIKMaUKyQMYZZYVXQIiYFyqIgRhmTXRjJykcNZ7KH0/QinGOHHsOEVxPM0JWlDjm9FugzYiwnOgTya2n7gLXC2W5M0hmDKFmk0IUbk6idTN7tvSTcrM29FlZd5TgkCWTIZGbbkV59Yt67cm15MEXrI6mA51cdX3vjkEcPnjNfNdx/cs75VSOTm7UN7qqN7M10IIXG60HLb8loeU+RTV4paLNBEFSirEQfNF5Wi99FP3Dm5TAtoe25qjTzPMrCibIR/IKscS6hZiITn7PsE4vng5QZMVJmc1bIYjKXQ8YyZ86+jNlI6nm2fcA5AdsYI519oswz3T1DE1Zu3EpA0udnNTfVevHyuiD3VFeOLjOZauiRjVplhBpdGISl2mGdoSgdBzPLs7OGD087mQOQDJcNqnzl3zRsmjTZ8maypc2uKlBXNvvUZm9ZC6ePmbCqZN8i/9cwcPOpzzFJFKbBa/AhURm4M4ucbwOLyvKllxcUhePpdWDbS59y4dRN1wQVCBuvsSONt2hao5NTDFYfWERZgDEULg2uquSAZENlDgBroHLqMkeJSY11JCPjs5Nu8qQJm05BGHXBAFDJjWS5TuvUrfNJ8Nqz0kkeICbNY8jo9BgShXM4a9h0kplOiHKpXKJyVmmi5VHkqTkksSpe79dpIiyvfq6ExCSC6rJ7ZybKOunEGZ1aG6IwMz0+bfjl1/ZZ1jKI48HztXSXxci2DTy7Ei/pzoGMF8vPWMqWZpjkk3TXZ/BRFixnDQEzjHQzSWLiTHNlVLgcGhMb8Wjyxm2joTSRyqrnpPKYczOFut7WidIMIQzxuSRKGaxyJqQZRrsZO/b+627O7nAOGUoHNnr1LJP2BOg214SoVWUjSEwzdnwy4iIqDetmVcG29dSlk3kAPpAbwUSpSmPZtHfBWGHQmheRp2fd0HHbA+eNKA3dgjsx//jLGC4PekDDeFE6GeinJeihDDg5hqiHHIPAFCk2hAvZlVBvIQtvF2QK7q2ZuISbPvHO7Rn3jme0IXG2DnRBrEipGt+oy7ntciigZ8wPNMGssEON1Sft3rPjUJAcL5IVk3oZkyT2MDwyT3Nt+4QrnA410c+kgDNjxcFqhrrXWDuDRJ0qHbl02cxl4TDIROPSymfaIGi1EMS6lAoSiVFouSVbLWcPOs0IhImm0HMHTU5YY3R4pyi7jPfPlhPNH5TOCm5Ca+TWyCZ+dtHzzs2S2kXOtrkBSwZytl3g2Vqm+N7erwZqNYO274Y0kJPmsVc5bCtMzkuozGSRVEsrsbBuUrXYQtyiyWRlF+5TQYqRvUoYoGTwhlSCcpeeZOBl47Y+YU2gsE47AeXZRMUyyLElz9JH8TxKa3RknXotVjj3nC1IMVCaONC9Z5sqOIQM7BkjYyllMlBASncoAytPoUYlr4g1ckyvnlph0MRr0iEhTsrnm5aH5x1XTWJeGZoobNp587/o4ecfx5ZpXX+Tt3LO48mHhQ9CvaesAIYDqTsx1RbZ+uRyTb6lKVAojzoSgRXBPq4NJYGmF8agN27WrBYV0TiuuygMqSGIVUuSKZaGHuGtjzFbfem0SinpDAC1NjkppMw3WeBlDLPE5iiFkgEtBWkYowLcRwNlJXX+2GF8N2T6U4riqTAiCSOWtvfMq5KoYYNTUEouaTnQOr8OT0E8i0p71zvl1MtQ4FlpdVqOXJ6PE1cTqAsJHwonwptDE++FA26UB6O5FQE1NQqEyaCas7Un9T2v3yi5bFVBd4EQYdNHTjZwa2lYzQsSUuNPJvPkMXgaGdiTo0KLCHQuB0pYglpaASsVhSVoUnjAmxnJfYjOs7RJ6MlnLhK8H/JNebqvy+XEoVJj2PRC4WU1brc6TishSVch7YzK4CRJUyGUsRqGjSXDhEyq7kOUkmmUJ59nJwb1hiTySUOOR7wHGXsPDJUpGS4byfgZa2GmZAuNl++UhXBHFMbQ9IGnZw0X26jVBMNVD23ULsncITXd9Lpn02Tj57/nCt70b85ZcnhqYEQCTtXK0Es98QiyQsAwbMxsAXLJJWqYICOMJVarTOKwEiFoukhVWl49rrl9UNJFy7qNbNpAny8BcdWHjZXGbLZzE0tdOL0OhqSUkE5YtZYiOIV6AT57B4yC2wchBSnrGdH3uOSHEk526SKWpHFv4RwpCU671NqajisY4Kly7AwdtWM5x8pudlYELOdApl1rAlGVLrPRVc7hkBBFdkEsQUbaJSbz8vR40upsBuucy2I+Jj4+abApDZOGuhBZd3DRJOalTCSelQVlOUJiCy1ndmHE7GcBchrC9VFI0PI6JE3AoWuTLSiM4WN2u0OELhmKqhK0WugoYiAPWY1RYuMwuedccu2CTB5ezByORN97CmeFoAN5jtlyWyMAG7kmOxgumxGZJj/30aDMKoVba0iSmaSyV5yrP8YkqRo53VxWyGby+DoQxV0pDLooLAV59Lr0EFy3YgTKwtAEuNJhB9ME+HTz518Gi5+3ELljNJcAx89ZZVMdGvz2lrM07HLVDDCWvaaHnSIEzRBgDKGahgNJXRrtxNIEzF4Je9rn3PjIvDDsz4Vzfn/h6KNR0g+GIQoxjsqmV0sZoz4ga4hBZsJHTboVTkpKMlxBjlUXKKpNyzgRMrONAHl0zmAIAwe9NDWxk0vI5UdjBdADEieOYYxgEgwSBonbLVBc5ywhBokZE0NZrcrxtBErVWoSc9vHkWZKwzCvIBxRENqR5sYHkHstGBQnYHQ8VVSC05i4bmQQSc7wg+DUlyWsZoLHKJ2VLkfkGkiyziFGjHWyySdQaK8+cFUIRiCq8FiNta22mPs46XuImfZbkrrOWaJxBBwL60nBa1lNKhkGgSsbI2taOFn3gGXbj4qytKIoIzpN1+nk6hR1h1vNqWTuvFxuNopQtMNuGMBFKQ/LhZFodrdsLCQmGmIO3o3YZeuECMYZyWc5Epttx3UTudhKbqx0Uu7tIlz3Ock53bwv7Pr80yfeY8j2Tz30aQMQjN6Z2VvWYsg1ps3dcC/GGQPxYnYMhuRPzguYYfMn1aAZS5CScgYaWBawKkV/ei9991VhZGTY3HG0rAbc+bYTwElC4I5lKZNTjLFaphQL5X3AKtNO0/Qs5wVByAYUdBKHKkHeSJ0PWFdIltqIqxuizMuTDkZx5YNef0QShiFoGUiFPDcSOaeDTBCi0pwsjMqkK2SSQJQWYqsJQCltZX5FqQmD/F0SXjJbMATBMxSFpe8l+95pyawuC4YHphvPRB0+WRaEGCXsQJRH0wkhxXUr61JasTqz0lFXhcTozuVtMHhiAnO12ncgGzpGQaPt1Ubd5JG7P/PvF4UbMufWaWlNFgMriRlsElbiuqooTSRGP4BspgMyM9lIqeFQ1IpDQkKn3svz3ZvJ9fg0xu5l4Wj7KFWgqLmnJInNoVmKRGmFXHVoPEI8qV5HqRUuMwIZAaghVr0sRM/EKOfNwztyEvp6G9h2kevG0ymQo9SKUhdgrfvBTLZX3u5px76PObj8yrkuaQYyO2HW8BkN4XNOIKUkCmDH9SdpzXrMLBsjyDA72fTDZ/PRVRHkmC17EdkrSKoccovjrDAsSkOlrnEfsoWQkd6L2lEXRi24UZSVbDIfVDEkeegSe+uYZB+VUlzc7E5ny8vNxx1Xe7BwMABlgjZk5FFj2dWWqTGSE4gxUmVMQbb2bswoR03ylE4STBnQE3WNcm45K0VUmHL+ZSQHEXc++DhUaXJiTUZNi2U31o6sRmhHXoiEpOSmabyfTJYpWAil+VaLUDgz8A6UduwNKVweh50G615pLNt5TXpqHmdoMEJzHwkN6fJ4a1GgVg0Gmo3OZb1MwinVoAyIikNepjCa8zAjO1LGEWBkYEYfE/M8CyFjTMgKWQyTjhNQudKbVm8rezLOGZJ2U+YwLW/ILBdR94r4Q2MjVECrOQofHiLc4VkLQKoJgvMIem6bTzDZ+DnL82ICfvjo8PkR7JNIk8+pdy9fHo5hDJjVok6YDA/UpN9EAQwhgHoJIyrODAcm5dufWP8sLBPlkC1CQinFVVhrK7x0VSG4OkNQRZLhnmlwr3JSMgwrOkk6AZmHP433vbNYeUFzmmP42DT0yYuoH5hWQCfrOSiN4R7173ZcskGJponQZNl/YXn1vGNb8K7Ozxpdn2E+eBptQ5p8J593rDmPx5L8Su4Ky3+f/DeNaziGguN5VReMrulkLWJiINHIx5vmK6bLOH1EZrIOafL9nWNNFiP3GtiJwslibrJCeGHt8l/ydU7vabg2M04rluNmY6H5nYkMviBek+cpBx1YqRFwkngpiTZmw5WG63nBoO9s8jS5+czjMFUSxpjhGY/5O/OpxxruORv91bJO08Egg6ZgdO1F4+UBimnYGCbHS2rxp62eIDEb2SPIocFkkyUYF1PVozXo0ErBjRtG/L8oan0gavE+sZH13vSSdgRx52FNvpcFMMGo/KZrkLJQjY9kWgYde8tzcizjCRk1se6YF9c5P9yshIwec4iwkySY8vqMO3D6MMcNkTdlhgbLWqTdNTLjU97FfkzOkUb0nDHs1p3l7SxCUz+Q6VHEgsuDGIhSyM/F5NUV4WVUwOP6px3FNW7uUTHENMoBaaSFy0bnhX21sw4wjrnfufDxA6PyTOP15uPsKrJdOcgy3SfxMpImbse1+eSmz/c4fEjvIQvnMKw2G4J8jGzV9ftZVHbl/QWFYMAkHQ8+Pt0sMLurkS1+FttPuhcMFybjl1VwtLPJmKwkGDbIqIHNzmJEJH7q+7AjMP+vXy9ez///9f9br/9vP5epT/H/yevTjvH/7rGzxRm/mzc7MLA5f+LoZtxX4zXlTZr3znikQWEN1m606lnpZSCXHG5U8mlyigQUO7YuTe2//G1q6XJnGGniJk0ObFBLNJin0dal/KFBw6fpaXZcGnLCcXKcXcX0aa80/NdMfxhPOb2yHYuW1+jFB/NCCJUNIy/++S+4lIG/79M0fT7gcOhR0e9e2+Tc+WtT/2HqxaSJpR6Ok9/kL7CK5sW7/pR7Mf+a31/881/0/l+4DuP747V+8hA7IdMLXsdwB3nfvLj+L57MvPC8X3imfIrnML73Fzzz/N7k5Ck/2J3r3L32IQxLozHMZ5dnav7C8+X1MC9uDPWYB1DdRPhzKT9740WanC5/abTuZrj+pC4DMJAJ5NPmQZ55o03nW4xinnY03YuxzI5gTs7/yR0wuXn+NQ9l8tUdV2hXmQ4fHh/cVNDGTTnVRS9ew66m2f3OJ2I7XhQyfeRTwf+0k+RTqKBML+jT9ucnjqM3NrjaTJ7FC99/8YKHpRzc+E8qjE8+uxee12Q9p7Lziff5lJAiTZ6PHnv3LIM6fAEiO9EG+uGRTHTcajtKP39Uj2Mn12N2Pj3+vHvNkwc5jdt33h1/Hy7XjrI5vWTzKafM1n6Qs0+L9/U7007e8RmO61dkNZmUUmgwHWn3wMDOWChZpGmdUbVK2r3hDI7Jy5SVQI57x803qKXRozBI7KXq+tNka1z8fJZJ5uJToJOj9WTyYCeOkxm/m+9nXOPpLh0VxjQ7m2fLS7IufarXsis6IoZmKrlp/Dll5TAIr9m9pRcuaYgJ03SrTtcYFTKzK2w5ofipZlpPzjSZmJ9hzi5PdvXkXgYZmSrjiVIZ5GNHYU/WwTBe5LCWZrqIg3KYKtS8AXc296coY12dTyidbOR2PzndYGkQWUif2ORp+tkd+XzhNfnDRAImilJzQPk9u3OXu9f0ws+5+rZzjsGTl/suBtubtZX95MXk+x0e2M4T0/e1O22aHjZ6J3INSX8ekzZDYmgihAOibqrIBjWYhW3y3uSzeUVNvuDsCk22285iJv3r8JzMcOyccMpJwGHq63DBo6CZibI003ufCurkGvPWzj9/4iN5v0yP+6LwGoOJ08PuCmEarkeV6o6mGO9z58CfPAl585t8oYjy2BXwyc9mso56/dNntrMkLxiLnec6/Gn3/VHZTo459Uz1d320Q8l1fH3CGuxszXHLpjEkG04/fmEwa7u6aLIe4/3v3NS4pPJrYmfZhw7FwRjl45nJc9S98AltwgsXPJ77k1Bh2fNmtcycgPrZT7gt+WRjWSyfIz/r3AAijCyj1UyTsVxZ8wwXlHfTC6s3jYUHDZ6t7KcITD73TopheuWjbvuE9t1Jiky+k/+zU+qcXOdwffrZneOY8bZePO50g39CYibvDVs3pd1zDdf2KfeZf3/h2qaewrDkZnedp8cZZWHXVfzk5Y5uN4y16vzJ0Q5MFsTkZiEmizau7fR4OxZ5UCS7uJNPLPK/7qWf/7Rn8699fcqHh7v8pGjsKpXhflXl7xg2M3Hv06Ao812O4jR5AnmdXvTMjdldjskvA7BPy0ojQlDeFz6ANHnUZvcAGUG5c5dZEbyYoJgs8LT09OLFTq9yx31Og+7bvf0XrmkU3OnZxxLbjoXZ+fz4mjgdY4JqqnyGbagaf+IFDPehJ9kFRU3LSmn6fHe2zHCMQYnlNeAFq/RCnDqJXT8Zw8sXp0mwIdk6UV7A2BKbz6vrxcT1HQKUQau/aEd2LRLTY03OleUkew3j/ZhhcnMu5+2s+86T2i2nJpOGdZ0KyCeuUN8anLtPaajBmLHd/YUN/cJWm/w0apKp6rN2GIy2q/CZqsnE0JWSG62mZxm8t6lhGffCjnLJnsH0lifKdjjvJCNs9MDGGMxyUafJI9MNMfECdHfslPH0SjItGOSPjRo+6gmiTuZ90bPIrvQ0j5BeWImUxjvLx7TDhhxVwDQH8CnPahSlHBaopkqTDwzX/BcdZ6ocptIx7K9xsYcvTD6wmxv5dPM1PX6mSUsDemi6MC8cQx9o3mDD+T7xmRd+3EnN717Ti4olC9/U0n3CBZ26G59Q7Pnvk3tVWUkvulSTQw0xtn43e44i1PkDu+uAMWNKwqTdtc8KJN/frnad/jKxlpMbTeMn8j1Mpcbka5xs9+lO3l2JXeU5KLm/4JUbeKbX+MnPyHF3PK189CS9DmPGSyDOGDJGePfGRw3zwgMczEX+eTfWnmr6nZvdube08+PgSo46Z/heVLcib37z4rEGINMLi5Ht31TjZYGc/C2/hp7pxGBhyGOiR39tuFe5jslD3JHF6VqNj1t0j3lBGexecR7rxUSpivchApATjTtyP3EhczF29F4mYjO9vp1LMGPonnbfz1e/k/+ZJvp0Labh39TdfzEpPDzTT9eDO+s3JkflnHlEyXR9YHLeYT30fb3zUVcMR/7kPhp376e+8qPc+YQqmxf2+Y7yFVHSK/mUnBWgvTj5ee0qz+keHL8/OX7+bL7KibIZy4zTkJbhmAIFHu4wf2i8kHGBI3mwwPSkuQd6uO30KVbdAENDx/hwXrT40+tg8mCnXsn4GYZM5tTaZpdoGHGVbxZDmlzrqGSmj2rX2xnv9NMkJV8Xk/fzjcGAJX3h78YMjGETu7GjqHdcu2ks/Gn7ZTS60/Plv3/KtU81wU7mfrz0T5a78jF3cwIvJqSG8CWva9r1zbLXsXPkyTNg57MqqBqTvOgR7C5cGu9J/xlj78nT3VH4u57Gi69P8VleWOJPyu6LHsMolZP7etGjmHw3v7/zO3mvjcozu/SjDp4aG/1ROSunBs+8sA6JRDH8Wc8SM3XT1EAPbtPujabMl6Urky3/cDWjoR2+O31+w41MLmy02PLBaTykJ5dzDZp4tMrykMZ7GOGnuxoVNE6fWDhjIMUcj+16Ii+KyOhSpsmmyLGVGazjNNMLYqXFAiVeWBHSxIsZ7xXJwVhNsE7W9tNQXlkBj9eSBiuQl3TH65+sf8Zm5GXZwcrvKLDplhivexCDyTnGzPWoPJIxwgk53QTZGk2U0jSUelHBvYiT/4RHuPMa35t6pS/qkV1FbwZLP26WnUvd+d4gCYOXyeB15VsaPrnzkJNUVFKarP9EbqZGbVC0ZnKs8ZriYNDkD2nyLAHS1L2b3PH/E5DdjK10ArkPAAAAAElFTkSuQmCC
-"""
\ No newline at end of file
@@ -1,3 +1,4 @@
+import io
 import os
 import time
 import asyncio
@@ -6,15 +7,29 @@ import traceback
 import shutil
 import random
 from datetime import datetime
-from telethon import TelegramClient, utils
+from telethon import utils
+from telethon.tl import types
 
 # Importa il session manager
 from gui_session_manager import session_manager
 
-from utils import log_error, retry_operation, sanitize_group_name, format_user_info, sanitize_username
+from event_bus import log
+from metrics import metrics
+import client_tracking
+from bandwidth import bandwidth_governor
+from download_scheduler import download_schedulers
+from message_sink import message_sinks
+from path_resolver import path_resolver
+from media_layout import media_layouts
+from dedup import message_claims, record_duplicate
+from archive_estimate import DiskQuota, archive_usage, estimate_archive, log_estimate
+from operation_control import OperationCancelled, ProgressTracker, is_cancelled
+from utils import load_json, save_json, log_error, retry_operation, format_user_info, sanitize_username
 from config import (
-    API_ID, API_HASH, DOWNLOADS_DIR, TEMP_DIR, ARCHIVE_DIR,
-    MAX_DOWNLOAD_RETRIES, DOWNLOAD_RETRY_DELAY, VERBOSE
+    DOWNLOADS_DIR, TEMP_DIR, ARCHIVE_DIR,
+    MAX_DOWNLOAD_RETRIES, DOWNLOAD_RETRY_DELAY, VERBOSE,
+    PRIVATE_MEDIA_MEMORY_LIMIT, PRIVATE_MEDIA_RETENTION_DAYS, PRIVATE_MEDIA_MAX_BYTES,
+    ARCHIVE_EXPORT_AFTER_DOWNLOAD, EXPORT_FORMAT
 )
 
 def get_media_type(message):
@@ -36,25 +51,122 @@ def get_media_type(message):
     else:
         return "others"
 
-async def safe_download_media(message, file_path, retries=MAX_DOWNLOAD_RETRIES):
-    """Scarica un media con tentativi multipli."""
+def is_forwardable_media(message):
+    """
+    Verifica se il media di un messaggio privato va inoltrato.
+    
+    Solo file veri e propri: posizioni, contatti, sondaggi, dadi e anteprime dei
+    link (che per Telethon possono avere una foto o un documento) restano esclusi.
+    """
+    if not message.media or isinstance(message.media, types.MessageMediaWebPage):
+        return False
+    return get_media_type(message) != "others"
+
+def download_progress(account, operation_class, cancel_token=None):
+    """
+    Callback di avanzamento dei download: controlla la cancellazione e
+    applica i limiti di banda (bandwidth.py) dopo ogni blocco ricevuto.
+    """
+    last = 0
+    
+    async def on_progress(received, total):
+        nonlocal last
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        # Un nuovo tentativo ricomincia da zero
+        if received < last:
+            last = 0
+        await bandwidth_governor.acquire(received - last, account, operation_class)
+        last = received
+    
+    return on_progress
+
+async def safe_download_media(message, file_path, retries=MAX_DOWNLOAD_RETRIES, cancel_token=None, thumb=None):
+    """
+    Scarica un media con tentativi multipli.
+    
+    Il file viene scritto in un percorso temporaneo ".part" e rinominato solo a
+    download completato, così un'interruzione non lascia file scritti a metà.
+    La cancellazione tramite cancel_token interrompe il download tra due blocchi.
+    Il download attende il proprio turno nella coda dell'account
+    (download_scheduler.py); banda e download contemporanei sono limitati in
+    base all'account e al tipo di operazione del client (bandwidth.py).
+    Con thumb viene scaricata solo quella miniatura (in JPEG).
+    """
+    if thumb is not None:
+        final_path = file_path + ".jpg"
+        size = thumb_size(thumb)
+    else:
+        final_path = file_path + utils.get_extension(message.media)
+        size = getattr(message.file, 'size', None) if message.file else None
+    part_path = final_path + ".part"
+    account, operation_class = client_tracking.get_client_labels(message._client)
+    thumb_kwargs = {"thumb": thumb} if thumb is not None else {}
+    
+    async def transfer():
+        async with bandwidth_governor.slot(account, operation_class):
+            with metrics.timer("download"):
+                downloaded = await retry_operation(
+                    message.download_media,
+                    file=part_path,
+                    progress_callback=download_progress(account, operation_class, cancel_token),
+                    **thumb_kwargs,
+                    retries=retries,
+                    delay=DOWNLOAD_RETRY_DELAY
+                )
+        if not downloaded:
+            return None
+        os.replace(downloaded, final_path)
+        client_tracking.track(message._client, bytes_downloaded=os.path.getsize(final_path))
+        return final_path
+    
     try:
-        return await retry_operation(
-            message.download_media,
-            file=file_path,
-            retries=retries,
-            delay=DOWNLOAD_RETRY_DELAY
-        )
+        # Una richiesta per lo stesso file già in coda attende il download esistente
+        return await download_schedulers.get(account).run(transfer, key=final_path, size=size,
+                                                          operation_class=operation_class)
+    except OperationCancelled:
+        raise
     except Exception as e:
         log_error(f"Download fallito definitivamente: {e}")
         return None
+    finally:
+        if os.path.exists(part_path):
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+
+def downloaded_media_path(message, group_name, app_nickname=None, base_dir=DOWNLOADS_DIR):
+    """
+    Percorso del media di un messaggio se è già stato scaricato, altrimenti None.
+    
+    Il controllo usa la bitmap del gruppo (completed_ids.py); il percorso si
+    ricava dal messaggio, perché nome ed estensione del file dipendono solo
+    da data, ID e tipo del media.
+    """
+    group_dir = path_resolver.group_dir(base_dir, app_nickname, group_name,
+                                        chat_id=getattr(message, 'chat_id', None))
+    layout = media_layouts.get(group_dir)
+    if message.id not in layout.completed_ids():
+        return None
+    timestamp = int(message.date.timestamp() if hasattr(message, 'date') else time.time())
+    media_dir = layout.media_dir(get_media_type(message), message.id, timestamp)
+    return os.path.join(media_dir, f"{timestamp}_{message.id}") + utils.get_extension(message.media)
 
-async def download_media(message, group_name, app_nickname=None, base_dir=DOWNLOADS_DIR, sender_info=None):
+def thumb_size(thumb):
+    """Dimensione in byte di una miniatura di Telegram (0 se non nota)."""
+    if isinstance(thumb, (types.PhotoCachedSize, types.PhotoStrippedSize)):
+        return len(thumb.bytes)
+    if isinstance(thumb, types.PhotoSizeProgressive):
+        return max(thumb.sizes, default=0)
+    return getattr(thumb, "size", 0) or 0
+
+async def download_media(message, group_name, app_nickname=None, base_dir=DOWNLOADS_DIR, sender_info=None, cancel_token=None):
     """Scarica il media da un messaggio e lo salva nella cartella appropriata."""
     media_type = get_media_type(message)
     if media_type == "others":
         if VERBOSE:
-            print(f"⚠️ Media non supportato (ID: {message.id})")
+            log(f"⚠️ Media non supportato (ID: {message.id})", level="warning")
         log_error(f"Media non supportato ID: {message.id}")
         return None
 
@@ -72,24 +184,31 @@ async def download_media(message, group_name, app_nickname=None, base_dir=DOWNLO
             user_folder = "unknown_user"
         sender_display = format_user_info(sender_info)
 
-    # Crea percorso per il salvataggio
-    sanitized_group_name = sanitize_group_name(group_name)
+    # Struttura: Downloads/[utente]/[gruppo]/[tipo_media]/, con le sottocartelle della
+    # disposizione del gruppo (media_layout.py)
+    group_dir = path_resolver.group_dir(base_dir, app_nickname, group_name,
+                                        chat_id=getattr(message, 'chat_id', None))
+    layout = media_layouts.get(group_dir)
+    await layout.load_completed_ids()
     
-    # Struttura: Downloads/[utente]/[gruppo]/[tipo_media]/
-    group_dir = os.path.join(base_dir, app_nickname, sanitized_group_name, media_type)
-    os.makedirs(group_dir, exist_ok=True)
+    # Media già scaricato: lo dice l'indice del gruppo, senza richieste né accessi al disco
+    existing = downloaded_media_path(message, group_name, app_nickname, base_dir)
+    if existing:
+        return existing
 
     # Genera un nome file unico basato sul timestamp e ID del messaggio
     timestamp = int(message.date.timestamp() if hasattr(message, 'date') else time.time())
     file_name = f"{timestamp}_{message.id}"
-    file_path = os.path.join(group_dir, file_name)
+    file_path = os.path.join(layout.media_dir(media_type, message.id, timestamp), file_name)
 
     # Scarica il media
-    downloaded = await safe_download_media(message, file_path)
+    downloaded = await safe_download_media(message, file_path, cancel_token=cancel_token)
     
     if downloaded:
+        layout.record(message, media_type, downloaded)
+        
         # Registra info sul media in un file JSON di metadati
-        metadata_file = os.path.join(os.path.dirname(os.path.dirname(group_dir)), "media_metadata.txt")
+        metadata_file = os.path.join(os.path.dirname(group_dir), "media_metadata.txt")
         with open(metadata_file, "a", encoding="utf-8") as f:
             date_str = message.date.strftime('%Y-%m-%d %H:%M:%S') if hasattr(message, 'date') else time.strftime('%Y-%m-%d %H:%M:%S')
             media_size = os.path.getsize(downloaded) if os.path.exists(downloaded) else "unknown"
@@ -98,8 +217,59 @@ async def download_media(message, group_name, app_nickname=None, base_dir=DOWNLO
     
     return downloaded
 
-async def save_message_content(group_name, message, app_nickname=None, base_dir=DOWNLOADS_DIR, sender_info=None):
-    """Salva il contenuto testuale di un messaggio."""
+# Task in background che collegano i media scaricati da altri account
+_duplicate_tasks = set()
+metrics.add_collector(lambda: {"dedup_pending_links": len(_duplicate_tasks)})
+
+async def download_media_once(message, group_name, app_nickname=None, sender_info=None):
+    """
+    Scarica il media di un messaggio del monitoraggio una sola volta tra tutti gli account.
+    
+    Se un altro account (di questa o di un'altra istanza) ha già prenotato il
+    messaggio, il media non viene scaricato di nuovo: in background si attende
+    il suo download e lo si registra nel catalogo del gruppo di questo account.
+    
+    Returns:
+        str: Percorso del media scaricato, oppure None (anche se gestito da un altro account)
+    """
+    if not message.is_channel:
+        # Nei gruppi base e nelle chat private gli ID dei messaggi sono diversi per ogni
+        # account: la stessa coppia (chat, messaggio) può indicare messaggi diversi
+        return await download_media(message, group_name, app_nickname, sender_info=sender_info)
+    
+    # La prenotazione legge e scrive file (e controlla i processi): fuori dall'event loop
+    claim = await asyncio.to_thread(message_claims.claim, message.chat_id, message.id, app_nickname)
+    if claim.owned:
+        path = None
+        try:
+            path = await download_media(message, group_name, app_nickname, sender_info=sender_info)
+            return path
+        finally:
+            await asyncio.to_thread(message_claims.complete, claim, path)
+    
+    media_type = get_media_type(message)
+    if media_type == "others":
+        return None
+    owner = claim.owner or "di un'altra istanza"
+    log(f"🔗 Media {message.id} già gestito dall'account {owner}, registrato nel catalogo")
+    
+    async def link_duplicate():
+        try:
+            path = await message_claims.wait_path(claim)
+            group_dir = path_resolver.group_dir(DOWNLOADS_DIR, app_nickname, group_name, message.chat_id)
+            await media_layouts.get(group_dir).load_completed_ids()
+            record_duplicate(group_dir, message, claim.owner, path, media_type)
+        except Exception as e:
+            log_error(f"Errore registrazione media duplicato {message.id}: {e}")
+    
+    task = asyncio.ensure_future(link_duplicate())
+    _duplicate_tasks.add(task)
+    task.add_done_callback(_duplicate_tasks.discard)
+    return None
+
+async def save_message_content(group_name, message, app_nickname=None, base_dir=DOWNLOADS_DIR, sender_info=None,
+                               media_path=None):
+    """Salva il contenuto testuale di un messaggio (e il percorso del suo media, nei formati strutturati)."""
     # Prepara informazioni sull'utente
     if not sender_info:
         user_id = message.sender_id if hasattr(message, 'sender_id') else "unknown"
@@ -107,22 +277,13 @@ async def save_message_content(group_name, message, app_nickname=None, base_dir=
     else:
         sender_display = format_user_info(sender_info)
 
-    sanitized_group_name = sanitize_group_name(group_name)
-    
-    # Struttura: Downloads/[utente]/[gruppo]/
-    user_group_dir = os.path.join(base_dir, app_nickname, sanitized_group_name)
-    os.makedirs(user_group_dir, exist_ok=True)
-
-    # File per i messaggi di testo per questo gruppo e utente
-    file_path = os.path.join(user_group_dir, "messages.txt")
+    # Il sink del gruppo tiene il file aperto e scrive i messaggi a blocchi
     try:
-        with open(file_path, 'a', encoding='utf-8') as f:
-            text = message.text or message.message or "<vuoto>"
-            date_str = message.date.strftime('%Y-%m-%d %H:%M:%S') if hasattr(message, 'date') else "unknown_date"
-            f.write(f"[{date_str}] {sender_display}: {text}\n")
+        sink = message_sinks.get(base_dir, app_nickname, group_name, chat_id=getattr(message, 'chat_id', None))
+        sink.write(message, sender_display, media_path)
         
         if VERBOSE:
-            print(f"💬 Salvato messaggio da {sender_display}")
+            log(f"💬 Salvato messaggio da {sender_display}")
         return True
     except Exception as e:
         log_error(f"Errore salvataggio messaggio: {e}\n{traceback.format_exc()}")
@@ -141,12 +302,7 @@ async def download_temporary_media(message, client, sender_id, app_nickname=None
             sender_name = f"user_{sender_id}"
     
     # Personalizza la cartella temporanea per questo utente
-    if app_nickname:
-        sender_folder = os.path.join(TEMP_DIR, app_nickname, sender_name)
-    else:
-        sender_folder = os.path.join(TEMP_DIR, sender_name)
-        
-    os.makedirs(sender_folder, exist_ok=True)
+    sender_folder = path_resolver.sender_dir(TEMP_DIR, app_nickname, sender_name)
 
     media_type = get_media_type(message)
     if media_type == "others":
@@ -158,28 +314,29 @@ async def download_temporary_media(message, client, sender_id, app_nickname=None
 
     return await safe_download_media(message, file_path)
 
+async def build_forward_caption(client, sender_id=None, sender_info=None):
+    """Prepara la didascalia con informazioni dettagliate sul mittente."""
+    if sender_info:
+        return f"Media inviato da {format_user_info(sender_info)}"
+    if sender_id:
+        try:
+            sender = await client.get_entity(sender_id)
+            sender_username = f"@{sender.username}" if getattr(sender, 'username', None) else None
+            caption = f"Media inviato da {utils.get_display_name(sender)}"
+            if sender_username:
+                caption += f" ({sender_username})"
+            return caption
+        except Exception:
+            return f"Media inviato da User_{sender_id}"
+    return "Media inviato"
+
 async def forward_media_clear(client, recipient_id, file_path, sender_id=None, sender_info=None):
     """Inoltra un media in chiaro a un destinatario."""
     if not os.path.exists(file_path):
         return False
 
     try:
-        # Prepara la didascalia con informazioni dettagliate sul mittente
-        if sender_info:
-            sender_display = format_user_info(sender_info)
-            caption = f"Media inviato da {sender_display}"
-        elif sender_id:
-            try:
-                sender = await client.get_entity(sender_id)
-                sender_username = f"@{sender.username}" if getattr(sender, 'username', None) else None
-                sender_name = utils.get_display_name(sender)
-                caption = f"Media inviato da {sender_name}"
-                if sender_username:
-                    caption += f" ({sender_username})"
-            except Exception:
-                caption = f"Media inviato da User_{sender_id}"
-        else:
-            caption = "Media inviato"
+        caption = await build_forward_caption(client, sender_id, sender_info)
 
         # Determina se inviare come documento o media
         mime_type, _ = mimetypes.guess_type(file_path)
@@ -192,12 +349,175 @@ async def forward_media_clear(client, recipient_id, file_path, sender_id=None, s
             force_document=not is_media
         )
 
-        print(f"✅ Media inoltrato a {recipient_id}")
+        log(f"✅ Media inoltrato a {recipient_id}")
         return True
     except Exception as e:
         log_error(f"Errore forwarding media: {e}\n{traceback.format_exc()}")
         return False
 
+async def download_to_memory(message):
+    """Scarica il media di un messaggio in un BytesIO pronto per send_file."""
+    buffer = io.BytesIO()
+    account, operation_class = client_tracking.get_client_labels(message._client)
+    
+    async def transfer():
+        async with bandwidth_governor.slot(account, operation_class):
+            await message.download_media(file=buffer, progress_callback=download_progress(account, operation_class))
+    
+    await download_schedulers.get(account).run(transfer, size=getattr(message.file, 'size', None) if message.file else None,
+                                               operation_class=operation_class)
+    buffer.name = f"{message.id}{utils.get_extension(message.media)}"  # Telethon deduce il tipo dal nome
+    buffer.seek(0)
+    return buffer
+
+async def forward_private_media(client, recipient_id, message, sender_id=None, sender_info=None):
+    """
+    Inoltra in chiaro il media di un messaggio privato senza passare dal disco.
+    
+    Prima prova a reinviare il media per riferimento (InputPhoto/InputDocument):
+    Telegram non trasferisce di nuovo il file. Se non è possibile (ad esempio per
+    i media a tempo), il media viene scaricato in memoria e ricaricato; oltre
+    PRIVATE_MEDIA_MEMORY_LIMIT si usa un file temporaneo, rimosso subito dopo.
+    
+    Returns:
+        str: Modalità usata ("riferimento", "memoria", "file") oppure None in caso di errore
+    """
+    if not is_forwardable_media(message):
+        return None
+    
+    try:
+        caption = await build_forward_caption(client, sender_id, sender_info)
+    except Exception:
+        caption = "Media inviato"
+    
+    # 1. Reinvio per riferimento
+    try:
+        await client.send_file(recipient_id, message.media, caption=caption)
+        log(f"✅ Media inoltrato a {recipient_id} (per riferimento)")
+        return "riferimento"
+    except Exception as e:
+        log(f"⚠️ Reinvio per riferimento non riuscito ({e}), ricarico il media", level="warning")
+    
+    extension = utils.get_extension(message.media)
+    mime_type, _ = mimetypes.guess_type("file" + extension)
+    is_media = bool(mime_type and mime_type.startswith(("image/", "video/")))
+    size = getattr(message.file, 'size', None) if message.file else None
+    
+    # 2. Download in memoria e nuovo upload
+    if size is not None and size <= PRIVATE_MEDIA_MEMORY_LIMIT:
+        try:
+            buffer = await download_to_memory(message)
+            await client.send_file(recipient_id, buffer, caption=caption, force_document=not is_media)
+            log(f"✅ Media inoltrato a {recipient_id} (tramite memoria)")
+            return "memoria"
+        except Exception as e:
+            log_error(f"Errore inoltro media tramite memoria: {e}\n{traceback.format_exc()}")
+            return None
+    
+    # 3. Media troppo grande (o di dimensione ignota): file temporaneo
+    temp_dir = path_resolver.ensure_dir(TEMP_DIR)
+    temp_file = await safe_download_media(message, os.path.join(temp_dir, f"forward_{int(time.time())}_{message.id}"))
+    if not temp_file:
+        return None
+    try:
+        if await forward_media_clear(client, recipient_id, temp_file, sender_id, sender_info=sender_info):
+            return "file"
+        return None
+    finally:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+
+async def forward_private_album(client, recipient_id, messages, sender_id=None, sender_info=None):
+    """
+    Inoltra in chiaro i media di un album privato con un unico invio multiplo.
+    
+    Come forward_private_media: prima per riferimento, poi scaricando tutti i
+    media in memoria in parallelo. Se l'album supera PRIVATE_MEDIA_MEMORY_LIMIT
+    (o non si può inviare come album) i media vengono inoltrati uno alla volta.
+    
+    Returns:
+        str: Modalità usata ("riferimento", "memoria", "singoli") oppure None in caso di errore
+    """
+    try:
+        caption = await build_forward_caption(client, sender_id, sender_info)
+    except Exception:
+        caption = "Media inviato"
+    
+    # 1. Reinvio per riferimento dell'intero album
+    try:
+        await client.send_file(recipient_id, [message.media for message in messages], caption=caption)
+        log(f"✅ Album di {len(messages)} media inoltrato a {recipient_id} (per riferimento)")
+        return "riferimento"
+    except Exception as e:
+        log(f"⚠️ Reinvio dell'album per riferimento non riuscito ({e}), ricarico i media", level="warning")
+    
+    # 2. Download in memoria in parallelo e un solo upload multiplo
+    sizes = [getattr(message.file, 'size', None) if message.file else None for message in messages]
+    if None not in sizes and sum(sizes) <= PRIVATE_MEDIA_MEMORY_LIMIT:
+        try:
+            buffers = await asyncio.gather(*(download_to_memory(message) for message in messages))
+            await client.send_file(recipient_id, list(buffers), caption=caption)
+            log(f"✅ Album di {len(messages)} media inoltrato a {recipient_id} (tramite memoria)")
+            return "memoria"
+        except Exception as e:
+            log(f"⚠️ Inoltro dell'album tramite memoria non riuscito ({e}), inoltro i media singolarmente", level="warning")
+    
+    # 3. Inoltro dei singoli media
+    results = []
+    for message in messages:
+        results.append(await forward_private_media(client, recipient_id, message, sender_id, sender_info=sender_info))
+    return "singoli" if all(results) else None
+
+def cleanup_private_media(max_age_days=PRIVATE_MEDIA_RETENTION_DAYS, max_total_bytes=PRIVATE_MEDIA_MAX_BYTES):
+    """
+    Applica la politica di conservazione alla cartella dei media privati.
+    
+    Rimuove i media più vecchi di max_age_days e, se la cartella supera ancora
+    max_total_bytes, i media meno recenti fino a rientrare nel limite. I file di
+    log (media_log.txt) non vengono toccati.
+    
+    Returns:
+        tuple: (file rimossi, byte liberati)
+    """
+    if not os.path.isdir(TEMP_DIR):
+        return 0, 0
+    
+    files = []
+    for root, _, names in os.walk(TEMP_DIR):
+        for name in names:
+            if name == "media_log.txt":
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+    
+    files.sort()  # Dal meno recente
+    now = time.time()
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    freed = 0
+    for mtime, size, path in files:
+        expired = max_age_days is not None and now - mtime > max_age_days * 86400
+        over_limit = max_total_bytes is not None and total > max_total_bytes
+        if not (expired or over_limit):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+        freed += size
+    
+    if removed:
+        log(f"🧹 Rimossi {removed} media privati ({freed / 1048576:.1f} MB)")
+    return removed, freed
+
 def log_saved_media(sender_id, recipient_id, file_path, app_nickname=None, sender_info=None, recipient_info=None):
     """Registra l'operazione di inoltro media."""
     if app_nickname:
@@ -215,30 +535,104 @@ def log_saved_media(sender_id, recipient_id, file_path, app_nickname=None, sende
     with open(log_file, "a", encoding="utf-8") as f:
         f.write(f"{time.strftime('%Y-%m-%d %H:%M:%S')} | Da: {sender_display} | A: {recipient_display} | File: {file_path}\n")
 
-async def create_client_for_operation(nickname, operation_id=None):
-    """Crea un client Telegram per un'operazione specifica."""
+async def create_client_for_operation(nickname, operation_id=None, operation_type="archive"):
+    """
+    Crea un client Telegram per un'operazione specifica.
+    
+    Args:
+        nickname: Nickname dell'account
+        operation_id: ID dell'operazione (se presente viene usata una sessione dedicata)
+        operation_type: Tipo di operazione per il tracciamento, le code e i limiti di banda
+    
+    Returns:
+        client: Il client creato
+        session_id: ID della sessione dedicata da rilasciare con session_manager
+                    (None se viene usata la sessione standard)
+    """
+    session_id = None
     if operation_id:
         # Usa il session manager per creare o ottenere una sessione dedicata
-        _, session_path = session_manager.create_session(nickname, "op")
+        session_id, session_path = session_manager.create_session(nickname, "op")
     else:
         # Se non c'è operation_id, usa la sessione standard
         session_path = f'session_{nickname}'
     
-    # Crea il client con la sessione
-    client = TelegramClient(
-        session_path,
-        API_ID, 
-        API_HASH,
-        connection_retries=10,
-        retry_delay=3
-    )
+    # Crea il client con la sessione (registrato nel tracciamento dei client)
+    client = client_tracking.create_client(session_path, nickname, operation_type, operation_id)
     
-    return client, session_path
+    return client, session_id
 
-async def download_group_archive(selected_group, instance_id=None, operation_id=None):
-    """Scarica tutti i media disponibili di un gruppo selezionato."""
+async def start_operation_client(client, purpose):
+    """Avvia il client di un'operazione, ritentando se il database della sessione è bloccato."""
+    # Evita conflitti con altre istanze
+    await asyncio.sleep(random.uniform(0.2, 0.5))
+    
+    # Tenta la connessione con retry
+    max_attempts = 5
+    for attempt in range(max_attempts):
+        try:
+            await client.start()
+            log(f"✅ Client connesso per {purpose}")
+            return
+        except Exception as e:
+            if "database is locked" in str(e).lower() and attempt < max_attempts - 1:
+                log(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})", level="warning")
+                await asyncio.sleep(random.uniform(1, 3) * (attempt + 1))
+            else:
+                raise
+
+async def close_operation_client(client, session_id, nickname, purpose):
+    """Disconnette il client di un'operazione e rilascia la sua sessione dedicata."""
+    # Disconnetti il client SOLO se è ancora definito e connesso
+    # Utilizziamo una variabile locale per evitare conflitti con altri client
+    try:
+        if client and client.is_connected():
+            client_id = id(client)
+            await client.disconnect()
+            log(f"🔌 Client disconnesso per {purpose} (ID: {client_id})")
+    except Exception as e:
+        log_error(f"Errore durante la disconnessione del client: {e}")
+        
+    # Rilascia la copia della sessione creata per questa operazione
+    if session_id:
+        session_manager.release_session(session_id, nickname)
+
+def load_archive_checkpoint(archive_path):
+    """Carica il checkpoint di un archivio (vuoto se non esiste)."""
+    return load_json(os.path.join(archive_path, "checkpoint.json"))
+
+def save_archive_checkpoint(archive_path, checkpoint):
+    """Salva il checkpoint di un archivio in modo atomico."""
+    checkpoint["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    save_json(os.path.join(archive_path, "checkpoint.json"), checkpoint)
+
+def archive_passes(checkpoint):
+    """
+    Calcola le scansioni necessarie per completare un archivio senza
+    ripercorrere la cronologia già salvata.
+    
+    Returns:
+        Lista di (nome, parametri per iter_messages)
+    """
+    passes = []
+    if checkpoint.get("newest_id"):
+        # Messaggi arrivati dopo l'ultima esecuzione, dal più vecchio al più recente
+        passes.append(("new", {"min_id": checkpoint["newest_id"], "reverse": True}))
+    if not checkpoint.get("completed"):
+        # Cronologia ancora da scaricare, dal punto in cui ci si era fermati
+        passes.append(("history", {"offset_id": checkpoint.get("oldest_id", 0)}))
+    return passes
+
+async def download_group_archive(selected_group, instance_id=None, operation_id=None, cancel_token=None):
+    """
+    Scarica tutti i media disponibili di un gruppo selezionato.
+    
+    L'avanzamento viene salvato in checkpoint.json: un download interrotto
+    (anche tramite cancel_token) riprende da dove si era fermato, e le esecuzioni
+    successive scaricano solo i messaggi nuovi.
+    """
     if not selected_group:
-        print("❌ Nessun gruppo selezionato.")
+        log("❌ Nessun gruppo selezionato.", level="error")
         return False
     
     nickname = selected_group["user"]
@@ -246,14 +640,12 @@ async def download_group_archive(selected_group, instance_id=None, operation_id=
     group_id = group["id"]
     group_name = group["name"]
     
-    print(f"\n📥 Avvio download archivio completo per: {group_name}")
-    print(f"👤 Utente: {nickname}")
-    print(f"🆔 ID Gruppo: {group_id}")
+    log(f"📥 Avvio download archivio completo per: {group_name}")
+    log(f"👤 Utente: {nickname}")
+    log(f"🆔 ID Gruppo: {group_id}")
     
     # Crea directory per l'archivio, organizzata per utente dell'applicazione
-    sanitized_group_name = sanitize_group_name(group_name)
-    archive_path = os.path.join(ARCHIVE_DIR, nickname, sanitized_group_name)
-    os.makedirs(archive_path, exist_ok=True)
+    archive_path = path_resolver.group_dir(ARCHIVE_DIR, nickname, group_name, chat_id=group_id)
     
     # File di log per questo specifico archivio
     log_file = os.path.join(archive_path, "download_log.txt")
@@ -265,107 +657,176 @@ async def download_group_archive(selected_group, instance_id=None, operation_id=
         operation_id = f"archive_{int(time.time())}_{random.randint(1000, 9999)}"
     
     client = None
+    session_id = None
+    checkpoint = load_archive_checkpoint(archive_path)
     
     try:
         # Crea un client con una sessione dedicata per questa operazione
-        client, session_path = await create_client_for_operation(nickname, operation_id)
+        client, session_id = await create_client_for_operation(nickname, operation_id)
         
         # Stampa l'ID del client per debug
         client_id = id(client)
-        print(f"Debug: Client ID per download_group_archive: {client_id}")
+        log(f"Debug: Client ID per download_group_archive: {client_id}", level="debug")
         
-        # Evita conflitti con altre istanze
-        await asyncio.sleep(random.uniform(0.2, 0.5))
-        
-        # Tenta la connessione con retry
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            try:
-                await client.start()
-                print("✅ Client connesso per download archivio")
-                break
-            except Exception as e:
-                if "database is locked" in str(e).lower() and attempt < max_attempts - 1:
-                    print(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})")
-                    await asyncio.sleep(random.uniform(1, 3) * (attempt + 1))
-                else:
-                    raise
+        await start_operation_client(client, "download archivio")
         
         # Ottieni l'entità del gruppo
         try:
             target_group = await client.get_entity(group_id)
-            print(f"✅ Gruppo trovato: {utils.get_display_name(target_group)}")
+            log(f"✅ Gruppo trovato: {utils.get_display_name(target_group)}")
         except Exception as e:
             log_error(f"Impossibile trovare il gruppo: {e}")
-            if client and client.is_connected():
-                await client.disconnect()
-                print(f"🔌 Client disconnesso (ID: {client_id})")
+            return False
+        
+        # Stima dei media da scaricare e controllo dello spazio su disco
+        # Scorre tutto l'archivio: fuori dall'event loop
+        usage = await asyncio.to_thread(archive_usage, archive_path)
+        await media_layouts.get(archive_path).load_completed_ids()
+        quota = DiskQuota(archive_path, used_bytes=usage["total"][1])
+        try:
+            estimate = await estimate_archive(client, target_group, usage)
+            log_estimate(estimate)
+        except Exception as e:
+            log(f"⚠️ Stima della dimensione dell'archivio non disponibile: {e}", level="warning")
+            estimate = None
+        reason = quota.preflight(estimate) if estimate else quota.check()
+        if reason:
+            log_error(f"Download dell'archivio non avviato: {reason}")
             return False
         
         # Statistiche
         total_messages = 0
         media_count = 0
+        existing_count = 0
         text_count = 0
         users_found = set()
         
         # Timestamp per monitoraggio
         start_time = time.time()
-        last_update = start_time
         
-        print("\n⏳ Download in corso... (potrebbe richiedere tempo)")
+        if checkpoint:
+            log(f"↩️ Ripresa dal checkpoint (messaggi già processati: {checkpoint.get('processed', 0)})")
+        log("⏳ Download in corso... (potrebbe richiedere tempo)")
+        
+        # Il conteggio totale dei messaggi (una sola richiesta) permette di stimare l'ETA
+        try:
+            total_count = (await client.get_messages(target_group, limit=0)).total
+            total_count = max(total_count - checkpoint.get("processed", 0), 0) or None
+        except Exception:
+            total_count = None
+        tracker = ProgressTracker("Download archivio", total=total_count)
         
         # Cache degli utenti per evitare richieste ripetute
         user_cache = {}
+        cancelled = False
         
-        # Scarica tutti i messaggi
-        async for message in client.iter_messages(target_group):
-            total_messages += 1
-            
-            # Aggiorna lo stato ogni 50 messaggi o ogni 10 secondi
-            current_time = time.time()
-            if total_messages % 50 == 0 or current_time - last_update > 10:
-                print(f"💬 Messaggi processati: {total_messages} (Media: {media_count}, Testo: {text_count}, Utenti: {len(users_found)})")
-                last_update = current_time
-            
-            # Ottieni informazioni sul mittente
-            sender_id = message.sender_id
-            if sender_id:
-                if sender_id not in user_cache:
-                    try:
-                        sender = await client.get_entity(sender_id)
-                        user_cache[sender_id] = {
-                            "id": sender_id,
-                            "username": getattr(sender, 'username', None),
-                            "first_name": getattr(sender, 'first_name', None),
-                            "last_name": getattr(sender, 'last_name', None),
-                            "display_name": utils.get_display_name(sender)
-                        }
-                        users_found.add(sender_id)
-                    except Exception:
-                        user_cache[sender_id] = {"id": sender_id, "display_name": f"User_{sender_id}"}
+        # Scarica i messaggi, una scansione per ogni intervallo ancora da coprire
+        for pass_name, iter_kwargs in archive_passes(checkpoint):
+            async for message in client.iter_messages(target_group, **iter_kwargs):
+                # Punto sicuro: il messaggio precedente è stato salvato completamente
+                if is_cancelled(cancel_token):
+                    cancelled = True
+                    break
                 
-                sender_info = user_cache[sender_id]
-                sender_display = format_user_info(sender_info)
-            else:
-                sender_info = None
-                sender_display = "Mittente sconosciuto"
-            
-            # Salva il testo del messaggio
-            if message.text or message.message:
-                await save_message_content(group_name, message, nickname, ARCHIVE_DIR, sender_info=sender_info)
-                text_count += 1
-                if VERBOSE:
-                    print(f"💬 Salvato messaggio di {sender_display}")
+                total_messages += 1
+                
+                # Ottieni informazioni sul mittente
+                sender_id = message.sender_id
+                if sender_id:
+                    if sender_id not in user_cache:
+                        try:
+                            sender = await client.get_entity(sender_id)
+                            user_cache[sender_id] = {
+                                "id": sender_id,
+                                "username": getattr(sender, 'username', None),
+                                "first_name": getattr(sender, 'first_name', None),
+                                "last_name": getattr(sender, 'last_name', None),
+                                "display_name": utils.get_display_name(sender)
+                            }
+                            users_found.add(sender_id)
+                        except Exception:
+                            user_cache[sender_id] = {"id": sender_id, "display_name": f"User_{sender_id}"}
+                    
+                    sender_info = user_cache[sender_id]
+                    sender_display = format_user_info(sender_info)
+                else:
+                    sender_info = None
+                    sender_display = "Mittente sconosciuto"
+                
+                # Scarica il media se presente
+                downloaded_bytes = 0
+                media_path = None
+                if message.media:
+                    media_type = get_media_type(message)
+                    existing_path = (downloaded_media_path(message, group_name, nickname, ARCHIVE_DIR)
+                                     if media_type != "others" else None)
+                    if existing_path:
+                        # Già scaricato da un'esecuzione precedente (ad esempio con il checkpoint perso)
+                        existing_count += 1
+                        media_path = existing_path
+                    elif media_type != "others":
+                        # Senza spazio ci si ferma prima del messaggio, che verrà ripreso dal checkpoint
+                        reason = quota.check(getattr(message.file, "size", None) or 0)
+                        if reason:
+                            log(f"⏸️ Download in pausa: {reason}. Riavvialo per riprendere dal checkpoint",
+                                level="warning")
+                            cancelled = True
+                            break
+                        try:
+                            result = await download_media(message, group_name, nickname, ARCHIVE_DIR,
+                                                          sender_info=sender_info, cancel_token=cancel_token)
+                        except OperationCancelled:
+                            # Download interrotto: il messaggio verrà ripreso alla prossima esecuzione
+                            cancelled = True
+                            break
+                        if result:
+                            media_count += 1
+                            media_path = result
+                            downloaded_bytes = os.path.getsize(result)
+                            quota.add(downloaded_bytes)
+                            if VERBOSE:
+                                log(f"📥 Salvato {media_type} di {sender_display}")
+                        else:
+                            # Un download fallito per disco pieno non deve far saltare il messaggio
+                            reason = quota.check()
+                            if reason:
+                                log(f"⏸️ Download in pausa: {reason}. Riavvialo per riprendere dal checkpoint",
+                                    level="warning")
+                                cancelled = True
+                                break
+                
+                # Salva il testo del messaggio (nei formati strutturati ogni messaggio, con il suo media)
+                has_text = bool(message.text or message.message)
+                if has_text or message_sinks.structured:
+                    await save_message_content(group_name, message, nickname, ARCHIVE_DIR, sender_info=sender_info,
+                                               media_path=media_path)
+                if has_text:
+                    text_count += 1
+                    if VERBOSE:
+                        log(f"💬 Salvato messaggio di {sender_display}")
+                
+                # Aggiorna il checkpoint: il messaggio è stato processato completamente
+                if pass_name == "new":
+                    checkpoint["newest_id"] = message.id
+                else:
+                    checkpoint["oldest_id"] = message.id
+                    checkpoint.setdefault("newest_id", message.id)
+                checkpoint["processed"] = checkpoint.get("processed", 0) + 1
+                if total_messages % 100 == 0:
+                    # I messaggi coperti dal checkpoint devono essere già su disco
+                    message_sinks.get(ARCHIVE_DIR, nickname, group_name, chat_id=group_id).flush()
+                    save_archive_checkpoint(archive_path, checkpoint)
+                
+                tracker.update(messages=1, nbytes=downloaded_bytes, media=1 if downloaded_bytes else 0)
             
-            # Scarica il media se presente
-            if message.media:
-                media_type = get_media_type(message)
-                if media_type != "others":
-                    result = await download_media(message, group_name, nickname, ARCHIVE_DIR, sender_info=sender_info)
-                    if result:
-                        media_count += 1
-                        if VERBOSE:
-                            print(f"📥 Salvato {media_type} di {sender_display}")
+            if cancelled:
+                break
+            if pass_name == "history":
+                checkpoint["completed"] = True
+        
+        message_sinks.close(ARCHIVE_DIR, nickname, group_id)
+        save_archive_checkpoint(archive_path, checkpoint)
+        tracker.emit()
         
         # Salva informazioni sugli utenti
         users_file = os.path.join(archive_path, "users.txt")
@@ -379,39 +840,46 @@ async def download_group_archive(selected_group, instance_id=None, operation_id=
         
         # Statistiche finali
         duration = time.time() - start_time
-        print(f"\n✅ Download completato in {duration:.1f} secondi")
-        print(f"📊 Statistiche:")
-        print(f"   - Messaggi totali: {total_messages}")
-        print(f"   - Media scaricati: {media_count}")
-        print(f"   - Messaggi di testo: {text_count}")
-        print(f"   - Utenti trovati: {len(users_found)}")
-        print(f"📁 Archivio salvato in: {os.path.abspath(archive_path)}")
-        print(f"👥 Elenco degli utenti salvato in: {os.path.abspath(users_file)}")
+        if cancelled:
+            log(f"🛑 Download interrotto dopo {duration:.1f} secondi: verrà ripreso dal checkpoint")
+        else:
+            log(f"✅ Download completato in {duration:.1f} secondi")
+        log("📊 Statistiche:")
+        log(f"   - Messaggi totali: {total_messages}")
+        log(f"   - Media scaricati: {media_count}")
+        if existing_count:
+            log(f"   - Media già presenti: {existing_count}")
+        log(f"   - Messaggi di testo: {text_count}")
+        log(f"   - Utenti trovati: {len(users_found)}")
+        log(f"📁 Archivio salvato in: {os.path.abspath(archive_path)}")
+        log(f"👥 Elenco degli utenti salvato in: {os.path.abspath(users_file)}")
         
         # Aggiorna il log
         with open(log_file, "a", encoding="utf-8") as f:
-            f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Download completato\n")
+            status = "Download interrotto" if cancelled else "Download completato"
+            f.write(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {status}\n")
             f.write(f"Messaggi totali: {total_messages}\n")
             f.write(f"Media scaricati: {media_count}\n")
+            if existing_count:
+                f.write(f"Media già presenti: {existing_count}\n")
             f.write(f"Messaggi di testo: {text_count}\n")
             f.write(f"Utenti trovati: {len(users_found)}\n")
             f.write(f"Durata: {duration:.1f} secondi\n")
         
-        return True
+        # Esportazione dei file nuovi in un contenitore compresso (facoltativa)
+        if ARCHIVE_EXPORT_AFTER_DOWNLOAD and not cancelled:
+            from archive_export import export_archive
+            try:
+                await asyncio.to_thread(export_archive, archive_path, None, EXPORT_FORMAT, cancel_token)
+            except Exception as e:
+                log_error(f"Errore durante l'esportazione dell'archivio: {e}")
+        
+        return not cancelled
     except Exception as e:
         log_error(f"Errore durante il download dell'archivio: {e}\n{traceback.format_exc()}")
+        if checkpoint:
+            message_sinks.close(ARCHIVE_DIR, nickname, group_id)
+            save_archive_checkpoint(archive_path, checkpoint)
         return False
     finally:
-        # Disconnetti il client SOLO se è ancora definito e connesso
-        # Utilizziamo una variabile locale per evitare conflitti con altri client
-        try:
-            if client and client.is_connected():
-                client_id = id(client)
-                await client.disconnect()
-                print(f"🔌 Client disconnesso per download archivio (ID: {client_id})")
-        except Exception as e:
-            log_error(f"Errore durante la disconnessione del client: {e}")
-            
-        # Rilascia la sessione
-        if operation_id:
-            session_manager.release_session(operation_id, nickname)
\ No newline at end of file
+        await close_operation_client(client, session_id, nickname, "download archivio")
@@ -0,0 +1,339 @@
+"""
+Disposizione dei media nelle cartelle dei gruppi e catalogo dei file.
+
+Con la disposizione "flat" (predefinita) ogni tipo di media sta in una sola
+cartella, <gruppo>/<tipo>/: con centinaia di migliaia di file elencarla,
+copiarla o anche solo controllare se un file esiste diventa lento. Con
+MEDIA_LAYOUT si può scegliere per i nuovi gruppi una disposizione divisa in
+sottocartelle:
+
+- "date": <tipo>/<anno>/<mese>/ in base alla data del messaggio;
+- "hash": <tipo>/<xx>/ con le prime cifre esadecimali dell'MD5 dell'ID del
+  messaggio (MEDIA_HASH_SHARD_CHARS), che distribuisce i file in modo uniforme.
+
+La disposizione di ogni gruppo è salvata in layout.json nella sua cartella:
+i gruppi già esistenti restano "flat" finché non vengono convertiti con
+
+    python media_layout.py migrate archive/<utente>/<gruppo> --layout hash
+
+(anche su una cartella utente o su archive/ per convertirli tutti, con
+l'applicazione ferma). I gruppi con layout.json hanno un catalogo completo,
+media_catalogue.jsonl, che associa ogni ID di messaggio al percorso del suo
+file: trovare un media o contare quelli scaricati non richiede di leggere
+le cartelle. Ogni gruppo ha inoltre l'indice completed_ids.bin
+(completed_ids.py) per sapere subito se un media è già stato scaricato; se
+dei file vengono rimossi a mano, catalogo e indice si ricostruiscono con
+
+    python media_layout.py reindex archive/<utente>/<gruppo>
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from completed_ids import COMPLETED_FILE, CompletedIds, build
+from config import MEDIA_LAYOUT, MEDIA_HASH_SHARD_CHARS
+from event_bus import log
+from path_resolver import path_resolver
+from utils import load_json, save_json
+
+LAYOUT_FILE = "layout.json"
+CATALOGUE_FILE = "media_catalogue.jsonl"
+LAYOUTS = ("flat", "date", "hash")
+
+# Cartelle dei tipi di media (vedi get_media_type in media_handler.py)
+MEDIA_TYPES = ("images", "videos", "audio", "voice", "documents", "stickers", "gifs")
+
+# Nome dei media salvati dall'applicazione: <timestamp>_<id messaggio>.<estensione>
+MEDIA_NAME = re.compile(r"^(\d+)_(\d+)(\.[^.]+)?$")
+
+def shard(layout, message_id, timestamp):
+    """Sottocartella di un media all'interno di quella del suo tipo ("" per flat)."""
+    if layout == "date":
+        return time.strftime("%Y/%m", time.gmtime(timestamp))
+    if layout == "hash":
+        return hashlib.md5(str(message_id).encode()).hexdigest()[:MEDIA_HASH_SHARD_CHARS]
+    return ""
+
+class GroupLayout:
+    """Disposizione e catalogo dei media della cartella di un gruppo."""
+
+    def __init__(self, group_dir):
+        self.group_dir = group_dir
+        self._files = None  # {ID messaggio: percorso relativo}, caricato al primo uso
+        self._completed = None  # Bitmap dei messaggi completati (completed_ids.py)
+        self._lock = threading.Lock()
+        self._new = False  # layout.json va scritto al primo media salvato
+        layout_file = os.path.join(group_dir, LAYOUT_FILE)
+        settings = load_json(layout_file) if os.path.exists(layout_file) else None
+        if settings:
+            self.layout = settings.get("layout", "flat")
+            self.indexed = settings.get("indexed", False)
+        elif any(os.path.isdir(os.path.join(group_dir, media_type)) for media_type in MEDIA_TYPES):
+            # Gruppo creato prima del catalogo: resta flat finché non viene convertito
+            self.layout = "flat"
+            self.indexed = False
+        else:
+            self.layout = MEDIA_LAYOUT
+            self.indexed = True
+            self._new = True
+
+    def media_dir(self, media_type, message_id, timestamp):
+        """Restituisce (creandola se serve) la cartella in cui salvare un media."""
+        if self._new:
+            self._new = False
+            save_json(os.path.join(path_resolver.ensure_dir(self.group_dir), LAYOUT_FILE),
+                      {"layout": self.layout, "indexed": True})
+        subdir = shard(self.layout, message_id, timestamp)
+        return path_resolver.ensure_dir(os.path.join(self.group_dir, media_type, subdir))
+
+    def completed_ids(self):
+        """Bitmap dei messaggi con il media già salvato, ricostruita dal disco se manca."""
+        with self._lock:
+            if self._completed is None:
+                path = os.path.join(self.group_dir, COMPLETED_FILE)
+                if not os.path.exists(path):
+                    message_ids = self._saved_ids()
+                    if message_ids:
+                        log(f"🗂️ Indice dei media di {self.group_dir} ricostruito ({len(message_ids)} media)")
+                    build(path, message_ids)
+                self._completed = CompletedIds(path)
+            return self._completed
+
+    async def load_completed_ids(self):
+        """
+        Come completed_ids, ma la prima ricostruzione (che può scorrere tutte le
+        cartelle dei media) avviene fuori dall'event loop.
+        """
+        if self._completed is None:
+            return await asyncio.to_thread(self.completed_ids)
+        return self._completed
+
+    def _saved_ids(self):
+        """ID dei messaggi con un media salvato, dal catalogo se è completo, altrimenti dalle cartelle."""
+        if self.indexed:
+            return {entry["message_id"] for entry in read_catalogue(self.group_dir) if entry.get("file")}
+        message_ids = set()
+        for media_type in MEDIA_TYPES:
+            for _, _, names in os.walk(os.path.join(self.group_dir, media_type)):
+                for name in names:
+                    match = MEDIA_NAME.match(name)
+                    if match:
+                        message_ids.add(int(match.group(2)))
+        return message_ids
+
+    def _load(self):
+        if self._files is None:
+            files = {}
+            for entry in read_catalogue(self.group_dir):
+                if entry.get("file"):
+                    files[entry["message_id"]] = entry["file"]
+            self._files = files
+        return self._files
+
+    def lookup(self, message_id):
+        """Percorso del media già scaricato di un messaggio, oppure None."""
+        with self._lock:
+            relative = self._load().get(message_id)
+        return os.path.join(self.group_dir, relative) if relative else None
+
+    def record(self, message, media_type, file_path, **extra):
+        """Aggiunge al catalogo il media di un messaggio salvato in file_path (None se non disponibile)."""
+        relative = os.path.relpath(file_path, self.group_dir).replace(os.sep, "/") if file_path else None
+        entry = {
+            "chat_id": getattr(message, 'chat_id', None),
+            "message_id": message.id,
+            "date": message.date.isoformat() if getattr(message, 'date', None) else None,
+            "type": media_type,
+            "file": relative,
+            "size": os.path.getsize(file_path) if file_path else None,
+        }
+        entry.update(extra)
+        with self._lock:
+            with open(os.path.join(self.group_dir, CATALOGUE_FILE), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            if relative and self._files is not None:
+                self._files[message.id] = relative
+        if relative:
+            self.completed_ids().add(message.id)
+
+    def usage(self):
+        """
+        File e byte per tipo di media secondo il catalogo.
+
+        Returns:
+            dict: {tipo: (file, byte)}, oppure None se il catalogo del gruppo non è completo
+        """
+        if not self.indexed:
+            return None
+        latest = {}
+        for entry in read_catalogue(self.group_dir):
+            if entry.get("file"):
+                latest[entry["message_id"]] = entry
+        usage = {}
+        for entry in latest.values():
+            files, size = usage.get(entry["type"], (0, 0))
+            usage[entry["type"]] = (files + 1, size + (entry.get("size") or 0))
+        return usage
+
+class MediaLayouts:
+    """Registro delle disposizioni dei gruppi usati in questa esecuzione."""
+
+    def __init__(self):
+        self._groups = {}
+        self._lock = threading.Lock()
+
+    def get(self, group_dir):
+        with self._lock:
+            layout = self._groups.get(group_dir)
+            if layout is None:
+                layout = self._groups[group_dir] = GroupLayout(group_dir)
+            return layout
+
+    def forget(self, group_dir):
+        """Dimentica un gruppo (ad esempio dopo una conversione)."""
+        with self._lock:
+            layout = self._groups.pop(group_dir, None)
+        if layout is not None and layout._completed is not None:
+            layout._completed.close()
+
+# Istanza singleton condivisa da download, archivio e monitoraggio
+media_layouts = MediaLayouts()
+
+def read_catalogue(group_dir):
+    """Legge le voci di media_catalogue.jsonl (ignorando righe troncate)."""
+    catalogue_path = os.path.join(group_dir, CATALOGUE_FILE)
+    if not os.path.exists(catalogue_path):
+        return
+    with open(catalogue_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+def find_group_dirs(path):
+    """Cartelle dei gruppi (con almeno una cartella di media) sotto path."""
+    group_dirs = []
+    for root, dirs, _ in os.walk(path):
+        if any(media_type in dirs for media_type in MEDIA_TYPES):
+            group_dirs.append(root)
+            # Non scendere nelle cartelle dei media
+            dirs[:] = []
+    return sorted(group_dirs)
+
+def migrate_group(group_dir, layout, dry_run=False):
+    """
+    Converte i media di un gruppo alla disposizione richiesta e ricostruisce
+    dal disco il catalogo e l'indice dei media scaricati.
+
+    Si può ripetere: una conversione interrotta viene completata dalla successiva.
+
+    Returns:
+        dict: {"files", "moved", "skipped"}
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Disposizione non valida: {layout}")
+    if not dry_run:
+        # L'indice del gruppo verrà sostituito: va chiuso se è aperto
+        media_layouts.forget(group_dir)
+    previous = {}
+    for entry in read_catalogue(group_dir):
+        previous[entry["message_id"]] = entry
+    entries = dict(previous)
+    found = set()
+    stats = {"files": 0, "moved": 0, "skipped": 0}
+
+    for media_type in MEDIA_TYPES:
+        type_dir = os.path.join(group_dir, media_type)
+        for root, dirs, names in os.walk(type_dir, topdown=False):
+            for name in names:
+                match = MEDIA_NAME.match(name)
+                if not match:
+                    # File temporanei o non creati dall'applicazione: restano dove sono
+                    stats["skipped"] += 1
+                    continue
+                timestamp, message_id = int(match.group(1)), int(match.group(2))
+                source = os.path.join(root, name)
+                target_dir = os.path.join(type_dir, shard(layout, message_id, timestamp))
+                target = os.path.join(target_dir, name)
+                stats["files"] += 1
+                if os.path.normpath(source) != os.path.normpath(target):
+                    stats["moved"] += 1
+                    if not dry_run:
+                        os.makedirs(target_dir, exist_ok=True)
+                        os.replace(source, target)
+                entry = dict(previous.get(message_id) or {
+                    "message_id": message_id,
+                    "date": time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(timestamp)),
+                    "type": media_type,
+                })
+                entry["file"] = os.path.relpath(target, group_dir).replace(os.sep, "/")
+                entry["size"] = os.path.getsize(target if not dry_run else source)
+                entries[message_id] = entry
+                found.add(message_id)
+            if not dry_run and root != type_dir and not os.listdir(root):
+                # Sottocartella svuotata dalla conversione
+                os.rmdir(root)
+                path_resolver.forget_dir(root)
+
+    for message_id, entry in entries.items():
+        # Media rimossi dal disco: la voce resta senza file
+        if message_id not in found and entry.get("file"):
+            entries[message_id] = dict(entry, file=None)
+
+    if dry_run:
+        return stats
+    # Il catalogo viene sostituito in un colpo solo, poi la disposizione diventa effettiva
+    catalogue_path = os.path.join(group_dir, CATALOGUE_FILE)
+    with open(catalogue_path + ".temp", "w", encoding="utf-8") as f:
+        for message_id in sorted(entries):
+            f.write(json.dumps(entries[message_id], ensure_ascii=False) + "\n")
+    os.replace(catalogue_path + ".temp", catalogue_path)
+    build(os.path.join(group_dir, COMPLETED_FILE), found)
+    save_json(os.path.join(group_dir, LAYOUT_FILE), {"layout": layout, "indexed": True})
+    media_layouts.forget(group_dir)
+    return stats
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Disposizione dei media nelle cartelle dei gruppi")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = commands.add_parser("migrate", help="Converte i gruppi a una nuova disposizione")
+    migrate_parser.add_argument("path", help="Cartella di un gruppo, di un utente oppure archive/ o downloads/")
+    migrate_parser.add_argument("--layout", choices=LAYOUTS, default=MEDIA_LAYOUT, help="Disposizione di destinazione")
+    migrate_parser.add_argument("--dry-run", action="store_true", help="Mostra cosa verrebbe spostato senza modificare nulla")
+
+    reindex_parser = commands.add_parser("reindex", help="Ricostruisce dal disco catalogo e indice dei media")
+    reindex_parser.add_argument("path", help="Cartella di un gruppo, di un utente oppure archive/ o downloads/")
+
+    find_parser = commands.add_parser("find", help="Trova il media di un messaggio tramite il catalogo")
+    find_parser.add_argument("group_dir", help="Cartella del gruppo")
+    find_parser.add_argument("message_id", type=int, help="ID del messaggio")
+
+    args = parser.parse_args()
+    if args.command in ("migrate", "reindex"):
+        group_dirs = find_group_dirs(args.path)
+        if not group_dirs:
+            print(f"Nessuna cartella di gruppo in {args.path}")
+        for group_dir in group_dirs:
+            if args.command == "reindex":
+                # Stessa disposizione: non sposta nulla, rilegge solo i file presenti
+                stats = migrate_group(group_dir, GroupLayout(group_dir).layout)
+                print(f"✅ {group_dir}: {stats['files']} media indicizzati")
+                continue
+            stats = migrate_group(group_dir, args.layout, args.dry_run)
+            action = "da spostare" if args.dry_run else "spostati"
+            print(f"{'🔍' if args.dry_run else '✅'} {group_dir}: {stats['files']} media, {stats['moved']} {action}"
+                  + (f", {stats['skipped']} file ignorati" if stats["skipped"] else ""))
+    else:
+        path = GroupLayout(args.group_dir).lookup(args.message_id)
+        print(path or f"Messaggio {args.message_id} non presente nel catalogo")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""
+Anteprima degli archivi: miniature e metadati al posto dei media completi.
+
+Per capire cosa contiene un gruppo prima di scaricarne terabyte,
+preview_group_archive scorre solo i messaggi con media (ricerca per tipo,
+senza leggere i messaggi di testo) e per ognuno salva in
+archive/<utente>/<gruppo>/previews/:
+
+- <tipo>/<timestamp>_<id>.jpg: la miniatura più grande che non supera
+  PREVIEW_THUMB_MAX_SIDE pixel (le sottocartelle seguono la disposizione dei
+  media del gruppo, vedi media_layout.py);
+- preview.jsonl: una riga per media con tipo, MIME, dimensione, risoluzione,
+  durata, nome del file, didascalia e percorso della miniatura.
+
+Le miniature vengono scaricate in parallelo (PREVIEW_CONCURRENCY) dalla coda
+dell'account; l'anteprima interrotta riprende dai media mancanti
+(previews/completed_ids.bin). I media scelti dall'anteprima si scaricano poi
+in originale con promote_media, nelle normali cartelle dell'archivio.
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+
+from telethon.tl import types
+
+from archive_estimate import MEDIA_FILTERS, DiskQuota, archive_usage
+from completed_ids import COMPLETED_FILE, CompletedIds
+from config import ARCHIVE_DIR, PREVIEW_DIR_NAME, PREVIEW_THUMB_MAX_SIDE, PREVIEW_CONCURRENCY
+from event_bus import log
+from media_handler import (
+    create_client_for_operation, start_operation_client, close_operation_client, download_media,
+    get_media_type, safe_download_media, thumb_size
+)
+from media_layout import media_layouts, shard
+from operation_control import OperationCancelled, ProgressTracker, is_cancelled
+from path_resolver import path_resolver
+from utils import log_error
+
+PREVIEW_FILE = "preview.jsonl"
+CAPTION_CHARS = 200  # Caratteri della didascalia conservati nell'anteprima
+INLINE_THUMBS = (types.PhotoStrippedSize, types.PhotoCachedSize)  # Miniature incluse nel messaggio
+
+def pick_thumb(message):
+    """
+    Sceglie la miniatura da scaricare per un media.
+
+    Returns:
+        La miniatura più grande entro PREVIEW_THUMB_MAX_SIDE pixel, altrimenti quella
+        minuscola inclusa nel messaggio (senza richieste a Telegram) o la più piccola
+        disponibile, oppure None se il media non ha miniature. Con PREVIEW_THUMB_MAX_SIDE
+        a 0 solo le miniature incluse nel messaggio.
+    """
+    if message.photo:
+        sizes = message.photo.sizes
+    elif message.document:
+        sizes = message.document.thumbs or []
+    else:
+        return None
+    candidates = [size for size in sizes if isinstance(size, (types.PhotoSize, types.PhotoSizeProgressive))]
+    fitting = [size for size in candidates if max(size.w, size.h) <= PREVIEW_THUMB_MAX_SIDE]
+    if fitting:
+        return max(fitting, key=lambda size: size.w * size.h)
+    inline = [size for size in sizes if isinstance(size, INLINE_THUMBS)]
+    if inline:
+        # PhotoCachedSize (con dimensioni) è migliore della PhotoStrippedSize
+        return max(inline, key=lambda size: getattr(size, "w", 0))
+    if PREVIEW_THUMB_MAX_SIDE <= 0:
+        return None
+    return min(candidates, key=lambda size: size.w * size.h) if candidates else None
+
+def media_metadata(message, media_type):
+    """Metadati leggeri di un media (i valori non disponibili vengono omessi)."""
+    file = message.file
+    entry = {
+        "message_id": message.id,
+        "date": message.date.isoformat() if getattr(message, 'date', None) else None,
+        "type": media_type,
+        "mime": getattr(file, "mime_type", None),
+        "size": getattr(file, "size", None),
+        "width": getattr(file, "width", None),
+        "height": getattr(file, "height", None),
+        "duration": getattr(file, "duration", None),
+        "name": getattr(file, "name", None),
+        "caption": (message.message or "")[:CAPTION_CHARS] or None,
+    }
+    return {key: value for key, value in entry.items() if value is not None}
+
+def read_preview(archive_path):
+    """Restituisce {ID messaggio: metadati} dall'anteprima di un archivio (vale l'ultima riga)."""
+    entries = {}
+    preview_file = os.path.join(archive_path, PREVIEW_DIR_NAME, PREVIEW_FILE)
+    if not os.path.exists(preview_file):
+        return entries
+    with open(preview_file, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            entries[entry["message_id"]] = entry
+    return entries
+
+def select_preview(archive_path, media_types=None, min_size=0, max_size=None, min_duration=None):
+    """
+    Sceglie dall'anteprima i media da scaricare in originale.
+
+    Args:
+        archive_path: Cartella dell'archivio del gruppo
+        media_types: Tipi di media da includere (None = tutti)
+        min_size, max_size: Intervallo di dimensione in byte
+        min_duration: Durata minima in secondi (per video e audio)
+
+    Returns:
+        list: ID dei messaggi, in ordine crescente
+    """
+    selected = []
+    for message_id, entry in read_preview(archive_path).items():
+        size = entry.get("size") or 0
+        if media_types and entry["type"] not in media_types:
+            continue
+        if size < min_size or (max_size is not None and size > max_size):
+            continue
+        if min_duration is not None and (entry.get("duration") or 0) < min_duration:
+            continue
+        selected.append(message_id)
+    return sorted(selected)
+
+def _group_info(selected_group):
+    group = selected_group["group"]
+    archive_path = path_resolver.group_dir(ARCHIVE_DIR, selected_group["user"], group["name"], chat_id=group["id"])
+    return selected_group["user"], group["id"], group["name"], archive_path
+
+async def preview_group_archive(selected_group, instance_id=None, operation_id=None, cancel_token=None,
+                                media_types=None):
+    """
+    Crea l'anteprima di un gruppo: miniature e metadati di tutti i media.
+
+    Args:
+        selected_group: Gruppo selezionato ({"user", "group": {"id", "name"}})
+        instance_id: ID dell'istanza (non usato, per uniformità con download_group_archive)
+        operation_id: ID dell'operazione (generato se assente)
+        cancel_token: Token per interrompere l'anteprima
+        media_types: Tipi di media da includere (None = tutti)
+
+    Returns:
+        dict: Riepilogo ({"media", "thumbs", "missing", "bytes", "cancelled"}), oppure None in caso di errore
+    """
+    if not selected_group:
+        log("❌ Nessun gruppo selezionato.", level="error")
+        return None
+    nickname, group_id, group_name, archive_path = _group_info(selected_group)
+    preview_dir = path_resolver.ensure_dir(os.path.join(archive_path, PREVIEW_DIR_NAME))
+    layout = media_layouts.get(archive_path).layout
+    operation_id = operation_id or f"preview_{int(time.time())}_{random.randint(1000, 9999)}"
+    log(f"🔍 Avvio anteprima dell'archivio per: {group_name}")
+
+    done = CompletedIds(os.path.join(preview_dir, COMPLETED_FILE))
+    summary = {"media": 0, "thumbs": 0, "missing": 0, "bytes": 0, "cancelled": False}
+    client = None
+    session_id = None
+    try:
+        client, session_id = await create_client_for_operation(nickname, operation_id, "preview")
+        await start_operation_client(client, "anteprima archivio")
+        try:
+            entity = await client.get_entity(group_id)
+        except Exception as e:
+            log_error(f"Impossibile trovare il gruppo: {e}")
+            return None
+
+        tracker = ProgressTracker("Anteprima archivio")
+        slots = asyncio.Semaphore(PREVIEW_CONCURRENCY)
+        pending = set()
+
+        with open(os.path.join(preview_dir, PREVIEW_FILE), "a", encoding="utf-8") as preview_file:
+            async def preview(message, media_type):
+                try:
+                    entry = media_metadata(message, media_type)
+                    thumb = pick_thumb(message)
+                    thumb_bytes = 0
+                    if thumb is not None:
+                        timestamp = int(message.date.timestamp())
+                        thumb_dir = path_resolver.ensure_dir(
+                            os.path.join(preview_dir, media_type, shard(layout, message.id, timestamp)))
+                        file_path = os.path.join(thumb_dir, f"{timestamp}_{message.id}")
+                        if isinstance(thumb, INLINE_THUMBS):
+                            # Già incluse nel messaggio: nessuna richiesta, niente coda dei download
+                            path = await message.download_media(file=file_path + ".jpg", thumb=thumb)
+                        else:
+                            path = await safe_download_media(message, file_path, cancel_token=cancel_token, thumb=thumb)
+                        if path:
+                            entry["thumb"] = os.path.relpath(path, archive_path).replace(os.sep, "/")
+                            thumb_bytes = thumb_size(thumb)
+                            summary["thumbs"] += 1
+                            summary["bytes"] += thumb_bytes
+                    preview_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    summary["media"] += 1
+                    if thumb is not None and "thumb" not in entry:
+                        # Miniatura non scaricata: il media verrà ripreso alla prossima anteprima
+                        summary["missing"] += 1
+                    else:
+                        done.add(message.id)
+                    tracker.update(messages=1, nbytes=thumb_bytes)
+                except OperationCancelled:
+                    summary["cancelled"] = True
+                except Exception as e:
+                    log_error(f"Errore nell'anteprima del media {message.id}: {e}")
+                finally:
+                    slots.release()
+
+            try:
+                for filter_type, media_filter in MEDIA_FILTERS.items():
+                    if summary["cancelled"]:
+                        break
+                    if media_types and filter_type not in media_types:
+                        continue
+                    async for message in client.iter_messages(entity, filter=media_filter()):
+                        if is_cancelled(cancel_token):
+                            summary["cancelled"] = True
+                            break
+                        media_type = get_media_type(message)
+                        # Un messaggio può comparire in più ricerche (es. un video inviato come file)
+                        if media_type == "others" or message.id in done:
+                            continue
+                        if media_types and media_type not in media_types:
+                            continue
+                        await slots.acquire()
+                        task = asyncio.ensure_future(preview(message, media_type))
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+                if pending:
+                    await asyncio.gather(*pending)
+            finally:
+                # Dopo un errore (o una cancellazione) le miniature in corso vanno fermate
+                # prima di chiudere preview.jsonl e completed_ids.bin
+                if pending:
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+        tracker.emit()
+
+        status = "interrotta (riprenderà dai media mancanti)" if summary["cancelled"] else "completata"
+        log(f"✅ Anteprima {status}: {summary['media']} media, {summary['thumbs']} miniature "
+            f"({summary['bytes'] / 1048576:.1f} MB) in {os.path.abspath(preview_dir)}")
+        if summary["missing"]:
+            log(f"⚠️ {summary['missing']} miniature non scaricate: verranno riprovate alla prossima anteprima",
+                level="warning")
+        return summary
+    except Exception as e:
+        log_error(f"Errore durante l'anteprima dell'archivio: {e}")
+        return None
+    finally:
+        done.close()
+        await close_operation_client(client, session_id, nickname, "anteprima archivio")
+
+async def promote_media(selected_group, message_ids=None, media_types=None, operation_id=None, cancel_token=None):
+    """
+    Scarica in originale, nelle cartelle dell'archivio, i media scelti dall'anteprima.
+
+    Args:
+        selected_group: Gruppo selezionato ({"user", "group": {"id", "name"}})
+        message_ids: ID dei messaggi (ad esempio da select_preview)
+        media_types: In alternativa agli ID, tutti i media di questi tipi presenti nell'anteprima
+        operation_id: ID dell'operazione (generato se assente)
+        cancel_token: Token per interrompere i download
+
+    Returns:
+        int: Media scaricati (o già presenti), oppure None in caso di errore
+    """
+    nickname, group_id, group_name, archive_path = _group_info(selected_group)
+    if not message_ids:
+        message_ids = select_preview(archive_path, media_types=media_types)
+    message_ids = sorted(set(message_ids))
+    if not message_ids:
+        log("⚠️ Nessun media selezionato: crea prima l'anteprima dell'archivio", level="warning")
+        return 0
+    operation_id = operation_id or f"promote_{int(time.time())}_{random.randint(1000, 9999)}"
+    log(f"📥 Download in originale di {len(message_ids)} media di {group_name}")
+
+    # Scorre tutto l'archivio: fuori dall'event loop
+    usage = await asyncio.to_thread(archive_usage, archive_path)
+    quota = DiskQuota(archive_path, used_bytes=usage["total"][1])
+    tracker = ProgressTracker("Download originali", total=len(message_ids))
+    downloaded = 0
+    client = None
+    session_id = None
+    try:
+        client, session_id = await create_client_for_operation(nickname, operation_id)
+        await start_operation_client(client, "download originali")
+        entity = await client.get_entity(group_id)
+        for start in range(0, len(message_ids), 100):
+            # Una richiesta ogni 100 messaggi
+            for message in await client.get_messages(entity, ids=message_ids[start:start + 100]):
+                if is_cancelled(cancel_token):
+                    log("🛑 Download degli originali interrotto")
+                    return downloaded
+                if message is None or not message.media:
+                    continue
+                reason = quota.check(getattr(message.file, "size", None) or 0)
+                if reason:
+                    log(f"⏸️ Download degli originali in pausa: {reason}", level="warning")
+                    return downloaded
+                try:
+                    path = await download_media(message, group_name, nickname, ARCHIVE_DIR, cancel_token=cancel_token)
+                except OperationCancelled:
+                    log("🛑 Download degli originali interrotto")
+                    return downloaded
+                if path:
+                    downloaded += 1
+                    size = os.path.getsize(path)
+                    quota.add(size)
+                    tracker.update(messages=1, nbytes=size)
+        tracker.emit()
+        log(f"✅ {downloaded} media in originale salvati in {os.path.abspath(archive_path)}")
+        return downloaded
+    except Exception as e:
+        log_error(f"Errore durante il download degli originali: {e}")
+        return None
+    finally:
+        await close_operation_client(client, session_id, nickname, "download originali")
+
+def parse_selection(text):
+    """
+    Interpreta una selezione scritta dall'utente: ID separati da virgole
+    (anche intervalli 10-20) oppure tipi di media (es. "videos, images").
+
+    Returns:
+        (ID dei messaggi, tipi di media): uno dei due è vuoto
+    """
+    message_ids = []
+    media_types = []
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        if "-" in part and part.replace("-", "").isdigit():
+            first, last = part.split("-", 1)
+            message_ids.extend(range(int(first), int(last) + 1))
+        elif part.isdigit():
+            message_ids.append(int(part))
+        else:
+            media_types.append(part)
+    return message_ids, media_types
@@ -0,0 +1,323 @@
+"""
+Formato strutturato della cronologia dei messaggi (messages.jsonl).
+
+Ogni messaggio diventa una riga JSON con sempre gli stessi campi (i valori
+assenti sono null), così gli strumenti esterni possono caricarla senza
+interpretare il testo di messages.txt:
+
+    {"v": 1, "id": 42, "chat_id": -100123, "date": "2024-01-01T12:00:00+00:00",
+     "edit_date": null, "sender_id": 1000, "sender": "@nome", "text": "...",
+     "entities": [{"type": "text_url", "offset": 0, "length": 4, "url": "..."}],
+     "reply_to": {"message_id": 41, "top_id": null},
+     "forward": {"date": "...", "from_id": -100456, "from_name": null, "channel_post": 7, "post_author": null},
+     "grouped_id": null, "views": null, "forwards": null, "replies": null, "pinned": false,
+     "post_author": null, "via_bot_id": null,
+     "media": {"kind": "photo", "mime": "image/jpeg", "size": 123, "name": null,
+               "width": 1280, "height": 720, "duration": null, "file": "images/1704110400_42.jpg"},
+     "action": null}
+
+"text" è il testo originale: gli offset delle entità si riferiscono a questo.
+"media.file" è il percorso del media scaricato, relativo alla cartella del
+gruppo. "action" è il tipo dei messaggi di servizio (es. "chat_add_user").
+Campi nuovi si aggiungono in coda senza cambiare "v"; "v" cambia solo se il
+significato di un campo esistente cambia.
+
+I file si leggono in streaming con iter_records, anche compressi (.gz) e
+anche se l'ultima riga è stata scritta a metà. Un file .gz lasciato aperto
+da un'uscita non pulita si ripara con repair_records prima di aggiungervi
+altri record.
+"""
+
+import gzip
+import json
+import mmap
+import os
+import re
+import zlib
+
+from telethon import utils
+
+SCHEMA_VERSION = 1
+GZIP_MAGIC = b"\x1f\x8b\x08"  # Inizio di ogni membro gzip (compressione deflate)
+PROBE_BYTES = 64 * 1024  # Byte decompressi per riconoscere l'inizio di un membro
+READ_CHUNK = 1024 * 1024
+
+_CAMEL = re.compile(r'(?<!^)(?=[A-Z])')
+# Un solo encoder riutilizzato: json.dumps con opzioni ne crea uno a ogni chiamata
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+def _type_name(obj, prefix):
+    """Nome di un tipo di Telethon senza prefisso, in snake_case (MessageEntityTextUrl -> text_url)."""
+    name = type(obj).__name__
+    if name.startswith(prefix):
+        name = name[len(prefix):]
+    return _CAMEL.sub('_', name).lower()
+
+def _iso(date):
+    return date.isoformat() if date else None
+
+def _peer_id(peer):
+    if peer is None:
+        return None
+    try:
+        return utils.get_peer_id(peer)
+    except Exception:
+        return None
+
+def _entities(message):
+    entities = []
+    for entity in getattr(message, 'entities', None) or ():
+        record = {"type": _type_name(entity, "MessageEntity"), "offset": entity.offset, "length": entity.length}
+        # Solo gli attributi che servono a ricostruire il testo formattato
+        for attribute in ("url", "user_id", "language", "document_id"):
+            value = getattr(entity, attribute, None)
+            if value is not None:
+                record[attribute] = value
+        entities.append(record)
+    return entities
+
+def _reply_to(message):
+    reply = getattr(message, 'reply_to', None)
+    if reply is None or getattr(reply, 'reply_to_msg_id', None) is None:
+        return None
+    return {"message_id": reply.reply_to_msg_id, "top_id": getattr(reply, 'reply_to_top_id', None)}
+
+def _forward(message):
+    forward = getattr(message, 'fwd_from', None)
+    if forward is None:
+        return None
+    return {
+        "date": _iso(getattr(forward, 'date', None)),
+        "from_id": _peer_id(getattr(forward, 'from_id', None)),
+        "from_name": getattr(forward, 'from_name', None),
+        "channel_post": getattr(forward, 'channel_post', None),
+        "post_author": getattr(forward, 'post_author', None),
+    }
+
+def _media(message, media_file):
+    media = getattr(message, 'media', None)
+    if media is None:
+        return None
+    file = getattr(message, 'file', None)
+    return {
+        "kind": _type_name(media, "MessageMedia"),
+        "mime": getattr(file, 'mime_type', None),
+        "size": getattr(file, 'size', None),
+        "name": getattr(file, 'name', None),
+        "width": getattr(file, 'width', None),
+        "height": getattr(file, 'height', None),
+        "duration": getattr(file, 'duration', None),
+        "file": media_file,
+    }
+
+def message_record(message, sender_display=None, media_file=None):
+    """
+    Record di un messaggio nello schema di messages.jsonl.
+
+    Args:
+        message: Messaggio di Telethon
+        sender_display: Nome del mittente da mostrare
+        media_file: Percorso del media scaricato, relativo alla cartella del gruppo
+
+    Returns:
+        dict: Il record, con tutti i campi dello schema
+    """
+    action = getattr(message, 'action', None)
+    replies = getattr(message, 'replies', None)
+    return {
+        "v": SCHEMA_VERSION,
+        "id": getattr(message, 'id', None),
+        "chat_id": getattr(message, 'chat_id', None),
+        "date": _iso(getattr(message, 'date', None)),
+        "edit_date": _iso(getattr(message, 'edit_date', None)),
+        "sender_id": getattr(message, 'sender_id', None),
+        "sender": sender_display,
+        "text": getattr(message, 'message', None) or getattr(message, 'text', None) or "",
+        "entities": _entities(message),
+        "reply_to": _reply_to(message),
+        "forward": _forward(message),
+        "grouped_id": getattr(message, 'grouped_id', None),
+        "views": getattr(message, 'views', None),
+        "forwards": getattr(message, 'forwards', None),
+        "replies": getattr(replies, 'replies', None),
+        "pinned": bool(getattr(message, 'pinned', False)),
+        "post_author": getattr(message, 'post_author', None),
+        "via_bot_id": getattr(message, 'via_bot_id', None),
+        "media": _media(message, media_file),
+        "action": _type_name(action, "MessageAction") if action is not None else None,
+    }
+
+def record_line(message, sender_display=None, media_file=None):
+    """Riga JSONL (con il ritorno a capo) del record di un messaggio."""
+    return _ENCODER.encode(message_record(message, sender_display, media_file)) + "\n"
+
+def open_records(path, mode="rb"):
+    """Apre un file di record, compresso con gzip se termina con .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+def iter_records(path):
+    """
+    Legge in streaming i record di un file messages.jsonl (o .jsonl.gz).
+
+    La memoria usata non dipende dalla dimensione del file. Una riga finale
+    incompleta (applicazione chiusa durante una scrittura) viene ignorata; in
+    un file gzip danneggiato si leggono tutti i record dei membri leggibili.
+    """
+    if path.endswith(".gz"):
+        if not os.path.getsize(path):
+            return
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            lines = _gzip_lines(data, [])
+            yield from _parse(lines)
+        return
+    with open(path, "rb") as f:
+        yield from _parse(f)
+
+def _parse(lines):
+    for line in lines:
+        try:
+            yield json.loads(line)
+        except ValueError:
+            continue
+
+def _decompress_until_error(decompressor, chunk):
+    """Dati validi di chunk prima del punto danneggiato, decomprimendo a pezzi sempre più piccoli."""
+    output = []
+    position = 0
+    step = 4096
+    while position < len(chunk) and not decompressor.eof:
+        piece = chunk[position:position + step]
+        saved = decompressor.copy()
+        try:
+            output.append(decompressor.decompress(piece))
+            position += len(piece)
+        except zlib.error:
+            if step == 1:
+                break
+            decompressor = saved
+            step = 1
+    return b"".join(output)
+
+def _member_starts_at(data, position):
+    """True se da position inizia un membro gzip leggibile (e non tre byte simili dentro i dati compressi)."""
+    probe = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        probe.decompress(data[position:position + PROBE_BYTES])
+    except zlib.error:
+        return False
+    return True
+
+def _gzip_lines(data, damage):
+    """
+    Righe complete di tutti i membri gzip in data.
+
+    Le parti illeggibili (membri troncati o danneggiati) vengono saltate, riprendendo
+    dal membro successivo, e segnalate aggiungendo la loro posizione a damage.
+    """
+    position = 0
+    while position < len(data):
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        rest = b""
+        cursor = position
+        damaged = False
+        boundary = position
+        following = None  # Membro successivo a un membro troncato
+        while cursor < len(data) and not decompressor.eof:
+            if boundary <= cursor:
+                # Inizio del membro successivo: un membro troncato (processo terminato) non
+                # deve proseguire nei byte di quello dopo, che darebbero righe inventate
+                boundary = data.find(GZIP_MAGIC, max(cursor, position + 1))
+                if boundary < 0:
+                    boundary = len(data)
+                elif boundary == cursor:
+                    if _member_starts_at(data, boundary):
+                        damaged = True
+                        following = boundary
+                        break
+                    boundary = cursor + 1
+                    continue
+            chunk = data[cursor:min(cursor + READ_CHUNK, boundary)]
+            saved = decompressor.copy()
+            try:
+                text = rest + decompressor.decompress(chunk)
+            except zlib.error:
+                # zlib scarta i dati dell'intera chiamata: si recupera quanto precede l'errore
+                text = rest + _decompress_until_error(saved, chunk)
+                damaged = True
+            cut = text.rfind(b"\n") + 1
+            if cut:
+                yield from text[:cut].splitlines(keepends=True)
+            rest = text[cut:]
+            if damaged:
+                break
+            cursor += len(chunk) - len(decompressor.unused_data)
+        if decompressor.eof and not damaged:
+            position = cursor
+            continue
+        # Membro troncato o danneggiato: la riga in corso è persa, si riparte dal membro successivo
+        damage.append(position)
+        position = following if following is not None else data.find(GZIP_MAGIC, position + 1)
+        if position < 0:
+            return
+
+def gzip_left_open(path):
+    """True se il file gzip termina con un flush senza la coda del membro (scritto da un processo terminato)."""
+    if not os.path.exists(path) or os.path.getsize(path) < 4:
+        return False
+    with open(path, "rb") as f:
+        f.seek(-4, os.SEEK_END)
+        return f.read() == b"\x00\x00\xff\xff"
+
+def repair_records(path):
+    """
+    Ripara un file .jsonl.gz lasciato incompleto (ad esempio da un processo terminato).
+
+    Un membro gzip senza la coda rende illeggibili anche i membri aggiunti dopo:
+    il file viene riscritto con tutte le righe ancora leggibili e sostituito
+    in un colpo solo.
+
+    Returns:
+        int: Righe conservate, oppure None se il file era integro
+    """
+    if not os.path.exists(path) or not os.path.getsize(path):
+        return None
+    damage = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for _ in _gzip_lines(data, damage):
+            pass
+        if not damage:
+            return None
+        temp_path = path + ".repair"
+        kept = 0
+        with gzip.open(temp_path, "wb") as out:
+            for line in _gzip_lines(data, []):
+                # Dove il membro è stato interrotto a metà blocco possono uscire byte spuri
+                try:
+                    json.loads(line)
+                except ValueError:
+                    continue
+                out.write(line)
+                kept += 1
+    os.replace(temp_path, path)
+    return kept
+
+def trim_partial_line(path):
+    """Elimina da un file JSONL non compresso l'ultima riga, se è stata scritta a metà."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r+b") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(position - 4096, 0)
+            f.seek(start)
+            block = f.read(position - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            f.truncate(position)
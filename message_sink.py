@@ -0,0 +1,217 @@
+"""
+Scrittura bufferizzata dei messaggi di testo di un gruppo.
+
+Invece di riaprire messages.txt per ogni messaggio, ogni gruppo ha un sink
+che tiene il file aperto, accumula le righe in memoria e le scrive a blocchi
+quando si supera una soglia di dimensione o di tempo, oltre che alla chiusura.
+Opzionalmente ogni messaggio viene scritto anche in formato JSONL, con lo
+schema di message_schema.py, eventualmente compresso con gzip.
+"""
+
+import os
+import gzip
+import time
+import atexit
+import asyncio
+import threading
+
+from utils import log_error
+from metrics import metrics
+from path_resolver import path_resolver
+from message_schema import gzip_left_open, record_line, repair_records, trim_partial_line
+from event_bus import log
+from config import MESSAGE_SINK_FORMATS, MESSAGE_SINK_FLUSH_INTERVAL, MESSAGE_SINK_FLUSH_BYTES, MESSAGE_SINK_GZIP_LEVEL
+
+FILE_NAMES = {"text": "messages.txt", "jsonl": "messages.jsonl", "jsonl.gz": "messages.jsonl.gz"}
+STRUCTURED_FORMATS = ("jsonl", "jsonl.gz")  # Formati che registrano ogni messaggio, anche senza testo
+OPEN_MARKER = ".open"  # Segnaposto accanto ai file compressi aperti in scrittura
+
+def format_text_line(message, sender_display, media_file=None):
+    """Riga di messages.txt, nello stesso formato usato finora (None per i messaggi senza testo)."""
+    text = message.text or message.message
+    if not text:
+        return None
+    date_str = message.date.strftime('%Y-%m-%d %H:%M:%S') if hasattr(message, 'date') else "unknown_date"
+    return f"[{date_str}] {sender_display}: {text}\n"
+
+def format_json_line(message, sender_display, media_file=None):
+    """Riga di messages.jsonl con il record completo del messaggio."""
+    return record_line(message, sender_display, media_file)
+
+FORMATTERS = {"text": format_text_line, "jsonl": format_json_line, "jsonl.gz": format_json_line}
+
+class MessageSink:
+    """Buffer di scrittura per i file dei messaggi di un singolo gruppo."""
+
+    def __init__(self, directory, formats=MESSAGE_SINK_FORMATS,
+                 flush_interval=MESSAGE_SINK_FLUSH_INTERVAL, flush_bytes=MESSAGE_SINK_FLUSH_BYTES):
+        """
+        Args:
+            directory: Directory del gruppo (già esistente)
+            formats: Formati da scrivere ("text", "jsonl")
+            flush_interval: Secondi massimi prima che le righe vengano scritte
+            flush_bytes: Dimensione del buffer oltre la quale le righe vengono scritte
+        """
+        self.directory = directory
+        self.formats = tuple(formats)
+        self.structured = any(fmt in STRUCTURED_FORMATS for fmt in self.formats)
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+        self._buffers = {fmt: [] for fmt in self.formats}
+        self._buffered = 0
+        self._handles = {}
+        self._first_pending = None
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def write(self, message, sender_display, media_path=None):
+        """
+        Accoda un messaggio; le righe vengono scritte quando scatta una soglia.
+
+        media_path è il media scaricato del messaggio, registrato nei formati
+        strutturati con il percorso relativo alla cartella del gruppo.
+        """
+        media_file = None
+        if media_path:
+            media_file = os.path.relpath(media_path, self.directory).replace(os.sep, "/")
+        with self._lock:
+            for fmt in self.formats:
+                line = FORMATTERS[fmt](message, sender_display, media_file)
+                if line is None:
+                    continue
+                self._buffers[fmt].append(line)
+                self._buffered += len(line)
+            if self._first_pending is None:
+                self._first_pending = time.monotonic()
+                self._schedule_flush()
+            due = (self._buffered >= self.flush_bytes
+                   or time.monotonic() - self._first_pending >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Scrive su disco tutte le righe in sospeso."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._buffered:
+                return
+            with metrics.timer("disk_write"):
+                for fmt, lines in self._buffers.items():
+                    if not lines:
+                        continue
+                    handle = self._handles.get(fmt)
+                    if handle is None:
+                        handle = self._open(fmt)
+                        self._handles[fmt] = handle
+                    handle.write("".join(lines))
+                    handle.flush()
+                    lines.clear()
+            self._buffered = 0
+            self._first_pending = None
+
+    def _open(self, fmt):
+        path = os.path.join(self.directory, FILE_NAMES[fmt])
+        if fmt.endswith(".gz"):
+            # Il segnaposto resta solo se il processo termina senza chiudere il file
+            # (i file scritti prima del segnaposto si riconoscono dalla fine del flush):
+            # il membro gzip lasciato senza coda va riparato prima di aggiungerne un altro
+            marker = path + OPEN_MARKER
+            if os.path.exists(marker) or gzip_left_open(path):
+                kept = repair_records(path)
+                if kept is not None:
+                    log(f"🩹 {path} non era stato chiuso correttamente: riparato ({kept} record)", level="warning")
+            open(marker, 'w').close()
+            # Ogni apertura aggiunge un nuovo membro gzip, letto di seguito ai precedenti;
+            # flush() svuota il compressore, quindi ogni blocco scritto è già leggibile
+            return gzip.open(path, 'at', encoding='utf-8', compresslevel=MESSAGE_SINK_GZIP_LEVEL)
+        if fmt in STRUCTURED_FORMATS:
+            # Una riga scritta a metà si unirebbe al record successivo
+            trim_partial_line(path)
+        return open(path, 'a', encoding='utf-8')
+
+    def close(self):
+        """Scrive le righe in sospeso e chiude i file."""
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                for fmt, handle in self._handles.items():
+                    handle.close()
+                    marker = os.path.join(self.directory, FILE_NAMES[fmt]) + OPEN_MARKER
+                    if os.path.exists(marker):
+                        os.remove(marker)
+                self._handles.clear()
+
+    def _schedule_flush(self):
+        # Se nessun altro messaggio arriva, le righe vengono comunque scritte
+        # allo scadere dell'intervallo (solo quando si è dentro un event loop)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._timer = loop.call_later(self.flush_interval, self._timed_flush)
+
+    def _timed_flush(self):
+        try:
+            self.flush()
+        except Exception as e:
+            log_error(f"Errore scrittura messaggi in {self.directory}: {e}")
+
+class MessageSinkRegistry:
+    """Mantiene un sink aperto per ogni terna (directory base, utente, gruppo)."""
+
+    def __init__(self, formats=MESSAGE_SINK_FORMATS):
+        self.formats = formats
+        self.structured = any(fmt in STRUCTURED_FORMATS for fmt in formats)
+        self._sinks = {}
+        self._lock = threading.Lock()
+
+    def get(self, base_dir, app_nickname, group_name, chat_id=None):
+        """Restituisce il sink del gruppo, creandolo (e creando la directory) al primo uso."""
+        key = (base_dir, app_nickname, chat_id if chat_id is not None else group_name)
+        sink = self._sinks.get(key)
+        if sink is None:
+            with self._lock:
+                sink = self._sinks.get(key)
+                if sink is None:
+                    # Struttura: Downloads/[utente]/[gruppo]/
+                    directory = path_resolver.group_dir(base_dir, app_nickname, group_name, chat_id)
+                    sink = MessageSink(directory, self.formats)
+                    self._sinks[key] = sink
+        return sink
+
+    def flush_all(self):
+        """Scrive le righe in sospeso di tutti i sink."""
+        for sink in list(self._sinks.values()):
+            sink.flush()
+
+    def close(self, base_dir=None, app_nickname=None, group=None):
+        """
+        Chiude i sink, eventualmente solo quelli di una directory base, utente o gruppo.
+
+        Il gruppo si indica con lo stesso valore usato in get: l'ID della chat
+        o, se non era disponibile, il nome.
+
+        I sink chiusi vengono rimossi e ricreati al primo utilizzo successivo.
+        """
+        with self._lock:
+            keys = [key for key in self._sinks
+                    if (base_dir is None or key[0] == base_dir)
+                    and (app_nickname is None or key[1] == app_nickname)
+                    and (group is None or key[2] == group)]
+            sinks = [self._sinks.pop(key) for key in keys]
+        for sink in sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                log_error(f"Errore chiusura file messaggi in {sink.directory}: {e}")
+
+# Istanza singleton condivisa da archivio e monitoraggio
+message_sinks = MessageSinkRegistry()
+atexit.register(message_sinks.close)
+metrics.add_collector(lambda: {
+    "message_sinks_open": len(message_sinks._sinks),
+    "message_sink_pending_bytes": sum(sink._buffered for sink in list(message_sinks._sinks.values())),
+})
@@ -0,0 +1,217 @@
+"""
+Metriche interne del monitoraggio e delle operazioni.
+
+Raccoglie contatori (RPC per account, messaggi, byte scaricati), valori
+istantanei (profondità delle code, ritardo dell'event loop) e tempi per fase
+(risoluzione delle entità, download, scrittura su disco, inoltro). Durante il
+monitoraggio le metriche vengono scritte periodicamente in METRICS_DIR:
+
+- <istanza>.json: fotografia leggibile delle metriche;
+- <istanza>.prom: formato testuale Prometheus, leggibile ad esempio dal
+  textfile collector di node_exporter.
+
+Aiuta a capire se un monitoraggio lento dipende dalla rete (RPC, download),
+dal disco (scrittura) o da un loop bloccato (ritardo del loop).
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from config import METRICS_DIR, METRICS_INTERVAL, METRICS_LAG_INTERVAL
+from event_bus import log
+
+PREFIX = "telegram_tools"
+
+# Limiti superiori (secondi) delle fasce degli istogrammi dei tempi
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+def _labels_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _format_labels(labels, **extra):
+    items = list(labels) + sorted((name, str(value)) for name, value in extra.items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in items) + "}"
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+class StageTimer:
+    """Istogramma dei tempi di una fase."""
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+                break
+
+class Metrics:
+    """Registro delle metriche del processo."""
+
+    def __init__(self):
+        self._counters = {}    # {(nome, etichette): valore}
+        self._gauges = {}      # {(nome, etichette): valore}
+        self._timers = {}      # {(fase, etichette): StageTimer}
+        self._collectors = []  # Funzioni che restituiscono {nome: valore} al momento della lettura
+        self._lock = threading.Lock()
+
+    def inc(self, name, value=1, **labels):
+        """Incrementa un contatore."""
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        """Imposta un valore istantaneo."""
+        with self._lock:
+            self._gauges[(name, _labels_key(labels))] = value
+
+    def observe(self, stage, seconds, **labels):
+        """Registra la durata di una fase."""
+        key = (stage, _labels_key(labels))
+        with self._lock:
+            timer = self._timers.get(key)
+            if timer is None:
+                timer = self._timers[key] = StageTimer()
+            timer.observe(seconds)
+
+    @contextmanager
+    def timer(self, stage, **labels):
+        """Misura la durata del blocco (anche se contiene await)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    def add_collector(self, collector):
+        """Registra una funzione che restituisce valori istantanei, letti a ogni scrittura."""
+        self._collectors.append(collector)
+
+    def _collect(self):
+        gauges = {}
+        for collector in self._collectors:
+            try:
+                for name, value in collector().items():
+                    gauges[(name, ())] = value
+            except Exception:
+                continue
+        with self._lock:
+            gauges.update(self._gauges)
+            counters = dict(self._counters)
+            timers = {key: (timer.count, timer.total, timer.max, list(timer.buckets))
+                      for key, timer in self._timers.items()}
+        return counters, gauges, timers
+
+    def snapshot(self):
+        """Restituisce una fotografia delle metriche in forma serializzabile."""
+        counters, gauges, timers = self._collect()
+        return {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "counters": {name + _format_labels(labels): value for (name, labels), value in sorted(counters.items())},
+            "gauges": {name + _format_labels(labels): value for (name, labels), value in sorted(gauges.items())},
+            "stages": {
+                stage + _format_labels(labels): {
+                    "count": count,
+                    "avg_ms": round(total / count * 1000, 2) if count else 0,
+                    "max_ms": round(maximum * 1000, 2),
+                }
+                for (stage, labels), (count, total, maximum, _) in sorted(timers.items())
+            },
+        }
+
+    def prometheus_text(self, instance):
+        """Restituisce le metriche nel formato testuale di Prometheus."""
+        counters, gauges, timers = self._collect()
+        lines = []
+        instance_label = (("instance", str(instance)),)
+
+        for kind, values in (("counter", counters), ("gauge", gauges)):
+            declared = set()
+            for (name, labels), value in sorted(values.items()):
+                metric = f"{PREFIX}_{name}" + ("_total" if kind == "counter" else "")
+                if metric not in declared:
+                    lines.append(f"# TYPE {metric} {kind}")
+                    declared.add(metric)
+                lines.append(f"{metric}{_format_labels(instance_label + labels)} {value}")
+
+        metric = f"{PREFIX}_stage_seconds"
+        if timers:
+            lines.append(f"# TYPE {metric} histogram")
+        for (stage, labels), (count, total, _, buckets) in sorted(timers.items()):
+            labels = instance_label + (("stage", stage),) + labels
+            cumulative = 0
+            for bound, bucket in zip(BUCKETS, buckets):
+                cumulative += bucket
+                lines.append(f"{metric}_bucket{_format_labels(labels, le=bound)} {cumulative}")
+            lines.append(f"{metric}_bucket{_format_labels(labels, le='+Inf')} {count}")
+            lines.append(f"{metric}_sum{_format_labels(labels)} {total:.6f}")
+            lines.append(f"{metric}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def write_files(self, instance, directory=METRICS_DIR):
+        """Scrive <istanza>.json e <istanza>.prom (sostituzione atomica)."""
+        os.makedirs(directory, exist_ok=True)
+        snapshot = dict(self.snapshot(), instance=instance)
+        for file_name, content in ((f"{instance}.json", json.dumps(snapshot, indent=2, ensure_ascii=False)),
+                                   (f"{instance}.prom", self.prometheus_text(instance))):
+            path = os.path.join(directory, file_name)
+            with open(path + ".temp", "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(path + ".temp", path)
+
+async def sample_loop_lag(interval=METRICS_LAG_INTERVAL):
+    """
+    Misura il ritardo dell'event loop: quanto un risveglio programmato arriva
+    in ritardo rispetto all'intervallo richiesto. Valori alti indicano handler
+    che bloccano il loop.
+    """
+    peak = 0.0
+    last_peak_reset = time.monotonic()
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(time.perf_counter() - start - interval, 0.0)
+        metrics.observe("loop_lag", lag)
+        metrics.set_gauge("loop_lag_seconds", round(lag, 6))
+        # Picco dell'ultimo intervallo di scrittura
+        if time.monotonic() - last_peak_reset >= METRICS_INTERVAL:
+            peak, last_peak_reset = 0.0, time.monotonic()
+        peak = max(peak, lag)
+        metrics.set_gauge("loop_lag_peak_seconds", round(peak, 6))
+        metrics.set_gauge("asyncio_tasks", len(asyncio.all_tasks()))
+
+async def run_metrics(instance, interval=METRICS_INTERVAL, directory=METRICS_DIR):
+    """Campiona il ritardo del loop e scrive periodicamente le metriche finché non viene annullata."""
+    sampler = asyncio.ensure_future(sample_loop_lag())
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(metrics.write_files, instance, directory)
+            except OSError as e:
+                log(f"⚠️ Impossibile scrivere le metriche: {e}", level="warning")
+    finally:
+        sampler.cancel()
+        try:
+            metrics.write_files(instance, directory)
+        except OSError:
+            pass
+
+# Istanza singleton condivisa da tutto il processo
+metrics = Metrics()
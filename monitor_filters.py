@@ -0,0 +1,118 @@
+"""
+Filtri del monitoraggio: quali chat, mittenti e media interessano.
+
+Le regole si trovano in monitor_rules.json (facoltativo; senza file il
+monitoraggio si comporta come prima e gestisce tutto):
+
+    {
+        "chats": [-1001234567890],     lista di chat da monitorare (vuota = tutte)
+        "exclude_chats": [],           chat da ignorare
+        "private": true,               gestisce i media ricevuti in privato
+        "senders": [],                 mittenti ammessi (vuota = tutti)
+        "exclude_senders": [],         mittenti da ignorare
+        "media_types": [],             tipi di media da scaricare (vuota = tutti)
+        "max_size_mb": null,           dimensione massima dei media
+        "save_text": true,             salva i messaggi di testo
+        "accounts": {                  regole specifiche per account (sovrascrivono le precedenti)
+            "nickname": {"chats": [...]}
+        }
+    }
+
+Le liste di chat vengono passate a Telethon (chats=) così gli aggiornamenti
+delle altre chat non arrivano nemmeno agli handler; il resto viene controllato
+con un pre-filtro che usa solo i dati già presenti nel messaggio, prima di
+qualsiasi richiesta a Telegram.
+"""
+
+import os
+
+from utils import load_json
+from config import MONITOR_RULES_FILE
+from media_handler import get_media_type
+
+DEFAULT_RULES = {
+    "chats": [],
+    "exclude_chats": [],
+    "private": True,
+    "senders": [],
+    "exclude_senders": [],
+    "media_types": [],
+    "max_size_mb": None,
+    "save_text": True,
+}
+
+class MonitorFilter:
+    """Regole compilate per un account del monitoraggio."""
+
+    def __init__(self, rules=None):
+        rules = dict(DEFAULT_RULES, **(rules or {}))
+        self.chats = frozenset(int(chat_id) for chat_id in rules["chats"])
+        self.exclude_chats = frozenset(int(chat_id) for chat_id in rules["exclude_chats"])
+        self.private = bool(rules["private"])
+        self.senders = frozenset(int(sender_id) for sender_id in rules["senders"])
+        self.exclude_senders = frozenset(int(sender_id) for sender_id in rules["exclude_senders"])
+        self.media_types = frozenset(rules["media_types"])
+        max_size_mb = rules["max_size_mb"]
+        self.max_size = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        self.save_text = bool(rules["save_text"])
+
+    def event_kwargs(self):
+        """
+        Argomenti per events.NewMessage/events.Album.
+
+        Con una lista di chat e senza i messaggi privati il filtro viene applicato
+        direttamente da Telethon; con i privati ammessi la lista viene controllata
+        nel pre-filtro (func), che accetta anche le chat private.
+        """
+        if self.chats and not self.private:
+            return {"chats": list(self.chats)}
+        if not self.chats and self.exclude_chats:
+            return {"chats": list(self.exclude_chats), "blacklist_chats": True}
+        return {}
+
+    def accepts_chat(self, chat_id, is_private=False):
+        """Verifica se una chat interessa."""
+        if chat_id in self.exclude_chats:
+            return False
+        if is_private:
+            return self.private
+        return not self.chats or chat_id in self.chats
+
+    def accepts_event(self, event):
+        """Pre-filtro per func= degli eventi: solo attributi già disponibili."""
+        return self.accepts_chat(event.chat_id, event.is_private)
+
+    def wants_media(self, message):
+        """Verifica se il media del messaggio va scaricato o inoltrato."""
+        if not message.media:
+            return False
+        if self.media_types and get_media_type(message) not in self.media_types:
+            return False
+        if self.max_size is not None:
+            size = getattr(message.file, 'size', None) if message.file else None
+            if size is not None and size > self.max_size:
+                return False
+        return True
+
+    def wants_text(self, message):
+        """Verifica se il testo del messaggio va salvato."""
+        return self.save_text and bool(message.text or message.message)
+
+    def accepts(self, message):
+        """Pre-filtro completo di un messaggio, da usare prima di risolvere mittente e chat."""
+        if not self.accepts_chat(message.chat_id, message.is_private):
+            return False
+        sender_id = message.sender_id
+        if sender_id in self.exclude_senders:
+            return False
+        if self.senders and sender_id not in self.senders:
+            return False
+        if message.is_private:
+            return self.wants_media(message)
+        return self.wants_media(message) or self.wants_text(message)
+
+def load_monitor_filter(nickname, rules_file=MONITOR_RULES_FILE):
+    """Carica le regole del monitoraggio per un account (tutto ammesso se il file non esiste)."""
+    rules = load_json(rules_file) if os.path.exists(rules_file) else {}
+    account_rules = rules.pop("accounts", {}).get(nickname, {})
+    return MonitorFilter(dict(rules, **account_rules))
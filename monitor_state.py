@@ -0,0 +1,154 @@
+"""
+Stato persistente del monitoraggio per il recupero dei messaggi persi.
+
+Per ogni account viene salvato, per chat (downloads/[utente]/monitor_state.json):
+
+- l'ID dell'ultimo messaggio gestito ("chats");
+- il punto fino a cui la cronologia è stata gestita senza buchi ("synced"):
+  il recupero riparte sempre da qui;
+- gli ID gestiti in diretta oltre quel punto ("pending"), per non elaborarli
+  di nuovo quando il recupero li incontra, anche dopo un riavvio.
+
+Dopo un avvio o una riconnessione ogni chat ha un buco (mark_gap): i messaggi
+in diretta non spostano più il punto "synced", che avanza solo con il
+recupero (mark_synced). Quando il recupero di una chat arriva ai messaggi più
+recenti senza nuove interruzioni nel frattempo, il buco è chiuso e il punto
+torna ad avanzare con i messaggi in diretta.
+"""
+
+import os
+import time
+import threading
+from collections import deque
+
+from utils import load_json, save_json
+from config import DOWNLOADS_DIR, MONITOR_STATE_SAVE_INTERVAL
+
+STATE_FILE = "monitor_state.json"
+RECENT_IDS = 1000  # ID recenti ricordati per chat
+
+class MonitorState:
+    """ID dell'ultimo messaggio gestito e punto di recupero per ogni chat di un account."""
+
+    def __init__(self, file_path, save_interval=MONITOR_STATE_SAVE_INTERVAL):
+        self.file_path = file_path
+        self.save_interval = save_interval
+        data = load_json(file_path) if os.path.exists(file_path) else {}
+        self.last_ids = {str(chat_id): int(last_id) for chat_id, last_id in data.get("chats", {}).items()}
+        # Gli stati salvati prima del punto di recupero partono dall'ultimo ID gestito
+        self.synced = {str(chat_id): int(synced) for chat_id, synced in data.get("synced", self.last_ids).items()}
+        self._pending = {str(chat_id): set(ids) for chat_id, ids in data.get("pending", {}).items()}
+        self._recent = {}
+        for key, ids in self._pending.items():
+            for message_id in sorted(ids):
+                self._remember(key, message_id)
+        # All'avvio tutte le chat note vanno recuperate
+        self._gaps = set(self.synced)
+        self.generation = 0
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_user(cls, nickname, base_dir=DOWNLOADS_DIR):
+        """Carica lo stato del monitoraggio di un account."""
+        return cls(os.path.join(base_dir, nickname, STATE_FILE))
+
+    def chats(self):
+        """Restituisce {chat_id: ultimo ID gestito} per le chat note."""
+        with self._lock:
+            return {int(chat_id): last_id for chat_id, last_id in self.last_ids.items()}
+
+    def backfill_points(self):
+        """Restituisce {chat_id: ID da cui recuperare} per le chat con un buco da recuperare."""
+        with self._lock:
+            return {int(key): self.synced[key] for key in self._gaps if key in self.synced}
+
+    def mark_gap(self):
+        """
+        Segna un'interruzione della connessione: tutte le chat vanno recuperate.
+
+        Va chiamata prima che arrivino i messaggi successivi alla riconnessione.
+        """
+        with self._lock:
+            self._gaps = set(self.synced)
+            self.generation += 1
+
+    def _remember(self, key, message_id):
+        recent = self._recent.get(key)
+        if recent is None:
+            recent = self._recent[key] = (deque(maxlen=RECENT_IDS), set())
+        order, seen = recent
+        if message_id in seen:
+            return False
+        if len(order) == order.maxlen:
+            seen.discard(order[0])
+        order.append(message_id)
+        seen.add(message_id)
+        return True
+
+    def claim(self, chat_id, message_id):
+        """
+        Registra un messaggio come gestito.
+
+        Returns:
+            bool: False se il messaggio era già stato gestito (in diretta o dal recupero)
+        """
+        key = str(chat_id)
+        with self._lock:
+            if not self._remember(key, message_id):
+                return False
+            if message_id > self.last_ids.get(key, 0):
+                self.last_ids[key] = message_id
+                self._dirty = True
+            if key in self._gaps:
+                # Oltre un buco il punto di recupero resta fermo: si ricordano gli ID gestiti
+                if message_id > self.synced.get(key, 0):
+                    self._pending.setdefault(key, set()).add(message_id)
+                    self._dirty = True
+            elif message_id > self.synced.get(key, 0):
+                self.synced[key] = message_id
+            due = self._dirty and time.monotonic() - self._last_save >= self.save_interval
+        if due:
+            self.save()
+        return True
+
+    def mark_synced(self, chat_id, message_id, generation, complete):
+        """
+        Registra l'avanzamento del recupero di una chat.
+
+        Args:
+            chat_id: Chat recuperata
+            message_id: ID fino a cui i messaggi sono stati gestiti (None se nessuno)
+            generation: Valore di generation all'inizio del recupero
+            complete: True se il recupero è arrivato ai messaggi più recenti
+        """
+        key = str(chat_id)
+        with self._lock:
+            synced = max(self.synced.get(key, 0), message_id or 0)
+            if complete and generation == self.generation:
+                # Nessuna interruzione durante il recupero: quanto arrivato dopo è stato gestito in diretta
+                synced = max(synced, self.last_ids.get(key, 0))
+                self._gaps.discard(key)
+            self.synced[key] = synced
+            pending = {i for i in self._pending.get(key, ()) if i > synced}
+            if pending:
+                self._pending[key] = pending
+            else:
+                self._pending.pop(key, None)
+            self._dirty = True
+
+    def save(self):
+        """Salva lo stato su disco se è cambiato."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {
+                "chats": dict(self.last_ids),
+                "synced": dict(self.synced),
+                "pending": {key: sorted(ids) for key, ids in self._pending.items()},
+                "updated": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+        save_json(self.file_path, data)
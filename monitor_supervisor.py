@@ -0,0 +1,272 @@
+"""
+Monitoraggio su più processi.
+
+Con molti account un solo event loop viene saturato dalla decifratura MTProto
+e dagli handler, e un handler lento rallenta tutti gli account. Il supervisore
+divide gli account tra MONITOR_WORKERS processi; ogni processo esegue
+start_monitoring solo per i propri account e si registra nel registro delle
+istanze (LOCK_FILE) con l'ID del supervisore, così le prenotazioni dei media
+(dedup.py) e la gestione delle istanze continuano a funzionare.
+
+I processi inviano al supervisore log, avanzamento e un segnale di vita
+periodico tramite una coda: il supervisore li ripubblica sul bus eventi
+(GUI, console e file di log restano gli stessi) e riavvia con attesa crescente
+i processi terminati o che non danno più segnali.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import time
+
+import profiling
+
+from bandwidth import bandwidth_governor
+from config import (
+    LOCK_FILE, PHONE_NUMBERS_FILE, MONITOR_WORKERS, MONITOR_WORKER_HEARTBEAT,
+    MONITOR_WORKER_TIMEOUT, MONITOR_WORKER_BACKOFF, MONITOR_WORKER_BACKOFF_MAX,
+    MONITOR_WORKER_STABLE, MONITOR_WORKER_STOP_TIMEOUT, MONITOR_SUPERVISOR_REPORT_INTERVAL
+)
+from event_bus import event_bus, log, progress, LogEvent, ProgressEvent
+from operation_control import is_cancelled
+from utils import load_json, log_error, get_instance_id, register_instance, unregister_instance, is_process_running
+
+# "spawn" su tutte le piattaforme: il processo figlio non eredita il loop
+# asincrono, i thread e Qt del processo principale
+_context = multiprocessing.get_context("spawn")
+
+def shard_accounts(nicknames, workers):
+    """Distribuisce gli account tra i processi (stessa ripartizione a ogni avvio)."""
+    nicknames = sorted(nicknames)
+    workers = max(1, min(workers, len(nicknames)))
+    return [nicknames[index::workers] for index in range(workers)]
+
+def _worker_main(worker_id, parent_id, parent_pid, nicknames, events, stop_event, profile_settings, bandwidth_share,
+                 priority_clock):
+    """Punto di ingresso di un processo del monitoraggio."""
+    from operation_control import CancellationToken
+    from event_handler import start_monitoring, active_clients, cleanup_session_files
+    from bandwidth import bandwidth_governor
+    # Impostazioni della profilazione del processo principale (anche se cambiate dalla GUI)
+    profiling.set_enabled(*profile_settings)
+    # I limiti di banda globali sono divisi tra i processi
+    bandwidth_governor.set_share(bandwidth_share)
+    bandwidth_governor.share_priority_clock(priority_clock)
+
+    def forward(event):
+        # I record vengono ripubblicati dal supervisore sul proprio bus
+        if event.kind == "log":
+            events.put(("log", worker_id, event.level, event.message))
+        else:
+            events.put(("progress", worker_id, event.stage, event.current, event.total, event.details))
+    event_bus.subscribe(forward)
+
+    instance_id = f"{parent_id}-w{worker_id}"
+    register_instance(instance_id, LOCK_FILE, supervisor=parent_id, accounts=nicknames, monitoring=True)
+    cancel_token = CancellationToken()
+
+    async def heartbeat():
+        # Il segnale di vita parte dal loop: un loop bloccato smette di inviarlo
+        while not cancel_token.cancelled:
+            events.put(("heartbeat", worker_id, os.getpid(), len(active_clients)))
+            if stop_event.is_set() or not is_process_running(parent_pid):
+                cancel_token.cancel()
+                break
+            await asyncio.sleep(MONITOR_WORKER_HEARTBEAT)
+
+    async def run():
+        task = asyncio.ensure_future(heartbeat())
+        try:
+            return await profiling.profiled(start_monitoring(instance_id, cancel_token, nicknames=nicknames),
+                                            f"start_monitoring_{instance_id}")
+        finally:
+            task.cancel()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        log_error(f"Errore nel processo di monitoraggio {worker_id}: {e}")
+    finally:
+        cleanup_session_files(instance_id)
+        unregister_instance(instance_id, LOCK_FILE)
+        events.put(("exit", worker_id, os.getpid(), None))
+
+class WorkerHandle:
+    """Stato di un processo del monitoraggio visto dal supervisore."""
+
+    def __init__(self, worker_id, nicknames):
+        self.worker_id = worker_id
+        self.nicknames = nicknames
+        self.process = None
+        self.stop_event = None
+        self.started = 0
+        self.last_heartbeat = 0
+        self.clients = 0
+        self.messages = 0
+        self.restarts = 0
+        self.failures = 0
+        self.restart_at = 0     # Momento del prossimo riavvio (0 = nessuno in programma)
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.is_alive()
+
+class MonitorSupervisor:
+    """Avvia, controlla e riavvia i processi del monitoraggio."""
+
+    def __init__(self, instance_id, nicknames, workers=MONITOR_WORKERS):
+        self.instance_id = instance_id
+        self.workers = [WorkerHandle(index, shard) for index, shard in enumerate(shard_accounts(nicknames, workers))]
+        self.events = _context.Queue()
+        self._stopping = False
+        # I limiti globali di banda sono divisi tra i processi e il processo principale (archivi)
+        self.bandwidth_share = 1 / (len(self.workers) + 1)
+        # Ultimo download del monitoraggio in qualsiasi processo: attiva la riserva di banda ovunque
+        self.priority_clock = _context.Value("d", 0.0)
+
+    def start_worker(self, worker):
+        """Avvia (o riavvia) il processo di un gruppo di account."""
+        worker.stop_event = _context.Event()
+        worker.process = _context.Process(
+            target=_worker_main,
+            args=(worker.worker_id, self.instance_id, os.getpid(), worker.nicknames, self.events, worker.stop_event,
+                  profiling.settings(), self.bandwidth_share, self.priority_clock),
+            name=f"monitor-{worker.worker_id}",
+            daemon=True
+        )
+        worker.process.start()
+        worker.started = worker.last_heartbeat = time.monotonic()
+        worker.restart_at = 0
+        log(f"🚀 Processo {worker.worker_id} avviato (PID: {worker.process.pid}) per: {', '.join(worker.nicknames)}")
+
+    def schedule_restart(self, worker, reason):
+        """Programma il riavvio di un processo con attesa crescente."""
+        if time.monotonic() - worker.started >= MONITOR_WORKER_STABLE:
+            worker.failures = 0
+        worker.failures += 1
+        delay = min(MONITOR_WORKER_BACKOFF * 2 ** (worker.failures - 1), MONITOR_WORKER_BACKOFF_MAX)
+        worker.restart_at = time.monotonic() + delay
+        log(f"⚠️ Processo {worker.worker_id} {reason}: riavvio tra {delay:.0f} secondi", level="warning")
+
+    def check_workers(self):
+        """Controlla lo stato dei processi: riavvia quelli terminati o bloccati."""
+        now = time.monotonic()
+        for worker in self.workers:
+            if worker.restart_at:
+                if now >= worker.restart_at:
+                    worker.restarts += 1
+                    self.start_worker(worker)
+                continue
+            if not worker.alive:
+                self.schedule_restart(worker, f"terminato (codice {worker.process.exitcode})")
+            elif now - worker.last_heartbeat > MONITOR_WORKER_TIMEOUT:
+                worker.process.terminate()
+                self.schedule_restart(worker, f"senza segnali da {now - worker.last_heartbeat:.0f} secondi")
+
+    def drain_events(self):
+        """Ripubblica sul bus i record ricevuti dai processi."""
+        while True:
+            try:
+                record = self.events.get_nowait()
+            except queue.Empty:
+                return
+            kind, worker_id = record[0], record[1]
+            worker = self.workers[worker_id]
+            if kind == "log":
+                _, _, level, message = record
+                event_bus.emit(LogEvent(f"[{worker_id}] {message}", level=level))
+            elif kind == "progress":
+                _, _, stage, current, total, details = record
+                if current is not None:
+                    worker.messages = current
+                event_bus.emit(ProgressEvent(f"{stage} [{worker_id}]", current=current, total=total, details=details))
+            elif kind == "heartbeat":
+                worker.last_heartbeat = time.monotonic()
+                worker.clients = record[3]
+
+    def status(self):
+        """Riepilogo dello stato dei processi."""
+        return {
+            worker.worker_id: {
+                "pid": worker.process.pid if worker.process else None,
+                "alive": worker.alive,
+                "accounts": worker.nicknames,
+                "clients": worker.clients,
+                "messages": worker.messages,
+                "restarts": worker.restarts,
+            }
+            for worker in self.workers
+        }
+
+    def report(self):
+        """Emette un record di avanzamento aggregato per tutti i processi."""
+        alive = sum(1 for worker in self.workers if worker.alive)
+        progress("Supervisore monitoraggio", sum(worker.messages for worker in self.workers),
+                 processi=f"{alive}/{len(self.workers)}",
+                 client=sum(worker.clients for worker in self.workers),
+                 riavvii=sum(worker.restarts for worker in self.workers))
+
+    async def run(self, cancel_token=None):
+        """Esegue il supervisore finché non viene annullato."""
+        bandwidth_governor.set_share(self.bandwidth_share)
+        bandwidth_governor.share_priority_clock(self.priority_clock)
+        for worker in self.workers:
+            self.start_worker(worker)
+        last_check = last_report = time.monotonic()
+        try:
+            while not is_cancelled(cancel_token):
+                self.drain_events()
+                now = time.monotonic()
+                if now - last_check >= MONITOR_WORKER_HEARTBEAT:
+                    self.check_workers()
+                    last_check = now
+                if now - last_report >= MONITOR_SUPERVISOR_REPORT_INTERVAL:
+                    self.report()
+                    last_report = now
+                await asyncio.sleep(0.5)
+        finally:
+            await self.stop()
+            bandwidth_governor.set_share(1.0)
+            bandwidth_governor.share_priority_clock(None)
+
+    async def stop(self):
+        """Ferma tutti i processi, attendendo la chiusura ordinata dei client."""
+        for worker in self.workers:
+            if worker.alive:
+                worker.stop_event.set()
+        deadline = time.monotonic() + MONITOR_WORKER_STOP_TIMEOUT
+        for worker in self.workers:
+            if worker.process is None:
+                continue
+            await asyncio.to_thread(worker.process.join, max(deadline - time.monotonic(), 0))
+            if worker.process.is_alive():
+                log(f"⚠️ Processo {worker.worker_id} non terminato in tempo: chiusura forzata", level="warning")
+                worker.process.terminate()
+                # Il processo terminato non rimuove la propria voce dal registro
+                unregister_instance(f"{self.instance_id}-w{worker.worker_id}", LOCK_FILE)
+        self.drain_events()
+        log(f"🛑 Processi del monitoraggio fermati ({len(self.workers)})")
+
+async def start_supervised_monitoring(instance_id=None, cancel_token=None, workers=MONITOR_WORKERS):
+    """
+    Avvia il monitoraggio dividendo gli account tra più processi.
+
+    Stessa interfaccia di start_monitoring: si ferma quando il cancel_token viene annullato.
+    """
+    instance_id = instance_id or get_instance_id()
+    phone_numbers = load_json(PHONE_NUMBERS_FILE)
+    if not phone_numbers:
+        log("❌ Nessun utente configurato. Aggiungi almeno un utente.", level="error")
+        return False
+
+    supervisor = MonitorSupervisor(instance_id, list(phone_numbers), workers)
+    log(f"🔀 Monitoraggio di {len(phone_numbers)} account su {len(supervisor.workers)} processi")
+    try:
+        await supervisor.run(cancel_token)
+    except Exception as e:
+        log_error(f"Errore nel supervisore del monitoraggio: {e}")
+        return False
+    return True
@@ -0,0 +1,120 @@
+"""
+Controllo delle operazioni lunghe: cancellazione cooperativa e avanzamento.
+
+Le operazioni (download archivi, monitoraggio, recupero gruppi) ricevono un
+CancellationToken e lo controllano nei punti sicuri, dove possono fermarsi
+salvando stato e checkpoint. Il ProgressTracker calcola velocità ed ETA ed
+emette periodicamente record di avanzamento sul bus eventi.
+"""
+
+import asyncio
+import threading
+import time
+
+from event_bus import progress
+
+class OperationCancelled(Exception):
+    """Sollevata quando un'operazione viene annullata tramite il suo token."""
+
+class CancellationToken:
+    """Token di cancellazione condivisibile tra thread e coroutine."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        """True se è stata richiesta la cancellazione."""
+        return self._event.is_set()
+
+    def cancel(self):
+        """Richiede la cancellazione; può essere chiamato da qualsiasi thread."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def add_callback(self, callback):
+        """Registra una funzione da chiamare alla cancellazione (subito, se già annullato)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self):
+        """Solleva OperationCancelled se è stata richiesta la cancellazione."""
+        if self._event.is_set():
+            raise OperationCancelled()
+
+    async def wait(self):
+        """Attende, senza bloccare il loop, che venga richiesta la cancellazione."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def _wake():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(True))
+
+        self.add_callback(_wake)
+        await future
+
+def is_cancelled(cancel_token):
+    """Verifica un token che può anche essere None."""
+    return cancel_token is not None and cancel_token.cancelled
+
+class ProgressTracker:
+    """Accumula l'avanzamento di un'operazione ed emette record con velocità ed ETA."""
+
+    def __init__(self, stage, total=None, interval=2.0):
+        """
+        Args:
+            stage: Descrizione della fase (es. "Download archivio")
+            total: Numero totale di messaggi previsto, se noto
+            interval: Intervallo minimo in secondi tra due record emessi
+        """
+        self.stage = stage
+        self.total = total
+        self.interval = interval
+        self.messages = 0
+        self.bytes = 0
+        self.counters = {}
+        self.start_time = time.monotonic()
+        self._last_emit = 0
+
+    def update(self, messages=0, nbytes=0, **counters):
+        """Aggiorna i contatori ed emette un record se è trascorso l'intervallo."""
+        self.messages += messages
+        self.bytes += nbytes
+        for name, value in counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        if time.monotonic() - self._last_emit >= self.interval:
+            self.emit()
+
+    def eta(self):
+        """Stima in secondi del tempo rimanente, o None se non calcolabile."""
+        if not self.total or not self.messages:
+            return None
+        elapsed = time.monotonic() - self.start_time
+        remaining = max(self.total - self.messages, 0)
+        return remaining * elapsed / self.messages
+
+    def emit(self, **extra):
+        """Emette subito un record di avanzamento."""
+        self._last_emit = time.monotonic()
+        elapsed = max(self._last_emit - self.start_time, 0.001)
+        details = dict(self.counters)
+        details["MB"] = f"{self.bytes / 1048576:.1f}"
+        details["msg/s"] = f"{self.messages / elapsed:.1f}"
+        eta = self.eta()
+        if eta is not None:
+            details["ETA"] = time.strftime("%H:%M:%S", time.gmtime(eta))
+        details.update(extra)
+        progress(self.stage, self.messages, self.total, **details)
@@ -0,0 +1,110 @@
+"""
+Risoluzione memorizzata dei percorsi di salvataggio.
+
+I percorsi <base>/<utente>/<gruppo>/<tipo> vengono calcolati una sola volta per
+(account, chat, tipo): la sanitizzazione del nome del gruppo e la creazione
+delle directory non vengono ripetute per ogni messaggio.
+
+Due gruppi diversi possono produrre lo stesso nome sanitizzato (ad esempio nomi
+composti solo da emoji diverse): il primo gruppo che usa un nome lo mantiene,
+gli altri ricevono il suffisso _<id chat>. Le assegnazioni vengono salvate in
+group_dirs.json nella cartella dell'utente, così restano stabili tra le esecuzioni.
+"""
+
+import os
+import threading
+
+from utils import load_json, save_json, sanitize_group_name, sanitize_username, log_error
+
+GROUP_DIRS_FILE = "group_dirs.json"
+
+class PathResolver:
+    """Calcola e memorizza le directory di salvataggio per account, chat e tipo."""
+
+    def __init__(self):
+        self._created = set()      # Directory già create in questa esecuzione
+        self._group_dirs = {}      # {(base_dir, nickname, chat_key): nome directory}
+        self._assignments = {}     # {(base_dir, nickname): {nome directory: chat_key}}
+        self._lock = threading.Lock()
+
+    def ensure_dir(self, path):
+        """Crea la directory la prima volta che viene richiesta e restituisce il percorso."""
+        if path not in self._created:
+            os.makedirs(path, exist_ok=True)
+            self._created.add(path)
+        return path
+
+    def forget_dir(self, path):
+        """Dimentica una directory (ad esempio dopo che è stata rimossa dal disco)."""
+        self._created.discard(path)
+
+    def group_dir_name(self, base_dir, app_nickname, group_name, chat_id=None):
+        """
+        Restituisce il nome della directory di un gruppo, risolvendo le collisioni.
+
+        Args:
+            base_dir: Directory base (downloads, archive, ...)
+            app_nickname: Nickname dell'account dell'applicazione
+            group_name: Nome del gruppo
+            chat_id: ID della chat; se assente il nome stesso identifica il gruppo
+        """
+        chat_key = str(chat_id) if chat_id is not None else f"name:{group_name}"
+        key = (base_dir, app_nickname, chat_key)
+        name = self._group_dirs.get(key)
+        if name is not None:
+            return name
+
+        with self._lock:
+            name = self._group_dirs.get(key)
+            if name is not None:
+                return name
+
+            assignments = self._load_assignments(base_dir, app_nickname)
+            owned = [dir_name for dir_name, owner in assignments.items() if owner == chat_key]
+            if owned:
+                name = owned[0]
+            else:
+                name = sanitize_group_name(group_name)
+                owner = assignments.get(name)
+                if owner is not None and owner != chat_key:
+                    suffix = str(chat_id).lstrip('-') if chat_id is not None else str(len(assignments))
+                    name = f"{name}_{suffix}"
+                assignments[name] = chat_key
+                self._save_assignments(base_dir, app_nickname, assignments)
+
+            self._group_dirs[key] = name
+            return name
+
+    def group_dir(self, base_dir, app_nickname, group_name, chat_id=None):
+        """Restituisce (creandola se serve) la directory <base>/<utente>/<gruppo>."""
+        name = self.group_dir_name(base_dir, app_nickname, group_name, chat_id)
+        return self.ensure_dir(os.path.join(base_dir, app_nickname, name))
+
+    def media_dir(self, base_dir, app_nickname, group_name, media_type, chat_id=None):
+        """Restituisce (creandola se serve) la directory <base>/<utente>/<gruppo>/<tipo>."""
+        group_dir = self.group_dir(base_dir, app_nickname, group_name, chat_id)
+        return self.ensure_dir(os.path.join(group_dir, media_type))
+
+    def sender_dir(self, base_dir, app_nickname, sender_name):
+        """Restituisce (creandola se serve) la directory di un mittente per i media privati."""
+        sender_folder = sanitize_username(sender_name)
+        if app_nickname:
+            return self.ensure_dir(os.path.join(base_dir, app_nickname, sender_folder))
+        return self.ensure_dir(os.path.join(base_dir, sender_folder))
+
+    def _load_assignments(self, base_dir, app_nickname):
+        key = (base_dir, app_nickname)
+        if key not in self._assignments:
+            file_path = os.path.join(base_dir, app_nickname, GROUP_DIRS_FILE)
+            self._assignments[key] = load_json(file_path) if os.path.exists(file_path) else {}
+        return self._assignments[key]
+
+    def _save_assignments(self, base_dir, app_nickname, assignments):
+        try:
+            user_dir = self.ensure_dir(os.path.join(base_dir, app_nickname))
+            save_json(os.path.join(user_dir, GROUP_DIRS_FILE), assignments)
+        except Exception as e:
+            log_error(f"Impossibile salvare le directory dei gruppi: {e}")
+
+# Istanza singleton condivisa da download, archivio e monitoraggio
+path_resolver = PathResolver()
@@ -0,0 +1,305 @@
+"""
+Profilazione opzionale delle operazioni.
+
+Si attiva con PROFILE_OPERATIONS=1 nel file .env (PROFILE_TRACEMALLOC=1 per
+misurare anche la memoria) oppure dalla casella nel tab Istanze della GUI.
+Ogni operazione (archivio, recupero gruppi, sessione di monitoraggio) viene
+eseguita sotto cProfile e i risultati vengono salvati in PROFILES_DIR:
+
+- <operazione>.prof: statistiche di cProfile (leggibili con pstats o snakeviz);
+- <operazione>.tracemalloc: istantanea della memoria alla fine dell'operazione;
+- <operazione>.json: riepilogo (durata, tempo eseguito, picco di memoria).
+
+Le operazioni condividono lo stesso event loop, quindi il profiler non resta
+attivo sull'intero thread: viene acceso solo mentre gira un passo
+dell'operazione o di un task creato da essa (ad esempio gli handler degli
+eventi del monitoraggio), così operazioni contemporanee non si mescolano.
+La memoria misurata da tracemalloc è invece quella dell'intero processo.
+
+Riepilogo da riga di comando:
+
+    python profiling.py                  # elenca i profili salvati
+    python profiling.py <operazione>     # funzioni più costose e maggiori allocazioni
+"""
+
+import asyncio
+import collections.abc
+import contextvars
+import cProfile
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+
+from config import PROFILES_DIR, PROFILE_OPERATIONS, PROFILE_TRACEMALLOC, PROFILE_TRACEMALLOC_FRAMES
+from event_bus import log
+
+# Sessione di profilazione del task in esecuzione (ereditata dai task che crea)
+_current_session = contextvars.ContextVar("profiling_session", default=None)
+# Sessione con il profiler acceso in questo momento, per thread
+_running = threading.local()
+
+# Impostazioni correnti, modificabili a runtime (ad esempio dalla GUI)
+_enabled = PROFILE_OPERATIONS
+_trace_memory = PROFILE_TRACEMALLOC
+_tracemalloc_users = 0  # Sessioni che stanno usando tracemalloc
+
+def set_enabled(enabled, trace_memory=None):
+    """Attiva o disattiva la profilazione delle operazioni avviate da ora in poi."""
+    global _enabled, _trace_memory
+    _enabled = enabled
+    if trace_memory is not None:
+        _trace_memory = trace_memory
+
+def settings():
+    """Restituisce (profilazione attiva, tracemalloc attivo)."""
+    return _enabled, _trace_memory
+
+class ProfileSession:
+    """Profilo di una singola operazione."""
+
+    def __init__(self, operation_id, name, trace_memory=False, directory=PROFILES_DIR):
+        self.operation_id = operation_id
+        self.name = name
+        self.directory = directory
+        self.profiler = cProfile.Profile()
+        self.trace_memory = trace_memory
+        self.started = time.time()
+        self.active_seconds = 0.0  # Tempo trascorso nei passi dell'operazione e dei suoi task
+        self.steps = 0
+        self.tasks = 0
+        self.closed = False
+        if trace_memory:
+            _start_tracemalloc()
+
+    def run_step(self, function, *args):
+        """Esegue un passo della coroutine con il profiler acceso."""
+        if self.closed:
+            return function(*args)
+        # Un'operazione profilata dentro un'altra sospende quella esterna
+        outer = getattr(_running, "session", None)
+        if outer is self:
+            return function(*args)
+        token = _current_session.set(self)
+        _running.session = self
+        if outer is not None:
+            outer.profiler.disable()
+        start = time.perf_counter()
+        try:
+            self.profiler.enable()
+        except ValueError:
+            # Un altro profiler (esterno all'applicazione) è già attivo sul thread
+            start = None
+        try:
+            return function(*args)
+        finally:
+            if start is not None:
+                self.profiler.disable()
+                self.active_seconds += time.perf_counter() - start
+                self.steps += 1
+            _current_session.reset(token)
+            _running.session = outer
+            if outer is not None and not outer.closed:
+                outer.profiler.enable()
+
+    def finish(self, status):
+        """Salva i risultati della sessione."""
+        if self.closed:
+            return
+        self.closed = True
+        os.makedirs(self.directory, exist_ok=True)
+        base = os.path.join(self.directory, self.operation_id)
+        summary = {
+            "operation_id": self.operation_id,
+            "name": self.name,
+            "status": status,
+            "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+            "duration_seconds": round(time.time() - self.started, 3),
+            "active_seconds": round(self.active_seconds, 3),
+            "steps": self.steps,
+            "tasks": self.tasks,
+        }
+        try:
+            # L'istantanea precede dump_stats, che alloca a sua volta
+            if self.trace_memory:
+                snapshot = tracemalloc.take_snapshot().filter_traces((
+                    tracemalloc.Filter(False, tracemalloc.__file__),
+                    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                ))
+                snapshot.dump(base + ".tracemalloc")
+                current, peak = tracemalloc.get_traced_memory()
+                summary["traced_memory_mb"] = round(current / 1048576, 1)
+                summary["traced_peak_mb"] = round(peak / 1048576, 1)
+            self.profiler.dump_stats(base + ".prof")
+            from utils import save_json
+            save_json(base + ".json", summary)
+            log(f"📊 Profilo dell'operazione {self.operation_id} salvato in {base}.prof")
+        except OSError as e:
+            log(f"⚠️ Impossibile salvare il profilo di {self.operation_id}: {e}", level="warning")
+        finally:
+            if self.trace_memory:
+                _stop_tracemalloc()
+
+def _start_tracemalloc():
+    global _tracemalloc_users
+    if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+        tracemalloc.start(PROFILE_TRACEMALLOC_FRAMES)
+    _tracemalloc_users += 1
+
+def _stop_tracemalloc():
+    global _tracemalloc_users
+    _tracemalloc_users -= 1
+    if _tracemalloc_users == 0:
+        tracemalloc.stop()
+
+class ProfiledCoroutine(collections.abc.Coroutine):
+    """Coroutine che esegue ogni passo di quella avvolta sotto il profiler della sessione."""
+
+    def __init__(self, coro, session, owner=False):
+        self._coro = coro
+        self._session = session
+        self._owner = owner  # La fine della coroutine chiude la sessione
+        self.__name__ = getattr(coro, "__name__", type(coro).__name__)
+        self.__qualname__ = getattr(coro, "__qualname__", self.__name__)
+
+    def _step(self, function, *args):
+        _install_task_factory()
+        try:
+            return self._session.run_step(function, *args)
+        except StopIteration:
+            self._finish("completed")
+            raise
+        except asyncio.CancelledError:
+            self._finish("cancelled")
+            raise
+        except BaseException:
+            self._finish("error")
+            raise
+
+    def _finish(self, status):
+        if self._owner:
+            self._session.finish(status)
+
+    def send(self, value):
+        return self._step(self._coro.send, value)
+
+    def throw(self, *args):
+        return self._step(self._coro.throw, *args)
+
+    def close(self):
+        try:
+            self._coro.close()
+        finally:
+            self._finish("closed")
+
+    def __await__(self):
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+def _task_factory_for(previous):
+    def factory(loop, coro, **kwargs):
+        # I task creati durante un passo profilato appartengono alla stessa operazione
+        session = _current_session.get()
+        if session is not None and not session.closed and asyncio.iscoroutine(coro):
+            session.tasks += 1
+            coro = ProfiledCoroutine(coro, session)
+        if previous is not None:
+            return previous(loop, coro, **kwargs)
+        return asyncio.Task(coro, loop=loop, **kwargs)
+    factory.profiling = True
+    return factory
+
+def _install_task_factory():
+    """Installa sul loop corrente la factory che segue i task delle operazioni profilate."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    previous = loop.get_task_factory()
+    if not getattr(previous, "profiling", False):
+        loop.set_task_factory(_task_factory_for(previous))
+
+def profiled(coro, operation_id=None, name=None):
+    """
+    Avvolge la coroutine di un'operazione con la profilazione, se attiva.
+
+    Args:
+        coro: La coroutine dell'operazione
+        operation_id: ID con cui salvare i risultati (generato se assente)
+        name: Nome dell'operazione (predefinito: quello della coroutine)
+
+    Returns:
+        La coroutine originale se la profilazione è disattivata, altrimenti una
+        coroutine equivalente che salva il profilo al termine
+    """
+    if not _enabled:
+        return coro
+    name = name or getattr(coro, "__qualname__", "operazione")
+    operation_id = operation_id or f"{name}_{uuid.uuid4().hex[:8]}"
+    session = ProfileSession(operation_id, name, trace_memory=_trace_memory)
+    return ProfiledCoroutine(coro, session, owner=True)
+
+def list_profiles(directory=PROFILES_DIR):
+    """Restituisce i riepiloghi dei profili salvati, dal più recente."""
+    from utils import load_json
+    if not os.path.isdir(directory):
+        return []
+    summaries = [load_json(os.path.join(directory, file_name))
+                 for file_name in os.listdir(directory) if file_name.endswith(".json")]
+    return sorted((summary for summary in summaries if summary), key=lambda summary: summary.get("started", ""),
+                  reverse=True)
+
+def summarize(operation_id, top=20, sort="cumulative", directory=PROFILES_DIR):
+    """Stampa le funzioni più costose e le maggiori allocazioni di un'operazione."""
+    import pstats
+    from utils import load_json
+    base = os.path.join(directory, operation_id)
+    summary = load_json(base + ".json")
+    if summary:
+        print(f"Operazione: {summary['operation_id']} ({summary['name']}, {summary['status']})")
+        print(f"Avviata: {summary['started']} | Durata: {summary['duration_seconds']} s | "
+              f"Eseguita: {summary['active_seconds']} s in {summary['steps']} passi, {summary['tasks']} task")
+    if not os.path.exists(base + ".prof"):
+        print(f"Profilo {operation_id} non trovato in {directory}")
+        return False
+    print(f"\n=== Funzioni più costose (ordinate per {sort}) ===")
+    pstats.Stats(base + ".prof").strip_dirs().sort_stats(sort).print_stats(top)
+
+    if os.path.exists(base + ".tracemalloc"):
+        snapshot = tracemalloc.Snapshot.load(base + ".tracemalloc")
+        print(f"=== Maggiori allocazioni ancora in memoria alla fine (picco del processo: "
+              f"{summary.get('traced_peak_mb', '?')} MB) ===")
+        for stat in snapshot.statistics("lineno")[:top]:
+            frame = stat.traceback[0]
+            print(f"{stat.size / 1024:10.1f} KB {stat.count:8} blocchi  {frame.filename}:{frame.lineno}")
+    return True
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Riepilogo dei profili delle operazioni")
+    parser.add_argument("operation_id", nargs="?", help="Operazione da riepilogare (predefinito: elenco dei profili)")
+    parser.add_argument("--top", type=int, default=20, help="Numero di righe da mostrare")
+    parser.add_argument("--sort", default="cumulative", choices=["cumulative", "tottime", "calls"],
+                        help="Ordinamento delle funzioni")
+    parser.add_argument("--dir", default=PROFILES_DIR, help="Directory dei profili")
+    args = parser.parse_args()
+
+    if args.operation_id:
+        summarize(args.operation_id, args.top, args.sort, args.dir)
+        return
+    profiles = list_profiles(args.dir)
+    if not profiles:
+        print(f"Nessun profilo in {args.dir}")
+    for summary in profiles:
+        memory = f" | picco {summary['traced_peak_mb']} MB" if "traced_peak_mb" in summary else ""
+        print(f"{summary['started']}  {summary['operation_id']:45} {summary['status']:10} "
+              f"{summary['duration_seconds']:>9} s (eseguita {summary['active_seconds']} s){memory}")
+
+if __name__ == "__main__":
+    main()
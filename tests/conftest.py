@@ -0,0 +1,19 @@
+import os
+import sys
+
+# I moduli dell'applicazione sono nella cartella principale del progetto
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Esegue il test in una cartella vuota, senza le directory ricordate dai test precedenti."""
+    from path_resolver import path_resolver
+    from media_layout import media_layouts
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(path_resolver, "_created", set())
+    monkeypatch.setattr(path_resolver, "_group_dirs", {})
+    monkeypatch.setattr(path_resolver, "_assignments", {})
+    monkeypatch.setattr(media_layouts, "_groups", {})
+    return tmp_path
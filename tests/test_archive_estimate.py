@@ -0,0 +1,79 @@
+import os
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import media_layout
+from archive_estimate import DiskQuota, archive_usage
+from media_layout import media_layouts
+
+MB = 1024 * 1024
+
+def make_quota(monkeypatch, free, **kwargs):
+    quota = DiskQuota("archivio", **kwargs)
+    monkeypatch.setattr(quota, "free_bytes", lambda: free)
+    return quota
+
+def test_check_stops_at_the_archive_quota(monkeypatch):
+    quota = make_quota(monkeypatch, 100 * 1024 * MB, used_bytes=90 * MB, quota_bytes=100 * MB, min_free=MB)
+    assert quota.check(5 * MB) is None
+    quota.add(8 * MB)
+    assert quota.check(5 * MB) == "raggiunta la quota dell'archivio (100 MB)"
+    # Senza quota conta solo il disco
+    unlimited = make_quota(monkeypatch, 100 * 1024 * MB, used_bytes=10 ** 12, quota_bytes=0, min_free=MB)
+    assert unlimited.check(5 * MB) is None
+
+def test_check_keeps_the_minimum_free_space(monkeypatch):
+    quota = make_quota(monkeypatch, 150 * MB, quota_bytes=0, min_free=100 * MB)
+    assert quota.check(50 * MB) is None
+    assert quota.check(51 * MB) == "spazio libero sul disco sotto 100 MB"
+    assert make_quota(monkeypatch, 99 * MB, quota_bytes=0, min_free=100 * MB).check() is not None
+
+def test_preflight_rejects_estimates_that_do_not_fit(monkeypatch):
+    quota = make_quota(monkeypatch, 200 * MB, quota_bytes=0, min_free=100 * MB)
+    # La stima viene maggiorata del margine: 100 MB ne richiedono 110
+    assert quota.preflight({"bytes": 90 * MB}) is None
+    assert quota.preflight({"bytes": 100 * MB}) == (
+        "servono circa 110.0 MB ma sul disco ne restano 100.0 MB utilizzabili")
+    full = make_quota(monkeypatch, 50 * MB, quota_bytes=0, min_free=100 * MB)
+    assert full.preflight({"bytes": MB}).endswith("ne restano 0.0 MB utilizzabili")
+
+def test_preflight_only_warns_about_the_quota(monkeypatch):
+    # La quota ferma il download al suo raggiungimento, non ne impedisce l'inizio
+    quota = make_quota(monkeypatch, 1024 * MB, used_bytes=90 * MB, quota_bytes=100 * MB, min_free=0)
+    assert quota.preflight({"bytes": 50 * MB}) is None
+
+def write_file(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+def test_usage_without_catalogue_scans_the_folders(workdir):
+    group_dir = str(workdir / "vecchio")
+    write_file(os.path.join(group_dir, "messages.txt"), 10)
+    write_file(os.path.join(group_dir, "images", "1700000000_1.jpg"), 100)
+    write_file(os.path.join(group_dir, "images", "1700000000_2.jpg"), 200)
+    write_file(os.path.join(group_dir, "videos", "1700000000_3.mp4"), 1000)
+    usage = archive_usage(group_dir)
+    assert usage == {"images": (2, 300), "videos": (1, 1000), "total": (3, 1310)}
+    media_layouts.forget(group_dir)
+    assert archive_usage(str(workdir / "mancante")) == {"total": (0, 0)}
+
+def test_usage_with_catalogue_counts_the_recorded_media(workdir, monkeypatch):
+    monkeypatch.setattr(media_layout, "MEDIA_LAYOUT", "hash")
+    group_dir = str(workdir / "nuovo")
+    layout = media_layouts.get(group_dir)
+    assert layout.indexed
+    message = SimpleNamespace(id=42, chat_id=-100, date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    file_path = os.path.join(layout.media_dir("images", message.id, 1704067200), "1704067200_42.jpg")
+    write_file(file_path, 500)
+    layout.record(message, "images", file_path)
+    write_file(os.path.join(group_dir, "messages.txt"), 10)
+    # Un file non registrato nel catalogo: le cartelle dei media non vengono lette
+    write_file(os.path.join(group_dir, "images", "estraneo.jpg"), 7)
+
+    usage = archive_usage(group_dir)
+    assert usage["images"] == (1, 500)
+    # Il totale comprende anche i file della cartella del gruppo (messaggi e catalogo)
+    top_level = sum(entry.stat().st_size for entry in os.scandir(group_dir) if entry.is_file())
+    assert usage["total"] == (1, 500 + top_level)
+    media_layouts.forget(group_dir)
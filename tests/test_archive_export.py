@@ -0,0 +1,108 @@
+import json
+import os
+import zipfile
+
+import pytest
+
+import archive_export
+from archive_export import ExportReader, export_archive, load_index, part_files
+from operation_control import CancellationToken
+
+def make_archive(archive_dir):
+    """Archivio di un gruppo con il file dei messaggi e due media."""
+    os.makedirs(os.path.join(archive_dir, "images"))
+    files = {
+        "messages.txt": b"primo messaggio\n",
+        "images/1700000000_1.jpg": b"foto-1",
+        "images/1700000000_2.jpg": b"foto-2",
+    }
+    for name, data in files.items():
+        with open(os.path.join(archive_dir, name), "wb") as f:
+            f.write(data)
+    # Un download in corso non va esportato
+    with open(os.path.join(archive_dir, "images", "1700000000_3.jpg.part"), "wb") as f:
+        f.write(b"incompleto")
+    return files
+
+def test_second_export_contains_only_changed_files(tmp_path):
+    archive_dir = str(tmp_path / "archivio")
+    export_dir = str(tmp_path / "export")
+    make_archive(archive_dir)
+
+    first = export_archive(archive_dir, export_dir, fmt="zip")
+    assert first["part"] == 1 and first["files"] == 3 and first["media"] == 2
+    assert export_archive(archive_dir, export_dir, fmt="zip") is None
+
+    # Il file dei messaggi cresce e arriva un nuovo media
+    with open(os.path.join(archive_dir, "messages.txt"), "ab") as f:
+        f.write(b"secondo messaggio\n")
+    with open(os.path.join(archive_dir, "images", "1700000000_4.jpg"), "wb") as f:
+        f.write(b"foto-4")
+    second = export_archive(archive_dir, export_dir, fmt="zip")
+    assert second["part"] == 2 and second["files"] == 2
+
+    assert sorted(part_files(export_dir).values()) == ["part-0001.zip", "part-0002.zip"]
+    with zipfile.ZipFile(second["path"]) as part:
+        names = {name for name in part.namelist() if not name.startswith("_export/")}
+        catalogue = [json.loads(line) for line in part.read("_export/catalogue-0002.jsonl").splitlines()]
+    assert names == {"messages.txt", "images/1700000000_4.jpg"}
+    assert catalogue == [{"name": "images/1700000000_4.jpg", "type": "images", "size": 6,
+                          "date": catalogue[0]["date"], "message_id": 4}]
+
+    # Per ogni file vale la parte più recente
+    index = load_index(export_dir)
+    assert index["messages.txt"]["part"] == 2
+    assert index["images/1700000000_1.jpg"]["part"] == 1
+    assert "images/1700000000_3.jpg.part" not in index
+
+def test_cancelled_export_keeps_the_files_already_written(tmp_path, monkeypatch):
+    archive_dir = str(tmp_path / "archivio")
+    export_dir = str(tmp_path / "export")
+    make_archive(archive_dir)
+    token = CancellationToken()
+    add_file = archive_export._ZipPart.add_file
+
+    def add_file_then_cancel(self, path, name):
+        # Interruzione richiesta durante la scrittura del primo file
+        token.cancel()
+        return add_file(self, path, name)
+
+    monkeypatch.setattr(archive_export._ZipPart, "add_file", add_file_then_cancel)
+    partial = export_archive(archive_dir, export_dir, fmt="zip", cancel_token=token)
+    assert partial["files"] == 1
+    assert not os.path.exists(partial["path"] + ".temp")
+    with zipfile.ZipFile(partial["path"]) as part:
+        assert part.testzip() is None
+        assert json.loads(part.read("_export/manifest-0001.json"))["files"] == 1
+
+    # La successiva esporta i file rimanenti
+    monkeypatch.setattr(archive_export._ZipPart, "add_file", add_file)
+    rest = export_archive(archive_dir, export_dir, fmt="zip")
+    assert rest["part"] == 2 and rest["files"] == 2
+    assert len(load_index(export_dir)) == 3
+
+def test_files_are_read_back_from_a_zip_part(tmp_path):
+    archive_dir = str(tmp_path / "archivio")
+    export_dir = str(tmp_path / "export")
+    files = make_archive(archive_dir)
+    export_archive(archive_dir, export_dir, fmt="zip")
+
+    reader = ExportReader(export_dir)
+    assert [name for name, _ in reader.list("images/*")] == ["images/1700000000_1.jpg", "images/1700000000_2.jpg"]
+    with reader.open("messages.txt") as f:
+        assert f.read() == files["messages.txt"]
+    target = reader.extract("images/1700000000_2.jpg", str(tmp_path / "estratti"))
+    assert target == str(tmp_path / "estratti" / "images" / "1700000000_2.jpg")
+    with open(target, "rb") as f:
+        assert f.read() == b"foto-2"
+    with pytest.raises(KeyError):
+        reader.open("images/mancante.jpg")
+
+@pytest.mark.parametrize("name", ["../fuori.txt", "images/../../fuori.txt", "."])
+def test_extract_rejects_names_outside_the_output_folder(tmp_path, name):
+    reader = ExportReader(str(tmp_path / "export"))
+    # Nomi letti da un indice manomesso
+    reader.items[name] = {"part": 1, "size": 1, "mtime_ns": 0}
+    with pytest.raises(ValueError):
+        reader.extract(name, str(tmp_path / "estratti"))
+    assert not os.path.exists(tmp_path / "fuori.txt")
@@ -0,0 +1,44 @@
+import asyncio
+import concurrent.futures
+import threading
+
+from async_runner import AsyncLoopThread
+
+def test_cancelled_future_completes_after_the_task_cleanup():
+    runner = AsyncLoopThread("test-loop")
+    started = threading.Event()
+    cleaned = threading.Event()
+
+    async def operation():
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        finally:
+            # Pulizia lenta (es. chiusura del client) dopo la cancellazione
+            await asyncio.sleep(0.2)
+            cleaned.set()
+
+    future = runner.submit(operation())
+    assert started.wait(2)
+    runner.cancel(future)
+    assert not future.done()
+    concurrent.futures.wait([future], timeout=2)
+    assert future.cancelled() and cleaned.is_set()
+    runner.stop()
+
+def test_cancel_before_the_task_starts():
+    runner = AsyncLoopThread("test-loop")
+    ran = []
+
+    async def operation():
+        ran.append(True)
+
+    # Il loop è occupato: il task dell'operazione non è ancora partito
+    blocker = threading.Event()
+    runner.loop.call_soon_threadsafe(blocker.wait, 2)
+    future = runner.submit(operation())
+    runner.cancel(future)
+    blocker.set()
+    concurrent.futures.wait([future], timeout=2)
+    assert future.cancelled() and not ran
+    runner.stop()
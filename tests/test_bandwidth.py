@@ -0,0 +1,90 @@
+import asyncio
+import multiprocessing
+import time
+
+from bandwidth import BandwidthGovernor, TokenBucket
+from config import BANDWIDTH_BURST_SECONDS, BANDWIDTH_RESERVE
+
+def make_governor(tmp_path, limits):
+    governor = BandwidthGovernor(limits_file=str(tmp_path / "bandwidth_limits.json"))
+    governor.configure(limits)
+    governor._checked = float("inf")  # Nessuna rilettura del file durante il test
+    return governor
+
+def test_global_limits_are_split_between_processes(tmp_path):
+    governor = make_governor(tmp_path, {"global_kbps": 900, "classes": {"archive": {"kbps": 300}},
+                                        "accounts": {"alice": {"kbps": 100}}})
+    # Due processi del monitoraggio più il processo principale
+    governor.set_share(1 / 3)
+    assert governor._global.rate == 300 * 1024
+    assert governor._bucket("class", "archive").rate == 100 * 1024
+    # Ogni account è gestito da un solo processo: il suo limite resta intero
+    assert governor._bucket("account", "alice").rate == 100 * 1024
+
+def test_concurrency_limits_are_split_between_processes(tmp_path):
+    governor = make_governor(tmp_path, {"max_concurrency": 6, "classes": {"archive": {"concurrency": 2}},
+                                        "accounts": {"alice": {"concurrency": 3}}})
+    governor.set_share(1 / 3)
+    keys = {(kind, name): limit for kind, name, limit in governor._concurrency_keys("alice", "archive")}
+    assert keys == {("global", None): 2, ("class", "archive"): 1, ("account", "alice"): 3}
+
+def test_priority_downloads_in_other_processes_keep_the_reserve(tmp_path):
+    clock = multiprocessing.get_context("spawn").Value("d", 0.0)
+    monitor = make_governor(tmp_path, {"global_kbps": 100})
+    archive = make_governor(tmp_path, {"global_kbps": 100})
+    monitor.share_priority_clock(clock)
+    archive.share_priority_clock(clock)
+    assert not archive._priority_recent(time.monotonic())
+
+    # Il monitoraggio scarica in un altro processo: la riserva vale anche per gli archivi
+    asyncio.run(monitor.acquire(1024, "alice", "monitoring"))
+    assert clock.value > 0
+    assert archive._priority_recent(time.monotonic())
+    bucket = archive._global
+    bucket.consume(bucket.burst * 0.4)
+    # Un blocco che intaccherebbe la riserva deve attendere, anche se la banda ci sarebbe
+    assert bucket.wait_time(bucket.burst * 0.3) == 0
+    assert bucket.wait_time(bucket.burst * 0.3, bucket.burst * BANDWIDTH_RESERVE) > 0
+
+def test_bucket_refills_up_to_the_burst():
+    bucket = TokenBucket(1000)
+    assert bucket.tokens == bucket.burst == 1000 * BANDWIDTH_BURST_SECONDS
+    bucket.consume(bucket.burst)
+    bucket.refill(bucket.updated + 0.5)
+    assert bucket.tokens == 500
+    bucket.refill(bucket.updated + 3600)
+    assert bucket.tokens == bucket.burst
+
+def test_bucket_wait_and_debt():
+    bucket = TokenBucket(1000)
+    bucket.consume(bucket.burst + 500)
+    # Il debito si ripaga alla velocità del secchio
+    assert bucket.debt_time() == 0.5
+    assert bucket.wait_time(100) == (500 + 100) / 1000
+    assert TokenBucket(0).wait_time(10 ** 9) == 0.0
+
+def test_limits_apply_at_runtime(tmp_path):
+    governor = make_governor(tmp_path, {"global_kbps": 100})
+    governor._global.consume(governor._global.burst)
+    assert governor._global.wait_time(1024) > 0
+    # Limite rimosso: i download in attesa ripartono subito
+    governor.configure({"global_kbps": 0})
+    assert governor._global.wait_time(1024) == 0.0
+
+def test_monitoring_takes_bandwidth_while_archives_wait(tmp_path, monkeypatch):
+    governor = make_governor(tmp_path, {"global_kbps": 100})
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        governor._global.tokens = governor._global.burst  # Il tempo passa: secchio di nuovo pieno
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    burst = governor._global.burst
+    # Il monitoraggio preleva subito anche oltre il secchio, pagando poi il debito
+    asyncio.run(governor.acquire(burst * 1.5, "alice", "monitoring"))
+    assert len(sleeps) == 1
+    # Un archivio subito dopo attende che si liberi anche la riserva
+    governor._global.tokens = burst * BANDWIDTH_RESERVE
+    asyncio.run(governor.acquire(1024, "bob", "archive"))
+    assert len(sleeps) == 2
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from telethon.errors import FloodWaitError
+from telethon.tl import functions, types
+
+import client_tracking
+from client_wrapper import TrackedTelegramClient
+
+def make_client():
+    # Sessione in memoria: il client non si connette mai
+    return TrackedTelegramClient(None, 1, "hash")
+
+def test_reconnect_callbacks_run_on_auto_reconnect():
+    client = make_client()
+    calls = []
+    client.add_reconnect_callback(lambda: calls.append("gap"))
+
+    async def reconnect():
+        await client._handle_auto_reconnect()
+
+    asyncio.run(reconnect())
+    assert calls == ["gap"]
+
+class FloodSender:
+    """Sender che risponde con un FloodWait alla prima richiesta."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.calls = 0
+
+    def send(self, request, ordered=False):
+        self.calls += 1
+        future = asyncio.get_running_loop().create_future()
+        if self.calls == 1:
+            future.set_exception(FloodWaitError(request=None, capture=self.seconds))
+        else:
+            future.set_result(types.Config)
+        return future
+
+def test_flood_wait_is_slept_and_counted_once(monkeypatch):
+    client = make_client()
+    client.flood_sleep_threshold = 60
+    sleeps, counters = [], []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(client_tracking, "track", lambda client, **values: counters.append(values))
+    monkeypatch.setattr(client.session, "process_entities", lambda result: None)
+    sender = FloodSender(2)
+
+    result = asyncio.run(client._call(sender, functions.help.GetConfigRequest()))
+    assert result is types.Config
+    # Una sola attesa, fatta dal wrapper (non da Telethon) e conteggiata
+    assert sleeps == [2]
+    assert {"flood_wait_seconds": 2} in counters
+    assert sender.calls == 2
+    assert client.flood_sleep_threshold == 60
+
+def test_flood_wait_over_the_threshold_is_raised(monkeypatch):
+    client = make_client()
+    client.flood_sleep_threshold = 1
+    monkeypatch.setattr(client_tracking, "track", lambda client, **values: None)
+
+    async def call():
+        await client._call(FloodSender(30), functions.help.GetConfigRequest())
+
+    with pytest.raises(FloodWaitError):
+        asyncio.run(call())
@@ -0,0 +1,106 @@
+import os
+import asyncio
+from types import SimpleNamespace
+
+import dedup
+import media_handler
+from dedup import MessageClaims
+
+def make_claims(tmp_path, instance_id):
+    claims = MessageClaims(claims_dir=str(tmp_path / ".claims"))
+    claims.set_instance(instance_id)
+    return claims
+
+def test_only_the_first_account_downloads(tmp_path):
+    claims = make_claims(tmp_path, "a")
+    first = claims.claim(-100, 1, "alice")
+    second = claims.claim(-100, 1, "bob")
+    assert first.owned and not second.owned
+    assert second.owner == "alice"
+    assert claims.claim(-100, 2, "bob").owned
+
+def test_claim_of_a_running_instance_is_respected(tmp_path, monkeypatch):
+    monkeypatch.setattr(dedup, "LOCK_FILE", str(tmp_path / "missing.lock"))
+    first = make_claims(tmp_path, "a")
+    other = make_claims(tmp_path, "b")
+    assert first.claim(-100, 1, "alice").owned
+    claim = other.claim(-100, 1, "bob")
+    # Il pid del file è quello di questo processo, quindi ancora attivo
+    assert not claim.owned and claim.instance_id == "a"
+
+def test_claim_of_a_dead_instance_is_replaced(tmp_path, monkeypatch):
+    monkeypatch.setattr(dedup, "LOCK_FILE", str(tmp_path / "missing.lock"))
+    monkeypatch.setattr(dedup, "is_process_running", lambda pid: False)
+    first = make_claims(tmp_path, "a")
+    other = make_claims(tmp_path, "b")
+    assert first.claim(-100, 1, "alice").owned
+    assert other.claim(-100, 1, "bob").owned
+
+def test_completed_claim_shares_the_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(dedup, "is_process_running", lambda pid: False)
+    first = make_claims(tmp_path, "a")
+    other = make_claims(tmp_path, "b")
+    claim = first.claim(-100, 1, "alice")
+    first.complete(claim, str(tmp_path / "photo.jpg"))
+    duplicate = other.claim(-100, 1, "bob")
+    # Anche con l'istanza terminata il media scaricato non va riscaricato
+    assert not duplicate.owned
+    assert duplicate.path == os.path.abspath(str(tmp_path / "photo.jpg"))
+
+def test_failed_download_releases_the_claim(tmp_path):
+    claims = make_claims(tmp_path, "a")
+    claim = claims.claim(-100, 1, "alice")
+    claims.complete(claim, None)
+    assert claims.claim(-100, 1, "bob").owned
+
+def run_download_once(monkeypatch, tmp_path, is_channel):
+    claims = make_claims(tmp_path, "a")
+    monkeypatch.setattr(media_handler, "message_claims", claims)
+    downloads = []
+
+    async def fake_download(message, group_name, app_nickname=None, sender_info=None):
+        downloads.append(app_nickname)
+        return f"{app_nickname}.jpg"
+
+    monkeypatch.setattr(media_handler, "download_media", fake_download)
+    message = SimpleNamespace(id=1, chat_id=-100, is_channel=is_channel, media=None)
+
+    async def both():
+        return [await media_handler.download_media_once(message, "gruppo", nickname)
+                for nickname in ("alice", "bob")]
+
+    return asyncio.run(both()), downloads
+
+def test_basic_groups_are_not_deduplicated(tmp_path, monkeypatch):
+    # Nei gruppi base lo stesso ID indica messaggi diversi per ogni account
+    paths, downloads = run_download_once(monkeypatch, tmp_path, is_channel=False)
+    assert downloads == ["alice", "bob"]
+    assert paths == ["alice.jpg", "bob.jpg"]
+
+def test_supergroups_are_downloaded_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(media_handler, "get_media_type", lambda message: "others")
+    paths, downloads = run_download_once(monkeypatch, tmp_path, is_channel=True)
+    assert downloads == ["alice"]
+    assert paths == ["alice.jpg", None]
+
+def test_waiting_duplicate_is_woken_by_a_completion_in_a_thread(tmp_path):
+    claims = make_claims(tmp_path, "a")
+    owned = claims.claim(-100, 1, "alice")
+    duplicate = claims.claim(-100, 1, "bob")
+
+    async def main():
+        waiter = asyncio.ensure_future(claims.wait_path(duplicate, timeout=5))
+        await asyncio.sleep(0)
+        await asyncio.to_thread(claims.complete, owned, str(tmp_path / "photo.jpg"))
+        return await waiter
+
+    # In modalità debug asyncio segnala le operazioni sui future da altri thread
+    assert asyncio.run(main(), debug=True) == str(tmp_path / "photo.jpg")
+
+def test_completion_before_waiting_is_not_missed(tmp_path):
+    claims = make_claims(tmp_path, "a")
+    owned = claims.claim(-100, 1, "alice")
+    duplicate = claims.claim(-100, 1, "bob")
+    claims.complete(owned, str(tmp_path / "photo.jpg"))
+    path = asyncio.run(asyncio.wait_for(claims.wait_path(duplicate, timeout=300), 1))
+    assert path == str(tmp_path / "photo.jpg")
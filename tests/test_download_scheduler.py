@@ -0,0 +1,92 @@
+import asyncio
+
+import download_scheduler
+from download_scheduler import DownloadItem, DownloadScheduler
+
+def run_in_order(requests, slots=1):
+    """
+    Accoda le richieste mentre un primo download occupa la coda e restituisce
+    l'ordine in cui partono. requests: [(nome, operation_class, size)]
+    """
+    scheduler = DownloadScheduler("alice", slots=slots)
+    order = []
+
+    async def main():
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        first = asyncio.ensure_future(scheduler.run(blocker, key="blocker"))
+        await asyncio.sleep(0)
+
+        def download(name):
+            async def run():
+                order.append(name)
+                return name
+            return run
+
+        tasks = [asyncio.ensure_future(scheduler.run(download(name), key=name, size=size, operation_class=kind))
+                 for name, kind, size in requests]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, *tasks)
+
+    asyncio.run(main())
+    return order, scheduler
+
+def test_monitoring_and_small_files_go_first():
+    order, _ = run_in_order([
+        ("archivio grande", "archive", 50 * 1024 * 1024),
+        ("archivio piccolo", "archive", 1024),
+        ("monitoraggio", "monitoring", 50 * 1024 * 1024),
+    ])
+    assert order == ["monitoraggio", "archivio piccolo", "archivio grande"]
+
+def test_waiting_downloads_gain_priority():
+    loop = asyncio.new_event_loop()
+    try:
+        old = DownloadItem("vecchio", "archive", 0, 0, loop)
+        new = DownloadItem("nuovo", "monitoring", 0, 1, loop)
+        now = new.enqueued
+        assert old.priority(now) > new.priority(now)
+        # Dopo tre intervalli di attesa l'archivio supera il monitoraggio appena arrivato
+        old.enqueued = now - 3 * download_scheduler.DOWNLOAD_AGING_INTERVAL
+        assert old.priority(now) < new.priority(now)
+    finally:
+        loop.close()
+
+def test_duplicate_requests_share_one_download():
+    scheduler = DownloadScheduler("alice", slots=2)
+    calls = []
+
+    async def main():
+        async def download():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "percorso"
+
+        return await asyncio.gather(*(scheduler.run(download, key="file.jpg") for _ in range(3)))
+
+    assert asyncio.run(main()) == ["percorso"] * 3
+    assert calls == [1]
+    status = scheduler.status()
+    assert status["deduplicated"] == 2 and status["completed"] == 1
+    assert status["active"] == 0 and status["queued"] == 0
+
+def test_slots_limit_concurrent_downloads():
+    scheduler = DownloadScheduler("alice", slots=2)
+    running = []
+    peak = []
+
+    async def main():
+        async def download():
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        await asyncio.gather(*(scheduler.run(download, key=index) for index in range(6)))
+
+    asyncio.run(main())
+    assert max(peak) == 2
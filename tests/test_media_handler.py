@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+from telethon.tl import types
+
+from media_handler import is_forwardable_media
+
+def make_message(media, **kinds):
+    attributes = dict(photo=None, video=None, audio=None, voice=None, document=None, sticker=None, gif=None)
+    attributes.update(kinds)
+    return SimpleNamespace(media=media, **attributes)
+
+def test_files_are_forwarded():
+    photo = types.Photo(id=1, access_hash=0, file_reference=b"", date=None, sizes=[], dc_id=2)
+    assert is_forwardable_media(make_message(types.MessageMediaPhoto(photo=photo), photo=photo))
+
+def test_non_file_media_is_not_forwarded():
+    geo = types.MessageMediaGeo(geo=types.GeoPointEmpty())
+    dice = types.MessageMediaDice(value=3, emoticon="🎲")
+    assert not is_forwardable_media(make_message(geo))
+    assert not is_forwardable_media(make_message(dice))
+    assert not is_forwardable_media(make_message(None))
+
+def test_link_previews_are_not_forwarded():
+    # Telethon espone la foto dell'anteprima come message.photo
+    photo = types.Photo(id=1, access_hash=0, file_reference=b"", date=None, sizes=[], dc_id=2)
+    webpage = types.MessageMediaWebPage(webpage=types.WebPageEmpty(id=1))
+    assert not is_forwardable_media(make_message(webpage, photo=photo))
@@ -0,0 +1,77 @@
+import asyncio
+import os
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import media_layout
+from config import MEDIA_HASH_SHARD_CHARS
+from media_layout import GroupLayout, shard
+
+def make_flat_group(group_dir, message_ids):
+    """Cartella di un gruppo creato prima del catalogo, con i media in images/."""
+    os.makedirs(os.path.join(group_dir, "images"))
+    for message_id in message_ids:
+        with open(os.path.join(group_dir, "images", f"1700000000_{message_id}.jpg"), "wb") as f:
+            f.write(b"x")
+
+def test_index_is_rebuilt_from_the_folders_off_the_event_loop(workdir, monkeypatch):
+    group_dir = str(workdir / "gruppo")
+    make_flat_group(group_dir, [5, 9])
+    layout = GroupLayout(group_dir)
+    threads = []
+    saved_ids = layout._saved_ids
+
+    def tracked_saved_ids():
+        threads.append(threading.current_thread())
+        return saved_ids()
+
+    monkeypatch.setattr(layout, "_saved_ids", tracked_saved_ids)
+
+    async def load():
+        completed = await layout.load_completed_ids()
+        # Già caricato: nessuna nuova ricostruzione
+        assert await layout.load_completed_ids() is completed
+        return completed
+
+    completed = asyncio.run(load())
+    assert 5 in completed and 9 in completed and 7 not in completed
+    assert threads and threads[0] is not threading.main_thread()
+    assert len(threads) == 1
+    layout._completed.close()
+
+def test_shards():
+    assert shard("flat", 42, 0) == ""
+    assert shard("date", 42, 1700000000) == "2023/11"
+    hashed = shard("hash", 42, 0)
+    assert len(hashed) == MEDIA_HASH_SHARD_CHARS and hashed == shard("hash", 42, 1)
+
+def test_new_groups_record_and_find_their_media(workdir, monkeypatch):
+    monkeypatch.setattr(media_layout, "MEDIA_LAYOUT", "hash")
+    group_dir = str(workdir / "nuovo")
+    layout = GroupLayout(group_dir)
+    assert layout.layout == "hash" and layout.indexed
+    message = SimpleNamespace(id=42, chat_id=-100, date=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    media_dir = layout.media_dir("images", message.id, 1704067200)
+    assert media_dir == os.path.join(group_dir, "images", shard("hash", 42, 0))
+    file_path = os.path.join(media_dir, "1704067200_42.jpg")
+    with open(file_path, "wb") as f:
+        f.write(b"12345")
+    layout.record(message, "images", file_path)
+
+    # Una nuova esecuzione ritrova il media dal catalogo, senza leggere le cartelle
+    reopened = GroupLayout(group_dir)
+    assert reopened.layout == "hash"
+    assert reopened.lookup(42) == file_path
+    assert reopened.lookup(43) is None
+    assert 42 in reopened.completed_ids()
+    assert reopened.usage() == {"images": (1, 5)}
+    layout._completed.close()
+    reopened._completed.close()
+
+def test_existing_flat_groups_stay_flat(workdir):
+    group_dir = str(workdir / "vecchio")
+    make_flat_group(group_dir, [1])
+    layout = GroupLayout(group_dir)
+    assert layout.layout == "flat" and not layout.indexed
+    assert layout.usage() is None
@@ -0,0 +1,103 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+from telethon.tl import types
+
+import media_preview
+from completed_ids import COMPLETED_FILE, CompletedIds
+from fake_telegram import FakeTelegramClient, FakeWorld
+from media_preview import pick_thumb
+
+def photo_message(sizes):
+    photo = types.Photo(id=1, access_hash=0, file_reference=b"", date=None, sizes=sizes, dc_id=2)
+    return SimpleNamespace(photo=photo, document=None)
+
+STRIPPED = types.PhotoStrippedSize(type="i", bytes=b"\x01\x28\x16")
+MEDIUM = types.PhotoSize(type="m", w=320, h=180, size=5000)
+LARGE = types.PhotoSize(type="x", w=1280, h=720, size=90000)
+
+def test_largest_thumb_within_the_limit(monkeypatch):
+    monkeypatch.setattr(media_preview, "PREVIEW_THUMB_MAX_SIDE", 320)
+    assert pick_thumb(photo_message([STRIPPED, MEDIUM, LARGE])) is MEDIUM
+
+def test_smallest_thumb_when_none_fits(monkeypatch):
+    monkeypatch.setattr(media_preview, "PREVIEW_THUMB_MAX_SIDE", 100)
+    assert pick_thumb(photo_message([MEDIUM, LARGE])) is MEDIUM
+    assert pick_thumb(photo_message([STRIPPED, MEDIUM, LARGE])) is STRIPPED
+
+def test_only_inline_thumbs_when_the_limit_is_zero(monkeypatch):
+    monkeypatch.setattr(media_preview, "PREVIEW_THUMB_MAX_SIDE", 0)
+    assert pick_thumb(photo_message([STRIPPED, MEDIUM, LARGE])) is STRIPPED
+    assert pick_thumb(photo_message([MEDIUM, LARGE])) is None
+
+@pytest.fixture
+def fake_preview(workdir, monkeypatch):
+    """Anteprima su un gruppo finto, con i download delle miniature sostituiti dal test."""
+    monkeypatch.setattr(FakeTelegramClient, "world",
+                        FakeWorld(groups=1, messages_per_group=40, media_ratio=1.0, rpc_latency=0))
+    client = FakeTelegramClient("fake")
+
+    async def create_client(nickname, operation_id, operation_type="archive"):
+        return client, None
+
+    async def no_op(*args, **kwargs):
+        return None
+
+    monkeypatch.setattr(media_preview, "create_client_for_operation", create_client)
+    monkeypatch.setattr(media_preview, "start_operation_client", no_op)
+    monkeypatch.setattr(media_preview, "close_operation_client", no_op)
+    monkeypatch.setattr(media_preview, "PREVIEW_THUMB_MAX_SIDE", 320)
+    group = {"user": "alice", "group": {"id": FakeTelegramClient.world.group_ids()[0], "name": "gruppo"}}
+
+    def completed_count():
+        archive_path = media_preview._group_info(group)[3]
+        done = CompletedIds(os.path.join(archive_path, media_preview.PREVIEW_DIR_NAME, COMPLETED_FILE))
+        try:
+            return done.count()
+        finally:
+            done.close()
+
+    return group, completed_count
+
+def test_failed_thumbs_are_retried(fake_preview, monkeypatch):
+    group, completed_count = fake_preview
+    monkeypatch.setattr(media_preview, "safe_download_media", lambda *args, **kwargs: asyncio.sleep(0))
+
+    summary = asyncio.run(media_preview.preview_group_archive(group))
+    assert summary["media"] > 0
+    assert summary["missing"] == summary["media"]
+    assert completed_count() == 0
+
+def test_pending_thumbs_are_stopped_on_errors(fake_preview, monkeypatch):
+    group, completed_count = fake_preview
+    started, finished = [], []
+
+    async def slow_download(message, file_path, **kwargs):
+        started.append(message.id)
+        await asyncio.sleep(3600)
+        finished.append(message.id)
+
+    async def broken_iter(self, entity, **kwargs):
+        async for message in original_iter(self, entity, **kwargs):
+            yield message
+            await asyncio.sleep(0)
+        raise ConnectionError("rete")
+
+    original_iter = FakeTelegramClient.iter_messages
+    monkeypatch.setattr(media_preview, "safe_download_media", slow_download)
+    monkeypatch.setattr(media_preview, "PREVIEW_CONCURRENCY", 1000)
+    monkeypatch.setattr(FakeTelegramClient, "iter_messages", broken_iter)
+
+    async def run():
+        result = await media_preview.preview_group_archive(group)
+        # Nessun task dell'anteprima deve restare in esecuzione
+        others = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        return result, others
+
+    result, others = asyncio.run(run())
+    assert result is None
+    assert started and not finished
+    assert others == []
+    assert completed_count() == 0
@@ -0,0 +1,100 @@
+import gzip
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from message_schema import iter_records, message_record, repair_records
+from message_sink import MessageSink
+
+def make_message(message_id, text="ciao"):
+    return SimpleNamespace(id=message_id, chat_id=-100, sender_id=7, text=text, message=text,
+                           date=datetime(2024, 1, 1, tzinfo=timezone.utc), media=None)
+
+def write(directory, ids, close=True):
+    os.makedirs(directory, exist_ok=True)
+    sink = MessageSink(str(directory), formats=("jsonl.gz",))
+    for message_id in ids:
+        sink.write(make_message(message_id), "User_7")
+    sink.flush()
+    if close:
+        sink.close()
+    return sink
+
+def killed_copy(sink, source, target):
+    """Copia lo stato su disco di un sink aperto, come dopo un processo terminato."""
+    os.makedirs(target, exist_ok=True)
+    for name in os.listdir(source):
+        shutil.copy(os.path.join(source, name), os.path.join(target, name))
+    sink._handles.clear()  # Il sink originale non viene chiuso
+
+def test_records_round_trip(tmp_path):
+    write(tmp_path, range(1, 4))
+    write(tmp_path, range(4, 6))
+    records = list(iter_records(str(tmp_path / "messages.jsonl.gz")))
+    assert [record["id"] for record in records] == [1, 2, 3, 4, 5]
+    assert set(records[0]) == set(message_record(make_message(1)))
+    assert not os.path.exists(tmp_path / "messages.jsonl.gz.open")
+
+def test_append_after_unclean_exit_stays_readable(tmp_path):
+    sink = write(tmp_path / "a", range(1, 4), close=False)
+    killed_copy(sink, tmp_path / "a", tmp_path / "b")
+
+    write(tmp_path / "b", range(4, 6))
+    path = str(tmp_path / "b" / "messages.jsonl.gz")
+    assert [record["id"] for record in iter_records(path)] == [1, 2, 3, 4, 5]
+    # Leggibile anche con gli strumenti standard (zcat)
+    with open(path, "rb") as f:
+        assert gzip.decompress(f.read()).count(b"\n") == 5
+
+def test_unclosed_member_without_marker_is_repaired(tmp_path):
+    sink = write(tmp_path / "a", range(1, 4), close=False)
+    killed_copy(sink, tmp_path / "a", tmp_path / "b")
+    os.remove(tmp_path / "b" / "messages.jsonl.gz.open")
+
+    write(tmp_path / "b", range(4, 6))
+    assert [record["id"] for record in iter_records(str(tmp_path / "b" / "messages.jsonl.gz"))] == [1, 2, 3, 4, 5]
+
+def test_reader_skips_a_member_left_without_trailer(tmp_path):
+    sink = write(tmp_path / "a", range(1, 4), close=False)
+    with open(tmp_path / "a" / "messages.jsonl.gz", "rb") as f:
+        broken = f.read()
+    sink._handles.clear()
+    path = tmp_path / "broken.jsonl.gz"
+    # Membro senza coda seguito da un altro membro: gzip.open fallisce con zlib.error
+    path.write_bytes(broken + gzip.compress(b'{"id": 4}\n'))
+    assert [record["id"] for record in iter_records(str(path))] == [1, 2, 3, 4]
+
+def test_repair_drops_a_member_cut_mid_block(tmp_path):
+    sink = write(tmp_path / "a", range(1, 4), close=False)
+    with open(tmp_path / "a" / "messages.jsonl.gz", "rb") as f:
+        first = f.read()
+    sink._handles.clear()
+    path = tmp_path / "cut.jsonl.gz"
+    whole = gzip.compress("".join(json.dumps({"id": i}) + "\n" for i in range(10, 200)).encode())
+    path.write_bytes(first + whole[:len(whole) // 2] + gzip.compress(b'{"id": 500}\n'))
+
+    kept = repair_records(str(path))
+    ids = [record["id"] for record in iter_records(str(path))]
+    assert ids[:3] == [1, 2, 3] and ids[-1] == 500
+    assert kept == len(ids)
+    assert repair_records(str(path)) is None
+
+def test_partial_jsonl_line_is_trimmed_before_appending(tmp_path):
+    path = tmp_path / "messages.jsonl"
+    path.write_text('{"id": 1}\n{"id": 2, "te')
+    sink = MessageSink(str(tmp_path), formats=("jsonl",))
+    sink.write(make_message(3), "User_7")
+    sink.close()
+    assert [record["id"] for record in iter_records(str(path))] == [1, 3]
+
+def test_truncated_member_is_not_read_into_the_next_one(tmp_path):
+    # I byte del membro successivo, letti come seguito di quello troncato, danno righe inventate
+    lines = "".join(json.dumps({"id": i}) + "\n" for i in range(10, 200)).encode()
+    path = tmp_path / "cut.jsonl.gz"
+    for mtime in range(100):
+        whole = gzip.compress(lines, mtime=mtime)
+        path.write_bytes(whole[:len(whole) // 2] + gzip.compress(b'{"id": 500}\n', mtime=mtime))
+        ids = [record["id"] for record in iter_records(str(path))]
+        assert ids == list(range(10, 10 + len(ids) - 1)) + [500]
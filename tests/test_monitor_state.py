@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+import event_handler
+from fake_telegram import FakeTelegramClient, FakeWorld
+from monitor_state import MonitorState
+
+CHAT = -1000000000001
+
+def make_state(tmp_path, synced=100):
+    path = tmp_path / "monitor_state.json"
+    state = MonitorState(str(path))
+    # Stato già in sincronia fino a synced, poi un avvio (tutte le chat hanno un buco)
+    state.mark_synced(CHAT, synced, state.generation, True)
+    state.claim(CHAT, synced)
+    state.save()
+    return MonitorState(str(path))
+
+def test_live_claims_do_not_move_the_point_past_a_gap(tmp_path):
+    state = make_state(tmp_path)
+    assert state.backfill_points() == {CHAT: 100}
+    assert state.claim(CHAT, 150)
+    assert state.chats() == {CHAT: 150}
+    assert state.backfill_points() == {CHAT: 100}
+
+def test_live_claims_advance_the_point_without_gaps(tmp_path):
+    state = make_state(tmp_path)
+    state.mark_synced(CHAT, None, state.generation, True)
+    state.claim(CHAT, 120)
+    state.mark_gap()
+    assert state.backfill_points() == {CHAT: 120}
+
+def test_reconnect_during_backfill_keeps_the_gap(tmp_path):
+    state = make_state(tmp_path)
+    generation = state.generation
+    state.mark_gap()
+    state.mark_synced(CHAT, 130, generation, True)
+    assert state.backfill_points() == {CHAT: 130}
+
+def test_live_ids_beyond_the_gap_survive_a_restart(tmp_path):
+    state = make_state(tmp_path)
+    state.claim(CHAT, 150)
+    state.save()
+    restarted = MonitorState(state.file_path)
+    assert not restarted.claim(CHAT, 150)
+    assert restarted.claim(CHAT, 149)
+
+@pytest.fixture
+def backfill(monkeypatch):
+    """Esegue backfill_missed_messages sul client finto registrando i messaggi elaborati."""
+    handled = []
+
+    async def handle_message(client, bot_entity, message, nickname, filters=None):
+        handled.append(message.id)
+
+    async def handle_album(client, bot_entity, messages, nickname, filters=None):
+        handled.extend(message.id for message in messages)
+
+    monkeypatch.setattr(event_handler, "handle_message", handle_message)
+    monkeypatch.setattr(event_handler, "handle_album", handle_album)
+    monkeypatch.setattr(event_handler, "MONITOR_BACKFILL_CHAT_DELAY", 0)
+    FakeTelegramClient.world = FakeWorld(groups=1, messages_per_group=300, rpc_latency=0)
+
+    def run(state, limit):
+        monkeypatch.setattr(event_handler, "MONITOR_BACKFILL_LIMIT", limit)
+        client = FakeTelegramClient("test")
+        return asyncio.run(event_handler.backfill_missed_messages(client, None, "test", state))
+
+    run.handled = handled
+    return run
+
+def test_backfill_beyond_the_limit_resumes_where_it_stopped(tmp_path, backfill):
+    state = make_state(tmp_path)
+    # Messaggi arrivati in diretta dopo la riconnessione, prima del recupero
+    state.claim(CHAT, 290)
+    state.claim(CHAT, 300)
+
+    backfill(state, limit=100)
+    assert backfill.handled == list(range(101, 201))
+    assert state.backfill_points() == {CHAT: 200}
+
+    # Dopo un riavvio il recupero riparte dal punto salvato, senza rielaborare i messaggi in diretta
+    restarted = MonitorState(state.file_path)
+    backfill(restarted, limit=150)
+    assert backfill.handled == [i for i in range(101, 300) if i != 290]
+    assert restarted.backfill_points() == {}
+    assert restarted.synced[str(CHAT)] == 300
@@ -0,0 +1,40 @@
+import os
+
+from utils import LogWriter
+
+def write_lines(writer, lines, file_name="info.txt"):
+    for line in lines:
+        writer.write(file_name, line)
+    assert writer.flush()
+
+def test_rotation_by_size(tmp_path):
+    writer = LogWriter(str(tmp_path), max_bytes=20, rotate_interval=0, backup_count=2)
+    write_lines(writer, [f"[riga {i:02}]\n" for i in range(5)])
+    writer.close()
+    assert os.path.exists(tmp_path / "info.txt.1")
+    assert os.path.exists(tmp_path / "info.txt.2")
+    assert not os.path.exists(tmp_path / "info.txt.3")
+
+def test_rotation_by_age_survives_restarts(tmp_path):
+    # File iniziato due giorni fa da un'esecuzione precedente
+    with open(tmp_path / "info.txt", "w", encoding="utf-8") as f:
+        f.write("[2000-01-01 10:00:00] vecchio\n")
+    writer = LogWriter(str(tmp_path), max_bytes=0, rotate_interval=24 * 3600)
+    write_lines(writer, ["[2000-01-03 10:00:00] nuovo\n"])
+    writer.close()
+    with open(tmp_path / "info.txt.1", encoding="utf-8") as f:
+        assert "vecchio" in f.read()
+    with open(tmp_path / "info.txt", encoding="utf-8") as f:
+        assert f.read() == "[2000-01-03 10:00:00] nuovo\n"
+
+def test_failed_rotation_keeps_logging(tmp_path, monkeypatch):
+    writer = LogWriter(str(tmp_path), max_bytes=10, rotate_interval=0)
+
+    def locked(path):
+        raise PermissionError("file in uso")
+
+    monkeypatch.setattr(writer, "_rotate", locked)
+    write_lines(writer, ["prima riga lunga\n", "seconda\n", "terza\n"])
+    writer.close()
+    with open(tmp_path / "info.txt", encoding="utf-8") as f:
+        assert f.read() == "prima riga lunga\nseconda\nterza\n"
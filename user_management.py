@@ -2,21 +2,16 @@ import os
 import time
 import random
 import asyncio
-from telethon import TelegramClient
+from event_bus import log
+import client_tracking
 from utils import load_json, save_json, log_error
-from config import API_ID, API_HASH, PHONE_NUMBERS_FILE
+from config import PHONE_NUMBERS_FILE
 
 async def create_client(nickname):
     """Crea un client con gestione migliorata delle sessioni."""
     # Usa il client standard ma con parametri migliorati
     session_path = f'session_{nickname}'
-    client = TelegramClient(
-        session_path, 
-        API_ID, 
-        API_HASH,
-        connection_retries=10,
-        retry_delay=3
-    )
+    client = client_tracking.create_client(session_path, nickname, "user")
     return client
 
 def add_new_user():
@@ -64,7 +59,7 @@ async def verify_and_add_user(nickname, phone_number):
                 break
             except Exception as e:
                 if "database is locked" in str(e).lower() and attempt < max_attempts - 1:
-                    print(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})")
+                    log(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})", level="warning")
                     await asyncio.sleep(random.uniform(1, 3) * (attempt + 1))
                 else:
                     raise
@@ -76,13 +71,13 @@ async def verify_and_add_user(nickname, phone_number):
         phone_numbers = load_json(PHONE_NUMBERS_FILE)
         phone_numbers[nickname] = phone_number
         save_json(PHONE_NUMBERS_FILE, phone_numbers)
-        print(f"✅ Utente {nickname} aggiunto con successo!")
+        log(f"✅ Utente {nickname} aggiunto con successo!")
         return True
     except Exception as e:
         if client.is_connected():
             await client.disconnect()
         log_error(f"Errore durante la verifica dell'account: {e}")
-        print(f"❌ Errore durante la verifica dell'account: {e}")
+        log(f"❌ Errore durante la verifica dell'account: {e}", level="error")
         return False
 
 def remove_user():
@@ -152,7 +147,7 @@ async def check_user_auth(nickname, phone_number):
                 break
             except Exception as e:
                 if "database is locked" in str(e).lower() and attempt < max_attempts - 1:
-                    print(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})")
+                    log(f"⚠️ Database bloccato, nuovo tentativo in corso... ({attempt+1}/{max_attempts})", level="warning")
                     await asyncio.sleep(random.uniform(1, 3) * (attempt + 1))
                 else:
                     raise
@@ -2,26 +2,209 @@ import os
 import json
 import time
 import re
-import emoji
+import functools
 import traceback
 import asyncio
 import sys
 import platform
 import subprocess
-from config import DOWNLOADS_DIR
+import threading
+import queue
+import atexit
+from config import (
+    DOWNLOADS_DIR, LOG_LEVEL, LOG_MAX_BYTES, LOG_ROTATE_INTERVAL,
+    LOG_BACKUP_COUNT, LOG_FLUSH_INTERVAL, LOG_ROTATE_RETRY
+)
+from event_bus import log, LEVELS
+from metrics import metrics
+from operation_control import OperationCancelled
+
+class LogWriter:
+    """
+    Scrittore di log in background.
+    
+    Le chiamate accodano solo la riga (senza mai bloccare il chiamante, anche
+    se è una coroutine); un thread dedicato scrive a blocchi, tiene i file
+    aperti, esegue il flush periodicamente e ruota i file per dimensione o età.
+    """
+    
+    def __init__(self, directory, max_bytes=LOG_MAX_BYTES, rotate_interval=LOG_ROTATE_INTERVAL,
+                 backup_count=LOG_BACKUP_COUNT, flush_interval=LOG_FLUSH_INTERVAL, batch_size=500):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue = queue.SimpleQueue()
+        self._files = {}  # {file_name: (handle, started_at)}: inizio del file, non della sua apertura
+        self._retry_at = {}  # {file_name: time}: prossimo tentativo dopo una rotazione non riuscita
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    def write(self, file_name, line):
+        """Accoda una riga per il file indicato (relativo alla directory dei log)."""
+        if self._thread is None:
+            self._start()
+        self._queue.put((file_name, line))
+    
+    def flush(self, timeout=2.0):
+        """Attende che tutte le righe accodate finora siano scritte su disco."""
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put((None, done))
+        return done.wait(timeout)
+    
+    def close(self, timeout=2.0):
+        """Scrive le righe in sospeso e chiude i file."""
+        self.flush(timeout)
+        with self._lock:
+            for handle, _ in self._files.values():
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+            self._files.clear()
+    
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        os.makedirs(self.directory, exist_ok=True)
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            # Raccogli tutte le righe già disponibili, fino alla dimensione del blocco
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            waiters = []
+            lines_by_file = {}
+            for file_name, item in batch:
+                if file_name is None:
+                    waiters.append(item)
+                else:
+                    lines_by_file.setdefault(file_name, []).append(item)
+            
+            with self._lock:
+                for file_name, lines in lines_by_file.items():
+                    try:
+                        handle = self._get_handle(file_name)
+                        for line in lines:
+                            if self._should_rotate(handle, file_name):
+                                handle = self._get_handle(file_name)
+                            handle.write(line)
+                        handle.flush()
+                    except Exception:
+                        # Il logging non deve mai interrompere l'applicazione
+                        pass
+            
+            for waiter in waiters:
+                waiter.set()
+    
+    def _should_rotate(self, handle, file_name):
+        started_at = self._files[file_name][1]
+        if time.time() < self._retry_at.get(file_name, 0):
+            return False
+        too_big = self.max_bytes and handle.tell() >= self.max_bytes
+        too_old = self.rotate_interval and time.time() - started_at >= self.rotate_interval
+        return bool(too_big or too_old)
+    
+    def _get_handle(self, file_name):
+        """Restituisce il file aperto, ruotandolo prima se ha superato dimensione o età."""
+        path = os.path.join(self.directory, file_name)
+        handle = self._files.get(file_name, (None, None))[0]
+        if handle is not None:
+            if not self._should_rotate(handle, file_name):
+                return handle
+            # Su Windows un file aperto non si può rinominare: va chiuso prima
+            handle.close()
+            try:
+                self._rotate(path)
+            except OSError as e:
+                # Si continua a scrivere sul file attuale e si riprova più tardi,
+                # invece di lasciare nel dizionario un file chiuso
+                log(f"⚠️ Rotazione di {file_name} non riuscita ({e}), nuovo tentativo tra {LOG_ROTATE_RETRY} secondi",
+                    level="warning")
+                self._retry_at[file_name] = time.time() + LOG_ROTATE_RETRY
+                handle = open(path, "a", encoding="utf-8")
+                self._files[file_name] = (handle, self._files[file_name][1])
+                return handle
+            self._retry_at.pop(file_name, None)
+        started_at = self._started_at(path)
+        handle = open(path, "a", encoding="utf-8")
+        self._files[file_name] = (handle, started_at)
+        return handle
+    
+    def _started_at(self, path):
+        """
+        Istante di inizio di un file di log, valido anche dopo un riavvio: l'orario
+        della prima riga, oppure la data di modifica dell'ultimo backup (la rotazione
+        precedente) o del file stesso.
+        """
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                first_line = f.readline()
+        except OSError:
+            return time.time()  # File nuovo
+        if not first_line:
+            return time.time()
+        try:
+            return time.mktime(time.strptime(first_line[1:20], "%Y-%m-%d %H:%M:%S"))
+        except ValueError:
+            pass
+        for candidate in (f"{path}.1", path):
+            try:
+                return os.path.getmtime(candidate)
+            except OSError:
+                continue
+        return time.time()
+    
+    def _rotate(self, path):
+        """Rinomina file.log -> file.log.1 -> file.log.2 ..., mantenendo backup_count copie."""
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(path, f"{path}.1")
+        else:
+            os.remove(path)
+
+# Scrittore condiviso per tutti i file di log sotto DOWNLOADS_DIR
+log_writer = LogWriter(DOWNLOADS_DIR)
+atexit.register(log_writer.close)
+metrics.add_collector(lambda: {"log_queue_depth": log_writer._queue.qsize()})
+
+def write_log(message, level="info", file_name="info.txt"):
+    """Accoda una riga di log se il livello raggiunge LOG_LEVEL."""
+    if LEVELS.get(level, 0) < LEVELS.get(LOG_LEVEL, 0):
+        return
+    log_writer.write(file_name, f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {message}\n")
 
 def log_error(message):
     """Registra un errore in un file di log."""
-    os.makedirs(DOWNLOADS_DIR, exist_ok=True)
-    with open(os.path.join(DOWNLOADS_DIR, "errors.txt"), "a", encoding="utf-8") as f:
-        f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {message}\n")
-    print(f"❌ ERRORE: {message}")
+    write_log(message, "error", "errors.txt")
+    log(f"❌ ERRORE: {message}", level="error")
 
 def log_info(message, file_name="info.txt"):
     """Registra un'informazione in un file di log."""
-    os.makedirs(DOWNLOADS_DIR, exist_ok=True)
-    with open(os.path.join(DOWNLOADS_DIR, file_name), "a", encoding="utf-8") as f:
-        f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] {message}\n")
+    write_log(message, "info", file_name)
+
+def log_event(event):
+    """Iscritto al bus eventi: registra i record, con l'ID dell'operazione, in operations.log."""
+    level = getattr(event, "level", "info")
+    operation = event.operation_id or "-"
+    write_log(f"[{operation}] {level.upper()}: {event.format()}", level, "operations.log")
 
 def load_json(file_path):
     """Carica dati da un file JSON."""
@@ -78,16 +261,23 @@ def save_json(file_path, data):
                 pass
         return False
 
+# Espressioni precompilate per la sanitizzazione dei nomi
+_GROUP_NAME_INVALID = re.compile(r'[^a-zA-Z0-9\s:]')
+_USERNAME_INVALID = re.compile(r'[^a-zA-Z0-9_]')
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_group_name(name):
     """Sanitizza il nome di un gruppo per usarlo come nome di directory."""
     if isinstance(name, int) or (isinstance(name, str) and name.strip('-').isdigit()):
         return f"group_{name}"  # Converti gli ID numerici in un formato di nome
 
+    import emoji  # Importato al primo utilizzo: rallenta l'avvio della GUI
     name = emoji.demojize(name)
-    name = re.sub(r'[^a-zA-Z0-9\s:]', '', name)
+    name = _GROUP_NAME_INVALID.sub('', name)
     name = name.replace(":", "_").replace(" ", "_")
     return name
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_username(username):
     """Sanitizza un username per usarlo come nome di directory."""
     if not username:
@@ -98,7 +288,7 @@ def sanitize_username(username):
         username = username[1:]
         
     # Converti in formato valido per directory
-    username = re.sub(r'[^a-zA-Z0-9_]', '', username)
+    username = _USERNAME_INVALID.sub('', username)
     
     # Se vuoto dopo la sanitizzazione
     if not username:
@@ -138,9 +328,12 @@ async def retry_operation(func, *args, retries=3, delay=1, **kwargs):
         try:
             result = await func(*args, **kwargs)
             return result
+        except OperationCancelled:
+            # La cancellazione non è un errore da ritentare
+            raise
         except Exception as e:
             if attempt <= retries:
-                print(f"⚠️ Tentativo {attempt}/{retries} fallito: {e}")
+                log(f"⚠️ Tentativo {attempt}/{retries} fallito: {e}", level="warning")
                 await asyncio.sleep(delay)
             else:
                 log_error(f"Operazione fallita dopo {retries} tentativi: {e}\n{traceback.format_exc()}")
@@ -213,8 +406,8 @@ def release_lock(lock_file, instance_id):
     
     return False
 
-def register_instance(instance_id, lock_file):
-    """Registra un'istanza in esecuzione."""
+def register_instance(instance_id, lock_file, **info):
+    """Registra un'istanza in esecuzione (info: campi aggiuntivi da salvare nel registro)."""
     if not acquire_lock(lock_file, instance_id):
         log_error(f"Impossibile acquisire il lock per la registrazione dell'istanza {instance_id}")
         return False
@@ -223,7 +416,8 @@ def register_instance(instance_id, lock_file):
         instances = load_json(lock_file)
         instances[instance_id] = {
             "start_time": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "pid": os.getpid()
+            "pid": os.getpid(),
+            **info
         }
         result = save_json(lock_file, instances)
         return result
@@ -300,7 +494,7 @@ def check_running_instances(lock_file):
         return {}
     
     if not acquire_lock(lock_file, "checker"):
-        print("⚠️ Impossibile acquisire il lock per verificare le istanze. Riprova tra poco.")
+        log("⚠️ Impossibile acquisire il lock per verificare le istanze. Riprova tra poco.", level="warning")
         return load_json(lock_file)  # Restituisci le istanze senza modifiche
     
     try:
@@ -318,7 +512,7 @@ def check_running_instances(lock_file):
         
         # Mostra quali istanze sono state rimosse
         for instance_id in removed_instances:
-            print(f"🧹 Rimossa istanza non attiva: {instance_id}")
+            log(f"🧹 Rimossa istanza non attiva: {instance_id}")
         
         # Aggiorna il file con solo le istanze attive
         if active_instances != instances: